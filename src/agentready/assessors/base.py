@@ -67,6 +67,24 @@ class BaseAssessor(ABC):
         """
         return True
 
+    @property
+    def input_globs(self) -> tuple[str, ...] | None:
+        """Repository paths this assessor's result depends on.
+
+        Used for incremental re-assessment: when none of the paths changed
+        since a previous assessment, its finding is reused instead of
+        re-running the assessor. Patterns are fnmatch globs matched against
+        repository-relative POSIX paths ("*" also matches "/", so "*.py"
+        covers every Python file while "README.md" only the root README).
+
+        Default None means the inputs are unknown (e.g., git history or
+        directory layout) and the assessor always re-runs.
+
+        Returns:
+            Tuple of glob patterns, or None to always re-assess
+        """
+        return None
+
     def calculate_proportional_score(
         self,
         measured_value: float,
@@ -1,14 +1,18 @@
 """Code quality assessors for complexity, file length, type annotations, and code smells."""
 
-import ast
 import logging
 import re
+from collections import Counter
 
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
-from ..services.scanner import MissingToolError
-from ..utils.subprocess_utils import safe_subprocess_run
+from ..services.complexity import (
+    FunctionComplexity,
+    brace_complexities,
+    complexity_rank,
+)
+from ..services.language_detector import LanguageDetector
 from .base import BaseAssessor
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,10 @@ class TypeAnnotationsAssessor(BaseAssessor):
     def tier(self) -> int:
         return 1  # Essential
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return ("*.py", "tsconfig.json")
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -73,55 +81,19 @@ class TypeAnnotationsAssessor(BaseAssessor):
 
     def _assess_python_types(self, repository: Repository) -> Finding:
         """Assess Python type annotations using AST parsing."""
-        # Use AST parsing to accurately detect type annotations
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files", "*.py"],
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            python_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            python_files = [
-                str(f.relative_to(repository.path))
-                for f in repository.path.rglob("*.py")
-            ]
+        # Use the shared AST cache to accurately detect type annotations
+        python_files = repository.get_file_index().with_suffix(".py")
+        summaries = repository.get_ast_cache().summaries(python_files)
 
         total_functions = 0
         typed_functions = 0
 
-        for file_path in python_files:
-            full_path = repository.path / file_path
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Parse the file with AST
-                tree = ast.parse(content, filename=str(file_path))
-
-                # Walk the AST and count functions with type annotations
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        total_functions += 1
-                        # Check if function has type annotations
-                        # Return type annotation: node.returns is not None
-                        # Parameter annotations: any arg has annotation
-                        has_return_annotation = node.returns is not None
-                        has_param_annotations = any(
-                            arg.annotation is not None for arg in node.args.args
-                        )
-
-                        # Consider function typed if it has either return or param annotations
-                        if has_return_annotation or has_param_annotations:
-                            typed_functions += 1
-
-            except (OSError, UnicodeDecodeError, SyntaxError):
-                # Skip files that can't be read or parsed
-                continue
+        for summary in summaries:
+            for function in summary.functions:
+                total_functions += 1
+                # Consider function typed if it has either return or param annotations
+                if function.is_annotated:
+                    typed_functions += 1
 
         if total_functions == 0:
             return Finding.not_applicable(
@@ -261,7 +233,28 @@ def calculate(x: float, y: float) -> float:
 
 
 class CyclomaticComplexityAssessor(BaseAssessor):
-    """Assesses cyclomatic complexity using radon."""
+    """Assesses per-function cyclomatic complexity in-process."""
+
+    SUPPORTED_LANGUAGES = {"Python", "JavaScript", "TypeScript", "C", "C++", "Java"}
+
+    # Functions above this complexity are reported as offenders
+    FUNCTION_LIMIT = 15
+
+    # Offenders listed in the evidence
+    TOP_OFFENDERS = 5
+
+    # Larger non-Python sources are treated as generated
+    MAX_SOURCE_BYTES = 1024 * 1024
+
+    # Radon-style ranks and the complexity range each covers
+    RANK_LABELS = (
+        ("A", "1-5"),
+        ("B", "6-10"),
+        ("C", "11-20"),
+        ("D", "21-30"),
+        ("E", "31-40"),
+        ("F", "41+"),
+    )
 
     @property
     def attribute_id(self) -> str:
@@ -271,6 +264,14 @@ class CyclomaticComplexityAssessor(BaseAssessor):
     def tier(self) -> int:
         return 3  # Important
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return tuple(
+            f"*{suffix}"
+            for suffix, language in LanguageDetector.EXTENSION_MAP.items()
+            if language in self.SUPPORTED_LANGUAGES
+        )
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -284,102 +285,116 @@ class CyclomaticComplexityAssessor(BaseAssessor):
         )
 
     def is_applicable(self, repository: Repository) -> bool:
-        """Applicable to languages supported by radon or lizard."""
-        supported = {"Python", "JavaScript", "TypeScript", "C", "C++", "Java"}
-        return bool(set(repository.languages.keys()) & supported)
+        """Applicable to Python and the supported brace-delimited languages."""
+        return bool(set(repository.languages.keys()) & self.SUPPORTED_LANGUAGES)
 
     def assess(self, repository: Repository) -> Finding:
-        """Check cyclomatic complexity using radon or lizard."""
-        if "Python" in repository.languages:
-            return self._assess_python_complexity(repository)
-        else:
-            # Use lizard for other languages
-            return self._assess_with_lizard(repository)
+        """Compute per-function cyclomatic complexity in-process.
 
-    def _assess_python_complexity(self, repository: Repository) -> Finding:
-        """Assess Python complexity using radon."""
-        try:
-            # Check if radon is available
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["radon", "cc", str(repository.path), "-s", "-a"],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode != 0:
-                raise MissingToolError("radon", install_command="pip install radon")
+        Python functions come from the shared AST cache (and its persistent
+        per-blob store); other languages use a lightweight tokenizer-based
+        counter.
+        """
+        functions = self._python_functions(repository)
+        functions.extend(self._brace_language_functions(repository))
 
-            # Parse radon output for average complexity
-            # Output format: "Average complexity: A (5.2)"
-            output = result.stdout
+        if not functions:
+            return Finding.not_applicable(
+                self.attribute, reason="No functions to analyze"
+            )
 
-            if "Average complexity:" in output:
-                # Extract average value
-                avg_line = [
-                    line for line in output.split("\n") if "Average complexity:" in line
-                ][0]
-                avg_value = float(avg_line.split("(")[1].split(")")[0])
+        complexities = [function.complexity for _, function in functions]
+        avg_value = sum(complexities) / len(complexities)
+        over_limit = sum(1 for c in complexities if c > self.FUNCTION_LIMIT)
 
-                score = self.calculate_proportional_score(
-                    measured_value=avg_value,
-                    threshold=10.0,
-                    higher_is_better=False,
-                )
+        score = self.calculate_proportional_score(
+            measured_value=avg_value,
+            threshold=10.0,
+            higher_is_better=False,
+        )
+        status = "pass" if score >= 75 else "fail"
 
-                status = "pass" if score >= 75 else "fail"
+        distribution = Counter(complexity_rank(c) for c in complexities)
+        evidence = [
+            f"Average cyclomatic complexity: {avg_value:.1f} "
+            f"across {len(complexities)} functions",
+            "Distribution: "
+            + ", ".join(
+                f"{rank} ({label}): {distribution.get(rank, 0)}"
+                for rank, label in self.RANK_LABELS
+            ),
+            f"Functions over {self.FUNCTION_LIMIT}: {over_limit}",
+        ]
 
-                return Finding(
-                    attribute=self.attribute,
-                    status=status,
-                    score=score,
-                    measured_value=f"{avg_value:.1f}",
-                    threshold="<10.0",
-                    evidence=[f"Average cyclomatic complexity: {avg_value:.1f}"],
-                    remediation=(
-                        self._create_remediation() if status == "fail" else None
-                    ),
-                    error_message=None,
-                )
-            else:
-                return Finding.not_applicable(
-                    self.attribute, reason="No Python code to analyze"
+        offenders = sorted(
+            (item for item in functions if item[1].complexity > self.FUNCTION_LIMIT),
+            key=lambda item: -item[1].complexity,
+        )[: self.TOP_OFFENDERS]
+        if offenders:
+            evidence.append(
+                "Most complex: "
+                + ", ".join(
+                    f"{path}:{function.lineno} {function.name} "
+                    f"({function.complexity})"
+                    for path, function in offenders
                 )
-
-        except MissingToolError:
-            raise  # Re-raise to be caught by Scanner
-        except Exception as e:
-            return Finding.error(
-                self.attribute, reason=f"Complexity analysis failed: {str(e)}"
             )
 
-    def _assess_with_lizard(self, repository: Repository) -> Finding:
-        """Assess complexity using lizard (multi-language)."""
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["lizard", str(repository.path)],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if result.returncode != 0:
-                raise MissingToolError("lizard", install_command="pip install lizard")
+        return Finding(
+            attribute=self.attribute,
+            status=status,
+            score=score,
+            measured_value=f"{avg_value:.1f}",
+            threshold="<10.0",
+            evidence=evidence,
+            remediation=self._create_remediation() if status == "fail" else None,
+            error_message=None,
+        )
 
-            # Parse lizard output
-            # This is simplified - production code should parse properly
-            return Finding.not_applicable(
-                self.attribute, reason="Lizard analysis not fully implemented"
-            )
+    def _python_functions(
+        self, repository: Repository
+    ) -> list[tuple[str, FunctionComplexity]]:
+        """Collect Python function complexities from module summaries."""
+        if "Python" not in repository.languages:
+            return []
+
+        python_files = repository.get_file_index().with_suffix(".py")
+        return [
+            (summary.path, function)
+            for summary in repository.get_ast_cache().summaries(python_files)
+            for function in summary.complexities
+        ]
 
-        except MissingToolError:
-            raise
-        except Exception as e:
-            return Finding.error(
-                self.attribute, reason=f"Complexity analysis failed: {str(e)}"
+    def _brace_language_functions(
+        self, repository: Repository
+    ) -> list[tuple[str, FunctionComplexity]]:
+        """Collect function complexities for JavaScript, Java, C and friends."""
+        suffixes = [
+            suffix
+            for suffix, language in LanguageDetector.EXTENSION_MAP.items()
+            if language in self.SUPPORTED_LANGUAGES
+            and language != "Python"
+            and language in repository.languages
+        ]
+        if not suffixes:
+            return []
+
+        file_index = repository.get_file_index()
+        functions = []
+        for source_file in file_index.with_suffix(*suffixes):
+            # Minified bundles and generated sources are not maintained code
+            if source_file.size > self.MAX_SOURCE_BYTES or ".min." in source_file.name:
+                continue
+            try:
+                source = file_index.absolute_path(source_file).read_text(
+                    encoding="utf-8"
+                )
+            except (OSError, UnicodeDecodeError):
+                continue
+            functions.extend(
+                (source_file.path, function) for function in brace_complexities(source)
             )
+        return functions
 
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for high complexity."""
@@ -430,6 +445,10 @@ class SemanticNamingAssessor(BaseAssessor):
     def tier(self) -> int:
         return 3  # Important
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return ("*.py",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -459,21 +478,7 @@ class SemanticNamingAssessor(BaseAssessor):
     def _assess_python_naming(self, repository: Repository) -> Finding:
         """Assess Python naming conventions using AST parsing."""
         # Get list of Python files
-        try:
-            result = safe_subprocess_run(
-                ["git", "ls-files", "*.py"],
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            python_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            python_files = [
-                str(f.relative_to(repository.path))
-                for f in repository.path.rglob("*.py")
-            ]
+        python_files = repository.get_file_index().with_suffix(".py")
 
         # Sample files for large repositories (max 50 files)
         if len(python_files) > 50:
@@ -492,41 +497,30 @@ class SemanticNamingAssessor(BaseAssessor):
         pascal_case_pattern = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
         generic_names = {"temp", "data", "info", "obj", "var", "tmp", "x", "y", "z"}
 
-        for file_path in python_files:
-            full_path = repository.path / file_path
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                tree = ast.parse(content, filename=str(file_path))
-
-                for node in ast.walk(tree):
-                    # Check function names
-                    if isinstance(node, ast.FunctionDef):
-                        # Skip private/magic methods
-                        if node.name.startswith("_"):
-                            continue
-
-                        total_functions += 1
-                        if snake_case_pattern.match(node.name):
-                            compliant_functions += 1
-
-                        # Check for generic names
-                        if node.name.lower() in generic_names:
-                            generic_names_count += 1
-
-                    # Check class names
-                    elif isinstance(node, ast.ClassDef):
-                        # Skip private classes
-                        if node.name.startswith("_"):
-                            continue
-
-                        total_classes += 1
-                        if pascal_case_pattern.match(node.name):
-                            compliant_classes += 1
-
-            except (OSError, UnicodeDecodeError, SyntaxError):
-                continue
+        for summary in repository.get_ast_cache().summaries(python_files):
+            # Check function names
+            for function in summary.functions:
+                # Skip private/magic methods
+                if function.name.startswith("_"):
+                    continue
+
+                total_functions += 1
+                if snake_case_pattern.match(function.name):
+                    compliant_functions += 1
+
+                # Check for generic names
+                if function.name.lower() in generic_names:
+                    generic_names_count += 1
+
+            # Check class names
+            for cls in summary.classes:
+                # Skip private classes
+                if cls.name.startswith("_"):
+                    continue
+
+                total_classes += 1
+                if pascal_case_pattern.match(cls.name):
+                    compliant_classes += 1
 
         if total_functions == 0 and total_classes == 0:
             return Finding.not_applicable(
@@ -1,15 +1,11 @@
 """Documentation assessor for CLAUDE.md, README, docstrings, and ADRs."""
 
-import ast
 import json
 import re
 
-import yaml
-
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
-from ..utils.subprocess_utils import safe_subprocess_run
 from .base import BaseAssessor
 
 
@@ -28,6 +24,10 @@ class CLAUDEmdAssessor(BaseAssessor):
     def tier(self) -> int:
         return 1  # Essential
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return ("CLAUDE.md",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -160,6 +160,10 @@ class READMEAssessor(BaseAssessor):
     def tier(self) -> int:
         return 1  # Essential
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return ("README.md",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -566,6 +570,10 @@ class ConciseDocumentationAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2  # Critical
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return ("README.md",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -842,6 +850,10 @@ class InlineDocumentationAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2  # Critical
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return ("*.py",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -875,55 +887,26 @@ class InlineDocumentationAssessor(BaseAssessor):
     def _assess_python_docstrings(self, repository: Repository) -> Finding:
         """Assess Python docstring coverage using AST parsing."""
         # Get list of Python files
-        try:
-            result = safe_subprocess_run(
-                ["git", "ls-files", "*.py"],
-                cwd=repository.path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            python_files = [f for f in result.stdout.strip().split("\n") if f]
-        except Exception:
-            python_files = [
-                str(f.relative_to(repository.path))
-                for f in repository.path.rglob("*.py")
-            ]
+        python_files = repository.get_file_index().with_suffix(".py")
 
         total_public_items = 0
         documented_items = 0
 
-        for file_path in python_files:
-            full_path = repository.path / file_path
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+        for summary in repository.get_ast_cache().summaries(python_files):
+            # Check module-level docstring
+            if summary.has_module_docstring:
+                documented_items += 1
+            total_public_items += 1
 
-                # Parse the file with AST
-                tree = ast.parse(content, filename=str(file_path))
+            # Count public functions/classes with docstrings
+            for item in [*summary.functions, *summary.classes]:
+                # Skip private functions/classes (starting with _)
+                if item.name.startswith("_"):
+                    continue
 
-                # Check module-level docstring
-                module_doc = ast.get_docstring(tree)
-                if module_doc:
-                    documented_items += 1
                 total_public_items += 1
-
-                # Walk the AST and count functions/classes with docstrings
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        # Skip private functions/classes (starting with _)
-                        if node.name.startswith("_"):
-                            continue
-
-                        total_public_items += 1
-                        docstring = ast.get_docstring(node)
-                        if docstring:
-                            documented_items += 1
-
-            except (OSError, UnicodeDecodeError, SyntaxError):
-                # Skip files that can't be read or parsed
-                continue
+                if item.has_docstring:
+                    documented_items += 1
 
         if total_public_items == 0:
             return Finding.not_applicable(
@@ -1138,8 +1121,7 @@ class OpenAPISpecsAssessor(BaseAssessor):
             "swagger.json",
         ]
 
-        # Recursively search for spec files
-        found_specs = []
+        # Search the shared file index for spec files
         excluded_dirs = {
             ".git",
             "node_modules",
@@ -1149,28 +1131,14 @@ class OpenAPISpecsAssessor(BaseAssessor):
             ".pytest_cache",
         }
 
-        for spec_name in spec_files:
-            try:
-                # Use rglob to search recursively
-                matches = list(repository.path.rglob(spec_name))
-                # Filter out files in excluded directories
-                matches = [
-                    m
-                    for m in matches
-                    if not any(part in m.parts for part in excluded_dirs)
-                ]
-                found_specs.extend(matches)
-            except OSError:
-                # If rglob fails, continue to next pattern
-                continue
+        file_index = repository.get_file_index()
+        matches = file_index.excluding_dirs(
+            file_index.named(*spec_files), excluded_dirs
+        )
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_specs = []
-        for spec in found_specs:
-            if spec not in seen:
-                seen.add(spec)
-                unique_specs.append(spec)
+        # Preserve search order by spec name (openapi.yaml first, etc.)
+        matches.sort(key=lambda f: spec_files.index(f.name))
+        unique_specs = [file_index.absolute_path(f) for f in matches]
 
         # Select the first found spec (prefer root-level if available, otherwise first found)
         found_spec = None
@@ -1194,6 +1162,8 @@ class OpenAPISpecsAssessor(BaseAssessor):
                 error_message=None,
             )
 
+        import yaml
+
         # Parse the spec file
         try:
             content = found_spec.read_text(encoding="utf-8")
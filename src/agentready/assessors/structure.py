@@ -324,6 +324,10 @@ class IssuePRTemplatesAssessor(BaseAssessor):
     def tier(self) -> int:
         return 3  # Important
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return (".github/*", "PULL_REQUEST_TEMPLATE.md")
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -580,28 +584,18 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         total_files = 0
         oversized_files = 0
 
-        # Check Python files
-        try:
-            py_files = list(repository.path.rglob("*.py"))
-            for py_file in py_files:
-                # Skip venv, node_modules, etc.
-                if any(
-                    part in py_file.parts
-                    for part in [".venv", "venv", "node_modules", ".git"]
-                ):
-                    continue
-
-                try:
-                    with open(py_file, "r", encoding="utf-8") as f:
-                        lines = len(f.readlines())
-                    total_files += 1
-                    if lines > threshold:
-                        oversized_files += 1
-                except (OSError, UnicodeDecodeError):
-                    continue
-
-        except OSError:
-            pass
+        # Check Python files from the shared file index
+        file_index = repository.get_file_index()
+        py_files = file_index.excluding_dirs(
+            file_index.with_suffix(".py"), {".venv", "venv", "node_modules", ".git"}
+        )
+        for py_file in py_files:
+            lines = file_index.line_count(py_file)
+            if lines is None:
+                continue
+            total_files += 1
+            if lines > threshold:
+                oversized_files += 1
 
         if total_files == 0:
             return 100.0, {"total": 0, "oversized": 0}
@@ -616,24 +610,14 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         """Check for catch-all module anti-patterns."""
         antipattern_names = ["utils.py", "helpers.py", "common.py", "misc.py"]
 
-        found = []
-        try:
-            for pattern in antipattern_names:
-                matches = list(repository.path.rglob(pattern))
-                # Filter out venv/node_modules
-                matches = [
-                    m
-                    for m in matches
-                    if not any(
-                        part in m.parts
-                        for part in [".venv", "venv", "node_modules", ".git"]
-                    )
-                ]
-                if matches:
-                    found.extend([m.name for m in matches])
-
-        except OSError:
-            pass
+        file_index = repository.get_file_index()
+        matches = file_index.excluding_dirs(
+            file_index.named(*antipattern_names),
+            {".venv", "venv", "node_modules", ".git"},
+        )
+        # Preserve search order by anti-pattern name
+        matches.sort(key=lambda f: antipattern_names.index(f.name))
+        found = [m.name for m in matches]
 
         # Score: 100 if none found, -20 per antipattern file
         naming_score = max(0, 100.0 - (len(found) * 20))
@@ -13,6 +13,19 @@ from .base import BaseAssessor
 class LockFilesAssessor(BaseAssessor):
     """Tier 1 Essential - Lock files for reproducible dependencies."""
 
+    LOCK_FILES = (
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "Pipfile.lock",
+        "uv.lock",
+        "requirements.txt",
+        "Cargo.lock",
+        "Gemfile.lock",
+        "go.sum",
+    )
+
     @property
     def attribute_id(self) -> str:
         return "lock_files"
@@ -21,6 +34,10 @@ class LockFilesAssessor(BaseAssessor):
     def tier(self) -> int:
         return 1
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return self.LOCK_FILES
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -34,20 +51,7 @@ class LockFilesAssessor(BaseAssessor):
         )
 
     def assess(self, repository: Repository) -> Finding:
-        lock_files = [
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            "poetry.lock",
-            "Pipfile.lock",
-            "uv.lock",
-            "requirements.txt",
-            "Cargo.lock",
-            "Gemfile.lock",
-            "go.sum",
-        ]
-
-        found = [f for f in lock_files if (repository.path / f).exists()]
+        found = [f for f in self.LOCK_FILES if (repository.path / f).exists()]
 
         if found:
             return Finding(
@@ -157,6 +161,10 @@ class GitignoreAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return (".gitignore",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
@@ -274,30 +282,18 @@ class FileSizeLimitsAssessor(BaseAssessor):
             ".h",
         }
 
-        for ext in extensions:
-            pattern = f"**/*{ext}"
-            try:
-
-                for file_path in repository.path.glob(pattern):
-                    if file_path.is_file():
-                        try:
-                            with open(file_path, "r", encoding="utf-8") as f:
-                                lines = len(f.readlines())
-                                total_files += 1
-
-                                if lines > 1000:
-                                    huge_files.append(
-                                        (file_path.relative_to(repository.path), lines)
-                                    )
-                                elif lines > 500:
-                                    large_files.append(
-                                        (file_path.relative_to(repository.path), lines)
-                                    )
-                        except (OSError, UnicodeDecodeError):
-                            # Skip files we can't read
-                            pass
-            except Exception:
-                pass
+        file_index = repository.get_file_index()
+        for source_file in file_index.with_suffix(*extensions):
+            lines = file_index.line_count(source_file)
+            if lines is None:
+                # Skip files we can't read
+                continue
+            total_files += 1
+
+            if lines > 1000:
+                huge_files.append((source_file.path, lines))
+            elif lines > 500:
+                large_files.append((source_file.path, lines))
 
         if total_files == 0:
             return Finding.not_applicable(
@@ -230,6 +230,10 @@ class PreCommitHooksAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2  # Critical
 
+    @property
+    def input_globs(self) -> tuple[str, ...]:
+        return (".pre-commit-config.yaml",)
+
     @property
     def attribute(self) -> Attribute:
         return Attribute(
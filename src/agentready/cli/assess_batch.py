@@ -69,123 +69,172 @@ def _load_config(config_path: Path) -> Config:
         sys.exit(1)
 
 
-def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool) -> None:
-    """Generate all report formats in dated folder structure.
+class _BatchReportSink:
+    """Generate all report formats in dated folder structure as results arrive.
 
     Phase 2 Reporting:
     - Creates dated reports folder (reports-YYYYMMDD-HHMMSS/)
-    - Generates SQLite database (all assessments queryable)
     - Generates CSV/TSV summaries (one row per repo)
     - Generates aggregated JSON (all assessments in one file)
     - Generates individual reports (HTML/JSON/MD per repo)
     - Generates summary HTML (index.html with comparison table)
 
-    Args:
-        batch_assessment: Complete batch assessment with results
-        output_path: Base output directory
-        verbose: Whether to show verbose progress
+    Used as a BatchScanner sink: rows, aggregated JSON entries and
+    individual reports are written as each repository finishes, so no
+    report needs the whole batch in memory. A resumed batch reuses the
+    folder of the original run and rewrites it from the journal.
     """
-    from ..reporters.aggregated_json import AggregatedJSONReporter
-    from ..reporters.csv_reporter import CSVReporter
-    from ..reporters.json_reporter import JSONReporter
-    from ..reporters.multi_html import MultiRepoHTMLReporter
-
-    # Create dated reports folder
-    timestamp = batch_assessment.timestamp.strftime("%Y%m%d-%H%M%S")
-    reports_dir = output_path / f"reports-{timestamp}"
-    reports_dir.mkdir(parents=True, exist_ok=True)
-
-    if verbose:
-        click.echo(f"\nGenerating reports in {reports_dir}/")
 
-    # 1. CSV/TSV summary
-    try:
+    def __init__(self, output_path: Path, verbose: bool):
+        """Initialize sink.
+
+        Args:
+            output_path: Base output directory
+            verbose: Whether to show verbose progress
+        """
+        self.output_path = output_path
+        self.verbose = verbose
+        self.reports_dir: Optional[Path] = None
+        self.failures: list[dict] = []
+        # File name -> (stream writer, label, closer); failing writers are dropped
+        self._streams: dict = {}
+
+    def open(self, batch_id: str, started_at) -> None:
+        """Create the reports folder and open the streaming reports."""
+        from ..reporters.aggregated_json import AggregatedJSONReporter
+        from ..reporters.csv_reporter import CSVReporter
+
+        # Create dated reports folder
+        timestamp = started_at.strftime("%Y%m%d-%H%M%S")
+        self.reports_dir = self.output_path / f"reports-{timestamp}"
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.verbose:
+            click.echo(f"\nGenerating reports in {self.reports_dir}/")
+
+        # 1. CSV/TSV summary
         csv_reporter = CSVReporter()
-        csv_reporter.generate(
-            batch_assessment, reports_dir / "summary.csv", delimiter=","
+        self._open_stream(
+            "summary.csv",
+            lambda path: csv_reporter.open_stream(path, delimiter=","),
+            "CSV",
         )
-        csv_reporter.generate(
-            batch_assessment, reports_dir / "summary.tsv", delimiter="\t"
+        self._open_stream(
+            "summary.tsv",
+            lambda path: csv_reporter.open_stream(path, delimiter="\t"),
+            "CSV",
         )
-        if verbose:
-            click.echo("  ✓ summary.csv")
-            click.echo("  ✓ summary.tsv")
-    except Exception as e:
-        click.echo(f"  ✗ CSV generation failed: {e}", err=True)
 
-    # 2. Aggregated JSON
-    try:
-        json_reporter = AggregatedJSONReporter()
-        json_reporter.generate(batch_assessment, reports_dir / "all-assessments.json")
-        if verbose:
-            click.echo("  ✓ all-assessments.json")
-    except Exception as e:
-        click.echo(f"  ✗ Aggregated JSON generation failed: {e}", err=True)
+        # 2. Aggregated JSON
+        self._open_stream(
+            "all-assessments.json",
+            lambda path: AggregatedJSONReporter().open_stream(
+                path, batch_id, started_at
+            ),
+            "Aggregated JSON",
+            # Summary fields follow the results, so closing needs the batch
+            close=lambda stream, batch: stream.close(batch),
+        )
 
-    # 3. Individual reports for each successful assessment
-    individual_json = JSONReporter()
-    for result in batch_assessment.results:
-        if result.is_success():
-            assessment = result.assessment
-            base_name = f"{assessment.repository.name}-{assessment.timestamp.strftime('%Y%m%d-%H%M%S')}"
+    def _open_stream(
+        self,
+        filename: str,
+        opener,
+        label: str,
+        close=lambda stream, batch: stream.close(),
+    ) -> None:
+        try:
+            stream = opener(self.reports_dir / filename)
+            self._streams[filename] = (stream, label, close)
+        except Exception as e:
+            click.echo(f"  ✗ {label} generation failed: {e}", err=True)
 
+    def add(self, result) -> None:
+        """Write everything derived from one repository result."""
+        for filename, (stream, label, _) in list(self._streams.items()):
             try:
-                # HTML report
-                html_reporter = HTMLReporter()
-                html_reporter.generate(assessment, reports_dir / f"{base_name}.html")
+                stream.write(result)
+            except Exception as e:
+                click.echo(f"  ✗ {label} generation failed: {e}", err=True)
+                del self._streams[filename]
 
-                # JSON report
-                individual_json.generate(assessment, reports_dir / f"{base_name}.json")
+        if result.is_success():
+            self._write_individual_reports(result.assessment)
+        else:
+            self.failures.append(
+                {
+                    "repo_url": result.repository_url,
+                    "error_type": result.error_type,
+                    "error_message": result.error,
+                    "duration_seconds": result.duration_seconds,
+                }
+            )
 
-                # Markdown report
-                markdown_reporter = MarkdownReporter()
-                markdown_reporter.generate(assessment, reports_dir / f"{base_name}.md")
+    def _write_individual_reports(self, assessment) -> None:
+        """3. Individual reports for each successful assessment."""
+        from ..reporters.json_reporter import JSONReporter
 
-                if verbose:
-                    click.echo(f"  ✓ {base_name}.{{html,json,md}}")
-            except Exception as e:
-                click.echo(
-                    f"  ✗ Individual reports failed for {base_name}: {e}", err=True
-                )
+        base_name = f"{assessment.repository.name}-{assessment.timestamp.strftime('%Y%m%d-%H%M%S')}"
 
-    # 4. Multi-repo summary HTML (index)
-    try:
-        template_dir = Path(__file__).parent.parent / "templates"
-        multi_html = MultiRepoHTMLReporter(template_dir)
-        multi_html.generate(batch_assessment, reports_dir / "index.html")
-        if verbose:
-            click.echo("  ✓ index.html")
-    except Exception as e:
-        click.echo(f"  ✗ Multi-repo HTML generation failed: {e}", err=True)
+        try:
+            # HTML report
+            html_reporter = HTMLReporter()
+            html_reporter.generate(assessment, self.reports_dir / f"{base_name}.html")
+
+            # JSON report
+            JSONReporter().generate(assessment, self.reports_dir / f"{base_name}.json")
+
+            # Markdown report
+            markdown_reporter = MarkdownReporter()
+            markdown_reporter.generate(assessment, self.reports_dir / f"{base_name}.md")
+
+            if self.verbose:
+                click.echo(f"  ✓ {base_name}.{{html,json,md}}")
+        except Exception as e:
+            click.echo(f"  ✗ Individual reports failed for {base_name}: {e}", err=True)
+
+    def close(self, batch_assessment) -> None:
+        """Finish the streaming reports and write the batch-level ones."""
+        from ..reporters.multi_html import MultiRepoHTMLReporter
+
+        for filename, (stream, label, close) in self._streams.items():
+            try:
+                close(stream, batch_assessment)
+                if self.verbose:
+                    click.echo(f"  ✓ {filename}")
+            except Exception as e:
+                click.echo(f"  ✗ {label} generation failed: {e}", err=True)
 
-    # 5. Failures JSON
-    failed_results = [r for r in batch_assessment.results if not r.is_success()]
-    if failed_results:
+        # 4. Multi-repo summary HTML (index)
         try:
-            failures_data = [
-                {
-                    "repo_url": r.repository_url,
-                    "error_type": r.error_type,
-                    "error_message": r.error,
-                    "duration_seconds": r.duration_seconds,
-                }
-                for r in failed_results
-            ]
-            with open(reports_dir / "failures.json", "w", encoding="utf-8") as f:
-                json.dump(failures_data, f, indent=2)
-            if verbose:
-                click.echo("  ✓ failures.json")
+            template_dir = Path(__file__).parent.parent / "templates"
+            multi_html = MultiRepoHTMLReporter(template_dir)
+            multi_html.generate(batch_assessment, self.reports_dir / "index.html")
+            if self.verbose:
+                click.echo("  ✓ index.html")
         except Exception as e:
-            click.echo(f"  ✗ Failures JSON generation failed: {e}", err=True)
+            click.echo(f"  ✗ Multi-repo HTML generation failed: {e}", err=True)
 
-    # Print final summary
-    click.echo(f"\n✓ Reports generated: {reports_dir}/")
-    click.echo("  - index.html (summary)")
-    click.echo("  - summary.csv & summary.tsv")
-    click.echo("  - all-assessments.json")
-    click.echo("  - Individual reports per repository")
-    if failed_results:
-        click.echo("  - failures.json")
+        # 5. Failures JSON
+        if self.failures:
+            try:
+                with open(
+                    self.reports_dir / "failures.json", "w", encoding="utf-8"
+                ) as f:
+                    json.dump(self.failures, f, indent=2)
+                if self.verbose:
+                    click.echo("  ✓ failures.json")
+            except Exception as e:
+                click.echo(f"  ✗ Failures JSON generation failed: {e}", err=True)
+
+        # Print final summary
+        click.echo(f"\n✓ Reports generated: {self.reports_dir}/")
+        click.echo("  - index.html (summary)")
+        click.echo("  - summary.csv & summary.tsv")
+        click.echo("  - all-assessments.json")
+        click.echo("  - Individual reports per repository")
+        if self.failures:
+            click.echo("  - failures.json")
 
 
 @click.command()
@@ -261,6 +310,46 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
     default=None,
     help="Custom path for heatmap HTML (default: reports-*/heatmap.html)",
 )
+@click.option(
+    "--clone-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Number of repositories to clone concurrently (default: 4)",
+)
+@click.option(
+    "--scan-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of repositories to scan concurrently in separate processes (default: 1)",
+)
+@click.option(
+    "--update-clones/--no-update-clones",
+    default=True,
+    help="Fetch the latest commit into cached clones (default: update)",
+)
+@click.option(
+    "--clone-blob-limit",
+    default=None,
+    help="Skip downloading blobs larger than this size until checkout (e.g., 1m)",
+)
+@click.option(
+    "--sparse-checkout",
+    "sparse_patterns",
+    multiple=True,
+    help="Sparse-checkout pattern excluding paths from clones (e.g., '!/vendor/'; repeatable)",
+)
+@click.option(
+    "--resume",
+    "resume_batch_id",
+    default=None,
+    help="Resume an interrupted batch by ID, skipping repositories already assessed",
+)
+@click.option(
+    "--since-cache",
+    is_flag=True,
+    default=False,
+    help="Only report repositories whose HEAD changed since they were last cached",
+)
 def assess_batch(
     repos_file: Optional[str],
     repos: tuple,
@@ -274,6 +363,13 @@ def assess_batch(
     cache_dir: Optional[str],
     generate_heatmap: bool,
     heatmap_output: Optional[str],
+    clone_workers: int,
+    scan_workers: int,
+    update_clones: bool,
+    clone_blob_limit: Optional[str],
+    sparse_patterns: tuple,
+    resume_batch_id: Optional[str],
+    since_cache: bool,
 ):
     """Assess multiple repositories in a batch operation.
 
@@ -289,6 +385,15 @@ def assess_batch(
         agentready assess-batch --github-org anthropics
         agentready assess-batch --github-org myorg --include-private --max-repos 50
 
+    Cloning and scanning are pipelined; tune with --clone-workers (network)
+    and --scan-workers (CPU).
+
+    Results are journaled as each repository finishes; if a run is
+    interrupted, rerun the same command with --resume <batch-id>.
+
+    Remote repositories whose HEAD commit is already in the cache are not
+    cloned at all; with --since-cache they are also left out of the reports.
+
     Output files are saved to .agentready/batch/ by default.
     """
     # Collect repository URLs
@@ -308,6 +413,12 @@ def assess_batch(
     if repos:
         repository_urls.extend(repos)
 
+    # Set cache directory
+    if cache_dir:
+        cache_path = Path(cache_dir)
+    else:
+        cache_path = Path(".agentready/cache")
+
     # NEW: GitHub org scanning
     if github_org:
         try:
@@ -317,7 +428,8 @@ def assess_batch(
                 GitHubOrgScanner,
             )
 
-            scanner = GitHubOrgScanner()
+            # Repeat scans revalidate cached pages instead of downloading
+            scanner = GitHubOrgScanner(cache_dir=cache_path / "github")
             org_repos = scanner.get_org_repos(
                 org_name=github_org,
                 include_private=include_private,
@@ -381,20 +493,30 @@ def assess_batch(
 
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Set cache directory
-    if cache_dir:
-        cache_path = Path(cache_dir)
-    else:
-        cache_path = Path(".agentready/cache")
-
     # Create batch scanner
     version = _get_agentready_version()
     batch_scanner = BatchScanner(
         cache_dir=cache_path,
+        batch_id=resume_batch_id,
         version=version,
         command="assess-batch",
+        update_clones=update_clones,
+        blob_limit=clone_blob_limit,
+        # Patterns only exclude paths, so everything else stays checked out
+        sparse_patterns=["/*", *sparse_patterns] if sparse_patterns else None,
     )
 
+    if resume_batch_id:
+        try:
+            resumable = batch_scanner.journal_exists()
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        if not resumable:
+            click.echo(f"Error: No journal found for batch {resume_batch_id}", err=True)
+            sys.exit(1)
+    click.echo(f"Batch ID: {batch_scanner.batch_id}")
+
     # Create assessors
     assessors = create_all_assessors()
 
@@ -403,9 +525,9 @@ def assess_batch(
         click.echo(f"Cache: {cache_path}")
         click.echo()
 
-    # Progress callback
-    def show_progress(current: int, total: int):
-        click.echo(f"Assessing repository {current + 1}/{total}...")
+    # Progress callback (repositories may finish out of order)
+    def show_progress(completed: int, total: int):
+        click.echo(f"Assessed {completed}/{total} repositories...")
 
     # Run batch assessment
     try:
@@ -416,6 +538,10 @@ def assess_batch(
             use_cache=use_cache,
             verbose=verbose,
             progress_callback=show_progress if verbose else None,
+            clone_workers=clone_workers,
+            scan_workers=scan_workers,
+            sinks=[_BatchReportSink(output_path, verbose)],
+            since_cache=since_cache,
         )
     except Exception as e:
         click.echo(f"Error during batch assessment: {e}", err=True)
@@ -425,9 +551,6 @@ def assess_batch(
             traceback.print_exc()
         sys.exit(1)
 
-    # Generate comprehensive Phase 2 reports
-    _generate_multi_reports(batch_assessment, output_path, verbose)
-
     # Generate heatmap if requested
     if generate_heatmap:
         from ..services.attribute_analyzer import AttributeAnalyzer
@@ -457,6 +580,9 @@ def assess_batch(
     click.echo("Batch Assessment Summary")
     click.echo("=" * 50)
     click.echo(f"Total repositories: {batch_assessment.summary.total_repositories}")
+    if since_cache:
+        unchanged = len(repository_urls) - batch_assessment.summary.total_repositories
+        click.echo(f"Unchanged since cached: {unchanged}")
     click.echo(f"Successful: {batch_assessment.summary.successful_assessments}")
     click.echo(f"Failed: {batch_assessment.summary.failed_assessments}")
     click.echo(f"Success rate: {batch_assessment.get_success_rate():.1f}%")
@@ -476,6 +602,15 @@ def assess_batch(
         for item in batch_assessment.summary.top_failing_attributes[:5]:
             click.echo(f"  {item['attribute_id']}: {item['failure_count']} failures")
 
+    if verbose and batch_assessment.summary.assessor_timings:
+        click.echo()
+        click.echo("Slowest Assessors:")
+        for item in batch_assessment.summary.assessor_timings[:5]:
+            click.echo(
+                f"  {item['attribute_id']}: {item['total_wall_seconds']:.1f}s total, "
+                f"{item['max_wall_seconds']:.1f}s max ({item['slowest_repository']})"
+            )
+
 
 def _generate_batch_markdown_report(batch_assessment, output_file: Path) -> None:
     """Generate Markdown report for batch assessment.
@@ -526,6 +661,18 @@ def _generate_batch_markdown_report(batch_assessment, output_file: Path) -> None
             )
         lines.append("\n")
 
+    # Assessor timings
+    if batch_assessment.summary.assessor_timings:
+        lines.append("## Slowest Assessors\n")
+        for item in batch_assessment.summary.assessor_timings[:10]:
+            lines.append(
+                f"- {item['attribute_id']}: {item['total_wall_seconds']:.2f}s total, "
+                f"{item['mean_wall_seconds']:.2f}s mean, "
+                f"{item['max_wall_seconds']:.2f}s max "
+                f"({item['slowest_repository']})\n"
+            )
+        lines.append("\n")
+
     # Results detail
     lines.append("## Individual Results\n")
     for result in batch_assessment.results:
@@ -0,0 +1,137 @@
+"""CLI commands for the assessment daemon."""
+
+import signal
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import click
+
+from ..services.daemon import (
+    AssessmentDaemon,
+    DaemonClient,
+    DaemonError,
+    DaemonServer,
+    default_socket_path,
+)
+
+socket_option = click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket of the daemon (default: $AGENTREADY_DAEMON_SOCKET or "
+    "~/.agentready/daemon.sock)",
+)
+
+
+@click.group()
+def daemon():
+    """Run a background daemon for fast repeated assessments.
+
+    The daemon keeps weights, the research report, report templates,
+    metric caches and each repository's last assessment in memory.
+    `agentready assess --daemon` then hands scans to it, re-running only
+    assessors whose inputs changed.
+
+    \b
+    Examples:
+        agentready daemon start --detach
+        agentready assess --daemon .
+        agentready daemon stop
+    """
+    pass
+
+
+@daemon.command()
+@socket_option
+@click.option(
+    "--detach",
+    is_flag=True,
+    help="Start in the background and return once the daemon is ready",
+)
+def start(socket_path, detach):
+    """Start the assessment daemon."""
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    client = DaemonClient(socket_path)
+
+    if detach:
+        if client.status() is not None:
+            click.echo(f"Daemon already running on {socket_path}")
+            return
+        log_path = socket_path.with_suffix(".log")
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "ab") as log:
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "agentready.cli.main",
+                    "daemon",
+                    "start",
+                    "--socket",
+                    str(socket_path),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                start_new_session=True,
+            )
+        status = client.wait_until_ready()
+        if status is None:
+            click.echo(f"Error: Daemon did not start; see {log_path}", err=True)
+            sys.exit(1)
+        click.echo(f"Daemon started (pid {status['pid']}) on {socket_path}")
+        return
+
+    from .main import get_agentready_version
+
+    try:
+        server = DaemonServer(
+            socket_path, AssessmentDaemon(version=get_agentready_version())
+        )
+    except (DaemonError, OSError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Stop cleanly (removing the socket) on SIGTERM as well as Ctrl+C
+    signal.signal(
+        signal.SIGTERM,
+        lambda signum, frame: threading.Thread(target=server.shutdown).start(),
+    )
+    click.echo(f"Daemon listening on {socket_path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    click.echo("Daemon stopped")
+
+
+@daemon.command()
+@socket_option
+def stop(socket_path):
+    """Stop the assessment daemon."""
+    client = DaemonClient(Path(socket_path) if socket_path else None)
+    if client.shutdown():
+        click.echo("Daemon stopping")
+    else:
+        click.echo(f"No daemon running on {client.socket_path}")
+
+
+@daemon.command()
+@socket_option
+def status(socket_path):
+    """Show whether the daemon is running."""
+    client = DaemonClient(Path(socket_path) if socket_path else None)
+    info = client.status()
+    if info is None:
+        click.echo(f"No daemon running on {client.socket_path}")
+        sys.exit(1)
+
+    click.echo(f"Daemon running on {client.socket_path}")
+    click.echo(f"  PID: {info['pid']}")
+    click.echo(f"  Version: {info['version']}")
+    click.echo(f"  Uptime: {info['uptime_seconds']:.0f}s")
+    click.echo(f"  Assessments: {info['assessments']}")
+    click.echo(f"  Warm repositories: {info['warm_repositories']}")
@@ -58,6 +58,20 @@ from ..services.learning_service import LearningService
     is_flag=True,
     help="Bypass LLM response cache (always call API)",
 )
+@click.option(
+    "--llm-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Maximum concurrent LLM requests (default: 4)",
+)
+@click.option(
+    "--batch",
+    "batch_source",
+    type=click.Path(exists=True),
+    default=None,
+    help="Learn across repositories from a batch result (all-assessments.json) "
+    "or a directory of assessment JSON files; REPOSITORY is ignored",
+)
 def learn(
     repository,
     output_format,
@@ -68,6 +82,8 @@ def learn(
     enable_llm,
     llm_budget,
     llm_no_cache,
+    llm_workers,
+    batch_source,
 ):
     """Extract reusable patterns and generate Claude Code skills.
 
@@ -100,7 +116,26 @@ def learn(
         \b
         # Generate all formats with higher confidence threshold
         agentready learn . --output-format all --min-confidence 85
+
+        \b
+        # Learn across every repository of a batch assessment
+        agentready learn --batch .agentready/batch/reports-latest/all-assessments.json
     """
+    if batch_source:
+        _learn_batch(
+            Path(batch_source).resolve(),
+            output_format,
+            output_dir,
+            attribute,
+            min_confidence,
+            verbose,
+            enable_llm,
+            llm_budget,
+            llm_no_cache,
+            llm_workers,
+        )
+        return
+
     repo_path = Path(repository).resolve()
 
     # Validate repository exists
@@ -167,6 +202,8 @@ def learn(
             attribute_ids=list(attribute) if attribute else None,
             enable_llm=enable_llm,
             llm_budget=llm_budget,
+            llm_use_cache=not llm_no_cache,
+            llm_workers=llm_workers,
         )
     except Exception as e:
         click.echo(f"\nError during learning: {str(e)}", err=True)
@@ -239,3 +276,100 @@ def learn(
         click.echo("     agentready learn . --output-format all")
 
     click.echo()
+
+
+def _learn_batch(
+    source,
+    output_format,
+    output_dir,
+    attribute,
+    min_confidence,
+    verbose,
+    enable_llm,
+    llm_budget,
+    llm_no_cache,
+    llm_workers,
+):
+    """Run the learning loop across the repositories of a batch assessment."""
+    click.echo("🧠 AgentReady Learning Loop (batch)")
+    click.echo("=" * 50)
+    click.echo(f"\nSource: {source}")
+    click.echo(f"Output format: {output_format}")
+    click.echo(f"Min confidence: {min_confidence}%")
+    if attribute:
+        click.echo(f"Filtering attributes: {', '.join(attribute)}")
+
+    if enable_llm:
+        if os.environ.get("ANTHROPIC_API_KEY"):
+            click.echo(f"LLM enrichment: ENABLED (budget: {llm_budget} skills)")
+            if llm_no_cache:
+                click.echo("LLM cache: DISABLED")
+        else:
+            click.echo("⚠️  LLM enrichment: DISABLED (ANTHROPIC_API_KEY not set)")
+            enable_llm = False
+    click.echo()
+
+    learning_service = LearningService(
+        min_confidence=min_confidence,
+        output_dir=output_dir,
+    )
+
+    try:
+        results = learning_service.run_batch_workflow(
+            source=source,
+            output_format=output_format,
+            attribute_ids=list(attribute) if attribute else None,
+            enable_llm=enable_llm,
+            llm_budget=llm_budget,
+            llm_use_cache=not llm_no_cache,
+            llm_workers=llm_workers,
+        )
+    except Exception as e:
+        click.echo(f"\nError during learning: {str(e)}", err=True)
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+        sys.exit(1)
+
+    repositories = results["repositories_analyzed"]
+    skills_count = results["skills_discovered"]
+
+    click.echo("=" * 50)
+    if repositories == 0:
+        click.echo("\nNo assessments found in the batch source.")
+        sys.exit(1)
+
+    click.echo(
+        f"\n✅ Discovered {skills_count} skill(s) across {repositories} "
+        f"repositories\n"
+    )
+
+    if enable_llm and skills_count > 0:
+        enriched_count = min(llm_budget, skills_count)
+        click.echo(f"🤖 LLM-enriched {enriched_count} skill(s)\n")
+
+    if skills_count == 0:
+        click.echo("No skills met the confidence threshold.")
+        click.echo(f"Try lowering --min-confidence (current: {min_confidence}).")
+        return
+
+    if verbose:
+        click.echo("Discovered Skills:")
+        click.echo("-" * 50)
+        for skill in results["skills"]:
+            found = results["skill_repositories"][skill.skill_id]
+            click.echo(f"\n📚 {skill.name}")
+            click.echo(f"   ID: {skill.skill_id}")
+            click.echo(f"   Confidence: {skill.confidence}%")
+            click.echo(f"   Found in: {found}/{repositories} repositories")
+            click.echo(f"   Prevalence: {skill.reusability_score}%")
+            click.echo(f"   Impact: +{skill.impact_score} pts")
+            click.echo(f"\n   {skill.pattern_summary}")
+        click.echo()
+
+    click.echo("\nGenerated Files:")
+    click.echo("-" * 50)
+    for file_path in results["generated_files"]:
+        click.echo(f"  ✓ {file_path}")
+    click.echo()
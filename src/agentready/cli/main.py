@@ -2,6 +2,7 @@
 
 import json
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 import click
@@ -15,23 +16,23 @@ except ImportError:
 from pydantic import ValidationError
 
 from ..assessors import create_all_assessors
+from ..models.assessment import Assessment
 from ..models.config import Config
-from ..reporters.html import HTMLReporter
-from ..reporters.markdown import MarkdownReporter
+from ..reporters.report_files import write_assessment_reports
+from ..services.file_metric_cache import FileMetricCache
+from ..services.profiling import ScanProfiler
 from ..services.research_loader import ResearchLoader
 from ..services.scanner import Scanner
 from ..utils.subprocess_utils import safe_subprocess_run
 
 # Lightweight commands - imported immediately
-from .align import align
-from .bootstrap import bootstrap
 from .demo import demo
 from .repomix import repomix_generate
 from .research import research
-from .schema import migrate_report, validate_report
 
 # Heavy commands - lazy loaded via LazyGroup
-# (assess_batch, experiment, extract_skills, learn, submit)
+# (align, assess_batch, bootstrap, daemon, experiment, extract_skills, learn,
+# migrate_report, rescore, submit, validate_report)
 
 
 def get_agentready_version() -> str:
@@ -50,8 +51,10 @@ class LazyGroup(click.Group):
     """Click group that lazily loads heavy commands to improve startup time.
 
     Commands like 'experiment', 'extract-skills', and 'assess-batch' import heavy
-    dependencies (scipy, pandas, anthropic) that add ~1 second to startup time.
-    This class defers those imports until the command is actually invoked.
+    dependencies (scipy, pandas, anthropic) that add ~1 second to startup time,
+    and 'bootstrap', 'align' and the schema commands pull in Jinja2 and
+    jsonschema. This class defers those imports until the command is actually
+    invoked.
     """
 
     def __init__(self, *args, lazy_subcommands=None, **kwargs):
@@ -88,11 +91,17 @@ class LazyGroup(click.Group):
     invoke_without_command=True,
     cls=LazyGroup,
     lazy_subcommands={
+        "align": ("align", "align"),
         "assess-batch": ("assess_batch", "assess_batch"),
+        "bootstrap": ("bootstrap", "bootstrap"),
+        "daemon": ("daemon", "daemon"),
         "experiment": ("experiment", "experiment"),
         "extract-skills": ("extract_skills", "extract_skills"),
         "learn": ("learn", "learn"),
+        "migrate-report": ("schema", "migrate_report"),
+        "rescore": ("rescore", "rescore"),
         "submit": ("submit", "submit"),
+        "validate-report": ("schema", "validate_report"),
     },
 )
 @click.option("--version", is_flag=True, help="Show version information")
@@ -152,15 +161,73 @@ def cli(ctx, version):
     multiple=True,
     help="Attribute ID(s) to exclude (can be specified multiple times)",
 )
-def assess(repository, verbose, output_dir, config, exclude):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of assessors to run in parallel (default: 1)",
+)
+@click.option(
+    "--previous",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Previous assessment JSON; findings whose inputs are unchanged are reused",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Profile the scan into this file: Chrome trace if it ends in .json, "
+    "otherwise cProfile stats (runs assessors sequentially)",
+)
+@click.option(
+    "--daemon",
+    "use_daemon",
+    is_flag=True,
+    help="Hand the scan to a running 'agentready daemon' (assesses in-process "
+    "if none is running)",
+)
+def assess(
+    repository,
+    verbose,
+    output_dir,
+    config,
+    exclude,
+    jobs,
+    previous,
+    profile_path,
+    use_daemon,
+):
     """Assess a repository against agent-ready criteria.
 
     REPOSITORY: Path to git repository (default: current directory)
     """
-    run_assessment(repository, verbose, output_dir, config, exclude)
+    run_assessment(
+        repository,
+        verbose,
+        output_dir,
+        config,
+        exclude,
+        jobs=jobs,
+        previous_path=previous,
+        profile_path=profile_path,
+        use_daemon=use_daemon,
+    )
 
 
-def run_assessment(repository_path, verbose, output_dir, config_path, exclude=None):
+def run_assessment(
+    repository_path,
+    verbose,
+    output_dir,
+    config_path,
+    exclude=None,
+    jobs=1,
+    previous_path=None,
+    profile_path=None,
+    use_daemon=False,
+):
     """Execute repository assessment."""
     repo_path = Path(repository_path).resolve()
 
@@ -216,9 +283,27 @@ def run_assessment(repository_path, verbose, output_dir, config_path, exclude=No
 
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Profiling needs the scan in this process
+    if use_daemon and not profile_path:
+        result = _assess_with_daemon(
+            repo_path, output_path, config_path, exclude, jobs, previous_path
+        )
+        if result is not None:
+            assessment, reports = result
+            _echo_summary(assessment, reports, verbose)
+            return
+        if verbose:
+            click.echo("No daemon running; assessing in-process\n")
+
+    # Per-file metrics keyed by blob SHA, reused by later assessments
+    try:
+        metric_cache = FileMetricCache(output_path / "cache" / "file-metrics")
+    except (OSError, RuntimeError):
+        metric_cache = None
+
     # Create scanner
     try:
-        scanner = Scanner(repo_path, config)
+        scanner = Scanner(repo_path, config, metric_cache=metric_cache)
     except ValueError as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -249,10 +334,35 @@ def run_assessment(repository_path, verbose, output_dir, config_path, exclude=No
         click.echo(f"Assessors: {len(assessors)}")
         click.echo(f"Output: {output_path}\n")
 
+    # Load previous assessment for incremental re-assessment
+    previous = None
+    if previous_path:
+        try:
+            with open(previous_path, encoding="utf-8") as f:
+                previous = Assessment.from_dict(json.load(f), repository_path=repo_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            click.echo(
+                f"Warning: Ignoring previous assessment ({e}); running full scan",
+                err=True,
+            )
+
+    # Profile the whole scan if requested
+    profiler = ScanProfiler(Path(profile_path)) if profile_path else None
+    if profiler and not profiler.trace and jobs > 1:
+        # cProfile only sees the main thread
+        jobs = 1
+
     # Run scan
     try:
         version = get_agentready_version()
-        assessment = scanner.scan(assessors, verbose=verbose, version=version)
+        with profiler or nullcontext():
+            assessment = scanner.scan(
+                assessors,
+                verbose=verbose,
+                version=version,
+                jobs=jobs,
+                previous=previous,
+            )
     except Exception as e:
         click.echo(f"Error during assessment: {str(e)}", err=True)
         if verbose:
@@ -261,44 +371,54 @@ def run_assessment(repository_path, verbose, output_dir, config_path, exclude=No
             traceback.print_exc()
         sys.exit(1)
 
-    # Generate timestamp for file naming
-    timestamp = assessment.timestamp.strftime("%Y%m%d-%H%M%S")
-
-    # Save JSON output
-    json_file = output_path / f"assessment-{timestamp}.json"
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(assessment.to_dict(), f, indent=2)
-
-    # Generate HTML report
-    html_reporter = HTMLReporter()
-    html_file = output_path / f"report-{timestamp}.html"
-    html_reporter.generate(assessment, html_file)
-
-    # Generate Markdown report
-    markdown_reporter = MarkdownReporter()
-    markdown_file = output_path / f"report-{timestamp}.md"
-    markdown_reporter.generate(assessment, markdown_file)
-
-    # Create latest symlinks
-    latest_json = output_path / "assessment-latest.json"
-    latest_html = output_path / "report-latest.html"
-    latest_md = output_path / "report-latest.md"
-
-    for latest, target in [
-        (latest_json, json_file),
-        (latest_html, html_file),
-        (latest_md, markdown_file),
-    ]:
-        if latest.exists():
-            latest.unlink()
-        try:
-            latest.symlink_to(target.name)
-        except OSError:
-            # Windows doesn't support symlinks easily, just copy
-            import shutil
+    reports = write_assessment_reports(assessment, output_path)
+    _echo_summary(
+        assessment,
+        reports,
+        verbose,
+        profile_path=profiler.output_path if profiler else None,
+    )
+
+
+def _assess_with_daemon(
+    repo_path, output_path, config_path, exclude, jobs, previous_path
+):
+    """Run the assessment on a running daemon.
+
+    Returns:
+        Tuple of (assessment, report paths), or None if no daemon is running
+        or it runs a different agentready version
+    """
+    from ..services.daemon import DaemonClient, DaemonError
+
+    client = DaemonClient()
+    status = client.status()
+    if status is None:
+        return None
+    if status.get("version") != get_agentready_version():
+        click.echo(
+            f"Warning: Daemon runs agentready {status.get('version')}; "
+            "assessing in-process (restart the daemon to use it)",
+            err=True,
+        )
+        return None
+
+    try:
+        return client.assess(
+            repo_path,
+            output_dir=output_path,
+            config_path=config_path,
+            exclude=list(exclude or []),
+            jobs=jobs,
+            previous_path=previous_path,
+        )
+    except DaemonError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
 
-            shutil.copy(target, latest)
 
+def _echo_summary(assessment, reports, verbose, profile_path=None):
+    """Print the assessment summary and report locations."""
     if verbose:
         click.echo(f"\n{'=' * 50}")
 
@@ -312,9 +432,25 @@ def run_assessment(repository_path, verbose, output_dir, config_path, exclude=No
     click.echo(f"  Skipped: {assessment.attributes_not_assessed}")
     click.echo(f"  Duration: {assessment.duration_seconds:.1f}s")
     click.echo("\nReports generated:")
-    click.echo(f"  JSON: {json_file}")
-    click.echo(f"  HTML: {html_file}")
-    click.echo(f"  Markdown: {markdown_file}")
+    click.echo(f"  JSON: {reports['json']}")
+    click.echo(f"  HTML: {reports['html']}")
+    click.echo(f"  Markdown: {reports['markdown']}")
+    if profile_path:
+        click.echo(f"  Profile: {profile_path}")
+
+    if verbose and assessment.metadata and assessment.metadata.assessor_profiles:
+        slowest = sorted(
+            assessment.metadata.assessor_profiles,
+            key=lambda p: p.wall_seconds,
+            reverse=True,
+        )[:5]
+        click.echo("\nSlowest assessors:")
+        for p in slowest:
+            click.echo(
+                f"  {p.attribute_id}: {p.wall_seconds:.2f}s wall, "
+                f"{p.cpu_seconds:.2f}s CPU, {p.files_read} files, "
+                f"{p.subprocesses} subprocesses"
+            )
 
 
 def load_config(config_path: Path) -> Config:
@@ -410,18 +546,18 @@ def generate_config():
 
 
 # Register lightweight commands (heavy commands loaded lazily via LazyGroup)
-cli.add_command(align)
-cli.add_command(bootstrap)
 cli.add_command(demo)
-cli.add_command(migrate_report)
 cli.add_command(repomix_generate)
 cli.add_command(research)
-cli.add_command(validate_report)
 # Lazy-loaded commands (not registered here):
+#   - align, bootstrap (import jinja2)
 #   - assess-batch (imports pandas)
+#   - daemon (imports jinja2 and keeps assessment state warm)
 #   - experiment (imports scipy, pandas)
 #   - extract-skills (imports anthropic)
 #   - learn (imports anthropic)
+#   - migrate-report, validate-report (import jsonschema)
+#   - rescore (imports numpy)
 #   - submit (imports github)
 
 
@@ -0,0 +1,155 @@
+"""Rescore command for what-if weightings over stored assessments."""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import click
+import numpy as np
+
+from ..services.rescoring import ScoreMatrix, certification_levels, load_candidates
+from ..services.scorer import Scorer
+
+LEVEL_ORDER = ["Platinum", "Gold", "Silver", "Bronze", "Needs Improvement"]
+
+
+@click.command()
+@click.argument("weights_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("source", type=click.Path(exists=True))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write every assessment's score and level per candidate as JSON",
+)
+@click.option(
+    "--save-matrix",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Save the packed score matrix (.npz) to pass as SOURCE next time",
+)
+@click.option(
+    "--verbose", "-v", is_flag=True, help="List the assessments that move the most"
+)
+def rescore(weights_file, source, output, save_matrix, verbose):
+    """Re-score stored assessments under candidate weightings.
+
+    WEIGHTS_FILE: YAML with a "candidates" mapping (name -> weights and/or
+    tier_weights) or an agentready config file with "weights".
+
+    SOURCE: Directory of assessment JSON files (searched recursively) or a
+    matrix saved with --save-matrix.
+
+    No repository is rescanned: findings are packed into a score matrix
+    and every candidate is scored in one vectorized pass.
+
+    \b
+    Example weights file:
+        candidates:
+          docs-heavy:
+            weights:
+              claude_md_file: 0.2
+              readme_structure: 0.15
+          tier1-60:
+            tier_weights: {1: 0.6, 2: 0.25, 3: 0.1, 4: 0.05}
+    """
+    try:
+        candidates = load_candidates(Path(weights_file))
+    except (OSError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    source_path = Path(source)
+    start = time.perf_counter()
+    if source_path.is_file():
+        try:
+            matrix = ScoreMatrix.load(source_path)
+        except (OSError, ValueError, KeyError) as e:
+            click.echo(f"Error: Cannot read score matrix {source_path}: {e}", err=True)
+            sys.exit(1)
+    else:
+        matrix = ScoreMatrix.from_directory(source_path)
+    load_seconds = time.perf_counter() - start
+
+    if not len(matrix):
+        click.echo(f"Error: No assessment JSON files found in {source_path}", err=True)
+        sys.exit(1)
+
+    if save_matrix:
+        matrix.save(Path(save_matrix))
+        click.echo(f"Saved score matrix to {save_matrix}")
+
+    start = time.perf_counter()
+    scorer = Scorer()
+    weights = np.vstack([matrix.weight_vector(c, scorer) for c in candidates])
+    scores = matrix.rescore(weights)
+    levels = certification_levels(scores)
+    rescore_seconds = time.perf_counter() - start
+
+    stored_levels = certification_levels(matrix.stored_scores)
+
+    click.echo(
+        f"Loaded {len(matrix):,} assessments ({len(matrix.attributes)} attributes) "
+        f"in {load_seconds:.2f}s"
+    )
+    click.echo(
+        f"Scored {len(candidates)} candidate(s) in {rescore_seconds * 1000:.1f}ms\n"
+    )
+
+    for i, candidate in enumerate(candidates):
+        click.echo(f"{candidate.name}:")
+        click.echo(
+            f"  Mean: {scores[i].mean():.1f}  Median: {np.median(scores[i]):.1f}  "
+            f"Change vs stored: {(scores[i] - matrix.stored_scores).mean():+.1f}"
+        )
+        counts = {level: int((levels[i] == level).sum()) for level in LEVEL_ORDER}
+        click.echo(
+            "  Levels: " + ", ".join(f"{level} {n}" for level, n in counts.items())
+        )
+        changed = int((levels[i] != stored_levels).sum())
+        click.echo(f"  Level changes vs stored: {changed}")
+
+        if verbose:
+            deltas = scores[i] - matrix.stored_scores
+            for row in np.argsort(-np.abs(deltas))[:5]:
+                if deltas[row] == 0:
+                    break
+                click.echo(
+                    f"    {matrix.repositories[row]}: "
+                    f"{matrix.stored_scores[row]:.1f} -> {scores[i][row]:.1f} "
+                    f"({stored_levels[row]} -> {levels[i][row]})"
+                )
+
+    if output:
+        results = {
+            "candidates": [
+                {
+                    "name": candidate.name,
+                    "weights": candidate.weights,
+                    "tier_weights": candidate.tier_weights,
+                }
+                for candidate in candidates
+            ],
+            "assessments": [
+                {
+                    "source": matrix.sources[row],
+                    "repository": matrix.repositories[row],
+                    "stored_score": float(matrix.stored_scores[row]),
+                    "scores": {
+                        candidate.name: {
+                            "score": float(scores[i][row]),
+                            "certification_level": levels[i][row],
+                        }
+                        for i, candidate in enumerate(candidates)
+                    },
+                }
+                for row in range(len(matrix))
+            ],
+        }
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        click.echo(f"\nResults written to {output_path}")
@@ -3,14 +3,22 @@
 from .code_sampler import CodeSampler
 from .llm_enricher import LLMEnricher
 from .pattern_extractor import PatternExtractor
-from .prompt_templates import CODE_SAMPLING_GUIDANCE, PATTERN_EXTRACTION_PROMPT
+from .prompt_templates import (
+    CODE_SAMPLING_GUIDANCE,
+    PATTERN_EXTRACTION_PROMPT,
+    PROMPT_TEMPLATE_VERSION,
+)
+from .skill_aggregator import SkillAggregator, SkillExemplar
 from .skill_generator import SkillGenerator
 
 __all__ = [
     "CodeSampler",
     "LLMEnricher",
     "PatternExtractor",
+    "SkillAggregator",
+    "SkillExemplar",
     "SkillGenerator",
     "PATTERN_EXTRACTION_PROMPT",
     "CODE_SAMPLING_GUIDANCE",
+    "PROMPT_TEMPLATE_VERSION",
 ]
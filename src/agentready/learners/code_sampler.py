@@ -1,15 +1,29 @@
 """Smart code sampling from repositories for LLM analysis."""
 
+import ast
+import hashlib
 import logging
+import math
+import re
+from fnmatch import fnmatchcase
 from pathlib import Path
 
 from agentready.models import Finding, Repository
+from agentready.services.file_index import FileIndex, IndexedFile
 
 logger = logging.getLogger(__name__)
 
 
 class CodeSampler:
-    """Extracts relevant code samples from repository for LLM analysis."""
+    """Extracts relevant code samples from repository for LLM analysis.
+
+    Samples are chosen to fit a token budget. Candidate files are ranked
+    by relevance to the finding (files named in its evidence first, then
+    pattern order, depth, size and recency), near-duplicates are dropped,
+    and large files are reduced to their most informative regions:
+    signatures and docstrings for Python, headings for Markdown, sections
+    for config files.
+    """
 
     # Mapping of attribute IDs to file patterns to sample
     ATTRIBUTE_FILE_PATTERNS = {
@@ -35,8 +49,41 @@ class CodeSampler:
         "gitignore": [".gitignore"],
     }
 
+    # Default prompt budget for all samples of one finding
+    DEFAULT_TOKEN_BUDGET = 3000
+
+    # Rough token estimate for source text (no tokenizer dependency)
+    CHARS_PER_TOKEN = 4
+
+    # Files are not split below this allowance; smaller leftovers are unused
+    MIN_FILE_TOKENS = 100
+
+    # Candidates read per sample slot, after ranking on metadata alone
+    CANDIDATES_PER_FILE = 4
+
+    # Files larger than this (in estimated tokens) rank lower
+    PREFERRED_FILE_TOKENS = 1000
+
+    # Line-set overlap above which a file counts as a near-duplicate
+    DUPLICATE_SIMILARITY = 0.8
+
+    # Bytes inspected when sniffing for binary content
+    BINARY_SNIFF_BYTES = 8192
+
+    # Lines kept under each config section or Markdown heading
+    SECTION_LINES = 5
+
+    CONFIG_SUFFIXES = {".toml", ".ini", ".cfg"}
+    CONFIG_NAMES = {".coveragerc", ".editorconfig", ".flake8", ".pylintrc"}
+    YAML_SUFFIXES = {".yml", ".yaml"}
+    MARKDOWN_SUFFIXES = {".md", ".markdown", ".rst"}
+
     def __init__(
-        self, repository: Repository, max_files: int = 5, max_lines_per_file: int = 100
+        self,
+        repository: Repository,
+        max_files: int = 5,
+        max_lines_per_file: int = 100,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
     ):
         """Initialize code sampler.
 
@@ -44,10 +91,20 @@ class CodeSampler:
             repository: Repository to sample from
             max_files: Maximum number of files to include
             max_lines_per_file: Maximum lines per file to prevent token overflow
+            token_budget: Estimated tokens allowed for all samples together
         """
         self.repository = repository
         self.max_files = max_files
         self.max_lines_per_file = max_lines_per_file
+        self.token_budget = token_budget
+        self._file_index: FileIndex | None = None
+
+    @property
+    def file_index(self) -> FileIndex:
+        """Index of repository files, built on first use and reused."""
+        if self._file_index is None:
+            self._file_index = FileIndex.build(self.repository.path)
+        return self._file_index
 
     def get_relevant_code(self, finding: Finding) -> str:
         """Get relevant code samples for a finding.
@@ -65,24 +122,87 @@ class CodeSampler:
             logger.warning(f"No file patterns defined for {attribute_id}")
             return "No code samples available"
 
-        # Collect files matching patterns
-        files_to_sample = []
-        for pattern in patterns:
-            if pattern.endswith("/"):
-                # Directory listing
-                files_to_sample.append(self._get_directory_tree(pattern))
-            else:
-                # File pattern
-                matching_files = list(self.repository.path.glob(pattern))
-                files_to_sample.extend(matching_files[: self.max_files])
+        # Directory listings come first, then files in order of relevance
+        files_to_sample = [
+            self._get_directory_tree(pattern)
+            for pattern in patterns
+            if pattern.endswith("/")
+        ]
+        file_patterns = [p for p in patterns if not p.endswith("/")]
+        if file_patterns:
+            ranked = self._rank_candidates(file_patterns, finding.evidence or [])
+            files_to_sample.extend(
+                self.file_index.absolute_path(entry)
+                for entry in ranked[: self.max_files * self.CANDIDATES_PER_FILE]
+            )
 
         # Format as string
         return self._format_code_samples(files_to_sample)
 
+    def _rank_candidates(
+        self, patterns: list[str], evidence: list[str]
+    ) -> list[IndexedFile]:
+        """Rank files matching the patterns by relevance to the evidence.
+
+        Only index metadata is used, so no file is read to rank it.
+
+        Args:
+            patterns: File patterns, most specific first
+            evidence: Evidence strings of the finding
+
+        Returns:
+            Matching non-empty files, most relevant first
+        """
+        evidence_text = "\n".join(evidence)
+        candidates = []
+        for entry in self.file_index:
+            pattern_rank = next(
+                (
+                    rank
+                    for rank, pattern in enumerate(patterns)
+                    if self._matches(entry.path, pattern)
+                ),
+                None,
+            )
+            if pattern_rank is not None and entry.size > 0:
+                candidates.append((entry, pattern_rank))
+        if not candidates:
+            return []
+
+        oldest = min(entry.mtime for entry, _ in candidates)
+        newest = max(entry.mtime for entry, _ in candidates)
+
+        def relevance(candidate: tuple[IndexedFile, int]) -> float:
+            entry, pattern_rank = candidate
+            score = 0.0
+            if entry.path in evidence_text or entry.name in evidence_text:
+                score += 100
+            score -= 10 * pattern_rank
+            score -= 2 * (len(entry.parts) - 1)
+            # Penalize files far from a useful size, in either direction
+            tokens = entry.size / self.CHARS_PER_TOKEN
+            score -= abs(math.log2(tokens / self.PREFERRED_FILE_TOKENS))
+            if newest > oldest:
+                score += 2 * (entry.mtime - oldest) / (newest - oldest)
+            return score
+
+        candidates.sort(key=lambda c: (-relevance(c), c[0].path))
+        return [entry for entry, _ in candidates]
+
+    @staticmethod
+    def _matches(path: str, pattern: str) -> bool:
+        """Match a repository-relative path against a glob pattern."""
+        if pattern.startswith("**/"):
+            # Any depth, including the repository root
+            return fnmatchcase(path, pattern) or fnmatchcase(path, pattern[3:])
+        return fnmatchcase(path, pattern)
+
     def _get_directory_tree(self, dir_pattern: str) -> dict:
         """Get directory tree structure."""
-        base_path = self.repository.path / dir_pattern.rstrip("/")
-        if not base_path.exists():
+        # "**/" lists the repository root
+        rel_dir = dir_pattern.rstrip("/").replace("**", "") or "."
+        base_path = self.repository.path / rel_dir
+        if not base_path.is_dir():
             return {}
 
         tree = {
@@ -91,43 +211,238 @@ class CodeSampler:
             "children": [],
         }
 
-        for item in base_path.iterdir():
+        for item in sorted(base_path.iterdir()):
             if item.is_file():
                 tree["children"].append({"type": "file", "name": item.name})
-            elif item.is_dir() and not item.name.startswith("."):
+            elif (
+                item.is_dir()
+                and not item.name.startswith(".")
+                and item.name not in FileIndex.EXCLUDED_DIRS
+            ):
                 tree["children"].append({"type": "directory", "name": item.name})
 
         return tree
 
     def _format_code_samples(self, files: list) -> str:
-        """Format files as readable code samples."""
+        """Format files as readable code samples within the token budget.
+
+        Args:
+            files: Directory trees and file paths, most relevant first
+
+        Returns:
+            Formatted samples; files that duplicate an earlier sample, are
+            binary or do not fit the remaining budget are left out
+        """
         samples = []
+        remaining = self.token_budget
+        included_files = 0
+        seen_hashes: set[str] = set()
+        seen_lines: list[set[str]] = []
+
+        for position, file_item in enumerate(files):
+            if remaining < self.MIN_FILE_TOKENS:
+                break
 
-        for file_item in files[: self.max_files]:
             if isinstance(file_item, dict):
                 # Directory tree
-                samples.append(f"## Directory Structure: {file_item['path']}\n")
-                samples.append(self._format_tree(file_item))
+                if not file_item:
+                    continue
+                sample = (
+                    f"## Directory Structure: {file_item['path']}\n"
+                    f"\n{self._format_tree(file_item)}"
+                )
+                sample = self._fit_to_budget(sample.splitlines(), remaining)
+                samples.append(sample)
+                remaining -= self._estimate_tokens(sample)
+
             elif isinstance(file_item, Path):
-                # Regular file
-                try:
-                    rel_path = file_item.relative_to(self.repository.path)
-                    content = file_item.read_text(encoding="utf-8", errors="ignore")
+                if included_files >= self.max_files:
+                    continue
+                content = self._read_text(file_item)
+                if not content:
+                    continue
 
-                    # Truncate if too long
-                    lines = content.splitlines()
-                    if len(lines) > self.max_lines_per_file:
-                        lines = lines[: self.max_lines_per_file]
-                        lines.append("... (truncated)")
+                # Skip exact and near-duplicate content
+                normalized = {
+                    " ".join(line.split()) for line in content.splitlines()
+                } - {""}
+                digest = hashlib.sha256(
+                    "\n".join(sorted(normalized)).encode("utf-8")
+                ).hexdigest()
+                if digest in seen_hashes or any(
+                    self._similarity(normalized, other) >= self.DUPLICATE_SIMILARITY
+                    for other in seen_lines
+                ):
+                    logger.debug(f"Skipping near-duplicate sample {file_item}")
+                    continue
+                seen_hashes.add(digest)
+                seen_lines.append(normalized)
 
-                    samples.append(f"## File: {rel_path}\n")
-                    samples.append("```\n" + "\n".join(lines) + "\n```\n")
+                # Share what is left between the remaining sample slots
+                slots = min(
+                    self.max_files - included_files,
+                    sum(isinstance(f, Path) for f in files[position:]),
+                )
+                allowance = max(self.MIN_FILE_TOKENS, remaining // max(slots, 1))
+                allowance = min(allowance, remaining)
 
-                except Exception as e:
-                    logger.warning(f"Could not read {file_item}: {e}")
+                rel_path = file_item.relative_to(self.repository.path)
+                sample = self._format_file(rel_path, content, allowance)
+                samples.append(sample)
+                remaining -= self._estimate_tokens(sample)
+                included_files += 1
 
         return "\n".join(samples) if samples else "No code samples available"
 
+    def _format_file(self, rel_path: Path, content: str, allowance: int) -> str:
+        """Format one file, reduced to its key regions if it is too long.
+
+        Args:
+            rel_path: Repository-relative path of the file
+            content: File content
+            allowance: Estimated tokens available for this sample
+
+        Returns:
+            Markdown sample with a header and fenced content
+        """
+        lines = content.splitlines()
+        header = f"## File: {rel_path}\n"
+        fits = (
+            len(lines) <= self.max_lines_per_file
+            and self._estimate_tokens(content) <= allowance
+        )
+        if not fits:
+            regions = self._extract_regions(rel_path, content)
+            if regions is not None:
+                lines = regions
+                header = f"## File: {rel_path} (key regions)\n"
+
+        if len(lines) > self.max_lines_per_file:
+            lines = lines[: self.max_lines_per_file] + ["... (truncated)"]
+        body = self._fit_to_budget(
+            lines, allowance - self._estimate_tokens(header + "```\n```\n")
+        )
+        return f"{header}```\n{body}\n```\n"
+
+    def _extract_regions(self, rel_path: Path, content: str) -> list[str] | None:
+        """Extract the most informative lines of a file.
+
+        Returns:
+            Lines to sample, or None to sample the head of the file
+        """
+        suffix = rel_path.suffix.lower()
+        if suffix == ".py":
+            return self._python_outline(content)
+        if suffix in self.MARKDOWN_SUFFIXES:
+            return self._section_outline(content, r"^#{1,6} ")
+        if suffix in self.CONFIG_SUFFIXES or rel_path.name in self.CONFIG_NAMES:
+            return self._section_outline(content, r"^\s*\[[^\]]+\]\s*$")
+        if suffix in self.YAML_SUFFIXES:
+            # Keep the top two nesting levels and the first line of list
+            # items (workflow steps, hooks) at any depth
+            return [
+                line
+                for line in content.splitlines()
+                if line.strip()
+                and not line.lstrip().startswith("#")
+                and (
+                    len(line) - len(line.lstrip()) <= 4
+                    or line.lstrip().startswith("- ")
+                )
+            ]
+        return None
+
+    def _python_outline(self, content: str) -> list[str] | None:
+        """Outline of a Python module: docstrings, imports and signatures."""
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return None
+
+        source = content.splitlines()
+        outline = []
+
+        def add_docstring(node, indent: str):
+            docstring = ast.get_docstring(node)
+            if docstring:
+                first_line = docstring.strip().splitlines()[0]
+                outline.append(f'{indent}"""{first_line}"""')
+
+        def add_definitions(body, indent: str):
+            for node in body:
+                if isinstance(
+                    node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+                ):
+                    start = (
+                        node.decorator_list[0].lineno
+                        if node.decorator_list
+                        else node.lineno
+                    )
+                    # Decorators and signature: the lines before the body
+                    end = max(node.body[0].lineno - 1, node.lineno)
+                    outline.extend(source[start - 1 : end])
+                    add_docstring(node, indent + "    ")
+                    if isinstance(node, ast.ClassDef):
+                        add_definitions(node.body, indent + "    ")
+                    else:
+                        outline.append(f"{indent}    ...")
+                elif isinstance(node, (ast.Import, ast.ImportFrom)) and not indent:
+                    outline.extend(source[node.lineno - 1 : node.end_lineno])
+
+        add_docstring(tree, "")
+        add_definitions(tree.body, "")
+        return outline or None
+
+    def _section_outline(self, content: str, heading_pattern: str) -> list[str]:
+        """Headings or section headers with the first lines under each."""
+        heading = re.compile(heading_pattern)
+        outline = []
+        kept = self.SECTION_LINES
+        for line in content.splitlines():
+            if heading.match(line):
+                outline.append(line)
+                kept = 0
+            elif line.strip() and kept < self.SECTION_LINES:
+                outline.append(line)
+                kept += 1
+        return outline
+
+    def _fit_to_budget(self, lines: list[str], tokens: int) -> str:
+        """Join lines, truncating once the estimated tokens are used up."""
+        kept = []
+        used = 0
+        for line in lines:
+            cost = self._estimate_tokens(line + "\n")
+            if used + cost > tokens:
+                kept.append("... (truncated)")
+                break
+            kept.append(line)
+            used += cost
+        return "\n".join(kept)
+
+    def _read_text(self, path: Path) -> str | None:
+        """Read a text file; None if unreadable or binary."""
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Could not read {path}: {e}")
+            return None
+        if b"\0" in data[: self.BINARY_SNIFF_BYTES]:
+            return None
+        return data.decode("utf-8", errors="ignore")
+
+    @classmethod
+    def _estimate_tokens(cls, text: str) -> int:
+        """Estimate the token count of text."""
+        return math.ceil(len(text) / cls.CHARS_PER_TOKEN)
+
+    @staticmethod
+    def _similarity(a: set[str], b: set[str]) -> float:
+        """Jaccard similarity of two line sets."""
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
+
     def _format_tree(self, tree: dict, indent: int = 0) -> str:
         """Format directory tree as text."""
         lines = []
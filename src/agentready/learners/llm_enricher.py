@@ -3,28 +3,44 @@
 import hashlib
 import json
 import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import sleep
-
-from anthropic import Anthropic, APIError, RateLimitError
+from typing import TYPE_CHECKING
 
 from agentready.models import DiscoveredSkill, Finding, Repository
 from agentready.services.llm_cache import LLMCache
+from agentready.utils.rate_limiter import TokenBucket
 
 from .code_sampler import CodeSampler
-from .prompt_templates import PATTERN_EXTRACTION_PROMPT
+from .prompt_templates import PATTERN_EXTRACTION_PROMPT, PROMPT_TEMPLATE_VERSION
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
 
 logger = logging.getLogger(__name__)
 
+# Request pacing and retry policy
+DEFAULT_REQUESTS_PER_MINUTE = 50
+DEFAULT_WORKERS = 4
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+REQUEST_TIMEOUT_SECONDS = 120.0
+
 
 class LLMEnricher:
     """Enriches discovered skills using Claude API."""
 
     def __init__(
         self,
-        client: Anthropic,
+        client: "Anthropic",
         cache_dir: Path | None = None,
         model: str = "claude-sonnet-4-5-20250929",
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        max_retries: int = MAX_RETRIES,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
     ):
         """Initialize LLM enricher.
 
@@ -32,11 +48,122 @@ class LLMEnricher:
             client: Anthropic API client
             cache_dir: Cache directory (default: .agentready/llm-cache)
             model: Claude model to use
+            requests_per_minute: API request rate shared by all workers
+            max_retries: Retries after a rate limit before giving up on a skill
+            timeout: Seconds allowed for each API request
         """
         self.client = client
         self.model = model
         self.cache = LLMCache(cache_dir or Path(".agentready/llm-cache"))
         self.code_sampler = None  # Set per-repository
+        self.max_retries = max_retries
+        self.timeout = timeout
+        # Allow a burst of one request per worker, then pace to the rate
+        self.rate_limiter = TokenBucket(
+            requests_per_minute / 60, capacity=DEFAULT_WORKERS
+        )
+
+    def enrich_skills(
+        self,
+        skills: list[tuple[DiscoveredSkill, Finding]],
+        repository: Repository,
+        use_cache: bool = True,
+        max_workers: int = DEFAULT_WORKERS,
+    ) -> list[DiscoveredSkill]:
+        """Enrich several skills of one repository concurrently.
+
+        Args:
+            skills: (skill, finding that generated it) pairs
+            repository: Repository being assessed
+            use_cache: Whether to use cached responses
+            max_workers: Maximum concurrent API requests
+
+        Returns:
+            Enriched skills in input order; a skill whose enrichment fails
+            is returned unchanged
+        """
+        return self.enrich_many(
+            [(skill, finding, repository) for skill, finding in skills],
+            use_cache=use_cache,
+            max_workers=max_workers,
+        )
+
+    def enrich_many(
+        self,
+        items: list[tuple[DiscoveredSkill, Finding, Repository]],
+        use_cache: bool = True,
+        max_workers: int = DEFAULT_WORKERS,
+    ) -> list[DiscoveredSkill]:
+        """Enrich skills concurrently, each with its own source repository.
+
+        Cached enrichments for all skills are fetched in one lookup first;
+        API requests for the rest share this enricher's rate limiter. Each
+        enriched skill is cached as soon as it completes, so an interrupted
+        run resumes from the cache and only calls the API for skills not yet
+        enriched.
+
+        Args:
+            items: (skill, finding that generated it, repository of the
+                finding) triples
+            use_cache: Whether to use cached responses
+            max_workers: Maximum concurrent API requests
+
+        Returns:
+            Enriched skills in input order; a skill whose enrichment fails
+            is returned unchanged
+        """
+        if not items:
+            return []
+
+        cache_keys = [self.cache_key(skill, finding) for skill, finding, _ in items]
+        cached = self.cache.get_many(cache_keys) if use_cache else {}
+        if cached:
+            logger.info(f"Using cached enrichment for {len(cached)} skill(s)")
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                (
+                    None
+                    if cache_key in cached
+                    else executor.submit(
+                        self._enrich_uncached,
+                        skill,
+                        repository,
+                        finding,
+                        cache_key if use_cache else None,
+                    )
+                )
+                for (skill, finding, repository), cache_key in zip(items, cache_keys)
+            ]
+
+            enriched_skills = []
+            for (skill, _, _), cache_key, future in zip(items, cache_keys, futures):
+                if future is None:
+                    enriched_skills.append(cached[cache_key])
+                    continue
+                try:
+                    enriched_skills.append(future.result())
+                except Exception as e:
+                    logger.warning(f"Enrichment failed for {skill.skill_id}: {e}")
+                    enriched_skills.append(skill)  # Fallback to original
+
+        return enriched_skills
+
+    def cache_key(self, skill: DiscoveredSkill, finding: Finding) -> str:
+        """Cache key for a skill's enrichment.
+
+        Covers the finding's score and evidence, the model and the prompt
+        template version.
+        """
+        evidence_str = "".join(finding.evidence) if finding.evidence else ""
+        evidence_hash = hashlib.sha256(evidence_str.encode()).hexdigest()[:16]
+        return LLMCache.generate_key(
+            skill.skill_id,
+            finding.score,
+            evidence_hash,
+            self.model,
+            PROMPT_TEMPLATE_VERSION,
+        )
 
     def enrich_skill(
         self,
@@ -56,10 +183,7 @@ class LLMEnricher:
         Returns:
             Enriched DiscoveredSkill with LLM-generated content
         """
-        # Generate cache key
-        evidence_str = "".join(finding.evidence) if finding.evidence else ""
-        evidence_hash = hashlib.sha256(evidence_str.encode()).hexdigest()[:16]
-        cache_key = LLMCache.generate_key(skill.skill_id, finding.score, evidence_hash)
+        cache_key = self.cache_key(skill, finding)
 
         # Check cache first
         if use_cache:
@@ -68,50 +192,110 @@ class LLMEnricher:
                 logger.info(f"Using cached enrichment for {skill.skill_id}")
                 return cached
 
-        # Initialize code sampler for this repository
-        self.code_sampler = CodeSampler(repository)
+        return self._enrich_uncached(
+            skill, repository, finding, cache_key if use_cache else None
+        )
+
+    def _enrich_uncached(
+        self,
+        skill: DiscoveredSkill,
+        repository: Repository,
+        finding: Finding,
+        cache_key: str | None,
+    ) -> DiscoveredSkill:
+        """Enrich a skill through the API, caching the result under cache_key.
+
+        Returns:
+            Enriched skill, or the original skill if enrichment fails
+        """
+        # Imported here: the SDK takes over a second to load, and only
+        # enrichment needs it
+        from anthropic import APIError, RateLimitError
+
+        # Reuse the code sampler (and its file index) across skills of the
+        # same repository; kept local since skills are enriched concurrently
+        code_sampler = self.code_sampler
+        if code_sampler is None or code_sampler.repository.path != repository.path:
+            code_sampler = CodeSampler(repository)
+            self.code_sampler = code_sampler
 
         # Get relevant code samples
-        code_samples = self.code_sampler.get_relevant_code(finding)
+        code_samples = code_sampler.get_relevant_code(finding)
+
+        # Call Claude API, retrying rate limits with bounded backoff
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                enrichment_data = self._call_claude_api(
+                    skill, finding, repository, code_samples
+                )
+
+                # Merge enrichment into skill
+                enriched_skill = self._merge_enrichment(skill, enrichment_data)
+
+                # Cache result
+                if cache_key:
+                    self.cache.set(cache_key, enriched_skill)
+
+                logger.info(f"Successfully enriched {skill.skill_id}")
+                return enriched_skill
+
+            except RateLimitError as e:
+                if attempt == self.max_retries:
+                    logger.error(
+                        f"Rate limit persisted for {skill.skill_id} after "
+                        f"{attempt + 1} attempts, keeping heuristic skill"
+                    )
+                    return skill
+                delay = self._backoff_delay(attempt, e)
+                logger.warning(
+                    f"Rate limit hit for {skill.skill_id}, "
+                    f"retrying in {delay:.1f} seconds..."
+                )
+                sleep(delay)
+
+            except APIError as e:
+                # Security: Sanitize error message to prevent API key exposure
+                error_msg = str(e)
+                # Anthropic errors shouldn't contain keys, but sanitize to be safe
+                safe_error = error_msg if len(error_msg) < 200 else error_msg[:200]
+                logger.error(f"API error enriching {skill.skill_id}: {safe_error}")
+                return skill  # Fallback to original heuristic skill
+
+            except Exception as e:
+                # Security: Sanitize generic errors that might expose sensitive data
+                error_msg = str(e)
+                safe_error = error_msg if len(error_msg) < 200 else error_msg[:200]
+                logger.error(
+                    f"Unexpected error enriching {skill.skill_id}: {safe_error}"
+                )
+                return skill  # Fallback to original heuristic skill
+
+        return skill
+
+    @staticmethod
+    def _backoff_delay(attempt: int, error: Exception) -> float:
+        """Seconds to wait before retrying after a rate limit.
+
+        Exponential backoff with full jitter, so concurrent workers do not
+        retry in lockstep. A retry-after from the API is honored as a
+        minimum. Both are capped at MAX_BACKOFF_SECONDS.
+        """
+        delay = random.uniform(
+            0, min(MAX_BACKOFF_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+        )
 
-        # Call Claude API
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None:
+            response = getattr(error, "response", None)
+            headers = getattr(response, "headers", None) or {}
+            retry_after = headers.get("retry-after")
         try:
-            enrichment_data = self._call_claude_api(
-                skill, finding, repository, code_samples
-            )
+            delay = max(delay, float(retry_after))
+        except (TypeError, ValueError):
+            pass
 
-            # Merge enrichment into skill
-            enriched_skill = self._merge_enrichment(skill, enrichment_data)
-
-            # Cache result
-            if use_cache:
-                self.cache.set(cache_key, enriched_skill)
-
-            logger.info(f"Successfully enriched {skill.skill_id}")
-            return enriched_skill
-
-        except RateLimitError as e:
-            logger.warning(f"Rate limit hit for {skill.skill_id}: {e}")
-            # Exponential backoff
-            retry_after = int(getattr(e, "retry_after", 60))
-            logger.info(f"Retrying after {retry_after} seconds...")
-            sleep(retry_after)
-            return self.enrich_skill(skill, repository, finding, use_cache)
-
-        except APIError as e:
-            # Security: Sanitize error message to prevent API key exposure
-            error_msg = str(e)
-            # Anthropic errors shouldn't contain keys, but sanitize to be safe
-            safe_error = error_msg if len(error_msg) < 200 else error_msg[:200]
-            logger.error(f"API error enriching {skill.skill_id}: {safe_error}")
-            return skill  # Fallback to original heuristic skill
-
-        except Exception as e:
-            # Security: Sanitize generic errors that might expose sensitive data
-            error_msg = str(e)
-            safe_error = error_msg if len(error_msg) < 200 else error_msg[:200]
-            logger.error(f"Unexpected error enriching {skill.skill_id}: {safe_error}")
-            return skill  # Fallback to original heuristic skill
+        return min(delay, MAX_BACKOFF_SECONDS)
 
     def _call_claude_api(
         self,
@@ -152,6 +336,7 @@ class LLMEnricher:
             model=self.model,
             max_tokens=4096,
             messages=[{"role": "user", "content": prompt}],
+            timeout=self.timeout,
         )
 
         # Parse response
@@ -50,11 +50,16 @@ class PatternExtractor:
         },
     }
 
-    def __init__(self, assessment: Assessment, min_score: float = MIN_SCORE_THRESHOLD):
+    def __init__(
+        self,
+        assessment: Assessment | None = None,
+        min_score: float = MIN_SCORE_THRESHOLD,
+    ):
         """Initialize pattern extractor.
 
         Args:
-            assessment: The assessment to extract patterns from
+            assessment: The assessment to extract patterns from; may be None
+                when findings are passed to extract_from_findings directly
             min_score: Minimum finding score to consider (default: 80.0)
         """
         self.assessment = assessment
@@ -66,18 +71,7 @@ class PatternExtractor:
         Returns:
             List of discovered skills, sorted by confidence (highest first)
         """
-        discovered_skills = []
-
-        for finding in self.assessment.findings:
-            if self._should_extract_pattern(finding):
-                skill = self._create_skill_from_finding(finding)
-                if skill:
-                    discovered_skills.append(skill)
-
-        # Sort by confidence descending
-        discovered_skills.sort(key=lambda s: s.confidence, reverse=True)
-
-        return discovered_skills
+        return self.extract_from_findings(self.assessment.findings)
 
     def extract_specific_patterns(
         self, attribute_ids: list[str]
@@ -90,13 +84,28 @@ class PatternExtractor:
         Returns:
             List of discovered skills for specified attributes
         """
+        return self.extract_from_findings(self.assessment.findings, attribute_ids)
+
+    def extract_from_findings(
+        self,
+        findings: list[Finding],
+        attribute_ids: list[str] | None = None,
+    ) -> list[DiscoveredSkill]:
+        """Extract patterns from a list of findings.
+
+        Args:
+            findings: Findings to extract patterns from
+            attribute_ids: Optional attribute IDs to restrict extraction to
+
+        Returns:
+            List of discovered skills, sorted by confidence (highest first)
+        """
         discovered_skills = []
 
-        for finding in self.assessment.findings:
-            if (
-                finding.attribute.attribute_id in attribute_ids
-                and self._should_extract_pattern(finding)
-            ):
+        for finding in findings:
+            if attribute_ids and finding.attribute.id not in attribute_ids:
+                continue
+            if self._should_extract_pattern(finding):
                 skill = self._create_skill_from_finding(finding)
                 if skill:
                     discovered_skills.append(skill)
@@ -1,5 +1,7 @@
 """Prompt templates for LLM-powered pattern extraction."""
 
+import hashlib
+
 PATTERN_EXTRACTION_PROMPT = """You are analyzing a high-scoring repository to extract a reusable pattern as a Claude Code skill.
 
 ## Context
@@ -98,3 +100,9 @@ CODE_SAMPLING_GUIDANCE = """When selecting code samples to analyze:
 
 Limit to 3-5 files, max 100 lines per file to stay under token limits.
 """
+
+# Part of every LLM cache key. Derived from the template text, so editing a
+# prompt invalidates cached enrichments without a manual version bump.
+PROMPT_TEMPLATE_VERSION = hashlib.sha256(
+    (PATTERN_EXTRACTION_PROMPT + CODE_SAMPLING_GUIDANCE).encode("utf-8")
+).hexdigest()[:12]
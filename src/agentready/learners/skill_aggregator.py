@@ -0,0 +1,159 @@
+"""Aggregation of discovered skills across many repositories."""
+
+from dataclasses import dataclass, replace
+
+from agentready.models import DiscoveredSkill, Finding
+
+# Finding statuses where an attribute was actually measured
+ASSESSED_STATUSES = ("pass", "fail")
+
+
+@dataclass
+class SkillExemplar:
+    """One repository's instance of a discovered skill.
+
+    Attributes:
+        repository: Repository section of the assessment (Repository.to_dict)
+        finding: Finding the skill was extracted from
+        skill: Skill as extracted from this repository
+    """
+
+    repository: dict
+    finding: Finding
+    skill: DiscoveredSkill
+
+
+class SkillAggregator:
+    """Merges skills discovered in many repositories into one set.
+
+    Repositories are added one at a time and only per-skill counters and the
+    best few exemplars are kept, so memory does not grow with the batch.
+
+    Each skill ID appears once in the result, built from its best exemplar
+    (highest confidence, then most evidence), with:
+
+    - reusability_score: prevalence, the percentage of repositories that
+      assessed the source attribute (pass or fail) in which the skill was
+      found
+    - confidence: mean exemplar confidence, weighted by support: the mean is
+      shrunk toward PRIOR_CONFIDENCE as if PRIOR_REPOSITORIES more
+      repositories had scored it, so a pattern seen in many repositories
+      outranks one seen once with a perfect score
+    """
+
+    # Best exemplars kept per skill
+    MAX_EXEMPLARS = 3
+
+    # Support weighting of aggregated confidence
+    PRIOR_CONFIDENCE = 50.0
+    PRIOR_REPOSITORIES = 1
+
+    def __init__(self, max_exemplars: int = MAX_EXEMPLARS):
+        """Initialize aggregator.
+
+        Args:
+            max_exemplars: Best exemplars to keep per skill
+        """
+        self.max_exemplars = max_exemplars
+        self.repository_count = 0
+        self._assessed: dict[str, int] = {}
+        self._found: dict[str, int] = {}
+        self._confidence_sums: dict[str, float] = {}
+        self._exemplars: dict[str, list[SkillExemplar]] = {}
+
+    def add(
+        self,
+        repository: dict,
+        findings: list[Finding],
+        skills: list[DiscoveredSkill],
+    ) -> None:
+        """Add the skills discovered in one repository.
+
+        Args:
+            repository: Repository section of the assessment
+            findings: All findings of the assessment
+            skills: Skills extracted from those findings
+        """
+        self.repository_count += 1
+
+        for attribute_id in {
+            f.attribute.id for f in findings if f.status in ASSESSED_STATUSES
+        }:
+            self._assessed[attribute_id] = self._assessed.get(attribute_id, 0) + 1
+
+        findings_by_attribute: dict[str, Finding] = {}
+        for finding in findings:
+            findings_by_attribute.setdefault(finding.attribute.id, finding)
+
+        # A repository counts once per skill, with its best instance
+        best: dict[str, DiscoveredSkill] = {}
+        for skill in skills:
+            current = best.get(skill.skill_id)
+            if current is None or skill.confidence > current.confidence:
+                best[skill.skill_id] = skill
+
+        for skill_id, skill in best.items():
+            finding = findings_by_attribute.get(skill.source_attribute_id)
+            if finding is None:
+                continue
+
+            self._found[skill_id] = self._found.get(skill_id, 0) + 1
+            self._confidence_sums[skill_id] = (
+                self._confidence_sums.get(skill_id, 0.0) + skill.confidence
+            )
+
+            exemplars = self._exemplars.setdefault(skill_id, [])
+            exemplars.append(SkillExemplar(repository, finding, skill))
+            exemplars.sort(key=self._exemplar_rank, reverse=True)
+            del exemplars[self.max_exemplars :]
+
+    @staticmethod
+    def _exemplar_rank(exemplar: SkillExemplar) -> tuple[float, int]:
+        """Rank exemplars by confidence, then amount of evidence."""
+        return exemplar.skill.confidence, len(exemplar.finding.evidence or [])
+
+    def repositories_with(self, skill_id: str) -> int:
+        """Number of repositories in which a skill was found."""
+        return self._found.get(skill_id, 0)
+
+    def prevalence(self, skill_id: str) -> float:
+        """Percentage of repositories assessing the skill's attribute that have it."""
+        exemplars = self._exemplars.get(skill_id)
+        if not exemplars:
+            return 0.0
+        assessed = self._assessed.get(exemplars[0].skill.source_attribute_id, 0)
+        found = self._found[skill_id]
+        return round(100.0 * found / max(assessed, found), 1)
+
+    def confidence(self, skill_id: str) -> float:
+        """Support-weighted mean confidence of a skill."""
+        found = self._found.get(skill_id, 0)
+        total = self._confidence_sums.get(skill_id, 0.0)
+        weighted = (total + self.PRIOR_REPOSITORIES * self.PRIOR_CONFIDENCE) / (
+            found + self.PRIOR_REPOSITORIES
+        )
+        return round(weighted, 1)
+
+    def exemplars(self, skill_id: str) -> list[SkillExemplar]:
+        """Best exemplars of a skill, best first."""
+        return list(self._exemplars.get(skill_id, []))
+
+    def skills(self) -> list[DiscoveredSkill]:
+        """Aggregated skills, sorted by confidence (highest first).
+
+        Returns:
+            One skill per skill ID, with aggregated confidence and
+            prevalence as reusability_score
+        """
+        aggregated = [
+            replace(
+                exemplars[0].skill,
+                confidence=self.confidence(skill_id),
+                reusability_score=self.prevalence(skill_id),
+            )
+            for skill_id, exemplars in self._exemplars.items()
+        ]
+        aggregated.sort(
+            key=lambda s: (s.confidence, self._found[s.skill_id]), reverse=True
+        )
+        return aggregated
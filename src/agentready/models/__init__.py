@@ -5,6 +5,7 @@ from agentready.models.attribute import Attribute
 from agentready.models.batch_assessment import (
     BatchAssessment,
     BatchSummary,
+    BatchSummaryAggregator,
     FailureTracker,
     RepositoryResult,
 )
@@ -19,16 +20,18 @@ from agentready.models.fix import (
     Fix,
     MultiStepFix,
 )
-from agentready.models.metadata import AssessmentMetadata
+from agentready.models.metadata import AssessmentMetadata, AssessorProfile
 from agentready.models.repository import Repository
 from agentready.models.theme import Theme, validate_theme_contrast
 
 __all__ = [
     "Assessment",
     "AssessmentMetadata",
+    "AssessorProfile",
     "Attribute",
     "BatchAssessment",
     "BatchSummary",
+    "BatchSummaryAggregator",
     "Citation",
     "CommandFix",
     "Config",
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 
 from .config import Config
 from .discovered_skill import DiscoveredSkill
@@ -27,6 +28,9 @@ class Assessment:
         duration_seconds: Time taken for assessment
         discovered_skills: Patterns extracted from this assessment (optional)
         metadata: Execution context (version, user, command, timestamp)
+        input_fingerprints: Git blob SHA of the working tree content of each
+            file matching an assessor's input_globs, including uncommitted
+            and untracked files (None if not recorded)
         schema_version: Report schema version for backwards compatibility
     """
 
@@ -42,6 +46,7 @@ class Assessment:
     duration_seconds: float
     discovered_skills: list[DiscoveredSkill] = field(default_factory=list)
     metadata: AssessmentMetadata | None = None
+    input_fingerprints: dict[str, str] | None = None
     schema_version: str = "1.0.0"
 
     VALID_LEVELS = {"Platinum", "Gold", "Silver", "Bronze", "Needs Improvement"}
@@ -92,8 +97,63 @@ class Assessment:
             "config": self.config.to_dict() if self.config else None,
             "duration_seconds": self.duration_seconds,
             "discovered_skills": [s.to_dict() for s in self.discovered_skills],
+            "input_fingerprints": self.input_fingerprints,
         }
 
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict,
+        repository_path: Path | None = None,
+        check_checkout: bool = True,
+    ) -> "Assessment":
+        """Create assessment from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary produced by to_dict
+            repository_path: Local checkout to use instead of the recorded path
+            check_checkout: Require the repository checkout to still exist
+
+        Returns:
+            Assessment instance
+
+        Raises:
+            ValueError: If the schema version is unsupported or data is invalid
+            KeyError: If required fields are missing
+        """
+        schema_version = data.get("schema_version")
+        if schema_version != cls.CURRENT_SCHEMA_VERSION:
+            raise ValueError(
+                f"Unsupported assessment schema version: {schema_version} "
+                f"(expected {cls.CURRENT_SCHEMA_VERSION})"
+            )
+
+        metadata = data.get("metadata")
+        config = data.get("config")
+
+        return cls(
+            repository=Repository.from_dict(
+                data["repository"],
+                path=repository_path,
+                check_checkout=check_checkout,
+            ),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            overall_score=data["overall_score"],
+            certification_level=data["certification_level"],
+            attributes_assessed=data["attributes_assessed"],
+            attributes_not_assessed=data["attributes_not_assessed"],
+            attributes_total=data["attributes_total"],
+            findings=[Finding.from_dict(f) for f in data["findings"]],
+            config=Config.from_dict(config) if config else None,
+            duration_seconds=data["duration_seconds"],
+            discovered_skills=[
+                DiscoveredSkill.from_dict(s) for s in data.get("discovered_skills", [])
+            ],
+            metadata=AssessmentMetadata.from_dict(metadata) if metadata else None,
+            input_fingerprints=data.get("input_fingerprints"),
+            schema_version=schema_version,
+        )
+
     @staticmethod
     def determine_certification_level(score: float) -> str:
         """Determine certification level based on overall score.
@@ -52,6 +52,33 @@ class RepositoryResult:
             "cached": self.cached,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict, check_checkout: bool = True) -> "RepositoryResult":
+        """Create result from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary produced by to_dict
+            check_checkout: Require the assessed checkout to still exist
+
+        Raises:
+            ValueError: If the data is invalid, or check_checkout is set and
+                the assessed checkout no longer exists
+            KeyError: If required fields are missing
+        """
+        assessment = data.get("assessment")
+        return cls(
+            repository_url=data["repository_url"],
+            assessment=(
+                Assessment.from_dict(assessment, check_checkout=check_checkout)
+                if assessment
+                else None
+            ),
+            error=data.get("error"),
+            error_type=data.get("error_type"),
+            duration_seconds=data.get("duration_seconds", 0.0),
+            cached=data.get("cached", False),
+        )
+
 
 @dataclass
 class BatchSummary:
@@ -65,6 +92,8 @@ class BatchSummary:
         score_distribution: Count of repos by certification level
         language_breakdown: Aggregated language detection across repos
         top_failing_attributes: Most frequently failed attributes
+        assessor_timings: Wall time of each assessor across repositories,
+            slowest in total first
     """
 
     total_repositories: int
@@ -74,6 +103,7 @@ class BatchSummary:
     score_distribution: dict[str, int] = field(default_factory=dict)
     language_breakdown: dict[str, int] = field(default_factory=dict)
     top_failing_attributes: list[dict[str, str | int]] = field(default_factory=list)
+    assessor_timings: list[dict[str, str | int | float]] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -85,9 +115,110 @@ class BatchSummary:
             "score_distribution": self.score_distribution,
             "language_breakdown": self.language_breakdown,
             "top_failing_attributes": self.top_failing_attributes,
+            "assessor_timings": self.assessor_timings,
         }
 
 
+class BatchSummaryAggregator:
+    """Builds a BatchSummary incrementally as results arrive.
+
+    Only counters are kept, so memory does not grow with the number of
+    repositories and results can be discarded once they have been added.
+    """
+
+    # Certification levels, in the order they are reported
+    CERTIFICATION_LEVELS = ("Platinum", "Gold", "Silver", "Bronze", "Needs Improvement")
+
+    # Number of most frequently failed attributes reported
+    TOP_FAILING_LIMIT = 10
+
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.score_total = 0.0
+        self.score_distribution = dict.fromkeys(self.CERTIFICATION_LEVELS, 0)
+        self.language_breakdown: dict[str, int] = {}
+        self.failing_attributes: dict[str, int] = {}
+        # attribute_id -> [repositories, total wall, max wall, slowest URL]
+        self.assessor_timings: dict[str, list] = {}
+
+    def add(self, result: RepositoryResult) -> None:
+        """Account for one repository result."""
+        self.total += 1
+        if not result.is_success():
+            return
+
+        assessment = result.assessment
+        self.successful += 1
+        self.score_total += assessment.overall_score
+
+        level = assessment.certification_level
+        if level in self.score_distribution:
+            self.score_distribution[level] += 1
+
+        for lang, count in assessment.repository.languages.items():
+            self.language_breakdown[lang] = self.language_breakdown.get(lang, 0) + count
+
+        for finding in assessment.findings:
+            if finding.status == "fail":
+                attr_id = finding.attribute.id
+                self.failing_attributes[attr_id] = (
+                    self.failing_attributes.get(attr_id, 0) + 1
+                )
+
+        # Assessments from before assessor profiling have no profiles
+        profiles = assessment.metadata.assessor_profiles if assessment.metadata else []
+        for profile in profiles:
+            timing = self.assessor_timings.setdefault(
+                profile.attribute_id, [0, 0.0, -1.0, None]
+            )
+            timing[0] += 1
+            timing[1] += profile.wall_seconds
+            if profile.wall_seconds > timing[2]:
+                timing[2] = profile.wall_seconds
+                timing[3] = result.repository_url
+
+    def summary(self) -> BatchSummary:
+        """Get the summary of all results added so far."""
+        # Results arrive in completion order, so break ties by ID to keep
+        # the ranking deterministic
+        top_failing = sorted(
+            self.failing_attributes.items(),
+            key=lambda x: (-x[1], x[0]),
+        )[: self.TOP_FAILING_LIMIT]
+
+        return BatchSummary(
+            total_repositories=self.total,
+            successful_assessments=self.successful,
+            failed_assessments=self.total - self.successful,
+            average_score=(
+                self.score_total / self.successful if self.successful else 0.0
+            ),
+            score_distribution=dict(self.score_distribution),
+            language_breakdown=dict(self.language_breakdown),
+            top_failing_attributes=[
+                {
+                    "attribute_id": attr_id,
+                    "failure_count": count,
+                }
+                for attr_id, count in top_failing
+            ],
+            assessor_timings=[
+                {
+                    "attribute_id": attr_id,
+                    "repositories": count,
+                    "total_wall_seconds": round(total, 4),
+                    "mean_wall_seconds": round(total / count, 4),
+                    "max_wall_seconds": round(slowest, 4),
+                    "slowest_repository": slowest_url,
+                }
+                for attr_id, (count, total, slowest, slowest_url) in sorted(
+                    self.assessor_timings.items(), key=lambda x: (-x[1][1], x[0])
+                )
+            ],
+        )
+
+
 @dataclass
 class BatchAssessment:
     """Complete batch assessment of multiple repositories.
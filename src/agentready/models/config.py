@@ -121,6 +121,15 @@ class Config(BaseModel):
         """
         return self.model_dump()
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """Create config from dictionary (inverse of to_dict).
+
+        Raises:
+            pydantic.ValidationError: If data doesn't match schema
+        """
+        return cls.model_validate(data)
+
     def get_weight(self, attribute_id: str, default: float) -> float:
         """Get weight for attribute, falling back to default if not specified."""
         return self.weights.get(attribute_id, default)
@@ -91,6 +91,22 @@ class DiscoveredSkill:
             "citations": [c.to_dict() for c in self.citations],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DiscoveredSkill":
+        """Create discovered skill from dictionary (inverse of to_dict)."""
+        return cls(
+            skill_id=data["skill_id"],
+            name=data["name"],
+            description=data["description"],
+            confidence=data["confidence"],
+            source_attribute_id=data["source_attribute_id"],
+            reusability_score=data["reusability_score"],
+            impact_score=data["impact_score"],
+            pattern_summary=data["pattern_summary"],
+            code_examples=list(data.get("code_examples", [])),
+            citations=[Citation.from_dict(c) for c in data.get("citations", [])],
+        )
+
     def to_skill_md(self) -> str:
         """Generate SKILL.md content from this discovered skill.
 
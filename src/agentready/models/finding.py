@@ -45,6 +45,18 @@ class Remediation:
             "citations": [c.to_dict() for c in self.citations],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Remediation":
+        """Create remediation from dictionary (inverse of to_dict)."""
+        return cls(
+            summary=data["summary"],
+            steps=list(data["steps"]),
+            tools=list(data.get("tools", [])),
+            commands=list(data.get("commands", [])),
+            examples=list(data.get("examples", [])),
+            citations=[Citation.from_dict(c) for c in data.get("citations", [])],
+        )
+
 
 @dataclass
 class Finding:
@@ -101,6 +113,21 @@ class Finding:
             "error_message": self.error_message,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Finding":
+        """Create finding from dictionary (inverse of to_dict)."""
+        remediation = data.get("remediation")
+        return cls(
+            attribute=Attribute.from_dict(data["attribute"]),
+            status=data["status"],
+            score=data.get("score"),
+            measured_value=data.get("measured_value"),
+            threshold=data.get("threshold"),
+            evidence=list(data.get("evidence", [])),
+            remediation=Remediation.from_dict(remediation) if remediation else None,
+            error_message=data.get("error_message"),
+        )
+
     @classmethod
     def not_applicable(cls, attribute: Attribute, reason: str = "") -> "Finding":
         """Create a not_applicable finding for language-specific attributes."""
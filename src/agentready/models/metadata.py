@@ -3,10 +3,54 @@
 import getpass
 import os
 import socket
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
+@dataclass
+class AssessorProfile:
+    """Resources one assessor used during an assessment.
+
+    Attributes:
+        attribute_id: Attribute the assessor evaluates
+        wall_seconds: Elapsed wall time
+        cpu_seconds: CPU time of the assessor's thread (excludes subprocesses)
+        files_read: Regular files opened for reading
+        bytes_read: Total size of the files opened for reading
+        subprocesses: Subprocesses started
+    """
+
+    attribute_id: str
+    wall_seconds: float
+    cpu_seconds: float
+    files_read: int = 0
+    bytes_read: int = 0
+    subprocesses: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "attribute_id": self.attribute_id,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "files_read": self.files_read,
+            "bytes_read": self.bytes_read,
+            "subprocesses": self.subprocesses,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AssessorProfile":
+        """Create profile from dictionary (inverse of to_dict)."""
+        return cls(
+            attribute_id=data["attribute_id"],
+            wall_seconds=data["wall_seconds"],
+            cpu_seconds=data["cpu_seconds"],
+            files_read=data.get("files_read", 0),
+            bytes_read=data.get("bytes_read", 0),
+            subprocesses=data.get("subprocesses", 0),
+        )
+
+
 @dataclass
 class AssessmentMetadata:
     """Metadata about the assessment execution context.
@@ -22,6 +66,7 @@ class AssessmentMetadata:
         executed_by: Username and hostname (e.g., "jeder@macbook")
         command: Full CLI command executed (e.g., "agentready assess . --verbose")
         working_directory: Absolute path of current working directory when executed
+        assessor_profiles: Time and resources used by each assessor
     """
 
     agentready_version: str
@@ -31,6 +76,7 @@ class AssessmentMetadata:
     executed_by: str
     command: str
     working_directory: str
+    assessor_profiles: list[AssessorProfile] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -42,11 +88,33 @@ class AssessmentMetadata:
             "executed_by": self.executed_by,
             "command": self.command,
             "working_directory": self.working_directory,
+            "assessor_profiles": [p.to_dict() for p in self.assessor_profiles],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AssessmentMetadata":
+        """Create metadata from dictionary (inverse of to_dict)."""
+        return cls(
+            agentready_version=data["agentready_version"],
+            research_version=data["research_version"],
+            assessment_timestamp=data["assessment_timestamp"],
+            assessment_timestamp_human=data["assessment_timestamp_human"],
+            executed_by=data["executed_by"],
+            command=data["command"],
+            working_directory=data["working_directory"],
+            assessor_profiles=[
+                AssessorProfile.from_dict(p) for p in data.get("assessor_profiles", [])
+            ],
+        )
+
     @classmethod
     def create(
-        cls, version: str, research_version: str, timestamp: datetime, command: str
+        cls,
+        version: str,
+        research_version: str,
+        timestamp: datetime,
+        command: str,
+        assessor_profiles: list[AssessorProfile] | None = None,
     ) -> "AssessmentMetadata":
         """Create metadata from execution context.
 
@@ -55,6 +123,7 @@ class AssessmentMetadata:
             research_version: Research report version string
             timestamp: Assessment start time
             command: CLI command executed
+            assessor_profiles: Time and resources used by each assessor
 
         Returns:
             AssessmentMetadata instance
@@ -90,4 +159,5 @@ class AssessmentMetadata:
             executed_by=executed_by,
             command=command,
             working_directory=working_dir,
+            assessor_profiles=list(assessor_profiles or []),
         )
@@ -1,10 +1,16 @@
 """Repository model representing the target git repository being assessed."""
 
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..utils.privacy import sanitize_path, shorten_commit_hash
 
+if TYPE_CHECKING:
+    from ..services.ast_cache import ASTCache
+    from ..services.file_index import FileIndex
+    from ..services.git_probe import GitProbe
+
 
 @dataclass
 class Repository:
@@ -19,6 +25,12 @@ class Repository:
         languages: Detected languages with file counts (e.g., {"Python": 42})
         total_files: Total files in repository (respecting .gitignore)
         total_lines: Total lines of code
+        file_index: Shared per-scan file index (built lazily if not provided)
+        ast_cache: Shared per-scan parsed-module cache (built lazily)
+        git_probe: Git metadata collected when the repository was prepared
+            (branch, HEAD, remote, recent commits, tracked files)
+        check_checkout: Require path to be an existing git checkout; off
+            for stored results whose checkout may since have been deleted
     """
 
     path: Path
@@ -29,18 +41,23 @@ class Repository:
     languages: dict[str, int]
     total_files: int
     total_lines: int
+    file_index: "FileIndex | None" = field(default=None, repr=False, compare=False)
+    ast_cache: "ASTCache | None" = field(default=None, repr=False, compare=False)
+    git_probe: "GitProbe | None" = field(default=None, repr=False, compare=False)
+    check_checkout: InitVar[bool] = True
 
-    def __post_init__(self):
+    def __post_init__(self, check_checkout: bool):
         """Validate repository data after initialization."""
         # Convert string paths to Path objects for runtime type safety
         if isinstance(self.path, str):
             object.__setattr__(self, "path", Path(self.path))
 
-        if not self.path.exists():
-            raise ValueError(f"Repository path does not exist: {self.path}")
+        if check_checkout:
+            if not self.path.exists():
+                raise ValueError(f"Repository path does not exist: {self.path}")
 
-        if not (self.path / ".git").exists():
-            raise ValueError(f"Not a git repository: {self.path}")
+            if not (self.path / ".git").exists():
+                raise ValueError(f"Not a git repository: {self.path}")
 
         if self.total_files < 0:
             raise ValueError(f"Total files must be non-negative: {self.total_files}")
@@ -68,6 +85,36 @@ class Repository:
         """
         return shorten_commit_hash(self.commit_hash)
 
+    def get_file_index(self) -> "FileIndex":
+        """Get the shared file index, building it on first use.
+
+        Assessors should query this index instead of running git ls-files
+        or walking the tree themselves.
+
+        Returns:
+            FileIndex for this repository
+        """
+        if self.file_index is None:
+            from ..services.file_index import FileIndex
+
+            self.file_index = FileIndex.build(self.path, git_probe=self.git_probe)
+        return self.file_index
+
+    def get_ast_cache(self) -> "ASTCache":
+        """Get the shared parsed-module cache, building it on first use.
+
+        Python assessors should use this cache (or its module summaries)
+        instead of reading and parsing source files themselves.
+
+        Returns:
+            ASTCache over this repository's file index
+        """
+        if self.ast_cache is None:
+            from ..services.ast_cache import ASTCache
+
+            self.ast_cache = ASTCache(self.get_file_index())
+        return self.ast_cache
+
     @property
     def primary_language(self) -> str:
         """Get the primary programming language (most files).
@@ -110,3 +157,33 @@ class Repository:
                 "total_files": self.total_files,
                 "total_lines": self.total_lines,
             }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict, path: Path | None = None, check_checkout: bool = True
+    ) -> "Repository":
+        """Create repository from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary produced by to_dict (non-privacy mode)
+            path: Local checkout to use instead of the recorded path
+            check_checkout: Require the checkout to still exist
+
+        Returns:
+            Repository instance
+
+        Raises:
+            ValueError: If check_checkout is set and the repository path no
+                longer exists
+        """
+        return cls(
+            path=Path(path or data["path"]),
+            name=data["name"],
+            url=data.get("url"),
+            branch=data["branch"],
+            commit_hash=data["commit_hash"],
+            languages=dict(data.get("languages", {})),
+            total_files=data["total_files"],
+            total_lines=data["total_lines"],
+            check_checkout=check_checkout,
+        )
@@ -1,9 +1,16 @@
 """Aggregated JSON reporter for batch assessments."""
 
 import json
+import re
+import textwrap
+from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 
-from ..models.batch_assessment import BatchAssessment
+from ..models.batch_assessment import BatchAssessment, RepositoryResult
+
+# Opening of the results array in an aggregated JSON document
+_RESULTS_START = re.compile(r'"results"\s*:\s*\[')
 
 
 class AggregatedJSONReporter:
@@ -32,9 +39,156 @@ class AggregatedJSONReporter:
         Raises:
             IOError: If JSON cannot be written
         """
+        stream = self.open_stream(
+            output_path,
+            batch_assessment.batch_id,
+            batch_assessment.timestamp,
+            batch_assessment.schema_version,
+        )
+        try:
+            for result in batch_assessment.results:
+                stream.write(result)
+        finally:
+            stream.close(batch_assessment)
+
+        return output_path
+
+    def open_stream(
+        self,
+        output_path: Path,
+        batch_id: str,
+        timestamp: datetime,
+        schema_version: str = BatchAssessment.CURRENT_SCHEMA_VERSION,
+    ) -> "AggregatedJSONStreamWriter":
+        """Open an aggregated JSON file that results are written to as they arrive.
+
+        Args:
+            output_path: Path where JSON file should be saved
+            batch_id: Unique identifier of the batch
+            timestamp: When the batch started
+            schema_version: Data format version
+
+        Returns:
+            AggregatedJSONStreamWriter; close it with the finished batch
+        """
+        return AggregatedJSONStreamWriter(
+            output_path, batch_id, timestamp, schema_version
+        )
+
+
+class AggregatedJSONStreamWriter:
+    """Writes the aggregated JSON document one result at a time.
+
+    The document has the same layout as BatchAssessment.to_dict(): results
+    come before the summary, so each result is serialized and written when
+    it arrives and the summary fields are appended by close().
+    """
+
+    def __init__(
+        self, output_path: Path, batch_id: str, timestamp: datetime, schema_version: str
+    ):
+        self.output_path = output_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(output_path, "w", encoding="utf-8")
+        self._count = 0
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(batch_assessment.to_dict(), f, indent=2, default=str)
+        header = {
+            "schema_version": schema_version,
+            "batch_id": batch_id,
+            "timestamp": timestamp.isoformat(),
+        }
+        self._file.write("{\n")
+        for key, value in header.items():
+            self._file.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+        self._file.write('  "results": [')
 
-        return output_path
+    def write(self, result: RepositoryResult) -> None:
+        """Append one repository result."""
+        payload = json.dumps(result.to_dict(), indent=2, default=str)
+        self._file.write(",\n" if self._count else "\n")
+        self._file.write(textwrap.indent(payload, "    "))
+        self._count += 1
+
+    def close(self, batch_assessment: BatchAssessment) -> None:
+        """Write the summary fields and close the document.
+
+        Args:
+            batch_assessment: Finished batch (only its summary and run
+                metadata are read)
+        """
+        self._file.write("\n  ]" if self._count else "]")
+        footer = {
+            "summary": batch_assessment.summary.to_dict(),
+            "total_duration_seconds": batch_assessment.total_duration_seconds,
+            "success_rate": batch_assessment.get_success_rate(),
+            "agentready_version": batch_assessment.agentready_version,
+            "command": batch_assessment.command,
+        }
+        for key, value in footer.items():
+            payload = json.dumps(value, indent=2, default=str)
+            self._file.write(f",\n  {json.dumps(key)}: ")
+            self._file.write(textwrap.indent(payload, "  ").lstrip())
+        self._file.write("\n}")
+        self._file.close()
+
+
+def iter_aggregated_results(
+    path: Path, chunk_size: int = 1024 * 1024
+) -> Iterator[dict]:
+    """Read the results of an aggregated JSON file one at a time.
+
+    Only the result being decoded is held in memory, so batches of any
+    size can be processed. Documents written by AggregatedJSONReporter and
+    BatchAssessment.to_dict() are both supported.
+
+    Args:
+        path: Aggregated JSON file (all-assessments.json)
+        chunk_size: Characters read per chunk
+
+    Yields:
+        RepositoryResult dictionaries, in file order
+
+    Raises:
+        ValueError: If the file has no results array or ends before the
+            array is closed (e.g., an interrupted batch); results read up to
+            that point have already been yielded
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        # Find the start of the results array; the header before it is small
+        buffer = ""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError(f"No results array in {path}")
+            buffer += chunk
+            match = _RESULTS_START.search(buffer)
+            if match:
+                buffer = buffer[match.end() :]
+                break
+
+        position = 0
+        while True:
+            # Skip separators, reading more when the buffer runs out
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position == len(buffer):
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise ValueError(f"Results array in {path} is not closed")
+                buffer, position = chunk, 0
+                continue
+
+            if buffer[position] == "]":
+                return
+
+            try:
+                result, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Result continues past the buffer
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise ValueError(f"Results array in {path} is not closed")
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            yield result
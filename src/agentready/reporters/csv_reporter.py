@@ -7,7 +7,7 @@ import csv
 from pathlib import Path
 from typing import Any
 
-from ..models.batch_assessment import BatchAssessment
+from ..models.batch_assessment import BatchAssessment, RepositoryResult
 
 
 class CSVReporter:
@@ -58,6 +58,21 @@ class CSVReporter:
 
         return str_value
 
+    # Columns, one row per repository
+    FIELDNAMES = [
+        "repo_url",
+        "repo_name",
+        "overall_score",
+        "certification_level",
+        "primary_language",
+        "timestamp",
+        "duration_seconds",
+        "cached",
+        "status",
+        "error_type",
+        "error_message",
+    ]
+
     def generate(
         self, batch_assessment: BatchAssessment, output_path: Path, delimiter: str = ","
     ) -> Path:
@@ -84,70 +99,91 @@ class CSVReporter:
         Raises:
             IOError: If CSV cannot be written
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            # Define columns
-            fieldnames = [
-                "repo_url",
-                "repo_name",
-                "overall_score",
-                "certification_level",
-                "primary_language",
-                "timestamp",
-                "duration_seconds",
-                "cached",
-                "status",
-                "error_type",
-                "error_message",
-            ]
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter)
-            writer.writeheader()
-
-            # Write successful assessments
+        with self.open_stream(output_path, delimiter) as stream:
+            # Successful assessments first, then failures
             for result in batch_assessment.results:
                 if result.is_success():
-                    assessment = result.assessment
-                    # SECURITY: Sanitize all string fields
-                    row = {
-                        "repo_url": self.sanitize_csv_field(result.repository_url),
-                        "repo_name": self.sanitize_csv_field(
-                            assessment.repository.name
-                        ),
-                        "overall_score": assessment.overall_score,
-                        "certification_level": self.sanitize_csv_field(
-                            assessment.certification_level
-                        ),
-                        "primary_language": self.sanitize_csv_field(
-                            assessment.repository.primary_language
-                        ),
-                        "timestamp": assessment.timestamp.isoformat(),
-                        "duration_seconds": result.duration_seconds,
-                        "cached": result.cached,
-                        "status": "success",
-                        "error_type": "",
-                        "error_message": "",
-                    }
-                    writer.writerow(row)
-
-            # Write failed assessments
+                    stream.write(result)
             for result in batch_assessment.results:
                 if not result.is_success():
-                    # SECURITY: Sanitize all string fields
-                    row = {
-                        "repo_url": self.sanitize_csv_field(result.repository_url),
-                        "repo_name": "",
-                        "overall_score": 0,
-                        "certification_level": "",
-                        "primary_language": "",
-                        "timestamp": "",
-                        "duration_seconds": result.duration_seconds,
-                        "cached": False,
-                        "status": "failed",
-                        "error_type": self.sanitize_csv_field(result.error_type),
-                        "error_message": self.sanitize_csv_field(result.error),
-                    }
-                    writer.writerow(row)
+                    stream.write(result)
 
         return output_path
+
+    def open_stream(self, output_path: Path, delimiter: str = ",") -> "CSVStreamWriter":
+        """Open a CSV file that rows are written to as results arrive.
+
+        Args:
+            output_path: Path where CSV file should be saved
+            delimiter: Field delimiter (default: comma, use tab for TSV)
+
+        Returns:
+            CSVStreamWriter (also a context manager)
+        """
+        return CSVStreamWriter(self, output_path, delimiter)
+
+    def _row(self, result: RepositoryResult) -> dict:
+        """Build the CSV row for one repository result."""
+        if result.is_success():
+            assessment = result.assessment
+            # SECURITY: Sanitize all string fields
+            return {
+                "repo_url": self.sanitize_csv_field(result.repository_url),
+                "repo_name": self.sanitize_csv_field(assessment.repository.name),
+                "overall_score": assessment.overall_score,
+                "certification_level": self.sanitize_csv_field(
+                    assessment.certification_level
+                ),
+                "primary_language": self.sanitize_csv_field(
+                    assessment.repository.primary_language
+                ),
+                "timestamp": assessment.timestamp.isoformat(),
+                "duration_seconds": result.duration_seconds,
+                "cached": result.cached,
+                "status": "success",
+                "error_type": "",
+                "error_message": "",
+            }
+
+        # SECURITY: Sanitize all string fields
+        return {
+            "repo_url": self.sanitize_csv_field(result.repository_url),
+            "repo_name": "",
+            "overall_score": 0,
+            "certification_level": "",
+            "primary_language": "",
+            "timestamp": "",
+            "duration_seconds": result.duration_seconds,
+            "cached": False,
+            "status": "failed",
+            "error_type": self.sanitize_csv_field(result.error_type),
+            "error_message": self.sanitize_csv_field(result.error),
+        }
+
+
+class CSVStreamWriter:
+    """Writes CSV rows one result at a time, holding no results in memory."""
+
+    def __init__(self, reporter: CSVReporter, output_path: Path, delimiter: str):
+        self.reporter = reporter
+        self.output_path = output_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(output_path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=reporter.FIELDNAMES, delimiter=delimiter
+        )
+        self._writer.writeheader()
+
+    def write(self, result: RepositoryResult) -> None:
+        """Append the row for one repository result."""
+        self._writer.writerow(self.reporter._row(result))
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "CSVStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
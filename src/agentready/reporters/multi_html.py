@@ -130,15 +130,13 @@ class MultiRepoHTMLReporter:
         """
         template = self.env.get_template("multi_report.html.j2")
 
-        # Render template with assessment data
+        # Render template with assessment data, streamed to the file so the
+        # page for a large batch is never held in memory at once
         # SECURITY: Jinja2 autoescape handles all variable escaping
-        html_content = template.render(
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        template.stream(
             batch_assessment=batch_assessment,
             timestamp=batch_assessment.timestamp.isoformat(),
-        )
-
-        # Write to file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding="utf-8")
+        ).dump(str(output_path), encoding="utf-8")
 
         return output_path
@@ -0,0 +1,72 @@
+"""Writes the standard set of report files for one assessment."""
+
+import json
+import shutil
+from pathlib import Path
+
+from ..models.assessment import Assessment
+from .base import BaseReporter
+
+
+def write_assessment_reports(
+    assessment: Assessment,
+    output_dir: Path,
+    html_reporter: BaseReporter | None = None,
+    markdown_reporter: BaseReporter | None = None,
+) -> dict[str, Path]:
+    """Write timestamped JSON, HTML and Markdown reports plus "latest" links.
+
+    Args:
+        assessment: Complete assessment with findings
+        output_dir: Directory the reports are written to (must exist)
+        html_reporter: HTML reporter to reuse (created if not provided)
+        markdown_reporter: Markdown reporter to reuse (created if not provided)
+
+    Returns:
+        Mapping of "json", "html" and "markdown" to the written files
+    """
+    # Imported here so Jinja2 is only loaded when reports are written
+    if html_reporter is None:
+        from .html import HTMLReporter
+
+        html_reporter = HTMLReporter()
+    if markdown_reporter is None:
+        from .markdown import MarkdownReporter
+
+        markdown_reporter = MarkdownReporter()
+
+    # Generate timestamp for file naming
+    timestamp = assessment.timestamp.strftime("%Y%m%d-%H%M%S")
+
+    # Save JSON output
+    json_file = output_dir / f"assessment-{timestamp}.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(assessment.to_dict(), f, indent=2)
+
+    # Generate HTML report
+    html_file = output_dir / f"report-{timestamp}.html"
+    html_reporter.generate(assessment, html_file)
+
+    # Generate Markdown report
+    markdown_file = output_dir / f"report-{timestamp}.md"
+    markdown_reporter.generate(assessment, markdown_file)
+
+    # Create latest symlinks
+    latest_json = output_dir / "assessment-latest.json"
+    latest_html = output_dir / "report-latest.html"
+    latest_md = output_dir / "report-latest.md"
+
+    for latest, target in [
+        (latest_json, json_file),
+        (latest_html, html_file),
+        (latest_md, markdown_file),
+    ]:
+        if latest.exists() or latest.is_symlink():
+            latest.unlink()
+        try:
+            latest.symlink_to(target.name)
+        except OSError:
+            # Windows doesn't support symlinks easily, just copy
+            shutil.copy(target, latest)
+
+    return {"json": json_file, "html": html_file, "markdown": markdown_file}
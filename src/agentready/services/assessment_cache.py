@@ -1,21 +1,35 @@
 """SQLite-based cache for assessment results."""
 
+import hashlib
 import json
 import sqlite3
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from ..models import Assessment
+from .sqlite_store import SQLiteStore
 
 
-class AssessmentCache:
+class AssessmentCache(SQLiteStore):
     """SQLite-backed cache for assessment results with TTL support.
 
     Schema: assessments(repository_url, commit_hash, overall_score,
-            assessment_json, cached_at, expires_at)
+            assessment_json, cached_at, expires_at, fingerprint)
+
+    The fingerprint identifies what produced an entry (agentready version,
+    assessor set and configuration); lookups with a different fingerprint
+    are treated as misses so upgrades never serve stale results.
+
+    Each thread reuses one long-lived connection in WAL mode, so concurrent
+    readers never block the batch cache writer. Assessment JSON is stored
+    zlib-compressed; plain JSON rows from older caches are still readable.
     """
 
+    # (url, commit) pairs per bulk lookup, within SQLite's variable limit
+    BULK_CHUNK_SIZE = 400
+
     def __init__(self, cache_dir: Path, ttl_days: int = 7):
         """Initialize assessment cache.
 
@@ -25,14 +39,15 @@ class AssessmentCache:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = self.cache_dir / "assessments.db"
+        super().__init__(self.cache_dir / "assessments.db")
         self.ttl_days = ttl_days
         self._initialize_db()
 
     def _initialize_db(self) -> None:
         """Initialize database schema."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            conn = self._connection()
+            with conn:
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS assessments (
@@ -43,11 +58,19 @@ class AssessmentCache:
                         assessment_json TEXT NOT NULL,
                         cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         expires_at TIMESTAMP,
+                        fingerprint TEXT,
                         UNIQUE(repository_url, commit_hash)
                     )
                     """
                 )
 
+                # Migrate databases created before fingerprints were recorded
+                columns = {
+                    row[1] for row in conn.execute("PRAGMA table_info(assessments)")
+                }
+                if "fingerprint" not in columns:
+                    conn.execute("ALTER TABLE assessments ADD COLUMN fingerprint TEXT")
+
                 # Create index for faster queries
                 conn.execute(
                     """
@@ -62,12 +85,37 @@ class AssessmentCache:
                     ON assessments(expires_at)
                     """
                 )
-
-                conn.commit()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to initialize cache database: {e}")
 
-    def get(self, repository_url: str, commit_hash: str) -> Optional[Assessment]:
+    @staticmethod
+    def compute_fingerprint(version: str, attribute_ids: list[str], config=None) -> str:
+        """Compute the fingerprint of an assessment run.
+
+        Args:
+            version: AgentReady version
+            attribute_ids: IDs of the assessors that were run
+            config: Custom configuration (affects scoring)
+
+        Returns:
+            Hex digest identifying the version, assessor set and config
+        """
+        payload = json.dumps(
+            {
+                "version": version,
+                "attributes": sorted(attribute_ids),
+                "config": config.to_dict() if config else None,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        repository_url: str,
+        commit_hash: str,
+        fingerprint: Optional[str] = None,
+    ) -> Optional[Assessment]:
         """Get cached assessment if available and not expired.
 
         Security: Uses parameterized queries to prevent SQL injection.
@@ -75,53 +123,89 @@ class AssessmentCache:
         Args:
             repository_url: Repository URL
             commit_hash: Git commit hash
+            fingerprint: Expected run fingerprint (see compute_fingerprint);
+                entries with a different fingerprint are misses
 
         Returns:
             Assessment if found and valid, None otherwise
         """
+        key = (repository_url, commit_hash)
+        return self.get_many([key], fingerprint).get(key)
+
+    def get_many(
+        self,
+        keys: list[tuple[str, str]],
+        fingerprint: Optional[str] = None,
+    ) -> dict[tuple[str, str], Assessment]:
+        """Get cached assessments for many (url, commit) pairs at once.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
+        Args:
+            keys: (repository_url, commit_hash) pairs to look up
+            fingerprint: Expected run fingerprint (see compute_fingerprint)
+
+        Returns:
+            Mapping of (repository_url, commit_hash) to Assessment for hits;
+            misses, stale and expired entries are omitted
+        """
+        hits = {}
+        expired = []
+        now = datetime.now()
+        unique_keys = list(dict.fromkeys(keys))
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT assessment_json, expires_at FROM assessments
-                    WHERE repository_url = ? AND commit_hash = ?
+            conn = self._connection()
+            for start in range(0, len(unique_keys), self.BULK_CHUNK_SIZE):
+                chunk = unique_keys[start : start + self.BULK_CHUNK_SIZE]
+                placeholders = ", ".join(["(?, ?)"] * len(chunk))
+                params = [value for key in chunk for value in key]
+                rows = conn.execute(
+                    f"""
+                    SELECT repository_url, commit_hash, assessment_json,
+                           expires_at, fingerprint
+                    FROM assessments
+                    WHERE (repository_url, commit_hash) IN (VALUES {placeholders})
                     """,
-                    (repository_url, commit_hash),
-                )
-                row = cursor.fetchone()
-
-                if not row:
-                    return None
-
-                assessment_json, expires_at = row
-
-                # Check if expired
-                if expires_at:
-                    expires_dt = datetime.fromisoformat(expires_at)
-                    if datetime.now() > expires_dt:
-                        # Delete expired entry
-                        conn.execute(
-                            """
-                            DELETE FROM assessments
-                            WHERE repository_url = ? AND commit_hash = ?
-                            """,
-                            (repository_url, commit_hash),
-                        )
-                        conn.commit()
-                        return None
-
-                # Parse and return assessment
-                assessment_data = json.loads(assessment_json)
-                return self._deserialize_assessment(assessment_data)
-
-        except (sqlite3.Error, json.JSONDecodeError, ValueError):
-            return None
+                    params,
+                ).fetchall()
+
+                for url, commit, payload, expires_at, cached_fingerprint in rows:
+                    # Stale version, assessor set or config; overwritten on set
+                    if fingerprint is not None and cached_fingerprint != fingerprint:
+                        continue
+
+                    # Check if expired
+                    if expires_at and now > datetime.fromisoformat(expires_at):
+                        expired.append((url, commit))
+                        continue
+
+                    assessment = self._load_payload(payload)
+                    if assessment is not None:
+                        hits[(url, commit)] = assessment
+
+            # Delete expired entries
+            if expired:
+                with conn:
+                    conn.executemany(
+                        """
+                        DELETE FROM assessments
+                        WHERE repository_url = ? AND commit_hash = ?
+                        """,
+                        expired,
+                    )
+
+        except (sqlite3.Error, ValueError):
+            pass
+
+        return hits
 
     def set(
         self,
         repository_url: str,
         commit_hash: str,
         assessment: Assessment,
+        fingerprint: Optional[str] = None,
     ) -> bool:
         """Cache an assessment.
 
@@ -131,34 +215,60 @@ class AssessmentCache:
             repository_url: Repository URL
             commit_hash: Git commit hash
             assessment: Assessment to cache
+            fingerprint: Run fingerprint (see compute_fingerprint)
 
         Returns:
             True if successful, False otherwise
         """
+        return (
+            self.set_many([(repository_url, commit_hash, assessment)], fingerprint) == 1
+        )
+
+    def set_many(
+        self,
+        entries: list[tuple[str, str, Assessment]],
+        fingerprint: Optional[str] = None,
+    ) -> int:
+        """Cache many assessments in a single transaction.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
+        Args:
+            entries: (repository_url, commit_hash, assessment) triples
+            fingerprint: Run fingerprint shared by all entries
+
+        Returns:
+            Number of entries written (0 if the transaction failed)
+        """
         try:
-            assessment_json = json.dumps(assessment.to_dict())
-            expires_at = datetime.now() + timedelta(days=self.ttl_days)
+            expires_at = (datetime.now() + timedelta(days=self.ttl_days)).isoformat()
+            rows = [
+                (
+                    repository_url,
+                    commit_hash,
+                    assessment.overall_score,
+                    self._dump_payload(assessment),
+                    expires_at,
+                    fingerprint,
+                )
+                for repository_url, commit_hash, assessment in entries
+            ]
 
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            conn = self._connection()
+            with conn:
+                conn.executemany(
                     """
                     INSERT OR REPLACE INTO assessments
-                    (repository_url, commit_hash, overall_score, assessment_json, expires_at)
-                    VALUES (?, ?, ?, ?, ?)
+                    (repository_url, commit_hash, overall_score, assessment_json,
+                     expires_at, fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        repository_url,
-                        commit_hash,
-                        assessment.overall_score,
-                        assessment_json,
-                        expires_at.isoformat(),
-                    ),
+                    rows,
                 )
-                conn.commit()
-            return True
+            return len(rows)
 
         except (sqlite3.Error, TypeError):
-            return False
+            return 0
 
     def invalidate(self, repository_url: str, commit_hash: Optional[str] = None) -> int:
         """Invalidate cache entries.
@@ -171,7 +281,8 @@ class AssessmentCache:
             Number of entries deleted
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            conn = self._connection()
+            with conn:
                 if commit_hash:
                     cursor = conn.execute(
                         """
@@ -188,8 +299,7 @@ class AssessmentCache:
                         """,
                         (repository_url,),
                     )
-                conn.commit()
-                return cursor.rowcount
+            return cursor.rowcount
         except sqlite3.Error:
             return 0
 
@@ -200,7 +310,8 @@ class AssessmentCache:
             Number of entries deleted
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            conn = self._connection()
+            with conn:
                 cursor = conn.execute(
                     """
                     DELETE FROM assessments
@@ -208,8 +319,7 @@ class AssessmentCache:
                     """,
                     (datetime.now().isoformat(),),
                 )
-                conn.commit()
-                return cursor.rowcount
+            return cursor.rowcount
         except sqlite3.Error:
             return 0
 
@@ -220,32 +330,51 @@ class AssessmentCache:
             Dictionary with cache statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM assessments")
-                total = cursor.fetchone()[0]
-
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM assessments WHERE expires_at > ?",
-                    (datetime.now().isoformat(),),
-                )
-                valid = cursor.fetchone()[0]
-
-                cursor = conn.execute(
-                    "SELECT COUNT(DISTINCT repository_url) FROM assessments"
-                )
-                unique_repos = cursor.fetchone()[0]
-
-                return {
-                    "total_entries": total,
-                    "valid_entries": valid,
-                    "expired_entries": total - valid,
-                    "unique_repositories": unique_repos,
-                    "database_path": str(self.db_path),
-                    "ttl_days": self.ttl_days,
-                }
+            conn = self._connection()
+            cursor = conn.execute("SELECT COUNT(*) FROM assessments")
+            total = cursor.fetchone()[0]
+
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM assessments WHERE expires_at > ?",
+                (datetime.now().isoformat(),),
+            )
+            valid = cursor.fetchone()[0]
+
+            cursor = conn.execute(
+                "SELECT COUNT(DISTINCT repository_url) FROM assessments"
+            )
+            unique_repos = cursor.fetchone()[0]
+
+            return {
+                "total_entries": total,
+                "valid_entries": valid,
+                "expired_entries": total - valid,
+                "unique_repositories": unique_repos,
+                "database_path": str(self.db_path),
+                "ttl_days": self.ttl_days,
+            }
         except sqlite3.Error:
             return {}
 
+    def _dump_payload(self, assessment: Assessment) -> bytes:
+        """Serialize and compress an assessment for storage."""
+        assessment_json = json.dumps(assessment.to_dict(), separators=(",", ":"))
+        return zlib.compress(assessment_json.encode("utf-8"), self.COMPRESSION_LEVEL)
+
+    def _load_payload(self, payload: bytes | str) -> Optional[Assessment]:
+        """Decompress and deserialize a stored assessment.
+
+        Returns:
+            Assessment, or None if the payload is corrupt or unusable
+        """
+        try:
+            # Rows written before compression hold plain JSON text
+            if isinstance(payload, bytes):
+                payload = zlib.decompress(payload).decode("utf-8")
+            return self._deserialize_assessment(json.loads(payload))
+        except (zlib.error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            return None
+
     @staticmethod
     def _deserialize_assessment(data: dict) -> Assessment:
         """Deserialize assessment from JSON data.
@@ -255,16 +384,10 @@ class AssessmentCache:
 
         Returns:
             Assessment object
+
+        Raises:
+            ValueError: If the data is invalid or uses an unsupported schema
+                version
         """
-        # This is a simplified deserialization
-        # In practice, you'd need full deserialization logic
-        # For now, we'll use a placeholder that assumes the cached JSON
-        # has the correct structure
-
-        # Note: This is a simplified approach. In production, you'd need
-        # proper deserialization that reconstructs all nested objects
-        raise NotImplementedError(
-            "Full assessment deserialization not yet implemented. "
-            "Consider caching assessment JSON directly and providing "
-            "a proper deserializer factory."
-        )
+        # Hits are served without cloning, so the checkout may not exist
+        return Assessment.from_dict(data, check_checkout=False)
@@ -0,0 +1,332 @@
+"""Per-scan parsed-module cache so each Python source file is parsed once."""
+
+import ast
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from .complexity import FunctionComplexity, python_complexities
+from .file_index import FileIndex, IndexedFile
+from .file_metric_cache import FileMetricCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParsedModule:
+    """Source text and AST of a single Python file.
+
+    Attributes:
+        path: Repository-relative POSIX path
+        source: Decoded source text
+        tree: Parsed module AST
+    """
+
+    path: str
+    source: str
+    tree: ast.Module
+
+
+@dataclass(frozen=True)
+class FunctionInfo:
+    """Facts about a function definition collected by the summary pass."""
+
+    name: str
+    is_annotated: bool
+    has_docstring: bool
+
+
+@dataclass(frozen=True)
+class ClassInfo:
+    """Facts about a class definition collected by the summary pass."""
+
+    name: str
+    has_docstring: bool
+
+
+@dataclass
+class ModuleSummary:
+    """Everything the Python assessors need from one module, gathered in one pass.
+
+    Attributes:
+        path: Repository-relative POSIX path
+        has_module_docstring: True if the module has a docstring
+        functions: Synchronous function definitions (nested and methods included)
+        classes: Class definitions (nested included)
+        complexities: Cyclomatic complexity of every function and method
+    """
+
+    path: str
+    has_module_docstring: bool = False
+    functions: list[FunctionInfo] = field(default_factory=list)
+    classes: list[ClassInfo] = field(default_factory=list)
+    complexities: list[FunctionComplexity] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for persistence (path excluded).
+
+        The path is left out because the same content may live at many
+        paths; it is supplied again by from_dict.
+        """
+        return {
+            "has_module_docstring": self.has_module_docstring,
+            "functions": [
+                [f.name, f.is_annotated, f.has_docstring] for f in self.functions
+            ],
+            "classes": [[c.name, c.has_docstring] for c in self.classes],
+            "complexities": [
+                [c.name, c.lineno, c.complexity] for c in self.complexities
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str) -> "ModuleSummary":
+        """Create summary from dictionary (inverse of to_dict).
+
+        Args:
+            data: Dictionary produced by to_dict
+            path: Repository-relative path of the summarized file
+
+        Returns:
+            ModuleSummary instance
+        """
+        return cls(
+            path=path,
+            has_module_docstring=data["has_module_docstring"],
+            functions=[FunctionInfo(*f) for f in data["functions"]],
+            classes=[ClassInfo(*c) for c in data["classes"]],
+            complexities=[FunctionComplexity(*c) for c in data["complexities"]],
+        )
+
+
+class _SummaryVisitor(ast.NodeVisitor):
+    """Single traversal collecting functions, classes and docstrings."""
+
+    def __init__(self, summary: ModuleSummary):
+        self.summary = summary
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self.summary.has_module_docstring = bool(ast.get_docstring(node))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        # Typed if it has a return annotation or any annotated positional arg
+        is_annotated = node.returns is not None or any(
+            arg.annotation is not None for arg in node.args.args
+        )
+        self.summary.functions.append(
+            FunctionInfo(
+                name=node.name,
+                is_annotated=is_annotated,
+                has_docstring=bool(ast.get_docstring(node)),
+            )
+        )
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.summary.classes.append(
+            ClassInfo(name=node.name, has_docstring=bool(ast.get_docstring(node)))
+        )
+        self.generic_visit(node)
+
+
+class ASTCache:
+    """Parses Python files on demand and shares the results across assessors.
+
+    Source text and ASTs are kept in an LRU bounded by an estimated memory
+    budget; evicted modules are transparently re-parsed on the next request.
+    Module summaries are small and kept for the whole scan, so assessors that
+    only need counts never trigger a second parse. Files that cannot be read,
+    decoded or parsed are remembered and skipped. Safe to share between
+    assessors running on worker threads.
+
+    With a FileMetricCache, summaries and line counts are also persisted by
+    git blob SHA, so content analyzed by any earlier scan (another commit,
+    branch, fork or vendored copy) is never read or parsed again.
+    """
+
+    # Rough in-memory size of source plus AST relative to the source length
+    AST_SIZE_FACTOR = 12
+
+    # Default estimated memory budget for cached modules (bytes)
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        file_index: FileIndex,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        metric_cache: FileMetricCache | None = None,
+    ):
+        """Initialize cache over a file index.
+
+        Args:
+            file_index: Index the requested paths are resolved against
+            max_bytes: Estimated memory budget for cached sources and ASTs
+            metric_cache: Persistent per-blob store for summaries (optional)
+        """
+        self.file_index = file_index
+        self.max_bytes = max_bytes
+        self.metric_cache = metric_cache
+        self.hits = 0
+        self.misses = 0
+        self._modules: OrderedDict[str, tuple[ParsedModule, int]] = OrderedDict()
+        self._cached_bytes = 0
+        self._failed: set[str] = set()
+        self._summaries: dict[str, ModuleSummary | None] = {}
+        self._stored_blobs: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, entry: IndexedFile | str) -> ParsedModule | None:
+        """Get source and AST for a file, parsing it on first use.
+
+        Args:
+            entry: Indexed file or repository-relative path
+
+        Returns:
+            ParsedModule, or None if the file is unreadable or not valid Python
+        """
+        path = entry.path if isinstance(entry, IndexedFile) else entry
+        with self._lock:
+            if path in self._failed:
+                return None
+
+            cached = self._modules.get(path)
+            if cached is not None:
+                self.hits += 1
+                self._modules.move_to_end(path)
+                return cached[0]
+
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent duplicate parse is harmless
+        module = self._parse(path)
+
+        with self._lock:
+            if module is None:
+                self._failed.add(path)
+                return None
+            self._store(module)
+        return module
+
+    def summary(self, entry: IndexedFile | str) -> ModuleSummary | None:
+        """Get the one-pass summary of a file.
+
+        Args:
+            entry: Indexed file or repository-relative path
+
+        Returns:
+            ModuleSummary, or None if the file is unreadable or not valid Python
+        """
+        path = entry.path if isinstance(entry, IndexedFile) else entry
+        if path not in self._summaries:
+            module = self.get(path)
+            if module is None:
+                self._summaries[path] = None
+            else:
+                summary = ModuleSummary(path=path)
+                _SummaryVisitor(summary).visit(module.tree)
+                summary.complexities = python_complexities(module.tree)
+                self._summaries[path] = summary
+        return self._summaries[path]
+
+    def summaries(self, entries: list[IndexedFile]) -> list[ModuleSummary]:
+        """Get summaries for several files, skipping unparseable ones.
+
+        With a metric cache, stored summaries are fetched in one bulk lookup
+        first and newly computed ones are written back in one transaction.
+        """
+        if self.metric_cache is not None:
+            self._load_stored(entries)
+
+        results = []
+        for entry in entries:
+            summary = self.summary(entry)
+            if summary is not None:
+                results.append(summary)
+
+        if self.metric_cache is not None:
+            self._store_new(entries)
+        return results
+
+    def _load_stored(self, entries: list[IndexedFile]) -> None:
+        """Seed summaries and line counts from the metric cache."""
+        wanted = [
+            entry
+            for entry in entries
+            if entry.blob_sha is not None and entry.path not in self._summaries
+        ]
+        if not wanted:
+            return
+
+        stored = self.metric_cache.get_many([entry.blob_sha for entry in wanted])
+        for entry in wanted:
+            metrics = stored.get(entry.blob_sha)
+            if metrics is None:
+                continue
+            try:
+                data = metrics["summary"]
+                summary = ModuleSummary.from_dict(data, entry.path) if data else None
+                lines = metrics["lines"]
+            except (KeyError, TypeError, ValueError):
+                # Unusable entry; recompute and overwrite it
+                continue
+            self._summaries[entry.path] = summary
+            self.file_index.record_line_counts(entry, tuple(lines) if lines else None)
+            self._stored_blobs.add(entry.blob_sha)
+
+    def _store_new(self, entries: list[IndexedFile]) -> None:
+        """Persist summaries computed in this scan to the metric cache."""
+        new_metrics = {}
+        for entry in entries:
+            sha = entry.blob_sha
+            if sha is None or sha in self._stored_blobs or sha in new_metrics:
+                continue
+            if entry.path not in self._summaries:
+                continue
+            # Counts were primed by the parse; None means the file could not
+            # be read (or is binary), so there is nothing worth persisting
+            total = self.file_index.line_count(entry)
+            if total is None:
+                continue
+            summary = self._summaries[entry.path]
+            new_metrics[sha] = {
+                "summary": summary.to_dict() if summary else None,
+                "lines": [total, self.file_index.code_line_count(entry)],
+            }
+
+        if new_metrics and self.metric_cache.set_many(new_metrics):
+            self._stored_blobs.update(new_metrics)
+
+    def _parse(self, path: str) -> ParsedModule | None:
+        """Read, decode and parse a file."""
+        try:
+            content = self.file_index.absolute_path(path).read_bytes()
+        except OSError:
+            return None
+
+        # Share the read with the index so line counts don't re-read the file
+        self.file_index.prime_line_counts(path, content)
+
+        try:
+            source = content.decode("utf-8")
+            tree = ast.parse(source, filename=path)
+        except (UnicodeDecodeError, SyntaxError, ValueError):
+            return None
+
+        return ParsedModule(path=path, source=source, tree=tree)
+
+    def _store(self, module: ParsedModule) -> None:
+        """Add module to the LRU, evicting least recently used entries."""
+        size = len(module.source) * self.AST_SIZE_FACTOR
+        if size > self.max_bytes or module.path in self._modules:
+            # Too large to keep (summaries are still cached), or already
+            # stored by a concurrent parse
+            return
+
+        self._modules[module.path] = (module, size)
+        self._cached_bytes += size
+        while self._cached_bytes > self.max_bytes:
+            evicted_path, (_, evicted_size) = self._modules.popitem(last=False)
+            self._cached_bytes -= evicted_size
+            logger.debug(f"Evicted parsed module from AST cache: {evicted_path}")
@@ -2,11 +2,12 @@
 
 import json
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import pandas as pd
-import plotly.express as px
-from scipy.stats import pearsonr
+# pandas, plotly and scipy take about a second to import; they are loaded
+# by the methods that use them so importing the CLI stays fast
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class AttributeAnalyzer:
@@ -29,6 +30,9 @@ class AttributeAnalyzer:
         Returns:
             Analysis dict with correlation and top attributes
         """
+        import pandas as pd
+        from scipy.stats import pearsonr
+
         # Load all results
         results = []
         for f in result_files:
@@ -74,8 +78,9 @@ class AttributeAnalyzer:
 
         return analysis
 
-    def _create_experiment_heatmap(self, df: pd.DataFrame, output_path: Path):
+    def _create_experiment_heatmap(self, df: "pd.DataFrame", output_path: Path):
         """Create interactive Plotly Express heatmap for SWE-bench experiments."""
+        import plotly.express as px
 
         # Calculate deltas from baseline
         if "baseline" in df.columns:
@@ -208,6 +213,8 @@ class AttributeAnalyzer:
                 - hover_data: Nested dict with tooltip info per repo/attribute
                 - overall_scores: Dict mapping repo name → (overall_score, certification)
         """
+        import pandas as pd
+
         # Collect successful assessments
         assessments = [r.assessment for r in batch_assessment.results if r.is_success()]
 
@@ -294,6 +301,8 @@ class AttributeAnalyzer:
                 - hover_data: Nested dict with tooltip info per repo/attribute
                 - overall_scores: Dict mapping repo name → (overall_score, certification)
         """
+        import pandas as pd
+
         # Collect successful assessments
         assessments = [
             r["assessment"]
@@ -373,7 +382,7 @@ class AttributeAnalyzer:
 
     def _create_batch_heatmap(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         hover_data: dict,
         overall_scores: dict,
         output_path: Path,
@@ -388,6 +397,9 @@ class AttributeAnalyzer:
         - Hover: Repo, attribute, tier, score, status, measured value, overall score
         - Annotations: Certification badges on left margin
         """
+        import pandas as pd
+        import plotly.express as px
+
         # Handle NaN values for visualization
         # Replace NaN with -1 for custom colorscale (will show as gray)
         df_display = df.fillna(-1)
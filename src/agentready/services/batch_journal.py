@@ -0,0 +1,216 @@
+"""Append-only journal of batch results, used to resume interrupted runs."""
+
+import json
+import logging
+import os
+import re
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..models import RepositoryResult
+
+logger = logging.getLogger(__name__)
+
+# Batch IDs become file names, so keep them to a safe character set
+_BATCH_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+class BatchJournal:
+    """Durable record of a batch run, one JSON line per finished repository.
+
+    The first line is a header describing the run (start time and the
+    fingerprint of version, assessors and config); each following line
+    holds one RepositoryResult. Lines are flushed and fsynced as they are
+    written, so a crash or preemption loses at most the repositories that
+    were in flight. A truncated last line from a crash is ignored.
+
+    Results are addressed by the byte offset of their line, so a batch can
+    keep offsets instead of assessments and read results back one at a
+    time (see JournaledResults).
+
+    Format: <journal_dir>/<batch_id>.jsonl
+    """
+
+    def __init__(self, journal_dir: Path, batch_id: str):
+        """Initialize journal for a batch.
+
+        Args:
+            journal_dir: Directory holding batch journals
+            batch_id: Batch identifier (used as the file name)
+
+        Raises:
+            ValueError: If batch_id is not a safe file name
+        """
+        if not _BATCH_ID_RE.match(batch_id):
+            raise ValueError(f"Invalid batch ID: {batch_id!r}")
+
+        self.journal_dir = Path(journal_dir)
+        self.batch_id = batch_id
+        self.path = self.journal_dir / f"{batch_id}.jsonl"
+        self._file = None
+
+    def exists(self) -> bool:
+        """Check whether this batch has been started before."""
+        return self.path.exists()
+
+    def load(
+        self, fingerprint: Optional[str] = None
+    ) -> tuple[Optional[datetime], dict[str, int]]:
+        """Find the successful results recorded so far.
+
+        Entries are only parsed as JSON, not rebuilt into assessments, so
+        loading a large journal does not hold its results in memory.
+
+        Args:
+            fingerprint: Fingerprint of the resuming run; must match the one
+                the batch was started with
+
+        Returns:
+            Tuple of (batch start time or None if new, mapping of repository
+            URL to the offset of its latest successful result)
+
+        Raises:
+            ValueError: If the batch was started with another fingerprint
+        """
+        started_at = None
+        offsets: dict[str, int] = {}
+        if not self.path.exists():
+            return started_at, offsets
+
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Partially written line from an interrupted run
+                    continue
+
+                if record.get("type") == "batch":
+                    if fingerprint and record.get("fingerprint") != fingerprint:
+                        raise ValueError(
+                            f"Batch {self.batch_id} was started with a different "
+                            "agentready version, assessor set or configuration"
+                        )
+                    started_at = datetime.fromisoformat(record["started_at"])
+                elif record.get("type") == "result":
+                    result = record.get("result") or {}
+                    if result.get("assessment"):
+                        offsets[result["repository_url"]] = line_offset
+
+        return started_at, offsets
+
+    def read(self, offset: int) -> RepositoryResult:
+        """Read the result recorded at offset.
+
+        Raises:
+            ValueError: If the entry cannot be read back
+        """
+        with open(self.path, "rb") as f:
+            return self._read_at(f, offset)
+
+    @staticmethod
+    def _read_at(f, offset: int) -> RepositoryResult:
+        """Read the result line starting at offset from an open journal."""
+        f.seek(offset)
+        try:
+            record = json.loads(f.readline())
+            # Results stay readable after their checkout has been deleted
+            return RepositoryResult.from_dict(record["result"], check_checkout=False)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Corrupt journal entry at offset {offset}: {e}")
+
+    def start(self, started_at: datetime, fingerprint: Optional[str] = None) -> None:
+        """Open the journal for appending, writing the header if new.
+
+        Args:
+            started_at: When the batch started
+            fingerprint: Fingerprint of version, assessors and config
+        """
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell() > 0 and not self._ends_with_newline():
+            # Terminate a line cut short by a crash so the next entry starts
+            # on its own line instead of being merged into the partial one
+            self._file.write(b"\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        if self._file.tell() == 0:
+            self._write(
+                {
+                    "type": "batch",
+                    "batch_id": self.batch_id,
+                    "started_at": started_at.isoformat(),
+                    "fingerprint": fingerprint,
+                }
+            )
+
+    def _ends_with_newline(self) -> bool:
+        """Check whether the journal's last line is complete."""
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def append(self, result: RepositoryResult) -> int:
+        """Durably record a finished repository.
+
+        Returns:
+            Offset of the entry, for read() or JournaledResults
+        """
+        return self._write({"type": "result", "result": result.to_dict()})
+
+    def _write(self, record: dict) -> int:
+        """Write one line, force it to disk and return its offset."""
+        offset = self._file.tell()
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        self._file.write(line.encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return offset
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "BatchJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class JournaledResults(Sequence):
+    """Batch results backed by a journal instead of held in memory.
+
+    Only line offsets are kept; each access reads and rebuilds the result,
+    so iterating a batch of any size holds one assessment at a time.
+    """
+
+    def __init__(self, journal: BatchJournal, offsets: list[int]):
+        """Initialize results view.
+
+        Args:
+            journal: Journal the results were appended to
+            offsets: Offset of each result, in batch order
+        """
+        self.journal = journal
+        self.offsets = list(offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.journal.read(self.offsets[index])
+
+    def __iter__(self):
+        with open(self.journal.path, "rb") as f:
+            for offset in self.offsets:
+                yield BatchJournal._read_at(f, offset)
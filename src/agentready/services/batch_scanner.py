@@ -1,16 +1,139 @@
 """Batch assessment orchestrator for multiple repositories."""
 
+import multiprocessing
+import queue
+import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
 from uuid import uuid4
 
-from ..models import BatchAssessment, BatchSummary, RepositoryResult
+from ..models import (
+    Assessment,
+    BatchAssessment,
+    BatchSummaryAggregator,
+    Repository,
+    RepositoryResult,
+)
 from .assessment_cache import AssessmentCache
+from .batch_journal import BatchJournal, JournaledResults
+from .file_metric_cache import FileMetricCache
+from .git_probe import GitProbe
 from .repository_manager import RepositoryManager
 from .scanner import Scanner
 
+# Result slot of a repository left out of the batch (see since_cache)
+SKIPPED = -1
+
+
+def _scan_repository(
+    repo_path: Path,
+    assessors: list,
+    config,
+    verbose: bool,
+    version: str,
+    command: str,
+    metric_cache_dir: Optional[Path] = None,
+    git_probe: Optional[GitProbe] = None,
+    repository_name: Optional[str] = None,
+) -> Assessment:
+    """Scan one prepared repository (runs in a scan worker).
+
+    Module-level so it can be dispatched to a process pool.
+
+    Args:
+        repo_path: Path to cloned repository
+        assessors: List of assessor instances
+        config: Custom configuration
+        verbose: Verbose output
+        version: AgentReady version
+        command: CLI command that triggered the batch
+        metric_cache_dir: Directory of the shared per-file metric cache
+            (None disables it)
+        git_probe: Git metadata collected when the repository was prepared
+        repository_name: Repository name (the clone directory name carries a
+            URL hash)
+
+    Returns:
+        Completed Assessment
+    """
+    metric_cache = FileMetricCache(metric_cache_dir) if metric_cache_dir else None
+    try:
+        scanner = Scanner(
+            repo_path,
+            config,
+            metric_cache=metric_cache,
+            git_probe=git_probe,
+            repository_name=repository_name,
+        )
+        assessment = scanner.scan(assessors, verbose, version, command)
+    finally:
+        if metric_cache is not None:
+            metric_cache.close()
+
+    # Per-scan file index and AST cache are not needed once findings exist;
+    # dropping them keeps batch memory flat and results cheap to pickle
+    assessment.repository.file_index = None
+    assessment.repository.ast_cache = None
+    assessment.repository.git_probe = None
+    return assessment
+
+
+class _CacheWriter:
+    """Single background stage that serializes writes to the assessment cache.
+
+    Writes that queue up while a transaction is in flight are committed
+    together in the next one.
+    """
+
+    # Upper bound on assessments committed per transaction
+    MAX_BATCH = 50
+
+    def __init__(self, cache: AssessmentCache, fingerprint: Optional[str] = None):
+        self.cache = cache
+        self.fingerprint = fingerprint
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="assessment-cache-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, url: str, commit_hash: str, assessment: Assessment) -> None:
+        """Queue an assessment for caching."""
+        self._queue.put((url, commit_hash, assessment))
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self._queue.get()]
+                while len(batch) < self.MAX_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    stopping = True
+                    batch = [item for item in batch if item is not None]
+                if batch:
+                    # set_many never raises; failed writes are just misses
+                    self.cache.set_many(batch, self.fingerprint)
+        finally:
+            self.cache.close()
+
 
 class BatchScanner:
     """Orchestrates batch assessment of multiple repositories.
@@ -21,22 +144,41 @@ class BatchScanner:
     - Result aggregation
     - Error handling and retry logic
     - Progress tracking
+
+    Repositories flow through a pipeline of bounded stages: a clone pool
+    (network-bound threads), a scan pool (CPU-bound processes when more
+    than one scan worker is requested) and a single cache writer.
+
+    With caching enabled, a pre-flight stage first asks every remote for its
+    HEAD commit (`git ls-remote`, concurrently) and looks the commits up in
+    the assessment cache in one query; unchanged repositories are served
+    from the cache without being cloned or scanned.
     """
 
+    # Concurrent `git ls-remote` calls in the pre-flight stage
+    PREFLIGHT_WORKERS = 16
+
     def __init__(
         self,
         cache_dir: Path = None,
         batch_id: Optional[str] = None,
         version: str = "unknown",
         command: str = "",
+        update_clones: bool = True,
+        blob_limit: Optional[str] = None,
+        sparse_patterns: Optional[list[str]] = None,
     ):
         """Initialize batch scanner.
 
         Args:
             cache_dir: Directory for caching (default: .agentready/cache)
-            batch_id: Unique batch identifier (auto-generated if not provided)
+            batch_id: Unique batch identifier (auto-generated if not provided);
+                reusing the ID of an interrupted batch resumes it
             version: AgentReady version
             command: CLI command that triggered the batch
+            update_clones: Fetch the latest commit into cached clones
+            blob_limit: Partial clone size limit for blobs (e.g., "1m")
+            sparse_patterns: Sparse-checkout patterns for clones
         """
         if cache_dir is None:
             cache_dir = Path(".agentready/cache")
@@ -46,9 +188,28 @@ class BatchScanner:
         self.version = version
         self.command = command
 
-        self.repo_manager = RepositoryManager(self.cache_dir / "repositories")
+        self.repo_manager = RepositoryManager(
+            self.cache_dir / "repositories",
+            update=update_clones,
+            blob_limit=blob_limit,
+            sparse_patterns=sparse_patterns,
+        )
         self.cache = AssessmentCache(self.cache_dir / "assessments")
 
+        # Per-file metrics keyed by blob SHA, shared by every repository
+        self.metric_cache_dir = self.cache_dir / "file-metrics"
+
+        # Journals of finished repositories, one per batch ID
+        self.journal_dir = self.cache_dir / "journals"
+
+    def journal_exists(self) -> bool:
+        """Check whether this batch ID has a journal to resume from.
+
+        Raises:
+            ValueError: If the batch ID is not a valid journal name
+        """
+        return BatchJournal(self.journal_dir, self.batch_id).exists()
+
     def scan_batch(
         self,
         repository_urls: list[str],
@@ -57,187 +218,315 @@ class BatchScanner:
         use_cache: bool = True,
         verbose: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        clone_workers: int = 1,
+        scan_workers: int = 1,
+        sinks: Optional[list] = None,
+        since_cache: bool = False,
     ) -> BatchAssessment:
         """Scan multiple repositories and generate batch assessment.
 
+        Results are not kept in memory: each one is appended to the batch
+        journal, folded into the summary and passed to the sinks as soon as
+        it finishes. The returned batch reads results back from the journal
+        on access, so memory stays flat however many repositories run.
+
         Args:
             repository_urls: List of repository URLs or local paths
             assessors: List of assessor instances
             config: Custom configuration
             use_cache: Whether to use cached results
             verbose: Verbose output
-            progress_callback: Callback function(current, total) for progress tracking
+            progress_callback: Callback function(completed, total), invoked
+                each time a repository finishes (in completion order)
+            clone_workers: Number of repositories cloned concurrently
+            scan_workers: Number of repositories scanned concurrently
+                (values above 1 scan in separate processes)
+            sinks: Streaming consumers of results (e.g., report writers).
+                Each gets open(batch_id, started_at) before the first result,
+                add(result) per finished repository (in completion order,
+                results resumed from the journal first) and close(batch) at
+                the end.
+            since_cache: Only report repositories that changed since they
+                were cached; unchanged ones are left out of the batch
 
         Returns:
-            BatchAssessment with results and summary
+            BatchAssessment with results in the same order as repository_urls
         """
         start_time = time.time()
-        results = []
+        total = len(repository_urls)
+        # Journal offset of each repository's result (SKIPPED if left out)
+        results: list[Optional[int]] = [None] * total
+        completed = 0
+        aggregator = BatchSummaryAggregator()
+        sinks = sinks or []
+
+        # Cached results are only reused for the same version, assessors and config
+        fingerprint = AssessmentCache.compute_fingerprint(
+            self.version, [a.attribute_id for a in assessors], config
+        )
 
-        for i, url in enumerate(repository_urls):
+        # A batch ID seen before resumes that run: successful results in its
+        # journal are kept, failed and unfinished repositories run again
+        journal = BatchJournal(self.journal_dir, self.batch_id)
+        started_at, journaled = journal.load(fingerprint)
+        started_at = started_at or datetime.fromtimestamp(start_time)
+        journal.start(started_at, fingerprint)
+
+        def record(i: int, result: RepositoryResult) -> None:
+            nonlocal completed
+            completed += 1
+            if since_cache and result.cached:
+                # Unchanged since cached: not part of this batch's report
+                results[i] = SKIPPED
+            else:
+                results[i] = journal.append(result)
+                aggregator.add(result)
+                for sink in sinks:
+                    sink.add(result)
             if progress_callback:
-                progress_callback(i, len(repository_urls))
-
-            result = self._assess_single_repository(
-                url,
-                assessors,
-                config,
-                use_cache,
-                verbose,
+                progress_callback(completed, total)
+
+        for sink in sinks:
+            sink.open(self.batch_id, started_at)
+        for i, url in enumerate(repository_urls):
+            if url in journaled:
+                results[i] = journaled[url]
+                result = journal.read(results[i])
+                aggregator.add(result)
+                for sink in sinks:
+                    sink.add(result)
+                completed += 1
+
+        if use_cache:
+            pending_urls = [
+                url for i, url in enumerate(repository_urls) if results[i] is None
+            ]
+            unchanged = self._preflight(pending_urls, fingerprint)
+            for i, url in enumerate(repository_urls):
+                if results[i] is None and url in unchanged:
+                    record(i, unchanged[url])
+
+        cache_writer = _CacheWriter(self.cache, fingerprint) if use_cache else None
+
+        # Per-assessor progress from parallel scans would interleave
+        scan_verbose = verbose and scan_workers <= 1
+
+        clone_pool = ThreadPoolExecutor(
+            max_workers=max(1, clone_workers), thread_name_prefix="batch-clone"
+        )
+        if scan_workers > 1:
+            scan_pool = ProcessPoolExecutor(
+                max_workers=scan_workers, mp_context=self._scan_process_context()
+            )
+        else:
+            scan_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="batch-scan"
             )
-            results.append(result)
 
-        # Calculate summary statistics
-        summary = self._calculate_summary(results)
+        # future -> (stage, index, url, repository, start_time)
+        pending: dict[Future, tuple] = {}
+        queued_urls = (
+            (i, url) for i, url in enumerate(repository_urls) if results[i] is None
+        )
+
+        # Backpressure: cap repositories in flight so clones cannot run far
+        # ahead of scanning and fill the disk
+        max_in_flight = max(1, clone_workers) + 2 * max(1, scan_workers)
+
+        def feed_clone_stage():
+            while len(pending) < max_in_flight:
+                try:
+                    i, url = next(queued_urls)
+                except StopIteration:
+                    return
+                future = clone_pool.submit(
+                    self._prepare_repository, url, use_cache, fingerprint
+                )
+                pending[future] = ("clone", i, url, None, time.time())
+
+        try:
+            feed_clone_stage()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, i, url, repository, started = pending.pop(future)
+                    result = None
+
+                    if stage == "clone":
+                        try:
+                            result, repository = future.result()
+                        except Exception as e:
+                            result = self._error_result(url, e, started)
+                        if result is None:
+                            # Cache miss: hand off to the scan stage
+                            scan_future = scan_pool.submit(
+                                _scan_repository,
+                                repository.path,
+                                assessors,
+                                config,
+                                scan_verbose,
+                                self.version,
+                                self.command,
+                                self.metric_cache_dir if use_cache else None,
+                                repository.git_probe,
+                                repository.name,
+                            )
+                            pending[scan_future] = ("scan", i, url, repository, started)
+                            continue
+                    else:
+                        try:
+                            assessment = future.result()
+                        except Exception as e:
+                            result = self._error_result(url, e, started)
+                        else:
+                            if cache_writer:
+                                cache_writer.submit(
+                                    url, repository.commit_hash, assessment
+                                )
+                            result = RepositoryResult(
+                                repository_url=url,
+                                assessment=assessment,
+                                duration_seconds=time.time() - started,
+                            )
+
+                    record(i, result)
+
+                feed_clone_stage()
+        finally:
+            clone_pool.shutdown(wait=True, cancel_futures=True)
+            scan_pool.shutdown(wait=True, cancel_futures=True)
+            if cache_writer:
+                cache_writer.close()
+            journal.close()
+
+        # No clone is being updated now, so the shared store can be compacted
+        self.repo_manager.maintain_shared_objects()
 
         # Create batch assessment
         batch = BatchAssessment(
             batch_id=self.batch_id,
-            timestamp=datetime.fromtimestamp(start_time),
-            results=results,
-            summary=summary,
+            timestamp=started_at,
+            results=JournaledResults(
+                journal, [offset for offset in results if offset != SKIPPED]
+            ),
+            summary=aggregator.summary(),
             total_duration_seconds=time.time() - start_time,
             agentready_version=self.version,
             command=self.command,
         )
 
+        for sink in sinks:
+            sink.close(batch)
         return batch
 
-    def _assess_single_repository(
-        self,
-        url: str,
-        assessors: list,
-        config=None,
-        use_cache: bool = True,
-        verbose: bool = False,
-    ) -> RepositoryResult:
-        """Assess a single repository.
+    @staticmethod
+    def _scan_process_context():
+        """Get a multiprocessing context that is safe alongside clone threads.
+
+        Plain fork would copy the clone threads' in-flight subprocess pipes
+        into scan workers and deadlock git clone; forkserver (or spawn where
+        unavailable) starts workers from a clean process instead.
+        """
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("forkserver")
+        return multiprocessing.get_context("spawn")
+
+    def _preflight(
+        self, urls: list[str], fingerprint: Optional[str]
+    ) -> dict[str, RepositoryResult]:
+        """Pre-flight stage: find remotes whose HEAD is already assessed.
+
+        Args:
+            urls: Repository URLs still to be processed
+            fingerprint: Run fingerprint cached results must match
+
+        Returns:
+            Mapping of URL to cached result for unchanged repositories
+        """
+        remote_urls = [url for url in urls if "://" in url]
+        if not remote_urls:
+            return {}
+
+        start_time = time.time()
+        with ThreadPoolExecutor(
+            max_workers=self.PREFLIGHT_WORKERS, thread_name_prefix="batch-preflight"
+        ) as pool:
+            heads = dict(
+                zip(
+                    remote_urls,
+                    pool.map(self.repo_manager.resolve_remote_head, remote_urls),
+                )
+            )
+
+        keys = [(url, sha) for url, sha in heads.items() if sha]
+        hits = self.cache.get_many(keys, fingerprint) if keys else {}
+        # Each hit is charged its share of the pre-flight time
+        duration = (time.time() - start_time) / len(remote_urls)
+        return {
+            url: RepositoryResult(
+                repository_url=url,
+                assessment=assessment,
+                duration_seconds=duration,
+                cached=True,
+            )
+            for (url, _), assessment in hits.items()
+        }
+
+    def _prepare_repository(
+        self, url: str, use_cache: bool = True, fingerprint: Optional[str] = None
+    ) -> tuple[Optional[RepositoryResult], Optional[Repository]]:
+        """Clone stage: prepare a repository and check the cache.
 
         Args:
             url: Repository URL or path
-            assessors: List of assessors
-            config: Custom configuration
             use_cache: Use cached results if available
-            verbose: Verbose output
+            fingerprint: Run fingerprint cached results must match
 
         Returns:
-            RepositoryResult with assessment or error
+            Tuple of (finished_result, repository). finished_result is set
+            for clone failures and cache hits; otherwise the repository
+            still needs to be scanned.
         """
         start_time = time.time()
 
-        try:
-            # Prepare repository (clone if needed)
-            success, repository, failure = self.repo_manager.prepare_repository(url)
-            if not success:
-                return RepositoryResult(
+        # Prepare repository (clone if needed)
+        success, repository, failure = self.repo_manager.prepare_repository(url)
+        if not success:
+            return (
+                RepositoryResult(
                     repository_url=url,
                     assessment=None,
                     error=failure.error_message,
                     error_type=failure.error_type,
                     duration_seconds=time.time() - start_time,
-                )
+                ),
+                None,
+            )
 
-            # Check cache
-            if use_cache:
-                cached = self.cache.get(url, repository.commit_hash)
-                if cached:
-                    return RepositoryResult(
+        # Check cache
+        if use_cache:
+            cached = self.cache.get(url, repository.commit_hash, fingerprint)
+            if cached:
+                return (
+                    RepositoryResult(
                         repository_url=url,
                         assessment=cached,
                         duration_seconds=time.time() - start_time,
                         cached=True,
-                    )
-
-            # Perform assessment
-            scanner = Scanner(repository.path, config)
-            assessment = scanner.scan(assessors, verbose, self.version, self.command)
-
-            # Cache result
-            if use_cache:
-                self.cache.set(url, repository.commit_hash, assessment)
-
-            return RepositoryResult(
-                repository_url=url,
-                assessment=assessment,
-                duration_seconds=time.time() - start_time,
-            )
-
-        except Exception as e:
-            return RepositoryResult(
-                repository_url=url,
-                assessment=None,
-                error=f"Unexpected error: {str(e)}",
-                error_type="assessment_error",
-                duration_seconds=time.time() - start_time,
-            )
-
-    def _calculate_summary(self, results: list[RepositoryResult]) -> BatchSummary:
-        """Calculate summary statistics from results.
-
-        Args:
-            results: List of RepositoryResult objects
+                    ),
+                    repository,
+                )
 
-        Returns:
-            BatchSummary with aggregated statistics
-        """
-        successful = [r for r in results if r.is_success()]
-        failed = [r for r in results if not r.is_success()]
+        return None, repository
 
-        # Calculate average score
-        if successful:
-            average_score = sum(r.assessment.overall_score for r in successful) / len(
-                successful
-            )
-        else:
-            average_score = 0.0
-
-        # Score distribution
-        score_distribution = {
-            "Platinum": 0,
-            "Gold": 0,
-            "Silver": 0,
-            "Bronze": 0,
-            "Needs Improvement": 0,
-        }
-        for result in successful:
-            level = result.assessment.certification_level
-            if level in score_distribution:
-                score_distribution[level] += 1
-
-        # Language breakdown
-        language_breakdown = {}
-        for result in successful:
-            for lang, count in result.assessment.repository.languages.items():
-                language_breakdown[lang] = language_breakdown.get(lang, 0) + count
-
-        # Top failing attributes
-        failing_attributes = {}
-        for result in successful:
-            for finding in result.assessment.findings:
-                if finding.status == "fail":
-                    attr_id = finding.attribute.id
-                    failing_attributes[attr_id] = failing_attributes.get(attr_id, 0) + 1
-
-        top_failing = sorted(
-            failing_attributes.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-
-        top_failing_attributes = [
-            {
-                "attribute_id": attr_id,
-                "failure_count": count,
-            }
-            for attr_id, count in top_failing
-        ]
-
-        return BatchSummary(
-            total_repositories=len(results),
-            successful_assessments=len(successful),
-            failed_assessments=len(failed),
-            average_score=average_score,
-            score_distribution=score_distribution,
-            language_breakdown=language_breakdown,
-            top_failing_attributes=top_failing_attributes,
+    def _error_result(
+        self, url: str, error: Exception, start_time: float
+    ) -> RepositoryResult:
+        """Build the result for an unexpected error in any pipeline stage."""
+        return RepositoryResult(
+            repository_url=url,
+            assessment=None,
+            error=f"Unexpected error: {str(error)}",
+            error_type="assessment_error",
+            duration_seconds=time.time() - start_time,
         )
@@ -0,0 +1,315 @@
+"""In-process cyclomatic complexity for Python and brace-delimited languages."""
+
+import ast
+import re
+from dataclasses import dataclass
+
+try:
+    from radon.visitors import ComplexityVisitor
+
+    RADON_AVAILABLE = True
+except ImportError:
+    RADON_AVAILABLE = False
+
+# Engine used for Python; part of the identity of persisted metrics
+ENGINE = "radon" if RADON_AVAILABLE else "native"
+
+# Complexity ranks as reported by radon (upper bound, rank)
+RANKS = ((5, "A"), (10, "B"), (20, "C"), (30, "D"), (40, "E"))
+
+
+@dataclass(frozen=True)
+class FunctionComplexity:
+    """Cyclomatic complexity of a single function or method.
+
+    Attributes:
+        name: Function name, qualified with its class for methods
+        lineno: Line the definition starts on
+        complexity: Number of independent paths (1 + decision points)
+    """
+
+    name: str
+    lineno: int
+    complexity: int
+
+
+def complexity_rank(complexity: int) -> str:
+    """Get the radon-style letter rank (A best, F worst) for a complexity."""
+    for upper, rank in RANKS:
+        if complexity <= upper:
+            return rank
+    return "F"
+
+
+def python_complexities(tree: ast.Module) -> list[FunctionComplexity]:
+    """Compute per-function complexity of a parsed Python module.
+
+    Uses radon's visitor when radon is installed and an equivalent native
+    visitor otherwise. Nested functions are reported separately and do not
+    add to their parent's complexity.
+
+    Args:
+        tree: Parsed module AST
+
+    Returns:
+        Complexity of every function and method in definition order
+    """
+    if RADON_AVAILABLE:
+        results = []
+        _flatten_radon_blocks(ComplexityVisitor.from_ast(tree).blocks, results)
+        return sorted(results, key=lambda f: f.lineno)
+
+    collector = _FunctionCollector()
+    collector.visit(tree)
+    return collector.functions
+
+
+def _flatten_radon_blocks(blocks, results: list[FunctionComplexity]) -> None:
+    """Collect functions, methods and closures from radon blocks."""
+    for block in blocks:
+        if hasattr(block, "methods"):
+            # Classes: methods are already part of visitor.blocks, nested
+            # classes are not
+            _flatten_radon_blocks(getattr(block, "inner_classes", []), results)
+            _flatten_radon_blocks(block.methods, results)
+            continue
+        name = f"{block.classname}.{block.name}" if block.classname else block.name
+        if not any(r.lineno == block.lineno and r.name == name for r in results):
+            results.append(FunctionComplexity(name, block.lineno, block.complexity))
+        _flatten_radon_blocks(block.closures, results)
+
+
+class _DecisionCounter(ast.NodeVisitor):
+    """Counts decision points in a function body, excluding nested scopes.
+
+    Follows radon's rules so both engines agree: if/elif/ternaries, loops
+    (+1 for an else clause), except handlers and try-else, boolean operator
+    chains, comprehension loops and filters, match cases and asserts.
+    """
+
+    def __init__(self):
+        self.decisions = 0
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        pass  # Nested functions are measured on their own
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        pass
+
+    def visit_If(self, node: ast.If) -> None:
+        self.decisions += 1
+        self.generic_visit(node)
+
+    visit_IfExp = visit_If
+
+    def visit_For(self, node: ast.For) -> None:
+        self.decisions += 1 + bool(node.orelse)
+        self.generic_visit(node)
+
+    visit_AsyncFor = visit_For
+    visit_While = visit_For
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self.decisions += len(node.handlers) + bool(node.orelse)
+        self.generic_visit(node)
+
+    visit_TryStar = visit_Try
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self.decisions += len(node.values) - 1
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node: ast.comprehension) -> None:
+        self.decisions += 1 + len(node.ifs)
+        self.generic_visit(node)
+
+    def visit_Match(self, node: ast.Match) -> None:
+        # A trailing wildcard case is the "else" and adds no path
+        has_wildcard = any(
+            isinstance(case.pattern, ast.MatchAs) and case.pattern.pattern is None
+            for case in node.cases
+        )
+        self.decisions += max(0, len(node.cases) - has_wildcard)
+        self.generic_visit(node)
+
+    def visit_Assert(self, node: ast.Assert) -> None:
+        # Like radon, the asserted expression itself is not inspected
+        self.decisions += 1
+
+
+class _FunctionCollector(ast.NodeVisitor):
+    """Finds every function and measures it with _DecisionCounter."""
+
+    def __init__(self):
+        self.functions: list[FunctionComplexity] = []
+        self._classes: list[str] = []
+        self._function_depth = 0
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        if self._function_depth:
+            # Like radon, classes local to a function are not measured
+            return
+        self._classes.append(node.name)
+        self.generic_visit(node)
+        self._classes.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        counter = _DecisionCounter()
+        for child in node.body:
+            counter.visit(child)
+        name = f"{self._classes[-1]}.{node.name}" if self._classes else node.name
+        self.functions.append(
+            FunctionComplexity(name, node.lineno, 1 + counter.decisions)
+        )
+
+        # Closures are reported unqualified, as in radon
+        classes, self._classes = self._classes, []
+        self._function_depth += 1
+        self.generic_visit(node)
+        self._function_depth -= 1
+        self._classes = classes
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+# Tokens relevant to brace-language complexity; comments and string
+# literals are matched first so their contents are ignored
+_BRACE_TOKEN_RE = re.compile(
+    r"""
+    (?P<skip>
+        //[^\n]*
+      | /\*.*?\*/
+      | "(?:\\.|[^"\\\n])*"
+      | '(?:\\.|[^'\\\n])*'
+      | `(?:\\.|[^`\\])*`
+    )
+    | (?P<word>[A-Za-z_$][\w$]*)
+    | (?P<op>&&|\|\||\?\?|\?\.|=>|[{}()?;=])
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Keywords and operators that each add one path
+_DECISION_WORDS = {"if", "for", "foreach", "while", "case", "catch"}
+_DECISION_OPS = {"&&", "||", "?"}
+
+# Parenthesized headers that open a control block rather than a function
+_CONTROL_WORDS = {
+    "if",
+    "for",
+    "foreach",
+    "while",
+    "switch",
+    "catch",
+    "with",
+    "synchronized",
+    "using",
+    "lock",
+    "fixed",
+    "return",
+    "sizeof",
+    "typeof",
+}
+
+# Words that start a new statement or declaration; a parameter list seen
+# before them cannot belong to the next brace (e.g., Go lines without ";")
+_STATEMENT_WORDS = _DECISION_WORDS | {
+    "else",
+    "do",
+    "switch",
+    "select",
+    "try",
+    "finally",
+    "return",
+    "class",
+    "interface",
+    "struct",
+    "enum",
+    "namespace",
+    "go",
+    "defer",
+}
+
+
+def brace_complexities(source: str) -> list[FunctionComplexity]:
+    """Compute per-function complexity for C-family source code.
+
+    A lightweight tokenizer-based counter for JavaScript, TypeScript, Java,
+    C, C++, Go and similar languages. A brace block opened after a parameter
+    list (optionally followed by a return type or qualifiers) or after `=>`
+    starts a function; decision keywords and short-circuit operators inside
+    it count toward the innermost function.
+
+    Args:
+        source: Source file text
+
+    Returns:
+        Complexity of every detected function in order of appearance
+    """
+    functions: list[FunctionComplexity] = []
+    # One entry per open brace: [name, lineno, decisions], or None for blocks
+    blocks: list[list | None] = []
+    open_functions: list[list] = []
+    parens: list[str | None] = []
+
+    previous = None  # Previous significant token
+    candidate = None  # Name before the last closed parameter list
+    line, position = 1, 0
+
+    for match in _BRACE_TOKEN_RE.finditer(source):
+        kind = match.lastgroup
+        if kind == "skip":
+            continue
+        token = match.group()
+
+        if kind == "word":
+            if token in _DECISION_WORDS and open_functions:
+                open_functions[-1][2] += 1
+            if token in _STATEMENT_WORDS:
+                candidate = None
+        elif token in _DECISION_OPS:
+            if open_functions:
+                open_functions[-1][2] += 1
+        elif token == "(":
+            if previous == ")":
+                # Go multiple return values: keep the function name
+                parens.append(candidate)
+            elif previous and previous[0].isalpha() and previous != "function":
+                parens.append(previous)
+            else:
+                parens.append("(anonymous)")
+            candidate = None
+        elif token == ")":
+            candidate = parens.pop() if parens else None
+            if candidate in _CONTROL_WORDS:
+                candidate = None
+        elif token == "{":
+            if previous == "=>":
+                name = "(anonymous)"
+            else:
+                name = candidate
+            if name is None:
+                blocks.append(None)
+            else:
+                line += source.count("\n", position, match.start())
+                position = match.start()
+                record = [name, line, 0]
+                blocks.append(record)
+                open_functions.append(record)
+            candidate = None
+        elif token == "}":
+            record = blocks.pop() if blocks else None
+            if record is not None:
+                open_functions.pop()
+                functions.append(
+                    FunctionComplexity(record[0], record[1], 1 + record[2])
+                )
+            candidate = None
+        elif token in (";", "="):
+            candidate = None
+
+        previous = token
+
+    return sorted(functions, key=lambda f: f.lineno)
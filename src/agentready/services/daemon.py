@@ -0,0 +1,494 @@
+"""Long-running assessment daemon that keeps warm state between scans.
+
+Every `agentready assess` run pays for interpreter start-up, imports,
+loading default weights, parsing the research report and building Jinja2
+environments before it looks at the repository. The daemon pays those
+once and then serves assessments over a Unix socket, also keeping each
+repository's metric cache open and its last assessment in memory so the
+next scan only re-runs assessors whose inputs changed.
+
+Protocol: HTTP/1.1 with JSON bodies over the socket.
+
+- GET /status: daemon version, uptime and counters
+- POST /assess: run an assessment and write its reports
+- POST /shutdown: stop the daemon
+"""
+
+import http.client
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Optional
+
+from ..assessors import create_all_assessors
+from ..models.assessment import Assessment
+from ..models.config import Config
+from ..reporters.report_files import write_assessment_reports
+from .file_metric_cache import FileMetricCache
+from .scanner import Scanner
+from .scorer import Scorer
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the default socket location
+SOCKET_ENV_VAR = "AGENTREADY_DAEMON_SOCKET"
+
+
+def default_socket_path() -> Path:
+    """Socket the daemon listens on unless told otherwise."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / ".agentready" / "daemon.sock"
+
+
+class DaemonError(Exception):
+    """Raised when the daemon rejects or fails a request."""
+
+    pass
+
+
+class AssessmentDaemon:
+    """Warm assessment state shared by every request the daemon serves.
+
+    Holds a Scorer with default weights loaded, the research report
+    version, HTML and Markdown reporters with their Jinja2 environments,
+    one FileMetricCache per output directory and the latest assessment
+    of each repository. Assessments of the same repository are serialized;
+    different repositories are assessed concurrently.
+    """
+
+    def __init__(self, version: str):
+        """Initialize daemon state.
+
+        Args:
+            version: AgentReady version reported in assessments
+        """
+        # Imported here: the daemon is the only user of Jinja2 at start-up
+        from ..reporters.html import HTMLReporter
+        from ..reporters.markdown import MarkdownReporter
+
+        self.version = version
+        self.started_at = datetime.now()
+        self.scorer = Scorer()
+        self.research_version = Scanner.load_research_version()
+        self.html_reporter = HTMLReporter()
+        self.markdown_reporter = MarkdownReporter()
+        self.assessments = 0
+
+        self._lock = threading.Lock()
+        self._repo_locks: dict[Path, threading.Lock] = {}
+        self._metric_caches: dict[Path, Optional[FileMetricCache]] = {}
+        self._previous: dict[Path, Assessment] = {}
+
+    def status(self) -> dict:
+        """Describe the running daemon."""
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "version": self.version,
+                "research_version": self.research_version,
+                "started_at": self.started_at.isoformat(),
+                "uptime_seconds": round(
+                    (datetime.now() - self.started_at).total_seconds(), 1
+                ),
+                "assessments": self.assessments,
+                "warm_repositories": len(self._previous),
+            }
+
+    def assess(
+        self,
+        repository: str,
+        output_dir: Optional[str] = None,
+        config_path: Optional[str] = None,
+        exclude: Optional[list[str]] = None,
+        jobs: int = 1,
+        previous_path: Optional[str] = None,
+    ) -> dict:
+        """Assess a repository and write its reports.
+
+        Args:
+            repository: Path to the git repository
+            output_dir: Report directory (default: <repository>/.agentready)
+            config_path: Path to a configuration file
+            exclude: Attribute IDs to skip
+            jobs: Number of assessors to run concurrently
+            previous_path: Earlier assessment JSON to reuse findings from
+                (default: this daemon's last assessment of the repository)
+
+        Returns:
+            Dict with the assessment ("assessment") and report paths
+            ("reports")
+
+        Raises:
+            DaemonError: If the request is invalid
+        """
+        repo_path = Path(repository).resolve()
+        output_path = Path(output_dir) if output_dir else repo_path / ".agentready"
+        config = self._load_config(config_path) if config_path else None
+
+        all_assessors = create_all_assessors()
+        if exclude:
+            valid_ids = {a.attribute_id for a in all_assessors}
+            invalid_ids = set(exclude) - valid_ids
+            if invalid_ids:
+                raise DaemonError(
+                    f"Invalid attribute ID(s): {', '.join(sorted(invalid_ids))}"
+                )
+            assessors = [a for a in all_assessors if a.attribute_id not in exclude]
+        else:
+            assessors = all_assessors
+
+        with self._repo_lock(repo_path):
+            output_path.mkdir(parents=True, exist_ok=True)
+            try:
+                scanner = Scanner(
+                    repo_path,
+                    config,
+                    metric_cache=self._metric_cache(output_path),
+                    scorer=self.scorer,
+                    research_version=self.research_version,
+                )
+            except ValueError as e:
+                raise DaemonError(str(e))
+
+            previous = self._previous.get(repo_path)
+            if previous_path:
+                previous = self._load_previous(Path(previous_path), repo_path)
+
+            assessment = scanner.scan(
+                assessors,
+                version=self.version,
+                command=f"agentready assess {repo_path} (daemon)",
+                jobs=max(1, jobs),
+                previous=previous,
+            )
+            reports = write_assessment_reports(
+                assessment, output_path, self.html_reporter, self.markdown_reporter
+            )
+            # Per-scan file index, AST cache and git probe are not needed to
+            # reuse findings; drop them so warm repositories stay small
+            assessment.repository.ast_cache = None
+            assessment.repository.file_index = None
+            assessment.repository.git_probe = None
+            self._previous[repo_path] = assessment
+
+        with self._lock:
+            self.assessments += 1
+
+        return {
+            "assessment": assessment.to_dict(),
+            "reports": {kind: str(path) for kind, path in reports.items()},
+        }
+
+    def _repo_lock(self, repo_path: Path) -> threading.Lock:
+        """Lock serializing assessments of one repository."""
+        with self._lock:
+            return self._repo_locks.setdefault(repo_path, threading.Lock())
+
+    def _metric_cache(self, output_path: Path) -> Optional[FileMetricCache]:
+        """Open (once) the metric cache under a report directory."""
+        cache_dir = output_path / "cache" / "file-metrics"
+        with self._lock:
+            if cache_dir not in self._metric_caches:
+                try:
+                    self._metric_caches[cache_dir] = FileMetricCache(cache_dir)
+                except (OSError, RuntimeError):
+                    self._metric_caches[cache_dir] = None
+            return self._metric_caches[cache_dir]
+
+    @staticmethod
+    def _load_config(config_path: str) -> Config:
+        """Load and validate a configuration file.
+
+        Raises:
+            DaemonError: If the file cannot be read or is invalid
+        """
+        import yaml
+        from pydantic import ValidationError
+
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                return Config.from_yaml_dict(yaml.safe_load(f))
+        except (OSError, yaml.YAMLError, ValidationError) as e:
+            raise DaemonError(f"Invalid configuration {config_path}: {e}")
+
+    @staticmethod
+    def _load_previous(path: Path, repo_path: Path) -> Optional[Assessment]:
+        """Load an earlier assessment, or None if it cannot be read."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return Assessment.from_dict(json.load(f), repository_path=repo_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring previous assessment {path}: {e}")
+            return None
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix socket, one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, daemon: AssessmentDaemon):
+        self.daemon = daemon
+        super().__init__(str(socket_path), _RequestHandler)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes daemon requests to AssessmentDaemon."""
+
+    protocol_version = "HTTP/1.1"
+    server: _UnixHTTPServer
+
+    def do_GET(self):
+        if self.path == "/status":
+            self._reply(200, self.server.daemon.status())
+        else:
+            self._reply(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._reply(400, {"error": "Request body must be JSON"})
+            return
+
+        if self.path == "/assess":
+            self._assess(request)
+        elif self.path == "/shutdown":
+            self._reply(200, {"stopping": True})
+            # shutdown() waits for serve_forever(), so call it off this thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self._reply(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def _assess(self, request: dict) -> None:
+        if not isinstance(request.get("repository"), str):
+            self._reply(400, {"error": "Missing repository"})
+            return
+        try:
+            result = self.server.daemon.assess(
+                request["repository"],
+                output_dir=request.get("output_dir"),
+                config_path=request.get("config"),
+                exclude=request.get("exclude"),
+                jobs=int(request.get("jobs", 1)),
+                previous_path=request.get("previous"),
+            )
+        except DaemonError as e:
+            self._reply(400, {"error": str(e)})
+        except Exception as e:
+            logger.exception("Assessment failed")
+            self._reply(500, {"error": f"Error during assessment: {e}"})
+        else:
+            self._reply(200, result)
+
+    def _reply(self, status: int, body: dict) -> None:
+        payload = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Unix socket clients have no address to log
+        logger.debug(format % args)
+
+
+class DaemonServer:
+    """Serves an AssessmentDaemon on a Unix socket.
+
+    The socket is created with owner-only permissions, so only the user
+    who started the daemon can submit assessments.
+    """
+
+    def __init__(self, socket_path: Path, daemon: AssessmentDaemon):
+        """Bind the socket.
+
+        Args:
+            socket_path: Unix socket to listen on
+            daemon: Warm assessment state to serve
+
+        Raises:
+            DaemonError: If another daemon is already listening there
+        """
+        self.socket_path = Path(socket_path)
+        if DaemonClient(self.socket_path).status() is not None:
+            raise DaemonError(f"A daemon is already running on {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Left behind by a daemon that did not exit cleanly
+        if self.socket_path.exists() or self.socket_path.is_symlink():
+            self.socket_path.unlink()
+
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixHTTPServer(self.socket_path, daemon)
+        finally:
+            os.umask(old_umask)
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown() or a /shutdown request."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() (call from another thread)."""
+        self._server.shutdown()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix socket."""
+
+    def __init__(self, socket_path: Path, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(str(self.socket_path))
+
+
+class DaemonClient:
+    """Thin client submitting requests to a running daemon."""
+
+    # Seconds to wait for a status or shutdown reply
+    STATUS_TIMEOUT = 2
+    # Seconds to wait for an assessment of a large repository
+    ASSESS_TIMEOUT = 3600
+
+    def __init__(self, socket_path: Optional[Path] = None):
+        """Initialize client.
+
+        Args:
+            socket_path: Daemon socket (default: default_socket_path())
+        """
+        self.socket_path = Path(socket_path or default_socket_path())
+
+    def status(self) -> Optional[dict]:
+        """Get daemon status, or None if no daemon is reachable."""
+        try:
+            return self._request("GET", "/status", timeout=self.STATUS_TIMEOUT)
+        except (OSError, DaemonError):
+            return None
+
+    def assess(
+        self,
+        repository: Path,
+        output_dir: Optional[Path] = None,
+        config_path: Optional[Path] = None,
+        exclude: Optional[list[str]] = None,
+        jobs: int = 1,
+        previous_path: Optional[Path] = None,
+    ) -> Optional[tuple[Assessment, dict[str, Path]]]:
+        """Have the daemon assess a repository and write its reports.
+
+        Args:
+            repository: Path to the git repository
+            output_dir: Report directory (default: <repository>/.agentready)
+            config_path: Path to a configuration file
+            exclude: Attribute IDs to skip
+            jobs: Number of assessors to run concurrently
+            previous_path: Earlier assessment JSON to reuse findings from
+
+        Returns:
+            Tuple of (assessment, mapping of report kind to path), or None if
+            no daemon is reachable
+
+        Raises:
+            DaemonError: If the daemon rejected or failed the assessment, or
+                did not answer within ASSESS_TIMEOUT
+        """
+        repo_path = Path(repository).resolve()
+        request = {
+            "repository": str(repo_path),
+            "output_dir": str(Path(output_dir).resolve()) if output_dir else None,
+            "config": str(Path(config_path).resolve()) if config_path else None,
+            "exclude": list(exclude or []),
+            "jobs": jobs,
+            "previous": str(Path(previous_path).resolve()) if previous_path else None,
+        }
+        try:
+            response = self._request(
+                "POST", "/assess", request, timeout=self.ASSESS_TIMEOUT
+            )
+        except TimeoutError:
+            # The daemon may still be assessing; scanning in-process as well
+            # would race it for the same reports
+            raise DaemonError(
+                f"Daemon did not finish the assessment within {self.ASSESS_TIMEOUT}s"
+            )
+        except OSError:
+            return None
+
+        assessment = Assessment.from_dict(
+            response["assessment"], repository_path=repo_path
+        )
+        reports = {kind: Path(path) for kind, path in response["reports"].items()}
+        return assessment, reports
+
+    def shutdown(self) -> bool:
+        """Ask the daemon to stop.
+
+        Returns:
+            True if a daemon was running and is stopping
+        """
+        try:
+            self._request("POST", "/shutdown", {}, timeout=self.STATUS_TIMEOUT)
+            return True
+        except (OSError, DaemonError):
+            return False
+
+    def wait_until_ready(self, timeout: float = 10.0) -> Optional[dict]:
+        """Poll until a daemon answers, returning its status or None."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = self.status()
+            if status is not None:
+                return status
+            time.sleep(0.1)
+        return None
+
+    def _request(
+        self, method: str, path: str, body: Optional[dict] = None, timeout=None
+    ) -> dict:
+        """Send one request and decode the JSON reply.
+
+        Raises:
+            OSError: If the daemon cannot be reached
+            DaemonError: If the daemon answers with an error
+        """
+        if not self.socket_path.exists():
+            raise FileNotFoundError(f"No daemon socket at {self.socket_path}")
+
+        connection = _UnixHTTPConnection(self.socket_path, timeout)
+        try:
+            payload = json.dumps(body).encode("utf-8") if body is not None else None
+            headers = {"Content-Type": "application/json"} if payload else {}
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = json.loads(response.read() or b"{}")
+        except (http.client.HTTPException, ValueError) as e:
+            raise DaemonError(f"Invalid daemon response: {e}")
+        finally:
+            connection.close()
+
+        if response.status != 200:
+            raise DaemonError(data.get("error", f"HTTP {response.status}"))
+        return data
@@ -0,0 +1,337 @@
+"""Per-scan file index shared by the scanner and all assessors."""
+
+import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from .git_probe import GitProbe, list_tracked_files
+
+logger = logging.getLogger(__name__)
+
+# Whitespace dropped before blank-line detection (newlines are kept)
+_BLANK_BYTES = b" \t\r\f\v"
+
+
+class _LineCounter:
+    """Counts total and non-blank lines over a stream of byte chunks.
+
+    Newlines are counted with bytes.count and blank lines are found by
+    deleting whitespace in bulk, so no Python-level loop runs per line and
+    memory stays bounded by the chunk size however long the lines are.
+    """
+
+    def __init__(self):
+        self.newlines = 0
+        self.non_blank = 0
+        # Content seen after the last newline (any byte / non-whitespace)
+        self._open = False
+        self._pending = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Count one chunk of content."""
+        if not chunk:
+            return
+        self.newlines += chunk.count(b"\n")
+
+        # After deleting whitespace, blank lines are the empty parts
+        parts = chunk.translate(None, _BLANK_BYTES).split(b"\n")
+        if len(parts) > 1:
+            # parts[0] completes the pending line, parts[-1] starts a new one
+            empty = parts.count(b"") - (not parts[-1])
+            if self._pending and not parts[0]:
+                empty -= 1
+            self.non_blank += len(parts) - 1 - empty
+            self._pending = bool(parts[-1])
+        else:
+            self._pending = self._pending or bool(parts[0])
+        self._open = not chunk.endswith(b"\n")
+
+    def result(self) -> tuple[int, int]:
+        """Get (total, non-blank) counts; an unterminated last line counts."""
+        return self.newlines + self._open, self.non_blank + self._pending
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """A single tracked file captured in the file index.
+
+    Attributes:
+        path: Repository-relative POSIX path (e.g., "src/app/main.py")
+        suffix: Lowercased file extension including the dot (e.g., ".py")
+        size: File size in bytes
+        mtime: Last modification time (seconds since epoch)
+        blob_sha: Git blob SHA of the content, or None if the file is
+            untracked or modified in the working tree
+    """
+
+    path: str
+    suffix: str
+    size: int
+    mtime: float
+    blob_sha: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Final path component (e.g., "main.py")."""
+        return PurePosixPath(self.path).name
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Path components (e.g., ("src", "app", "main.py"))."""
+        return PurePosixPath(self.path).parts
+
+
+class FileIndex:
+    """Immutable snapshot of the files in a repository, built once per scan.
+
+    Lists tracked files with a single `git ls-files` call (falling back to a
+    filesystem walk outside of git) and records suffix, size, mtime and the
+    git blob SHA for each entry. Line counts are computed lazily on first
+    request and cached, so assessors can query the index instead of
+    shelling out or re-walking the tree.
+    """
+
+    # Directories skipped by the filesystem fallback walk
+    EXCLUDED_DIRS = {
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".pytest_cache",
+    }
+
+    # Bytes inspected when sniffing for binary content
+    BINARY_SNIFF_BYTES = 8192
+
+    # Read size when streaming files for line counts
+    LINE_COUNT_CHUNK_BYTES = 1024 * 1024
+
+    # Default threads for bulk line counting
+    LINE_COUNT_WORKERS = 8
+
+    def __init__(self, root: Path, files: list[IndexedFile], tracked: bool = True):
+        """Initialize index from pre-collected entries.
+
+        Args:
+            root: Repository root the entry paths are relative to
+            files: Indexed file entries
+            tracked: True if entries came from git (respects .gitignore)
+        """
+        self.root = Path(root)
+        self.tracked = tracked
+        self._files = tuple(sorted(files, key=lambda f: f.path))
+        self._by_path = {f.path: f for f in self._files}
+        self._line_counts: dict[str, tuple[int, int] | None] = {}
+
+    @classmethod
+    def build(cls, root: Path, git_probe: GitProbe | None = None) -> "FileIndex":
+        """Build index for repository.
+
+        Args:
+            root: Path to repository root
+            git_probe: Probe of the repository whose tracked file listing
+                is reused (probed here if not provided)
+
+        Returns:
+            FileIndex over tracked files (or all files if git is unavailable)
+        """
+        root = Path(root)
+        try:
+            if git_probe is not None:
+                blob_shas = git_probe.tracked_files()
+            else:
+                blob_shas = list_tracked_files(root)
+            tracked = True
+        except Exception:
+            # Fall back to pathlib walk (less accurate)
+            blob_shas = dict.fromkeys(cls._walk_files(root))
+            tracked = False
+
+        files = []
+        for rel_path, blob_sha in blob_shas.items():
+            try:
+                st = os.stat(root / rel_path)
+            except OSError:
+                # Tracked but missing from the working tree
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                # Submodules and other non-regular entries
+                continue
+            files.append(
+                IndexedFile(
+                    path=rel_path,
+                    suffix=PurePosixPath(rel_path).suffix.lower(),
+                    size=st.st_size,
+                    mtime=st.st_mtime,
+                    blob_sha=blob_sha,
+                )
+            )
+
+        return cls(root, files, tracked=tracked)
+
+    @classmethod
+    def _walk_files(cls, root: Path) -> list[str]:
+        """List files by walking the filesystem, pruning excluded directories."""
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in cls.EXCLUDED_DIRS]
+            rel_dir = Path(dirpath).relative_to(root)
+            for filename in filenames:
+                paths.append((rel_dir / filename).as_posix())
+        return paths
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self):
+        return iter(self._files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._by_path
+
+    @property
+    def files(self) -> tuple[IndexedFile, ...]:
+        """All indexed files, sorted by path."""
+        return self._files
+
+    def get(self, path: str) -> IndexedFile | None:
+        """Get entry by repository-relative path."""
+        return self._by_path.get(path)
+
+    def absolute_path(self, entry: IndexedFile | str) -> Path:
+        """Resolve entry (or relative path) against the repository root."""
+        path = entry.path if isinstance(entry, IndexedFile) else entry
+        return self.root / path
+
+    def with_suffix(self, *suffixes: str) -> list[IndexedFile]:
+        """Get files matching any of the given extensions (e.g., ".py")."""
+        wanted = {s.lower() for s in suffixes}
+        return [f for f in self._files if f.suffix in wanted]
+
+    def named(self, *names: str) -> list[IndexedFile]:
+        """Get files whose final path component matches any of the names."""
+        wanted = set(names)
+        return [f for f in self._files if f.name in wanted]
+
+    def excluding_dirs(
+        self, files: list[IndexedFile], excluded: set[str]
+    ) -> list[IndexedFile]:
+        """Filter out files located under any of the excluded directory names."""
+        return [f for f in files if not any(part in excluded for part in f.parts)]
+
+    def line_count(self, entry: IndexedFile | str) -> int | None:
+        """Get total line count for a file.
+
+        Args:
+            entry: Indexed file or repository-relative path
+
+        Returns:
+            Number of lines, or None if the file is binary or unreadable
+        """
+        counts = self._get_line_counts(entry)
+        return counts[0] if counts else None
+
+    def code_line_count(self, entry: IndexedFile | str) -> int | None:
+        """Get non-blank line count for a file.
+
+        Args:
+            entry: Indexed file or repository-relative path
+
+        Returns:
+            Number of non-blank lines, or None if binary or unreadable
+        """
+        counts = self._get_line_counts(entry)
+        return counts[1] if counts else None
+
+    def _get_line_counts(self, entry: IndexedFile | str) -> tuple[int, int] | None:
+        """Compute (total, non-blank) line counts once per file."""
+        path = entry.path if isinstance(entry, IndexedFile) else entry
+        if path not in self._line_counts:
+            self._line_counts[path] = self._count_lines(self.root / path)
+        return self._line_counts[path]
+
+    def count_lines(
+        self, entries: list[IndexedFile], max_workers: int = LINE_COUNT_WORKERS
+    ) -> None:
+        """Compute line counts for many files ahead of use, on a thread pool.
+
+        Results land in the same per-file cache that line_count and
+        code_line_count read, so later queries are free.
+
+        Args:
+            entries: Indexed files to count
+            max_workers: Maximum number of concurrent readers
+        """
+        pending = [entry for entry in entries if entry.path not in self._line_counts]
+        if max_workers <= 1 or len(pending) <= 1:
+            for entry in pending:
+                self._get_line_counts(entry)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)),
+            thread_name_prefix="line-count",
+        ) as executor:
+            counts = executor.map(
+                lambda entry: self._count_lines(self.root / entry.path), pending
+            )
+            for entry, entry_counts in zip(pending, counts):
+                self._line_counts.setdefault(entry.path, entry_counts)
+
+    def prime_line_counts(self, entry: IndexedFile | str, content: bytes) -> None:
+        """Record line counts from content another consumer already read.
+
+        Args:
+            entry: Indexed file or repository-relative path
+            content: Raw file content
+        """
+        path = entry.path if isinstance(entry, IndexedFile) else entry
+        if path not in self._line_counts:
+            self._line_counts[path] = self._count_content_lines(content)
+
+    def record_line_counts(
+        self, entry: IndexedFile | str, counts: tuple[int, int] | None
+    ) -> None:
+        """Record (total, non-blank) line counts known from elsewhere.
+
+        Used when counts for the same content were stored by an earlier scan,
+        so the file does not have to be read at all.
+
+        Args:
+            entry: Indexed file or repository-relative path
+            counts: (total, non-blank) line counts, or None for binary files
+        """
+        path = entry.path if isinstance(entry, IndexedFile) else entry
+        self._line_counts.setdefault(path, counts)
+
+    def _count_lines(self, full_path: Path) -> tuple[int, int] | None:
+        """Stream a file in chunks counting total and non-blank lines.
+
+        Only the leading block is read before binary files are skipped.
+        """
+        counter = _LineCounter()
+        try:
+            with open(full_path, "rb") as f:
+                head = f.read(self.BINARY_SNIFF_BYTES)
+                if b"\0" in head:
+                    return None
+                counter.feed(head)
+                while chunk := f.read(self.LINE_COUNT_CHUNK_BYTES):
+                    counter.feed(chunk)
+        except OSError:
+            return None
+        return counter.result()
+
+    def _count_content_lines(self, content: bytes) -> tuple[int, int] | None:
+        """Count total and non-blank lines in raw content."""
+        # Skip binary files (NUL byte in the leading block)
+        if b"\0" in content[: self.BINARY_SNIFF_BYTES]:
+            return None
+
+        counter = _LineCounter()
+        counter.feed(content)
+        return counter.result()
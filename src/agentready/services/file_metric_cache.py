@@ -0,0 +1,171 @@
+"""Content-addressed SQLite store of per-file metrics keyed by git blob SHA."""
+
+import json
+import sqlite3
+import sys
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from .complexity import ENGINE as COMPLEXITY_ENGINE
+from .sqlite_store import SQLiteStore
+
+
+class FileMetricCache(SQLiteStore):
+    """Persistent store mapping git blob SHAs to per-file metrics.
+
+    A blob SHA identifies file content, so metrics computed once are valid
+    for every copy of that content: unchanged files across commits and
+    branches, vendored files, forks and template-derived repositories in a
+    batch. Entries never expire; they are only invalidated by bumping
+    METRICS_VERSION, a different Python version (which can change what
+    parses) or a different complexity engine.
+
+    Schema: file_metrics(blob_sha, version, metrics)
+
+    Each thread reuses one long-lived connection in WAL mode so assessors on
+    worker threads and scan processes in a batch can share the database.
+    Metrics are stored as zlib-compressed JSON.
+    """
+
+    # Bump whenever the shape or meaning of stored metrics changes
+    METRICS_VERSION = 3
+
+    # Blob SHAs per bulk lookup, within SQLite's variable limit
+    BULK_CHUNK_SIZE = 900
+
+    def __init__(self, cache_dir: Path):
+        """Initialize file metric cache.
+
+        Args:
+            cache_dir: Directory for cache database
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(self.cache_dir / "file_metrics.db")
+        self.version = (
+            f"{self.METRICS_VERSION}-py{sys.version_info[0]}.{sys.version_info[1]}"
+            f"-{COMPLEXITY_ENGINE}"
+        )
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize database schema."""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS file_metrics (
+                        blob_sha TEXT NOT NULL,
+                        version TEXT NOT NULL,
+                        metrics BLOB NOT NULL,
+                        PRIMARY KEY (blob_sha, version)
+                    )
+                    """
+                )
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to initialize file metric cache: {e}")
+
+    def get_many(self, blob_shas: list[str]) -> dict[str, dict]:
+        """Get stored metrics for many blobs at once.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
+        Args:
+            blob_shas: Git blob SHAs to look up
+
+        Returns:
+            Mapping of blob SHA to metrics dict for hits; misses are omitted
+        """
+        hits = {}
+        unique_shas = list(dict.fromkeys(blob_shas))
+
+        try:
+            conn = self._connection()
+            for start in range(0, len(unique_shas), self.BULK_CHUNK_SIZE):
+                chunk = unique_shas[start : start + self.BULK_CHUNK_SIZE]
+                placeholders = ", ".join(["?"] * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT blob_sha, metrics FROM file_metrics
+                    WHERE version = ? AND blob_sha IN ({placeholders})
+                    """,
+                    [self.version, *chunk],
+                ).fetchall()
+
+                for blob_sha, payload in rows:
+                    metrics = self._load_payload(payload)
+                    if metrics is not None:
+                        hits[blob_sha] = metrics
+        except sqlite3.Error:
+            pass
+
+        return hits
+
+    def set_many(self, entries: dict[str, dict]) -> int:
+        """Store metrics for many blobs in a single transaction.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
+        Args:
+            entries: Mapping of blob SHA to JSON-serializable metrics dict
+
+        Returns:
+            Number of entries written (0 if the transaction failed)
+        """
+        if not entries:
+            return 0
+
+        try:
+            rows = [
+                (blob_sha, self.version, self._dump_payload(metrics))
+                for blob_sha, metrics in entries.items()
+            ]
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO file_metrics (blob_sha, version, metrics)
+                    VALUES (?, ?, ?)
+                    """,
+                    rows,
+                )
+            return len(rows)
+        except (sqlite3.Error, TypeError, ValueError):
+            return 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        try:
+            conn = self._connection()
+            total = conn.execute("SELECT COUNT(*) FROM file_metrics").fetchone()[0]
+            current = conn.execute(
+                "SELECT COUNT(*) FROM file_metrics WHERE version = ?",
+                (self.version,),
+            ).fetchone()[0]
+            return {
+                "total_entries": total,
+                "current_entries": current,
+                "database_path": str(self.db_path),
+                "version": self.version,
+            }
+        except sqlite3.Error:
+            return {}
+
+    def _dump_payload(self, metrics: dict) -> bytes:
+        """Serialize and compress metrics for storage."""
+        metrics_json = json.dumps(metrics, separators=(",", ":"))
+        return zlib.compress(metrics_json.encode("utf-8"), self.COMPRESSION_LEVEL)
+
+    @staticmethod
+    def _load_payload(payload: bytes) -> Optional[dict]:
+        """Decompress and deserialize stored metrics (None if corrupt)."""
+        try:
+            return json.loads(zlib.decompress(payload).decode("utf-8"))
+        except (zlib.error, UnicodeDecodeError, ValueError, TypeError):
+            return None
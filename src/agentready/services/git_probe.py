@@ -0,0 +1,246 @@
+"""Single-pass collection of the git metadata a scan needs."""
+
+import hashlib
+import logging
+import subprocess
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..utils.subprocess_utils import SubprocessSecurityError, safe_subprocess_run
+
+logger = logging.getLogger(__name__)
+
+# Field separator for `git log --format` (records are NUL-separated)
+_FIELD_SEP = "\x1f"
+
+
+def _git(root: Path, args: list[str], check: bool = False):
+    """Run a read-only git command in root."""
+    # Security: Use safe_subprocess_run for validation and limits
+    return safe_subprocess_run(
+        ["git", *args],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=check,
+    )
+
+
+def list_tracked_files(root: Path) -> dict[str, str | None]:
+    """List tracked files with their blob SHAs in one git invocation.
+
+    `git ls-files -c` reports the staged SHA of every entry and `-m` lists
+    entries whose working tree copy differs from the index a second time.
+    Those modified (or deleted) files get None since their content has no
+    known SHA; unmerged paths also get None.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Mapping of repository-relative path to blob SHA (or None)
+
+    Raises:
+        subprocess.CalledProcessError: If git cannot list the files
+    """
+    result = _git(root, ["ls-files", "-z", "-s", "-c", "-m"], check=True)
+    blob_shas: dict[str, str | None] = {}
+    for record in result.stdout.split("\0"):
+        if not record:
+            continue
+        # "<mode> <sha> <stage>\t<path>"; repeated paths are modified/unmerged
+        info, path = record.split("\t", 1)
+        _, sha, stage = info.split(" ")
+        if path in blob_shas:
+            blob_shas[path] = None
+        else:
+            blob_shas[path] = sha if stage == "0" else None
+    return blob_shas
+
+
+def list_untracked_files(root: Path) -> list[str]:
+    """List untracked files that are not ignored.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Repository-relative POSIX paths
+
+    Raises:
+        subprocess.CalledProcessError: If git cannot list the files
+    """
+    result = _git(root, ["ls-files", "-z", "--others", "--exclude-standard"], True)
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def hash_blob(path: Path) -> str | None:
+    """Compute the git blob SHA of a file's current content.
+
+    Matches `git hash-object`, so working tree files can be compared with
+    the SHAs git records for committed content.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex blob SHA, or None if the file cannot be read
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+@dataclass(frozen=True)
+class CommitInfo:
+    """A commit from the repository's recent history.
+
+    Attributes:
+        sha: Full commit SHA
+        author: Author name
+        authored_at: Author date (UTC)
+        subject: First line of the commit message
+    """
+
+    sha: str
+    author: str
+    authored_at: datetime
+    subject: str
+
+
+@dataclass
+class GitProbe:
+    """Git metadata of a repository, collected once and shared by consumers.
+
+    Branch, HEAD, remote URL and recent history are read eagerly with two
+    git invocations; the tracked file listing (with blob SHAs) takes one
+    more and is loaded on first use, so callers that only need HEAD (e.g.,
+    cache lookups in a batch) never pay for it. The probe is picklable and
+    travels with a prepared repository to the process that scans it.
+
+    Attributes:
+        root: Repository root
+        branch: Current branch name ("HEAD" when detached)
+        commit_hash: HEAD commit SHA, or None if there are no commits
+        remote_url: URL of the origin remote, if any
+        recent_commits: Newest first, up to RECENT_COMMITS entries
+    """
+
+    # Commits of history collected by collect()
+    RECENT_COMMITS = 20
+
+    root: Path
+    branch: str
+    commit_hash: str | None
+    remote_url: str | None
+    recent_commits: list[CommitInfo] = field(default_factory=list)
+    _tracked_files: dict[str, str | None] | None = field(default=None, repr=False)
+
+    @classmethod
+    def collect(cls, root: Path, list_files: bool = False) -> "GitProbe":
+        """Probe a repository.
+
+        Args:
+            root: Repository root
+            list_files: Also list tracked files now instead of on first use
+
+        Returns:
+            GitProbe for the repository
+
+        Raises:
+            subprocess.CalledProcessError: If the tracked files cannot be
+                listed (only with list_files)
+        """
+        root = Path(root)
+        branch, commit_hash, commits = cls._read_head_and_log(root)
+        probe = cls(
+            root=root,
+            branch=branch,
+            commit_hash=commit_hash,
+            remote_url=cls._read_remote_url(root),
+            recent_commits=commits,
+        )
+        if list_files:
+            probe.tracked_files()
+        return probe
+
+    def tracked_files(self) -> dict[str, str | None]:
+        """List tracked files with their blob SHAs (loaded once).
+
+        See list_tracked_files.
+
+        Returns:
+            Mapping of repository-relative path to blob SHA (or None)
+
+        Raises:
+            subprocess.CalledProcessError: If git cannot list the files
+        """
+        if self._tracked_files is None:
+            self._tracked_files = list_tracked_files(self.root)
+        return self._tracked_files
+
+    @classmethod
+    def _read_head_and_log(cls, root: Path) -> tuple[str, str | None, list[CommitInfo]]:
+        """Read branch, HEAD SHA and recent commits with one `git log`.
+
+        The branch comes from the "HEAD -> <branch>" decoration of the
+        newest commit; a detached HEAD has no arrow.
+        """
+        fmt = _FIELD_SEP.join(["%H", "%D", "%an", "%at", "%s"])
+        try:
+            result = _git(
+                root,
+                [
+                    "log",
+                    "-z",
+                    f"-n{cls.RECENT_COMMITS}",
+                    "--decorate-refs=HEAD",
+                    "--decorate-refs=refs/heads/",
+                    f"--format={fmt}",
+                    "HEAD",
+                    "--",
+                ],
+            )
+        except (SubprocessSecurityError, subprocess.SubprocessError, OSError) as e:
+            logger.debug(f"Cannot read git history of {root}: {e}")
+            return "HEAD", None, []
+        if result.returncode != 0:
+            # No commits yet (or not a repository)
+            return "HEAD", None, []
+
+        branch = "HEAD"
+        commits = []
+        for record in result.stdout.split("\0"):
+            fields = record.split(_FIELD_SEP)
+            if len(fields) != 5:
+                continue
+            sha, decorations, author, timestamp, subject = fields
+            if not commits:
+                for ref in decorations.split(", "):
+                    if ref.startswith("HEAD -> "):
+                        branch = ref[len("HEAD -> ") :]
+            commits.append(
+                CommitInfo(
+                    sha=sha,
+                    author=author,
+                    authored_at=datetime.fromtimestamp(int(timestamp), timezone.utc),
+                    subject=subject,
+                )
+            )
+
+        return branch, commits[0].sha if commits else None, commits
+
+    @classmethod
+    def _read_remote_url(cls, root: Path) -> str | None:
+        """Read the origin remote URL from git config."""
+        try:
+            result = _git(root, ["config", "--get", "remote.origin.url"])
+        except (SubprocessSecurityError, subprocess.SubprocessError, OSError):
+            return None
+        url = result.stdout.strip()
+        return url if result.returncode == 0 and url else None
@@ -11,13 +11,25 @@ SECURITY REQUIREMENTS:
 - API errors caught and sanitized
 """
 
+import hashlib
+import json
 import logging
+import math
 import os
 import re
+import sqlite3
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import parse_header_links
+
+from .sqlite_store import SQLiteStore
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +46,100 @@ class GitHubAPIError(Exception):
     pass
 
 
+class GitHubResponseCache(SQLiteStore):
+    """SQLite store of GitHub API responses keyed by request, for ETags.
+
+    Repeat enumerations send If-None-Match with the stored ETag; GitHub
+    answers 304 Not Modified (which does not count against the rate limit)
+    and the stored body is reused.
+
+    Schema: responses(request_key, etag, body, cached_at)
+
+    SECURITY: Listings differ per token, so request keys are a SHA-256 of
+    token and URL; the token itself is never stored.
+
+    Each thread reuses one long-lived connection in WAL mode so concurrent
+    page fetches can share the database. Bodies are stored as
+    zlib-compressed JSON.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cache database
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(self.cache_dir / "github_responses.db")
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize database schema."""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS responses (
+                        request_key TEXT PRIMARY KEY,
+                        etag TEXT NOT NULL,
+                        body BLOB NOT NULL,
+                        cached_at TEXT NOT NULL
+                    )
+                    """
+                )
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to initialize GitHub response cache: {e}")
+
+    def get(self, request_key: str) -> Optional[tuple[str, object]]:
+        """Get the stored ETag and body for a request.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
+        Returns:
+            Tuple of (etag, decoded JSON body), or None if not cached
+        """
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT etag, body FROM responses WHERE request_key = ?",
+                    (request_key,),
+                )
+                .fetchone()
+            )
+            if row is None:
+                return None
+            return row[0], json.loads(zlib.decompress(row[1]))
+        except (sqlite3.Error, zlib.error, ValueError):
+            return None
+
+    def set(self, request_key: str, etag: str, body: object) -> bool:
+        """Store a response.
+
+        Returns:
+            True if stored, False on error
+        """
+        try:
+            payload = zlib.compress(
+                json.dumps(body).encode("utf-8"), self.COMPRESSION_LEVEL
+            )
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                    (request_key, etag, body, cached_at)
+                    VALUES (?, ?, ?, datetime('now'))
+                    """,
+                    (request_key, etag, payload),
+                )
+            return True
+        except (sqlite3.Error, TypeError, ValueError):
+            return False
+
+
 class GitHubOrgScanner:
     """Discovers repositories from GitHub organizations.
 
@@ -43,6 +149,13 @@ class GitHubOrgScanner:
     - Enforce repository limit (default: 100)
     - Implement rate limiting
     - Validate org name (alphanumeric + hyphens only)
+
+    Pages are fetched over one pooled keep-alive session. Once the first
+    page's Link header gives the last page, the remaining pages are fetched
+    concurrently, a few at a time, until max_repos is reached. Requests are
+    paced from X-RateLimit-Remaining/Reset: nothing is slowed down while
+    quota is plentiful, requests are spread out until the reset when it runs
+    low, and an exhausted limit is waited out if the reset is near.
     """
 
     # GitHub token pattern (ghp_ followed by 36 alphanumeric characters)
@@ -51,11 +164,38 @@ class GitHubOrgScanner:
     # Organization name pattern (alphanumeric and hyphens, max 39 chars)
     ORG_PATTERN = re.compile(r"^[a-zA-Z0-9-]{1,39}$")
 
-    def __init__(self, token: Optional[str] = None):
+    API_URL = "https://api.github.com"
+
+    # Repositories per page (GitHub maximum)
+    PER_PAGE = 100
+
+    # Below this many remaining requests, spread requests out until reset
+    RATE_LIMIT_LOW_WATERMARK = 10
+
+    # Longest wait for a rate limit reset before giving up (seconds)
+    MAX_RATE_LIMIT_WAIT = 60
+
+    # Rate limited retries of one request before giving up
+    MAX_RETRIES = 3
+
+    # Longest delay inserted between requests while quota is low (seconds)
+    MAX_PACING_DELAY = 5
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        api_url: str = API_URL,
+        max_workers: int = 4,
+    ):
         """Initialize GitHub scanner.
 
         Args:
             token: GitHub personal access token (optional, defaults to GITHUB_TOKEN env var)
+            cache_dir: Directory for the ETag response cache (optional;
+                without it every page is downloaded)
+            api_url: GitHub API base URL
+            max_workers: Pages fetched concurrently
 
         Raises:
             GitHubAuthError: If token is missing or invalid
@@ -71,6 +211,24 @@ class GitHubOrgScanner:
 
         self._validate_token_format()
 
+        self.api_url = api_url.rstrip("/")
+        self.max_workers = max(1, max_workers)
+        self.response_cache = GitHubResponseCache(cache_dir) if cache_dir else None
+
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
     def _validate_token_format(self):
         """Validate GitHub token format.
 
@@ -121,107 +279,270 @@ class GitHubOrgScanner:
 
         logger.info(f"Scanning GitHub organization: {org_name}")
 
-        repos = []
-        page = 1
-        per_page = 100
+        url = f"{self.api_url}/orgs/{org_name}/repos"
+        params = {
+            "per_page": self.PER_PAGE,
+            "type": "all" if include_private else "public",
+        }
+
+        repos: List[str] = []
+        batch, last_page = self._fetch_page(url, params, 1, org_name)
+        done = self._collect(batch, repos, include_private, max_repos)
+
+        if last_page is not None:
+            # Remaining pages are known: fetch them concurrently, in order
+            pages = iter(range(2, last_page + 1))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while not done:
+                    # Enough pages to reach max_repos if nothing is filtered
+                    needed = math.ceil((max_repos - len(repos)) / self.PER_PAGE)
+                    wave = [
+                        p for _, p in zip(range(min(needed, self.max_workers)), pages)
+                    ]
+                    if not wave:
+                        break
+                    results = executor.map(
+                        lambda p: self._fetch_page(url, params, p, org_name)[0],
+                        wave,
+                    )
+                    for batch in results:
+                        if self._collect(batch, repos, include_private, max_repos):
+                            done = True
+                            break
+        else:
+            # No Link header: page until an empty or short page
+            page = 1
+            while not done and len(batch) == self.PER_PAGE:
+                page += 1
+                batch, _ = self._fetch_page(url, params, page, org_name)
+                done = self._collect(batch, repos, include_private, max_repos)
 
-        while len(repos) < max_repos:
-            url = f"https://api.github.com/orgs/{org_name}/repos"
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "type": "all" if include_private else "public",
-            }
+        logger.info(f"Found {len(repos)} repositories in {org_name}")
+        return repos[:max_repos]
+
+    def _collect(
+        self, batch: list, repos: List[str], include_private: bool, max_repos: int
+    ) -> bool:
+        """Add clone URLs from one page to repos.
 
+        Returns:
+            True when no more pages are needed
+        """
+        # No more repos
+        if not batch:
+            return True
+
+        # Filter and collect repos
+        for repo in batch:
+            # Skip private repos unless explicitly included
+            if not include_private and repo.get("private", False):
+                continue
+
+            # Skip archived repos
+            if repo.get("archived", False):
+                logger.info(f"Skipping archived repo: {repo['name']}")
+                continue
+
+            clone_url = repo.get("clone_url")
+            if clone_url:
+                repos.append(clone_url)
+
+                if len(repos) >= max_repos:
+                    logger.warning(
+                        f"Reached repository limit ({max_repos}). "
+                        "Increase --max-repos to scan more repositories"
+                    )
+                    return True
+
+        return False
+
+    def _fetch_page(
+        self, url: str, params: dict, page: int, org_name: str
+    ) -> tuple[list, Optional[int]]:
+        """Fetch one page of repositories, conditionally if cached.
+
+        Returns:
+            Tuple of (repositories on the page, last page number from the
+            Link header or None if the response has no Link header)
+
+        Raises:
+            GitHubAPIError: If the request fails
+            GitHubAuthError: If authentication or authorization fails
+        """
+        params = {**params, "page": page}
+        request_key = hashlib.sha256(
+            f"{self.token}\0{url}?{sorted(params.items())}".encode("utf-8")
+        ).hexdigest()
+        cached = self.response_cache.get(request_key) if self.response_cache else None
+
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._request(url, params, headers, org_name)
+
+        last_page = self._last_page(response, page)
+        if cached and response.status_code == 304:
+            logger.debug(f"Not modified: {org_name} page {page}")
+            return cached[1], last_page
+
+        # Parse response
+        try:
+            batch = response.json()
+        except ValueError:
+            raise GitHubAPIError("Invalid JSON response from GitHub API")
+
+        etag = response.headers.get("ETag")
+        if self.response_cache and isinstance(etag, str):
+            self.response_cache.set(request_key, etag, batch)
+
+        return batch, last_page
+
+    def _request(
+        self, url: str, params: dict, headers: dict, org_name: str
+    ) -> requests.Response:
+        """Send a GET request, waiting out rate limits that reset soon.
+
+        Raises:
+            GitHubAPIError: If still rate limited after MAX_RETRIES retries
+        """
+        retries = 0
+        while True:
+            self._pace()
             try:
-                response = requests.get(
-                    url,
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github.v3+json",
-                    },
-                    params=params,
-                    timeout=30,
+                response = self._session.get(
+                    url, params=params, headers=headers, timeout=30
                 )
-                response.raise_for_status()
+                if response.status_code != 304:
+                    response.raise_for_status()
 
             except requests.Timeout:
                 raise GitHubAPIError(f"GitHub API timeout for organization: {org_name}")
 
             except requests.HTTPError as e:
-                # SECURITY: Redact token before raising
-                safe_error = self._redact_token(str(e))
-
-                if response.status_code == 404:
-                    raise GitHubAPIError(
-                        f"Organization not found: {org_name}\n"
-                        "Verify the organization name is correct and your token has access"
-                    )
-                elif response.status_code == 401:
-                    raise GitHubAuthError(
-                        "GitHub authentication failed. Check your GITHUB_TOKEN"
-                    )
-                elif response.status_code == 403:
-                    # Check if rate limited
-                    if "rate limit" in response.text.lower():
+                if self._wait_for_rate_limit(response):
+                    retries += 1
+                    if retries > self.MAX_RETRIES:
                         raise GitHubAPIError(
-                            "GitHub API rate limit exceeded. Try again later or use authentication"
+                            "GitHub API rate limit still exceeded after "
+                            f"{self.MAX_RETRIES} retries for organization: {org_name}"
                         )
-                    raise GitHubAuthError(
-                        "GitHub authorization failed. Your token may lack required permissions"
-                    )
-                else:
-                    raise GitHubAPIError(f"GitHub API error: {safe_error}")
+                    continue
+                self._raise_for_error(response, e, org_name)
 
             except requests.RequestException as e:
                 # SECURITY: Redact token before raising
                 safe_error = self._redact_token(str(e))
                 raise GitHubAPIError(f"GitHub API request failed: {safe_error}")
 
-            # Parse response
-            try:
-                batch = response.json()
-            except ValueError:
-                raise GitHubAPIError("Invalid JSON response from GitHub API")
-
-            # No more repos
-            if not batch:
-                break
-
-            # Filter and collect repos
-            for repo in batch:
-                # Skip private repos unless explicitly included
-                if not include_private and repo.get("private", False):
-                    continue
+            self._observe_rate_limit(response)
+            return response
 
-                # Skip archived repos
-                if repo.get("archived", False):
-                    logger.info(f"Skipping archived repo: {repo['name']}")
-                    continue
+    def _raise_for_error(
+        self, response: requests.Response, error: requests.HTTPError, org_name: str
+    ) -> None:
+        """Translate an HTTP error into GitHubAPIError/GitHubAuthError."""
+        # SECURITY: Redact token before raising
+        safe_error = self._redact_token(str(error))
 
-                clone_url = repo.get("clone_url")
-                if clone_url:
-                    repos.append(clone_url)
+        if response.status_code == 404:
+            raise GitHubAPIError(
+                f"Organization not found: {org_name}\n"
+                "Verify the organization name is correct and your token has access"
+            )
+        elif response.status_code == 401:
+            raise GitHubAuthError(
+                "GitHub authentication failed. Check your GITHUB_TOKEN"
+            )
+        elif response.status_code in (403, 429):
+            # Check if rate limited
+            if response.status_code == 429 or "rate limit" in response.text.lower():
+                raise GitHubAPIError(
+                    "GitHub API rate limit exceeded. Try again later or use authentication"
+                )
+            raise GitHubAuthError(
+                "GitHub authorization failed. Your token may lack required permissions"
+            )
+        else:
+            raise GitHubAPIError(f"GitHub API error: {safe_error}")
 
-                    if len(repos) >= max_repos:
-                        logger.warning(
-                            f"Reached repository limit ({max_repos}). "
-                            "Increase --max-repos to scan more repositories"
-                        )
-                        break
+    @staticmethod
+    def _header_int(response: requests.Response, name: str) -> Optional[int]:
+        """Read an integer response header, or None if absent or malformed."""
+        try:
+            return int(response.headers.get(name))
+        except (TypeError, ValueError):
+            return None
 
-            # Check rate limit headers
-            remaining = response.headers.get("X-RateLimit-Remaining")
-            if remaining and int(remaining) < 10:
-                logger.warning(
-                    f"GitHub API rate limit low: {remaining} requests remaining"
-                )
+    @staticmethod
+    def _last_page(response: requests.Response, page: int) -> Optional[int]:
+        """Get the last page number from the Link header.
 
-            # Next page
-            page += 1
+        Returns:
+            Last page number (the current page if there is no "last" link),
+            or None if the response has no Link header
+        """
+        link = response.headers.get("Link")
+        if not isinstance(link, str):
+            return None
+        for entry in parse_header_links(link):
+            if entry.get("rel") == "last":
+                match = re.search(r"[?&]page=(\d+)", entry.get("url", ""))
+                if match:
+                    return int(match.group(1))
+        return page
+
+    def _pace(self) -> None:
+        """Sleep until the next request is allowed by the pacing schedule."""
+        with self._rate_lock:
+            delay = self._next_request_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _observe_rate_limit(self, response: requests.Response) -> None:
+        """Schedule the next request from the rate limit headers.
+
+        While quota is plentiful requests go out back to back. Below the
+        low watermark the remaining requests are spread evenly until reset.
+        """
+        remaining = self._header_int(response, "X-RateLimit-Remaining")
+        if remaining is None or remaining >= self.RATE_LIMIT_LOW_WATERMARK:
+            return
+
+        logger.warning(f"GitHub API rate limit low: {remaining} requests remaining")
+        reset = self._header_int(response, "X-RateLimit-Reset")
+        if reset is None:
+            return
+        delay = min((reset - time.time()) / max(remaining, 1), self.MAX_PACING_DELAY)
+        if delay > 0:
+            with self._rate_lock:
+                self._next_request_at = max(
+                    self._next_request_at, time.monotonic() + delay
+                )
 
-            # SECURITY: Basic rate limiting (avoid hammering API)
-            time.sleep(0.2)
+    def _wait_for_rate_limit(self, response: requests.Response) -> bool:
+        """Wait out a rate limit rejection if it lifts soon.
 
-        logger.info(f"Found {len(repos)} repositories in {org_name}")
-        return repos[:max_repos]
+        Returns:
+            True if the request should be retried
+        """
+        if response.status_code not in (403, 429):
+            return False
+
+        retry_after = self._header_int(response, "Retry-After")
+        if retry_after is not None:
+            wait = retry_after
+        elif self._header_int(response, "X-RateLimit-Remaining") == 0:
+            reset = self._header_int(response, "X-RateLimit-Reset")
+            if reset is None:
+                return False
+            wait = reset - time.time() + 1
+        else:
+            return False
+
+        if wait > self.MAX_RATE_LIMIT_WAIT:
+            return False
+
+        logger.warning(f"GitHub API rate limit reached, waiting {max(wait, 0):.0f}s")
+        with self._rate_lock:
+            self._next_request_at = max(
+                self._next_request_at, time.monotonic() + max(wait, 0)
+            )
+        return True
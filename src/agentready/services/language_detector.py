@@ -4,7 +4,7 @@ import logging
 from collections import defaultdict
 from pathlib import Path
 
-from ..utils.subprocess_utils import safe_subprocess_run
+from .file_index import FileIndex
 
 logger = logging.getLogger(__name__)
 
@@ -57,14 +57,27 @@ class LanguageDetector:
         ".xml": "XML",
     }
 
-    def __init__(self, repository_path: Path):
+    # Files larger than this are data or generated output, not code
+    MAX_LINE_COUNT_BYTES = 5 * 1024 * 1024
+
+    def __init__(self, repository_path: Path, file_index: FileIndex | None = None):
         """Initialize language detector for repository.
 
         Args:
             repository_path: Path to git repository root
+            file_index: Shared file index (built on first use if not provided)
         """
         self.repository_path = repository_path
         self.minimum_file_threshold = 3  # Need 3+ files to count as "using language"
+        self.max_line_count_bytes = self.MAX_LINE_COUNT_BYTES
+        self._file_index = file_index
+
+    @property
+    def file_index(self) -> FileIndex:
+        """File index used for detection (lists the repository only once)."""
+        if self._file_index is None:
+            self._file_index = FileIndex.build(self.repository_path)
+        return self._file_index
 
     def detect_languages(self) -> dict[str, int]:
         """Detect languages in repository with file counts.
@@ -77,36 +90,10 @@ class LanguageDetector:
         """
         language_counts = defaultdict(int)
 
-        # Try git ls-files first (respects .gitignore)
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-        except Exception:
-            # Fall back to pathlib walk (less accurate)
-            files = [
-                str(f.relative_to(self.repository_path))
-                for f in self.repository_path.rglob("*")
-                if f.is_file()
-            ]
-
-        # Count files by language
-        for file_path in files:
-            if not file_path.strip():
-                continue
-
-            path = Path(file_path)
-            suffix = path.suffix.lower()
-
-            if suffix in self.EXTENSION_MAP:
-                language = self.EXTENSION_MAP[suffix]
+        # Count files by language (index respects .gitignore via git ls-files)
+        for indexed_file in self.file_index:
+            if indexed_file.suffix in self.EXTENSION_MAP:
+                language = self.EXTENSION_MAP[indexed_file.suffix]
                 language_counts[language] += 1
 
         # Filter by minimum threshold
@@ -122,63 +109,31 @@ class LanguageDetector:
         Returns:
             Total file count
         """
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-            return len([f for f in files if f.strip()])
-        except Exception:
-            # Fall back to pathlib
-            return sum(1 for _ in self.repository_path.rglob("*") if _.is_file())
+        return len(self.file_index)
 
     def count_total_lines(self) -> int:
         """Count total lines of code in repository.
 
         Returns:
-            Total line count (excluding empty lines and comments)
+            Total line count (excluding empty lines; binary files and files
+            over max_line_count_bytes skipped)
 
         Note: This is a simple implementation. For production use,
         consider using a dedicated tool like cloc or tokei.
         """
-        total_lines = 0
+        counted = [
+            indexed_file
+            for indexed_file in self.file_index
+            if indexed_file.size <= self.max_line_count_bytes
+        ]
 
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-        except Exception:
-            files = [
-                str(f.relative_to(self.repository_path))
-                for f in self.repository_path.rglob("*")
-                if f.is_file()
-            ]
-
-        for file_path in files:
-            if not file_path.strip():
-                continue
-
-            full_path = self.repository_path / file_path
-
-            # Only count text files (skip binaries)
-            try:
-                with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                    total_lines += sum(1 for line in f if line.strip())
-            except (OSError, UnicodeDecodeError):
-                # Skip binary files or unreadable files
-                continue
+        # Stream the files on a thread pool; counts stay cached in the index
+        self.file_index.count_lines(counted)
+
+        total_lines = 0
+        for indexed_file in counted:
+            lines = self.file_index.code_line_count(indexed_file)
+            if lines is not None:
+                total_lines += lines
 
         return total_lines
@@ -3,11 +3,19 @@
 import json
 import logging
 import os
+from collections.abc import Iterator
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
-from agentready.learners import PatternExtractor, SkillGenerator
-from agentready.models import Assessment, DiscoveredSkill, Finding
+from agentready.learners import (
+    LLMEnricher,
+    PatternExtractor,
+    SkillAggregator,
+    SkillGenerator,
+)
+from agentready.models import Assessment, DiscoveredSkill, Finding, Repository
+from agentready.reporters.aggregated_json import iter_aggregated_results
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +41,9 @@ class LearningService:
         self.min_confidence = min_confidence
         self.output_dir = Path(output_dir)
         self.skill_generator = SkillGenerator(output_dir=self.output_dir)
+        # Created on first enrichment and reused, so every assessment shares
+        # one client and rate limiter
+        self._llm_enricher = None
 
     def load_assessment(self, assessment_file: Path) -> Assessment:
         """Load assessment from JSON file.
@@ -66,6 +77,8 @@ class LearningService:
         attribute_ids: list[str] | None = None,
         enable_llm: bool = False,
         llm_budget: int = 5,
+        llm_use_cache: bool = True,
+        llm_workers: int = 4,
     ) -> list[DiscoveredSkill]:
         """Extract patterns from an assessment file.
 
@@ -74,6 +87,8 @@ class LearningService:
             attribute_ids: Optional list of specific attributes to extract
             enable_llm: Enable LLM enrichment
             llm_budget: Max number of skills to enrich with LLM
+            llm_use_cache: Whether to use cached LLM responses
+            llm_workers: Maximum concurrent LLM requests
 
         Returns:
             List of discovered skills meeting confidence threshold
@@ -81,11 +96,6 @@ class LearningService:
         # Load assessment (returns dict for now)
         assessment_data = self.load_assessment(assessment_file)
 
-        # Convert to Assessment object for pattern extraction
-        # For MVP, we'll work with the dict and create Finding objects manually
-        # In future, add proper deserialization
-        from agentready.models import Attribute, Finding, Repository
-
         # Reconstruct Assessment object from dict
         repo_data = assessment_data["repository"]
 
@@ -104,33 +114,7 @@ class LearningService:
             total_lines=repo_data["total_lines"],
         )
 
-        findings = []
-        for finding_data in assessment_data["findings"]:
-            # Reconstruct Attribute
-            attr_data = finding_data["attribute"]
-
-            attribute = Attribute(
-                id=attr_data["id"],
-                name=attr_data["name"],
-                category=attr_data.get("category", "Unknown"),
-                tier=attr_data["tier"],
-                description=attr_data["description"],
-                criteria=attr_data.get("criteria", ""),
-                default_weight=attr_data.get("default_weight", 1.0),
-            )
-
-            # Reconstruct Finding
-            finding = Finding(
-                attribute=attribute,
-                status=finding_data["status"],
-                score=finding_data.get("score"),
-                measured_value=finding_data.get("measured_value"),
-                threshold=finding_data.get("threshold"),
-                evidence=finding_data.get("evidence", []),
-                remediation=None,  # Skip complex Remediation reconstruction for now
-                error_message=finding_data.get("error_message"),
-            )
-            findings.append(finding)
+        findings = self._load_findings(assessment_data)
 
         assessment = Assessment(
             repository=repo,
@@ -149,11 +133,9 @@ class LearningService:
 
         # Extract patterns
         extractor = PatternExtractor(assessment, min_score=self.min_confidence)
-
-        if attribute_ids:
-            discovered_skills = extractor.extract_specific_patterns(attribute_ids)
-        else:
-            discovered_skills = extractor.extract_all_patterns()
+        discovered_skills = extractor.extract_from_findings(
+            assessment.findings, attribute_ids
+        )
 
         # Filter by min confidence
         discovered_skills = [
@@ -163,11 +145,171 @@ class LearningService:
         # Optionally enrich with LLM
         if enable_llm and discovered_skills:
             discovered_skills = self._enrich_with_llm(
-                discovered_skills, assessment, llm_budget
+                discovered_skills,
+                assessment,
+                llm_budget,
+                use_cache=llm_use_cache,
+                workers=llm_workers,
             )
 
         return discovered_skills
 
+    def extract_patterns_from_batch(
+        self,
+        source: Path,
+        attribute_ids: list[str] | None = None,
+        enable_llm: bool = False,
+        llm_budget: int = 5,
+        llm_use_cache: bool = True,
+        llm_workers: int = 4,
+    ) -> tuple[list[DiscoveredSkill], SkillAggregator]:
+        """Extract patterns across the repositories of a batch assessment.
+
+        Assessments are streamed one at a time (see iter_batch_assessments)
+        and their skills merged by SkillAggregator, so a skill found in many
+        repositories is reported once, built from its best exemplar. LLM
+        enrichment runs once per aggregated skill, not once per repository.
+
+        The confidence threshold applies both to each repository's skills and
+        to the aggregated confidence, which is weighted by support: a skill
+        seen in a single repository must clear min_confidence after being
+        shrunk toward SkillAggregator.PRIOR_CONFIDENCE.
+
+        Args:
+            source: Aggregated batch JSON (all-assessments.json), directory of
+                assessment JSON files, or a single assessment JSON
+            attribute_ids: Optional list of specific attributes to extract
+            enable_llm: Enable LLM enrichment
+            llm_budget: Max number of skills to enrich with LLM
+            llm_use_cache: Whether to use cached LLM responses
+            llm_workers: Maximum concurrent LLM requests
+
+        Returns:
+            Aggregated skills meeting min_confidence (sorted by confidence)
+            and the aggregator holding per-skill prevalence and exemplars
+        """
+        extractor = PatternExtractor(min_score=self.min_confidence)
+        aggregator = SkillAggregator()
+
+        for assessment_data in self.iter_batch_assessments(source):
+            findings = self._load_findings(assessment_data)
+            skills = [
+                s
+                for s in extractor.extract_from_findings(findings, attribute_ids)
+                if s.confidence >= self.min_confidence
+            ]
+            aggregator.add(assessment_data.get("repository", {}), findings, skills)
+
+        discovered_skills = [
+            s for s in aggregator.skills() if s.confidence >= self.min_confidence
+        ]
+
+        if enable_llm and discovered_skills:
+            discovered_skills = self._enrich_aggregated_with_llm(
+                discovered_skills,
+                aggregator,
+                llm_budget,
+                use_cache=llm_use_cache,
+                workers=llm_workers,
+            )
+
+        return discovered_skills, aggregator
+
+    def iter_batch_assessments(self, source: Path) -> Iterator[dict]:
+        """Stream assessment dictionaries from a batch source.
+
+        Aggregated batch files are read result by result rather than loaded
+        whole. In a directory, every JSON file is read (symlinks such as
+        assessment-latest.json are skipped); files that are neither an
+        assessment nor a batch are ignored. An assessment seen more than once
+        (same repository and commit, e.g., in both all-assessments.json and
+        its per-repository report) is yielded once.
+
+        Args:
+            source: Aggregated batch JSON, directory, or assessment JSON
+
+        Yields:
+            Assessment dictionaries (Assessment.to_dict layout)
+
+        Raises:
+            FileNotFoundError: If source doesn't exist
+        """
+        source = Path(source)
+        if not source.exists():
+            raise FileNotFoundError(f"Batch source not found: {source}")
+
+        paths = (
+            [p for p in sorted(source.rglob("*.json")) if not p.is_symlink()]
+            if source.is_dir()
+            else [source]
+        )
+
+        seen = set()
+        for path in paths:
+            for assessment_data in self._read_assessments(path):
+                repo = assessment_data.get("repository") or {}
+                key = (
+                    repo.get("url") or repo.get("name") or repo.get("path"),
+                    repo.get("commit_hash"),
+                )
+                if key in seen:
+                    logger.debug(f"Skipping duplicate assessment of {key[0]}")
+                    continue
+                seen.add(key)
+                yield assessment_data
+
+    @staticmethod
+    def _read_assessments(path: Path) -> Iterator[dict]:
+        """Read the assessments of one JSON file (batch or single)."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                head = f.read(4096)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable {path}: {e}")
+            return
+
+        if '"batch_id"' in head:
+            try:
+                for result in iter_aggregated_results(path):
+                    if result.get("assessment"):
+                        yield result["assessment"]
+            except ValueError as e:
+                # Interrupted batches are still useful up to where they stop
+                logger.warning(f"Stopped reading {path}: {e}")
+            return
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable {path}: {e}")
+            return
+        if isinstance(data, dict) and isinstance(data.get("findings"), list):
+            yield data
+
+    @staticmethod
+    def _load_findings(assessment_data: dict) -> list[Finding]:
+        """Deserialize the findings of an assessment dictionary.
+
+        Attribute fields added after older assessments were written get
+        defaults; a finding that still cannot be read is skipped.
+        """
+        findings = []
+        for finding_data in assessment_data.get("findings", []):
+            attribute_data = {
+                "category": "Unknown",
+                "criteria": "",
+                "default_weight": 1.0,
+                **finding_data.get("attribute", {}),
+            }
+            try:
+                findings.append(
+                    Finding.from_dict({**finding_data, "attribute": attribute_data})
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping unreadable finding: {e}")
+        return findings
+
     def generate_skills(
         self, skills: list[DiscoveredSkill], output_format: str = "json"
     ) -> list[Path]:
@@ -238,7 +380,12 @@ class LearningService:
         return json_file
 
     def _enrich_with_llm(
-        self, skills: list[DiscoveredSkill], assessment: Assessment, budget: int
+        self,
+        skills: list[DiscoveredSkill],
+        assessment: Assessment,
+        budget: int,
+        use_cache: bool = True,
+        workers: int = 4,
     ) -> list[DiscoveredSkill]:
         """Enrich top N skills with LLM analysis.
 
@@ -246,19 +393,109 @@ class LearningService:
             skills: List of discovered skills
             assessment: Full assessment with findings
             budget: Max skills to enrich
+            use_cache: Whether to use cached LLM responses
+            workers: Maximum concurrent LLM requests
 
         Returns:
             List with top skills enriched
         """
-        from anthropic import Anthropic
+        enricher = self._get_llm_enricher()
+        if enricher is None:
+            return skills
+
+        # Enrich top N skills that have a finding; others keep their place
+        positions = []
+        to_enrich = []
+        for i, skill in enumerate(skills[:budget]):
+            finding = self._find_finding_for_skill(assessment, skill)
+            if finding:
+                positions.append(i)
+                to_enrich.append((skill, finding))
+
+        enriched = enricher.enrich_skills(
+            to_enrich, assessment.repository, use_cache=use_cache, max_workers=workers
+        )
 
-        from agentready.learners.llm_enricher import LLMEnricher
+        enriched_skills = list(skills)
+        for i, skill in zip(positions, enriched):
+            enriched_skills[i] = skill
+        return enriched_skills
+
+    def _enrich_aggregated_with_llm(
+        self,
+        skills: list[DiscoveredSkill],
+        aggregator: SkillAggregator,
+        budget: int,
+        use_cache: bool = True,
+        workers: int = 4,
+    ) -> list[DiscoveredSkill]:
+        """Enrich top N aggregated skills, once each, from their best exemplar.
+
+        Code is sampled from the best exemplar whose repository is still
+        checked out at its recorded path; skills with no such exemplar keep
+        their heuristic content.
+
+        Args:
+            skills: Aggregated skills, best first
+            aggregator: Aggregator holding the skills' exemplars
+            budget: Max skills to enrich
+            use_cache: Whether to use cached LLM responses
+            workers: Maximum concurrent LLM requests
+
+        Returns:
+            List with top skills enriched
+        """
+        enricher = self._get_llm_enricher()
+        if enricher is None:
+            return skills
+
+        positions = []
+        to_enrich = []
+        for i, skill in enumerate(skills[:budget]):
+            for exemplar in aggregator.exemplars(skill.skill_id):
+                try:
+                    repository = Repository.from_dict(exemplar.repository)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                positions.append(i)
+                to_enrich.append((skill, exemplar.finding, repository))
+                break
+            else:
+                logger.warning(
+                    f"No checked-out repository for {skill.skill_id}, "
+                    "skipping enrichment"
+                )
+
+        enriched = enricher.enrich_many(
+            to_enrich, use_cache=use_cache, max_workers=workers
+        )
+
+        enriched_skills = list(skills)
+        for i, skill in zip(positions, enriched):
+            # Keep the cross-repository scores; enrichment adds content only
+            enriched_skills[i] = replace(
+                skill,
+                confidence=skills[i].confidence,
+                reusability_score=skills[i].reusability_score,
+            )
+        return enriched_skills
+
+    def _get_llm_enricher(self):
+        """Create the LLM enricher on first use.
+
+        Returns:
+            LLMEnricher, or None if ANTHROPIC_API_KEY is not set
+        """
+        if self._llm_enricher is not None:
+            return self._llm_enricher
+
+        from anthropic import Anthropic
 
         # Security: Get API key from environment
         api_key = os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             logger.warning("LLM enrichment enabled but ANTHROPIC_API_KEY not set")
-            return skills
+            return None
 
         # Security: Clear API key from environment to prevent exposure
         # API keys should not persist in os.environ where they could be logged
@@ -267,35 +504,15 @@ class LearningService:
         except KeyError:
             pass  # Already removed or never existed
 
-        # Initialize LLM enricher
-        client = Anthropic(api_key=api_key)
-        enricher = LLMEnricher(client)
+        # Initialize LLM enricher. Retries are left to the enricher, which
+        # backs off under its shared rate limiter.
+        client = Anthropic(api_key=api_key, max_retries=0)
+        self._llm_enricher = LLMEnricher(client)
 
         # Security: Clear API key from local scope after client creation
         api_key = None
 
-        # Enrich top N skills
-        enriched_skills = []
-        for i, skill in enumerate(skills):
-            if i < budget:
-                # Find the finding for this skill
-                finding = self._find_finding_for_skill(assessment, skill)
-                if finding:
-                    try:
-                        enriched = enricher.enrich_skill(
-                            skill, assessment.repository, finding
-                        )
-                        enriched_skills.append(enriched)
-                    except Exception as e:
-                        logger.warning(f"Enrichment failed for {skill.skill_id}: {e}")
-                        enriched_skills.append(skill)  # Fallback to original
-                else:
-                    enriched_skills.append(skill)
-            else:
-                # Beyond budget, keep original
-                enriched_skills.append(skill)
-
-        return enriched_skills
+        return self._llm_enricher
 
     def _find_finding_for_skill(
         self, assessment: Assessment, skill: DiscoveredSkill
@@ -313,6 +530,8 @@ class LearningService:
         attribute_ids: list[str] | None = None,
         enable_llm: bool = False,
         llm_budget: int = 5,
+        llm_use_cache: bool = True,
+        llm_workers: int = 4,
     ) -> dict:
         """Run complete learning workflow: extract + generate.
 
@@ -322,6 +541,8 @@ class LearningService:
             attribute_ids: Optional specific attributes to extract
             enable_llm: Enable LLM enrichment
             llm_budget: Max skills to enrich with LLM
+            llm_use_cache: Whether to use cached LLM responses
+            llm_workers: Maximum concurrent LLM requests
 
         Returns:
             Dictionary with workflow results
@@ -332,6 +553,8 @@ class LearningService:
             attribute_ids,
             enable_llm=enable_llm,
             llm_budget=llm_budget,
+            llm_use_cache=llm_use_cache,
+            llm_workers=llm_workers,
         )
 
         # Generate output files
@@ -344,3 +567,53 @@ class LearningService:
             "generated_files": [str(f) for f in generated_files],
             "skills": skills,
         }
+
+    def run_batch_workflow(
+        self,
+        source: Path,
+        output_format: str = "all",
+        attribute_ids: list[str] | None = None,
+        enable_llm: bool = False,
+        llm_budget: int = 5,
+        llm_use_cache: bool = True,
+        llm_workers: int = 4,
+    ) -> dict:
+        """Run the learning workflow across a batch of repositories.
+
+        Args:
+            source: Aggregated batch JSON, directory of assessment JSON
+                files, or a single assessment JSON
+            output_format: Format for generated skills
+            attribute_ids: Optional specific attributes to extract
+            enable_llm: Enable LLM enrichment
+            llm_budget: Max skills to enrich with LLM
+            llm_use_cache: Whether to use cached LLM responses
+            llm_workers: Maximum concurrent LLM requests
+
+        Returns:
+            Dictionary with workflow results, as run_full_workflow, plus
+            repositories_analyzed and per-skill repository counts
+        """
+        skills, aggregator = self.extract_patterns_from_batch(
+            source,
+            attribute_ids,
+            enable_llm=enable_llm,
+            llm_budget=llm_budget,
+            llm_use_cache=llm_use_cache,
+            llm_workers=llm_workers,
+        )
+
+        generated_files = self.generate_skills(skills, output_format)
+
+        return {
+            "skills_discovered": len(skills),
+            "min_confidence": self.min_confidence,
+            "output_format": output_format,
+            "generated_files": [str(f) for f in generated_files],
+            "skills": skills,
+            "repositories_analyzed": aggregator.repository_count,
+            "skill_repositories": {
+                skill.skill_id: aggregator.repositories_with(skill.skill_id)
+                for skill in skills
+            },
+        }
@@ -3,28 +3,120 @@
 import hashlib
 import json
 import logging
+import sqlite3
+import threading
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 from agentready.models import DiscoveredSkill
-from agentready.utils.security import validate_filename, validate_path
+from agentready.services.sqlite_store import SQLiteStore
 
 logger = logging.getLogger(__name__)
 
 
-class LLMCache:
-    """Caches LLM enrichment responses."""
+class LLMCache(SQLiteStore):
+    """SQLite-backed cache of LLM enrichment responses.
 
-    def __init__(self, cache_dir: Path, ttl_days: int = 7):
+    Schema: llm_responses(cache_key, skill, size, cached_at, expires_at,
+            last_used), cache_meta(key, value)
+
+    All entries live in one database file rather than one file per key,
+    so shared caches on network filesystems stay fast to open. The store
+    is bounded: when it grows past max_bytes the least recently used
+    entries are evicted, and expired entries are swept in a background
+    thread at most once per SWEEP_INTERVAL.
+
+    Each thread reuses one long-lived connection. The default rollback
+    journal is used instead of WAL, which does not work on network
+    filesystems. Skills are stored as zlib-compressed JSON.
+    """
+
+    # Default size bound for stored responses
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+    # Eviction trims to this fraction of max_bytes so it is not rerun on
+    # every write
+    EVICTION_TARGET = 0.9
+
+    # Minimum time between background sweeps of expired entries
+    SWEEP_INTERVAL = timedelta(hours=1)
+
+    # Keys per bulk lookup, within SQLite's variable limit
+    BULK_CHUNK_SIZE = 900
+
+    # Rollback journal: WAL does not work on network filesystems
+    USE_WAL = False
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_days: int = 7,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
         """Initialize cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory for the cache database
             ttl_days: Time-to-live in days (default: 7)
+            max_bytes: Size bound for stored responses (default: 100 MB)
         """
-        self.cache_dir = cache_dir
+        self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(self.cache_dir / "llm_responses.db")
         self.ttl_days = ttl_days
+        self.max_bytes = max_bytes
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_read": 0,
+            "bytes_written": 0,
+            "evictions": 0,
+        }
+        self._initialize_db()
+        self._sweep_thread = self._start_sweep()
+
+    def _initialize_db(self) -> None:
+        """Initialize database schema."""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        cache_key TEXT PRIMARY KEY,
+                        skill BLOB NOT NULL,
+                        size INTEGER NOT NULL,
+                        cached_at TIMESTAMP NOT NULL,
+                        expires_at TIMESTAMP NOT NULL,
+                        last_used TIMESTAMP NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_llm_last_used
+                    ON llm_responses(last_used)
+                    """
+                )
+                conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_llm_expires_at
+                    ON llm_responses(expires_at)
+                    """
+                )
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS cache_meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL
+                    )
+                    """
+                )
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to initialize LLM cache database: {e}")
 
     def get(self, cache_key: str) -> DiscoveredSkill | None:
         """Get cached skill if exists and not expired.
@@ -35,99 +127,269 @@ class LLMCache:
         Returns:
             Cached DiscoveredSkill or None if miss/expired
         """
-        # Security: Validate cache_key to prevent path traversal
-        cache_file = self._get_safe_cache_path(cache_key)
-        if cache_file is None:
-            logger.warning(f"Invalid cache key rejected: {cache_key}")
-            return None
+        return self.get_many([cache_key]).get(cache_key)
 
-        if not cache_file.exists():
-            logger.debug(f"Cache miss: {cache_key}")
-            return None
+    def get_many(self, cache_keys: list[str]) -> dict[str, DiscoveredSkill]:
+        """Get cached skills for many keys at once.
+
+        Used to prefetch every key of a learning run in one query.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
+        Args:
+            cache_keys: Cache keys to look up
+
+        Returns:
+            Mapping of cache key to DiscoveredSkill for hits; misses and
+            expired entries are omitted
+        """
+        hits = {}
+        bytes_read = 0
+        now = datetime.now().isoformat()
+        unique_keys = list(dict.fromkeys(cache_keys))
 
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Check expiration
-            cached_at = datetime.fromisoformat(data["cached_at"])
-            if datetime.now() - cached_at > timedelta(days=self.ttl_days):
-                logger.info(f"Cache expired: {cache_key}")
-                cache_file.unlink()  # Delete expired cache
-                return None
+            conn = self._connection()
+            for start in range(0, len(unique_keys), self.BULK_CHUNK_SIZE):
+                chunk = unique_keys[start : start + self.BULK_CHUNK_SIZE]
+                placeholders = ", ".join(["?"] * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT cache_key, skill FROM llm_responses
+                    WHERE expires_at > ? AND cache_key IN ({placeholders})
+                    """,
+                    [now, *chunk],
+                ).fetchall()
 
-            logger.info(f"Cache hit: {cache_key}")
-            return DiscoveredSkill(**data["skill"])
+                for cache_key, payload in rows:
+                    skill = self._load_payload(payload)
+                    if skill is not None:
+                        hits[cache_key] = skill
+                        bytes_read += len(payload)
 
-        except Exception as e:
-            logger.warning(f"Cache read error for {cache_key}: {e}")
-            return None
+            # Record use for LRU eviction
+            if hits:
+                with conn:
+                    conn.executemany(
+                        "UPDATE llm_responses SET last_used = ? WHERE cache_key = ?",
+                        [(now, cache_key) for cache_key in hits],
+                    )
+
+        except sqlite3.Error as e:
+            logger.warning(f"Cache read error: {e}")
+
+        with self._stats_lock:
+            self._stats["hits"] += len(hits)
+            self._stats["misses"] += len(unique_keys) - len(hits)
+            self._stats["bytes_read"] += bytes_read
+
+        logger.debug(f"Cache lookup: {len(hits)}/{len(unique_keys)} hits")
+        return hits
 
     def set(self, cache_key: str, skill: DiscoveredSkill):
         """Save skill to cache.
 
+        Evicts least recently used entries if the cache grows past
+        max_bytes.
+
+        Security: Uses parameterized queries to prevent SQL injection.
+
         Args:
             cache_key: Unique cache key
             skill: DiscoveredSkill to cache
         """
-        # Security: Validate cache_key to prevent path traversal
-        cache_file = self._get_safe_cache_path(cache_key)
-        if cache_file is None:
-            logger.warning(f"Invalid cache key rejected: {cache_key}")
-            return
-
         try:
-            data = {
-                "cached_at": datetime.now().isoformat(),
-                "skill": skill.to_dict(),
-            }
+            payload = self._dump_payload(skill)
+            now = datetime.now()
+            expires_at = now + timedelta(days=self.ttl_days)
 
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_responses
+                    (cache_key, skill, size, cached_at, expires_at, last_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        cache_key,
+                        payload,
+                        len(payload),
+                        now.isoformat(),
+                        expires_at.isoformat(),
+                        now.isoformat(),
+                    ),
+                )
 
+            with self._stats_lock:
+                self._stats["bytes_written"] += len(payload)
             logger.debug(f"Cached: {cache_key}")
 
-        except Exception as e:
+            self._evict_if_needed()
+
+        except (sqlite3.Error, TypeError, ValueError) as e:
             logger.warning(f"Cache write error for {cache_key}: {e}")
 
-    def _get_safe_cache_path(self, cache_key: str) -> Path | None:
-        """Validate cache key and return safe path.
+    def _evict_if_needed(self) -> int:
+        """Evict least recently used entries while over max_bytes.
 
-        Security: Prevents path traversal attacks by validating cache_key
-        using centralized security utilities.
+        Returns:
+            Number of entries evicted
+        """
+        conn = self._connection()
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
 
-        Args:
-            cache_key: Cache key to validate
+        # Walk entries from least recently used until enough bytes are freed
+        excess = total - int(self.max_bytes * self.EVICTION_TARGET)
+        evict = []
+        freed = 0
+        for cache_key, size in conn.execute(
+            "SELECT cache_key, size FROM llm_responses ORDER BY last_used"
+        ):
+            if freed >= excess:
+                break
+            evict.append((cache_key,))
+            freed += size
+
+        with conn:
+            conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", evict)
+
+        with self._stats_lock:
+            self._stats["evictions"] += len(evict)
+        logger.info(f"Evicted {len(evict)} LLM cache entries ({freed:,} bytes)")
+        return len(evict)
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from cache.
 
         Returns:
-            Validated Path or None if invalid
+            Number of entries deleted
         """
-        # Validate filename using centralized utility
         try:
-            validate_filename(cache_key, allow_path_separators=False)
-        except ValueError:
-            return None
+            conn = self._connection()
+            now = datetime.now().isoformat()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM llm_responses WHERE expires_at <= ?", (now,)
+                )
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO cache_meta (key, value)
+                    VALUES ('last_sweep', ?)
+                    """,
+                    (now,),
+                )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Cache sweep error: {e}")
+            return 0
 
-        # Construct cache file path
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def _start_sweep(self) -> Optional[threading.Thread]:
+        """Sweep expired entries in the background if a sweep is due.
 
-        # Validate path is within cache directory
+        Returns:
+            The sweeping thread, or None if the last sweep is recent
+        """
         try:
-            return validate_path(cache_file, base_dir=self.cache_dir, must_exist=False)
-        except ValueError:
+            row = (
+                self._connection()
+                .execute("SELECT value FROM cache_meta WHERE key = 'last_sweep'")
+                .fetchone()
+            )
+            if row and datetime.now() - datetime.fromisoformat(row[0]) < (
+                self.SWEEP_INTERVAL
+            ):
+                return None
+        except (sqlite3.Error, ValueError):
+            pass
+
+        def sweep():
+            try:
+                deleted = self.cleanup_expired()
+                if deleted:
+                    logger.info(f"Swept {deleted} expired LLM cache entries")
+            finally:
+                self.close()
+
+        thread = threading.Thread(target=sweep, name="llm-cache-sweep", daemon=True)
+        thread.start()
+        return thread
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Hits, misses and bytes read/written count this instance's
+        lookups; entry and size totals describe the whole database.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        try:
+            conn = self._connection()
+            total, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()
+            expired = conn.execute(
+                "SELECT COUNT(*) FROM llm_responses WHERE expires_at <= ?",
+                (datetime.now().isoformat(),),
+            ).fetchone()[0]
+        except sqlite3.Error:
+            return stats
+
+        stats.update(
+            {
+                "total_entries": total,
+                "expired_entries": expired,
+                "total_bytes": total_bytes,
+                "max_bytes": self.max_bytes,
+                "database_path": str(self.db_path),
+                "ttl_days": self.ttl_days,
+            }
+        )
+        return stats
+
+    def _dump_payload(self, skill: DiscoveredSkill) -> bytes:
+        """Serialize and compress a skill for storage."""
+        skill_json = json.dumps(skill.to_dict(), separators=(",", ":"))
+        return zlib.compress(skill_json.encode("utf-8"), self.COMPRESSION_LEVEL)
+
+    @staticmethod
+    def _load_payload(payload: bytes) -> Optional[DiscoveredSkill]:
+        """Decompress and deserialize a stored skill (None if corrupt)."""
+        try:
+            return DiscoveredSkill(**json.loads(zlib.decompress(payload)))
+        except (zlib.error, UnicodeDecodeError, ValueError, TypeError):
             return None
 
     @staticmethod
-    def generate_key(attribute_id: str, score: float, evidence_hash: str) -> str:
+    def generate_key(
+        attribute_id: str,
+        score: float,
+        evidence_hash: str,
+        model: str,
+        prompt_version: str,
+    ) -> str:
         """Generate cache key from finding attributes.
 
+        The model and prompt template version are part of the key, so a new
+        model or changed prompt never serves an older enrichment.
+
         Args:
             attribute_id: Attribute ID (e.g., "claude_md_file")
             score: Finding score
             evidence_hash: Hash of evidence list
+            model: Claude model name
+            prompt_version: PROMPT_TEMPLATE_VERSION of the prompts used
 
         Returns:
             Cache key string
         """
-        key_data = f"{attribute_id}_{score}_{evidence_hash}"
+        key_data = f"{attribute_id}_{score}_{evidence_hash}_{model}_{prompt_version}"
         return hashlib.sha256(key_data.encode()).hexdigest()[:16]
@@ -0,0 +1,207 @@
+"""Per-assessor resource accounting and whole-scan profiling."""
+
+import cProfile
+import json
+import os
+import stat
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Usage being accounted on each thread (None when nothing is measured)
+_local = threading.local()
+
+_hook_lock = threading.Lock()
+_hook_installed = False
+
+# Active ScanProfiler recording trace events, if any
+_tracer: Optional["ScanProfiler"] = None
+
+
+@dataclass
+class ResourceUsage:
+    """Resources used by one measured block of work.
+
+    Attributes:
+        wall_seconds: Elapsed wall time
+        cpu_seconds: CPU time of the measuring thread (excludes subprocesses)
+        files_read: Regular files opened for reading
+        bytes_read: Total size of those files
+        subprocesses: Subprocesses started
+    """
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    files_read: int = 0
+    bytes_read: int = 0
+    subprocesses: int = 0
+
+
+def _audit_hook(event: str, args: tuple) -> None:
+    """Count file opens and subprocesses on threads being measured."""
+    usage = getattr(_local, "usage", None)
+    if usage is None:
+        return
+
+    if event == "open":
+        path, mode, flags = args
+        # os.open reports flags only; open() reports a mode string
+        if mode is None:
+            reading = (flags & os.O_ACCMODE) != os.O_WRONLY
+        else:
+            reading = "r" in mode or "+" in mode
+        if not reading or not isinstance(path, (str, bytes, os.PathLike)):
+            return
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return
+        if stat.S_ISREG(st.st_mode):
+            usage.files_read += 1
+            usage.bytes_read += st.st_size
+    elif event == "subprocess.Popen":
+        usage.subprocesses += 1
+
+
+def _install_hook() -> None:
+    """Install the audit hook once per process (hooks cannot be removed)."""
+    global _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+@contextmanager
+def measure(name: str) -> Iterator[ResourceUsage]:
+    """Measure the resources used by the enclosed block on this thread.
+
+    File opens and subprocess starts are counted through a process-wide
+    audit hook that only does work for threads inside measure(), so work
+    the block hands to other threads is not counted. The block is also
+    recorded as a trace span when a ScanProfiler is active.
+
+    Args:
+        name: Name of the measured work (trace span name)
+
+    Yields:
+        ResourceUsage, complete once the block exits
+    """
+    _install_hook()
+    usage = ResourceUsage()
+    outer = getattr(_local, "usage", None)
+    _local.usage = usage
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield usage
+    finally:
+        usage.wall_seconds = time.perf_counter() - wall_start
+        usage.cpu_seconds = time.thread_time() - cpu_start
+        _local.usage = outer
+        if outer is not None:
+            outer.files_read += usage.files_read
+            outer.bytes_read += usage.bytes_read
+            outer.subprocesses += usage.subprocesses
+        tracer = _tracer
+        if tracer is not None:
+            tracer.add_span(name, wall_start, usage.wall_seconds)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record the enclosed block as a trace span if a ScanProfiler is active."""
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.add_span(name, start, time.perf_counter() - start)
+
+
+class ScanProfiler:
+    """Profiles everything run inside it into a file.
+
+    The format follows the output file's extension:
+
+    - ".json": Chrome trace-event JSON (chrome://tracing or Perfetto) with
+      one span per scan phase and assessor, on the thread that ran it
+    - anything else: cProfile statistics, readable with pstats or snakeviz.
+      cProfile only sees the thread that entered the profiler, so callers
+      should run assessors sequentially.
+
+    Only one profiler can be active at a time.
+    """
+
+    def __init__(self, output_path: Path):
+        """Initialize profiler.
+
+        Args:
+            output_path: File the profile is written to on exit
+        """
+        self.output_path = Path(output_path)
+        self.trace = self.output_path.suffix.lower() == ".json"
+        self._events: list[dict] = []
+        self._thread_names: dict[int, str] = {}
+        self._events_lock = threading.Lock()
+        self._profile: Optional[cProfile.Profile] = None
+        self._origin = 0.0
+
+    def add_span(self, name: str, start: float, duration: float) -> None:
+        """Record a complete span (times from time.perf_counter)."""
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round(duration * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        with self._events_lock:
+            self._events.append(event)
+            # Pool threads are gone by the time the trace is written
+            self._thread_names[event["tid"]] = threading.current_thread().name
+
+    def __enter__(self) -> "ScanProfiler":
+        global _tracer
+        if self.trace:
+            if _tracer is not None:
+                raise RuntimeError("A scan profiler is already active")
+            self._origin = time.perf_counter()
+            _tracer = self
+        else:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        global _tracer
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.trace:
+            _tracer = None
+            # Thread names make the trace viewer's rows readable
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._thread_names.items()
+            ]
+            with open(self.output_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"traceEvents": metadata + self._events, "displayTimeUnit": "ms"},
+                    f,
+                )
+        else:
+            self._profile.disable()
+            self._profile.dump_stats(str(self.output_path))
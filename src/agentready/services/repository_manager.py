@@ -1,13 +1,17 @@
 """Secure repository manager for cloning and validating repositories."""
 
+import hashlib
 import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
 from ..models import Repository
 from ..models.batch_assessment import FailureTracker
+from .git_probe import GitProbe
 
 
 class RepositoryManager:
@@ -19,19 +23,62 @@ class RepositoryManager:
     - Shallow cloning for efficiency (depth=1)
     - Disabled Git hooks during clone
     - Parameterized validation
+
+    Cached clones are kept up to date: existing clones are refreshed with a
+    shallow fetch of the remote default branch and a hard reset, so repeated
+    runs only move the delta over the network. Clones borrow objects from a
+    shared bare repository in the cache (via git alternates), so forks and
+    template-derived repositories download common objects only once. The
+    shared repository is compacted by maintain_shared_objects().
     """
 
     # Allowed protocols for cloning
     ALLOWED_PROTOCOLS = {"https", "git"}
 
-    def __init__(self, cache_dir: Path):
+    # Bare repository holding objects shared by all clones
+    SHARED_OBJECTS_DIR = ".objects.git"
+
+    # Timeouts (seconds) for network and local git operations
+    NETWORK_TIMEOUT = 300
+    LOCAL_TIMEOUT = 60
+
+    # Timeout (seconds) for asking a remote for its HEAD
+    LS_REMOTE_TIMEOUT = 30
+
+    # Minimum time (seconds) between garbage collections of the shared
+    # repository, and the longest one may run
+    SHARED_GC_INTERVAL = 7 * 24 * 3600
+    SHARED_GC_TIMEOUT = 3600
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        update: bool = True,
+        blob_limit: Optional[str] = None,
+        sparse_patterns: Optional[list[str]] = None,
+        share_objects: bool = True,
+    ):
         """Initialize repository manager.
 
         Args:
             cache_dir: Directory where repositories will be cloned
+            update: Refresh existing clones to the remote default branch
+                (False reuses them as-is)
+            blob_limit: Partial clone size limit (e.g., "1m"); larger blobs
+                are only downloaded when checked out
+            sparse_patterns: Non-cone sparse-checkout patterns (e.g.,
+                ["/*", "!/assets/"]) limiting which paths are checked out
+            share_objects: Borrow objects from a shared bare repository so
+                forks dedupe objects
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.update = update
+        self.blob_limit = blob_limit
+        self.sparse_patterns = list(sparse_patterns) if sparse_patterns else None
+        self.share_objects = share_objects
+        # Clones run on worker threads; the shared store takes one writer
+        self._shared_lock = threading.Lock()
 
     def validate_url(self, url: str) -> tuple[bool, Optional[str]]:
         """Validate repository URL for security.
@@ -87,7 +134,7 @@ class RepositoryManager:
         url = url.strip()
 
         # For local paths
-        if not url.startswith(("http://", "https://", "git://")):
+        if not self._is_remote(url):
             return Path(url).name
 
         # For URLs, extract from the last part of the path
@@ -96,12 +143,70 @@ class RepositoryManager:
         path = parsed.path.rstrip("/").rstrip(".git")
         return Path(path).name or "repository"
 
+    @staticmethod
+    def _is_remote(url: str) -> bool:
+        """Check whether url refers to a remote repository (not a local path)."""
+        return "://" in url
+
+    def resolve_remote_head(self, url: str) -> Optional[str]:
+        """Ask a remote which commit its default branch points at.
+
+        A single `git ls-remote` round trip, without cloning or touching the
+        cache, so callers can decide whether a clone is needed at all.
+
+        Args:
+            url: Repository URL
+
+        Returns:
+            Commit SHA of the remote HEAD, or None for local paths, invalid
+            URLs and remotes that cannot be reached
+        """
+        url = url.strip()
+        if not self._is_remote(url) or not self.validate_url(url)[0]:
+            return None
+
+        try:
+            result = subprocess.run(
+                ["git", "-c", "core.hooksPath=/dev/null", "ls-remote", url, "HEAD"],
+                capture_output=True,
+                text=True,
+                timeout=self.LS_REMOTE_TIMEOUT,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        # "<sha>\tHEAD"
+        for line in result.stdout.splitlines():
+            sha, _, name = line.partition("\t")
+            if name == "HEAD":
+                return sha
+        return None
+
+    def get_clone_dir(self, url: str) -> Path:
+        """Get the cache directory a remote repository is cloned into.
+
+        The directory name combines the repository name with a short hash of
+        the URL so forks with the same name never share a clone. The hash is
+        only used here; Repository.name stays the plain repository name.
+
+        Args:
+            url: Repository URL
+
+        Returns:
+            Clone directory inside cache_dir
+        """
+        url = url.strip()
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:10]
+        return self.cache_dir / f"{self.get_repository_name_from_url(url)}-{digest}"
+
     def clone_repository(
         self,
         url: str,
         target_dir: Optional[Path] = None,
     ) -> tuple[bool, Path, Optional[str]]:
-        """Clone repository securely.
+        """Clone repository securely, or update an existing clone.
 
         Security: Uses shallow clone (depth=1) and disables Git hooks.
 
@@ -118,13 +223,12 @@ class RepositoryManager:
             return False, Path(), error
 
         # For local paths, just return the path
-        if not url.startswith(("http://", "https://", "git://")):
+        if not self._is_remote(url):
             return True, Path(url).resolve(), None
 
         # Determine target directory
         if target_dir is None:
-            repo_name = self.get_repository_name_from_url(url)
-            target_dir = self.cache_dir / repo_name
+            target_dir = self.get_clone_dir(url)
         else:
             target_dir = Path(target_dir).resolve()
 
@@ -138,49 +242,361 @@ class RepositoryManager:
                 f"Target directory is outside cache directory: {target_dir}",
             )
 
-        # Skip if already cloned
-        if (target_dir / ".git").exists():
+        if (target_dir / ".git").exists() and not self.update:
             return True, target_dir, None
 
+        # Refresh an existing clone; if that fails, start over once
+        existing = (target_dir / ".git").exists()
+        error = self._sync_clone(url, target_dir)
+        if error is not None and existing:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            error = self._sync_clone(url, target_dir)
+        if error is not None:
+            # Clean up partial clone
+            shutil.rmtree(target_dir, ignore_errors=True)
+            return False, Path(), error
+
+        self._share_objects(url, target_dir)
+        return True, target_dir, None
+
+    def _sync_clone(self, url: str, target_dir: Path) -> Optional[str]:
+        """Create target_dir if needed and bring it to the remote default branch.
+
+        A new clone is an empty repository that is then updated exactly like
+        an existing one, so both paths share the same shallow fetch.
+
+        Returns:
+            None on success, or an error message
+        """
+        try:
+            if not (target_dir / ".git").exists():
+                error = self._init_clone(url, target_dir)
+                if error is not None:
+                    return error
+            self._link_shared_objects(url, target_dir)
+            return self._update_clone(url, target_dir)
+        except subprocess.TimeoutExpired:
+            return "Clone operation timed out"
+        except Exception as e:
+            return f"Clone error: {str(e)}"
+
+    def _init_clone(self, url: str, target_dir: Path) -> Optional[str]:
+        """Create an empty clone configured for origin url.
+
+        Partial clone and sparse-checkout settings are written up front so
+        the first fetch and checkout already honor them.
+        """
         # Create parent directories
         target_dir.parent.mkdir(parents=True, exist_ok=True)
 
-        # Clone with security settings
-        try:
-            # Use subprocess with explicit arguments (no shell=True)
-            cmd = [
-                "git",
-                "clone",
-                "--depth=1",  # Shallow clone for efficiency
-                url,
-                str(target_dir),
+        result = subprocess.run(
+            ["git", "init", "-q", str(target_dir)],
+            capture_output=True,
+            text=True,
+            timeout=self.LOCAL_TIMEOUT,
+        )
+        if result.returncode != 0:
+            return f"Clone failed: {result.stderr}"
+
+        # No reflogs: superseded commits may borrow objects the shared
+        # repository has since pruned, which would break the clone's own gc
+        config = [
+            ["remote", "add", "origin", url],
+            ["config", "core.logAllRefUpdates", "false"],
+        ]
+        if self.blob_limit:
+            config += [
+                ["config", "remote.origin.promisor", "true"],
+                [
+                    "config",
+                    "remote.origin.partialclonefilter",
+                    f"blob:limit={self.blob_limit}",
+                ],
             ]
+        if self.sparse_patterns:
+            config.append(["config", "core.sparseCheckout", "true"])
+        for args in config:
+            result = self._git(target_dir, args)
+            if result.returncode != 0:
+                return f"Clone failed: {result.stderr}"
+
+        if self.sparse_patterns:
+            sparse_file = target_dir / ".git" / "info" / "sparse-checkout"
+            sparse_file.parent.mkdir(parents=True, exist_ok=True)
+            sparse_file.write_text("\n".join(self.sparse_patterns) + "\n")
+        return None
+
+    def _link_shared_objects(self, url: str, clone_dir: Path) -> None:
+        """Let a clone borrow objects from the shared repository.
+
+        Registers the shared object directory as a git alternate. Fetches
+        negotiate only against the shared refs of clones with the same
+        repository name (the clone itself and its forks). The shared
+        repository is shallow, so the clone's shallow file is rewritten to
+        its own boundary commits plus those reachable from these refs;
+        otherwise fetches would try to negotiate history that was never
+        downloaded.
+        """
+        shared = self._shared_objects_repo()
+        if shared is None:
+            return
+
+        git_dir = clone_dir / ".git"
+        alternates = git_dir / "objects" / "info" / "alternates"
+        shared_objects = str((shared / "objects").resolve())
+        lines = alternates.read_text().splitlines() if alternates.exists() else []
+        if shared_objects not in lines:
+            alternates.parent.mkdir(parents=True, exist_ok=True)
+            alternates.write_text("\n".join([*lines, shared_objects]) + "\n")
+
+        family = f"refs/clones/{self.get_repository_name_from_url(url)}-*"
+        self._git(clone_dir, ["config", "core.alternateRefsPrefixes", family])
+
+        shallow = git_dir / "shallow"
+        commits = set(shallow.read_text().split()) if shallow.exists() else set()
+        reachable = self._git(clone_dir, ["rev-list", "--all"])
+        own = (
+            [sha for sha in reachable.stdout.split() if sha in commits]
+            if reachable.returncode == 0
+            else sorted(commits)
+        )
+
+        shared_shallow = shared / "shallow"
+        borrowed = []
+        tips = self._git(shared, ["for-each-ref", "--format=%(objectname)", family])
+        if tips.stdout.split() and shared_shallow.exists():
+            boundaries = set(shared_shallow.read_text().split())
+            reachable = self._git(shared, ["rev-list", *tips.stdout.split()])
+            candidates = (
+                reachable.stdout.split()
+                if reachable.returncode == 0
+                else tips.stdout.split()
+            )
+            borrowed = [sha for sha in candidates if sha in boundaries]
+
+        merged = dict.fromkeys([*own, *borrowed])
+        if merged:
+            shallow.write_text("".join(f"{sha}\n" for sha in merged))
+        elif shallow.exists():
+            shallow.unlink()
+
+    def _git(
+        self, repo_dir: Path, args: list[str], timeout: Optional[int] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a git command inside repo_dir with hooks disabled."""
+        return subprocess.run(
+            ["git", "-C", str(repo_dir), "-c", "core.hooksPath=/dev/null", *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout or self.LOCAL_TIMEOUT,
+        )
+
+    def _update_clone(self, url: str, target_dir: Path) -> Optional[str]:
+        """Bring an existing clone to the tip of the remote default branch.
+
+        Asks the remote for its default branch first; if the clone already
+        has that commit nothing is fetched. Otherwise a shallow fetch moves
+        only the new objects, followed by a forced checkout and clean so the
+        working tree exactly matches the fetched commit.
 
+        Args:
+            url: Repository URL (the clone's origin is pointed at it)
+            target_dir: Existing clone
+
+        Returns:
+            None on success, or an error message
+        """
+        result = self._git(target_dir, ["remote", "set-url", "origin", url])
+        if result.returncode != 0:
+            return f"Update failed: {result.stderr}"
+
+        result = self._git(
+            target_dir,
+            ["ls-remote", "--symref", "origin", "HEAD"],
+            timeout=self.NETWORK_TIMEOUT,
+        )
+        if result.returncode != 0:
+            return f"Update failed: {result.stderr}"
+
+        # "ref: refs/heads/main\tHEAD" followed by "<sha>\tHEAD"
+        branch, remote_sha = None, None
+        for line in result.stdout.splitlines():
+            ref, _, name = line.partition("\t")
+            if name != "HEAD":
+                continue
+            if ref.startswith("ref: refs/heads/"):
+                branch = ref[len("ref: refs/heads/") :]
+            else:
+                remote_sha = ref
+        if remote_sha is None:
+            return "Update failed: remote has no default branch"
+
+        local = self._git(target_dir, ["rev-parse", "HEAD"])
+        up_to_date = local.returncode == 0 and local.stdout.strip() == remote_sha
+        if not up_to_date:
+            fetch = ["fetch", "--depth=1", "--no-tags"]
+            if self.blob_limit:
+                fetch.append(f"--filter=blob:limit={self.blob_limit}")
+            result = self._git(
+                target_dir,
+                [*fetch, "origin", branch or "HEAD"],
+                timeout=self.NETWORK_TIMEOUT,
+            )
+            if result.returncode != 0:
+                return f"Fetch failed: {result.stderr}"
+
+        # Reset branch, index and working tree to the remote commit
+        checkout = ["checkout", "--force", "-q"]
+        checkout += ["-B", branch] if branch else ["--detach"]
+        for args in (
+            [*checkout, "HEAD" if up_to_date else "FETCH_HEAD"],
+            ["clean", "-ffdxq"],
+        ):
+            result = self._git(target_dir, args, timeout=self.NETWORK_TIMEOUT)
+            if result.returncode != 0:
+                return f"Update failed: {result.stderr}"
+
+        # Drop objects of superseded commits once enough accumulate
+        self._git(target_dir, ["gc", "--auto", "--quiet"])
+        return None
+
+    def _shared_objects_repo(self) -> Optional[Path]:
+        """Get (creating on first use) the shared bare object repository."""
+        if not self.share_objects:
+            return None
+
+        shared = self.cache_dir / self.SHARED_OBJECTS_DIR
+        if not (shared / "HEAD").exists():
             result = subprocess.run(
-                cmd,
+                ["git", "init", "--bare", "-q", str(shared)],
                 capture_output=True,
                 text=True,
-                timeout=300,  # 5-minute timeout
+                timeout=self.LOCAL_TIMEOUT,
             )
-
             if result.returncode != 0:
-                # Clean up partial clone
-                if target_dir.exists():
-                    shutil.rmtree(target_dir)
-                return False, Path(), f"Clone failed: {result.stderr}"
+                return None
+            # Clones borrow objects from here, so automatic gc could prune
+            # objects they still need; maintain_shared_objects() prunes once
+            # every clone's objects are known to be referenced
+            self._git(shared, ["config", "gc.auto", "0"])
+        return shared
+
+    def _share_objects(self, url: str, clone_dir: Path) -> None:
+        """Copy a clone's objects into the shared repository (best effort).
+
+        The clone's HEAD is recorded under a ref named after the clone
+        directory, replacing its previous HEAD, so later clones of forks
+        negotiate against it and only download what differs.
+        """
+        # Partial clones lack blobs, so they cannot feed the shared store
+        shared = None if self.blob_limit else self._shared_objects_repo()
+        if shared is None:
+            return
 
-            return True, target_dir, None
+        try:
+            name = clone_dir.resolve().relative_to(self.cache_dir.resolve())
+        except ValueError:
+            return
+        ref = f"refs/clones/{name.as_posix()}"
+        try:
+            with self._shared_lock:
+                self._git(
+                    shared,
+                    [
+                        "fetch",
+                        "--depth=1",
+                        "--no-tags",
+                        "-q",
+                        str(clone_dir),
+                        f"+HEAD:{ref}",
+                    ],
+                )
+        except subprocess.TimeoutExpired:
+            pass
+
+    def maintain_shared_objects(self) -> bool:
+        """Drop refs of deleted clones and compact the shared repository.
 
+        Refs of clones that no longer exist are always deleted. At most once
+        per SHARED_GC_INTERVAL the shared repository is then repacked and
+        its unreferenced objects pruned, but only when every clone borrowing
+        from it has its current HEAD recorded there; otherwise pruning could
+        remove objects a clone still needs. Call it when no clone is being
+        updated, e.g., at the end of a batch.
+
+        Returns:
+            True if the shared repository was garbage collected
+        """
+        shared = self.cache_dir / self.SHARED_OBJECTS_DIR
+        if not self.share_objects or not (shared / "HEAD").exists():
+            return False
+
+        try:
+            with self._shared_lock:
+                return self._collect_shared_garbage(shared)
         except subprocess.TimeoutExpired:
-            # Clean up partial clone
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            return False, Path(), "Clone operation timed out"
-        except Exception as e:
-            # Clean up partial clone
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            return False, Path(), f"Clone error: {str(e)}"
+            return False
+
+    def _collect_shared_garbage(self, shared: Path) -> bool:
+        """Delete stale clone refs, then gc the shared repository if safe."""
+        result = self._git(
+            shared,
+            ["for-each-ref", "--format=%(objectname) %(refname)", "refs/clones/"],
+        )
+        if result.returncode != 0:
+            return False
+
+        recorded = {}
+        stale = []
+        for line in result.stdout.splitlines():
+            sha, _, ref = line.partition(" ")
+            name = ref[len("refs/clones/") :]
+            if (self.cache_dir / name / ".git").exists():
+                recorded[name] = sha
+            else:
+                stale.append(ref)
+        if stale:
+            subprocess.run(
+                [
+                    "git",
+                    "-C",
+                    str(shared),
+                    "-c",
+                    "core.hooksPath=/dev/null",
+                    "update-ref",
+                    "--stdin",
+                ],
+                input="".join(f"delete {ref}\n" for ref in stale),
+                capture_output=True,
+                text=True,
+                timeout=self.LOCAL_TIMEOUT,
+            )
+
+        stamp = shared / "agentready-gc"
+        if stamp.exists() and time.time() - stamp.stat().st_mtime < (
+            self.SHARED_GC_INTERVAL
+        ):
+            return False
+
+        shared_objects = str((shared / "objects").resolve())
+        for clone_dir in self.cache_dir.iterdir():
+            alternates = clone_dir / ".git" / "objects" / "info" / "alternates"
+            if clone_dir == shared or not alternates.exists():
+                continue
+            if shared_objects not in alternates.read_text().splitlines():
+                continue
+            head = self._git(clone_dir, ["rev-parse", "HEAD"])
+            if head.stdout.strip() != recorded.get(clone_dir.name):
+                # This clone may borrow objects that no ref keeps alive
+                return False
+
+        result = self._git(
+            shared, ["gc", "--prune=now", "--quiet"], timeout=self.SHARED_GC_TIMEOUT
+        )
+        if result.returncode != 0:
+            return False
+        stamp.touch()
+        return True
 
     def prepare_repository(
         self,
@@ -207,43 +623,26 @@ class RepositoryManager:
 
         # Build Repository model
         try:
-            # Get git information
-            git_cmd = ["git", "-C", str(repo_path), "rev-parse", "--abbrev-ref", "HEAD"]
-            branch_result = subprocess.run(
-                git_cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            branch = (
-                branch_result.stdout.strip()
-                if branch_result.returncode == 0
-                else "HEAD"
-            )
-
-            commit_cmd = ["git", "-C", str(repo_path), "rev-parse", "HEAD"]
-            commit_result = subprocess.run(
-                commit_cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            commit_hash = (
-                commit_result.stdout.strip()
-                if commit_result.returncode == 0
-                else "unknown"
-            )
+            # Branch, HEAD and history in one probe; the scan reuses it
+            probe = GitProbe.collect(repo_path)
 
             # Build Repository model (Scanner will handle language detection, etc.)
+            # Clone directories carry a URL hash; report the plain name
+            name = (
+                self.get_repository_name_from_url(url)
+                if self._is_remote(url)
+                else repo_path.name
+            )
             repository = Repository(
                 path=repo_path.resolve(),
-                name=repo_path.name,
+                name=name,
                 url=url,
-                branch=branch,
-                commit_hash=commit_hash,
+                branch=probe.branch,
+                commit_hash=probe.commit_hash or "unknown",
                 languages={},  # Will be populated by Scanner
                 total_files=0,  # Will be populated by Scanner
                 total_lines=0,  # Will be populated by Scanner
+                git_probe=probe,
             )
 
             return True, repository, None
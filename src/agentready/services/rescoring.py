@@ -0,0 +1,377 @@
+"""Vectorized what-if re-scoring of stored assessments.
+
+Scores depend only on each finding's status and score and on the weight
+vector, so a fleet of stored assessments can be packed into a
+repositories x findings matrix once and re-scored for any number of
+candidate weightings in one vectorized pass, without rescanning.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from ..models.assessment import Assessment
+from .scorer import Scorer
+
+logger = logging.getLogger(__name__)
+
+# Statuses Scorer leaves out of the overall score
+UNSCORED_STATUSES = ("skipped", "error", "not_applicable")
+
+
+@dataclass
+class WeightCandidate:
+    """A weighting to evaluate against stored assessments.
+
+    Attributes:
+        name: Label shown in results
+        weights: Attribute weight overrides, merged over the default weights
+            like Config.weights
+        tier_weights: Total weight given to each tier (tier -> share); the
+            attributes of a tier keep their relative weights
+    """
+
+    name: str
+    weights: dict[str, float] = field(default_factory=dict)
+    tier_weights: dict[int, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Validate weights are positive."""
+        for attr_id, weight in self.weights.items():
+            if weight <= 0:
+                raise ValueError(f"Weight must be positive for {attr_id}: {weight}")
+        for tier, share in self.tier_weights.items():
+            if share <= 0:
+                raise ValueError(f"Tier weight must be positive for tier {tier}")
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> "WeightCandidate":
+        """Create from a candidate entry of a weights file."""
+        return cls(
+            name=name,
+            weights={k: float(v) for k, v in (data.get("weights") or {}).items()},
+            tier_weights={
+                int(k): float(v) for k, v in (data.get("tier_weights") or {}).items()
+            },
+        )
+
+
+def load_candidates(path: Path) -> list[WeightCandidate]:
+    """Read candidate weightings from a YAML file.
+
+    Two layouts are accepted:
+
+    - A "candidates" mapping of name to {weights, tier_weights}
+    - An agentready config file; its "weights" become one candidate named
+      after the file
+
+    A "default" candidate with no overrides is always included first.
+
+    Raises:
+        ValueError: If the file has neither layout or a weight is invalid
+    """
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Weights file must contain a mapping: {path}")
+
+    if "candidates" in data:
+        entries = data["candidates"] or {}
+        if not isinstance(entries, dict):
+            raise ValueError("'candidates' must map names to weightings")
+        candidates = [
+            WeightCandidate.from_dict(str(name), entry or {})
+            for name, entry in entries.items()
+        ]
+    elif "weights" in data or "tier_weights" in data:
+        candidates = [WeightCandidate.from_dict(Path(path).stem, data)]
+    else:
+        raise ValueError(
+            f"Weights file needs a 'candidates' or 'weights' section: {path}"
+        )
+
+    if not any(c.name == "default" for c in candidates):
+        candidates.insert(0, WeightCandidate(name="default"))
+    return candidates
+
+
+class ScoreMatrix:
+    """Finding scores of many assessments packed into NumPy arrays.
+
+    Rows are assessments and columns are finding slots: the n-th finding
+    for an attribute ID (IDs are not unique across assessors), in the order
+    assessors report them. Each cell holds the finding's score, or 0 with
+    scored=False for findings Scorer leaves out (skipped, error,
+    not_applicable or no score).
+
+    Attributes:
+        sources: Where each row came from (assessment file or label)
+        repositories: Repository name of each row
+        attributes: Attribute ID of each column
+        tiers: Tier of each column
+        fallback_weights: Attribute default_weight of each column, used like
+            Scorer does for attributes missing from the weights
+        finding_scores: Finding scores (rows x columns)
+        scored: Whether each finding counts toward the score (rows x columns)
+        stored_scores: Overall score recorded in each assessment
+    """
+
+    def __init__(
+        self,
+        sources: list[str],
+        repositories: list[str],
+        attributes: list[str],
+        tiers: np.ndarray,
+        fallback_weights: np.ndarray,
+        finding_scores: np.ndarray,
+        scored: np.ndarray,
+        stored_scores: np.ndarray,
+    ):
+        self.sources = sources
+        self.repositories = repositories
+        self.attributes = attributes
+        self.tiers = tiers
+        self.fallback_weights = fallback_weights
+        self.finding_scores = finding_scores
+        self.scored = scored
+        self.stored_scores = stored_scores
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    @classmethod
+    def from_assessments(cls, assessments: Iterable[tuple[str, dict]]) -> "ScoreMatrix":
+        """Pack assessments (as written by Assessment.to_dict) into a matrix.
+
+        Args:
+            assessments: (source label, assessment dict) pairs
+
+        Returns:
+            ScoreMatrix with one row per assessment
+        """
+        sources: list[str] = []
+        repositories: list[str] = []
+        stored_scores: list[float] = []
+        columns: dict[tuple[str, int], int] = {}
+        tiers: list[int] = []
+        fallback_weights: list[float] = []
+        rows: list[int] = []
+        cols: list[int] = []
+        scores: list[float] = []
+
+        for source, data in assessments:
+            row = len(sources)
+            sources.append(source)
+            repositories.append(data.get("repository", {}).get("name", source))
+            stored_scores.append(float(data.get("overall_score", 0.0)))
+
+            seen: dict[str, int] = {}
+            for finding in data.get("findings", []):
+                attribute = finding["attribute"]
+                attr_id = attribute["id"]
+                slot = (attr_id, seen.get(attr_id, 0))
+                seen[attr_id] = slot[1] + 1
+                col = columns.get(slot)
+                if col is None:
+                    col = columns[slot] = len(columns)
+                    tiers.append(int(attribute.get("tier", 0)))
+                    fallback_weights.append(float(attribute.get("default_weight", 0)))
+
+                if finding["status"] in UNSCORED_STATUSES:
+                    continue
+                if finding.get("score") is None:
+                    continue
+                rows.append(row)
+                cols.append(col)
+                scores.append(float(finding["score"]))
+
+        shape = (len(sources), len(columns))
+        finding_scores = np.zeros(shape)
+        scored = np.zeros(shape, dtype=bool)
+        index = (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp))
+        finding_scores[index] = scores
+        scored[index] = True
+
+        return cls(
+            sources=sources,
+            repositories=repositories,
+            attributes=[attr_id for attr_id, _ in columns],
+            tiers=np.array(tiers, dtype=np.int16),
+            fallback_weights=np.array(fallback_weights),
+            finding_scores=finding_scores,
+            scored=scored,
+            stored_scores=np.array(stored_scores),
+        )
+
+    @classmethod
+    def from_directory(cls, directory: Path) -> "ScoreMatrix":
+        """Load every assessment JSON under a directory.
+
+        Files that are not assessments (batch summaries, caches) and
+        symlinks such as assessment-latest.json are skipped.
+        """
+
+        def assessments():
+            for path in sorted(Path(directory).rglob("*.json")):
+                if path.is_symlink():
+                    continue
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Skipping unreadable {path}: {e}")
+                    continue
+                if isinstance(data, dict) and isinstance(data.get("findings"), list):
+                    yield str(path), data
+
+        return cls.from_assessments(assessments())
+
+    def save(self, path: Path) -> Path:
+        """Write the matrix to a compressed .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        labels = {
+            "sources": self.sources,
+            "repositories": self.repositories,
+            "attributes": self.attributes,
+        }
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                labels=np.array(json.dumps(labels)),
+                tiers=self.tiers,
+                fallback_weights=self.fallback_weights,
+                finding_scores=self.finding_scores,
+                scored=self.scored,
+                stored_scores=self.stored_scores,
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "ScoreMatrix":
+        """Read a matrix written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            labels = json.loads(str(data["labels"]))
+            return cls(
+                sources=labels["sources"],
+                repositories=labels["repositories"],
+                attributes=labels["attributes"],
+                tiers=data["tiers"],
+                fallback_weights=data["fallback_weights"],
+                finding_scores=data["finding_scores"],
+                scored=data["scored"],
+                stored_scores=data["stored_scores"],
+            )
+
+    def weight_vector(
+        self, candidate: WeightCandidate, scorer: Optional[Scorer] = None
+    ) -> np.ndarray:
+        """Column weights for a candidate, as Scorer would use them.
+
+        Overrides are merged over the default weights and rescaled to sum
+        to 1.0 (Scorer.merge_and_rescale_weights); tier_weights first scale
+        each listed tier to its share. Columns missing from the merged
+        weights fall back to their attribute default_weight.
+        """
+        scorer = scorer or Scorer()
+        merged = scorer.default_weights.copy()
+        merged.update(candidate.weights)
+
+        for tier, share in candidate.tier_weights.items():
+            members = {
+                attr_id
+                for attr_id, attr_tier in zip(self.attributes, self.tiers)
+                if attr_tier == tier and attr_id in merged
+            }
+            current = sum(merged[attr_id] for attr_id in members)
+            if current <= 0:
+                continue
+            for attr_id in members:
+                merged[attr_id] *= share / current
+
+        total = sum(merged.values())
+        return np.array(
+            [
+                merged[attr_id] / total if attr_id in merged else fallback
+                for attr_id, fallback in zip(self.attributes, self.fallback_weights)
+            ]
+        )
+
+    def rescore(self, weights: np.ndarray) -> np.ndarray:
+        """Overall scores of every assessment under each weight vector.
+
+        Every assessment and candidate is scored at once, accumulating one
+        finding column at a time in the order Scorer adds them, so results
+        match Scorer.calculate_overall_score exactly rather than differing
+        by a rounding step at .x5 boundaries.
+
+        Args:
+            weights: One weight vector (columns) or a candidates x columns
+                array
+
+        Returns:
+            Scores rounded like Scorer (candidates x rows, or rows for a
+            single vector); 0.0 where nothing was scored
+        """
+        weights = np.asarray(weights, dtype=float)
+        single = weights.ndim == 1
+        weights = np.atleast_2d(weights)
+
+        # Column-major copies make each column a contiguous row
+        finding_scores = np.ascontiguousarray(self.finding_scores.T)
+        scored = np.ascontiguousarray(self.scored.T, dtype=float)
+
+        shape = (weights.shape[0], len(self))
+        total_score = np.zeros(shape)
+        total_weight = np.zeros(shape)
+        term = np.empty(shape)
+        for col in range(len(self.attributes)):
+            column_weights = weights[:, col : col + 1]
+            np.multiply(finding_scores[col], column_weights, out=term)
+            total_score += term
+            np.multiply(scored[col], column_weights, out=term)
+            total_weight += term
+
+        raw = np.divide(
+            total_score,
+            total_weight,
+            out=np.zeros_like(total_score),
+            where=total_weight > 0,
+        )
+        scores = _round_score(raw)
+        return scores[0] if single else scores
+
+
+def _round_score(raw: np.ndarray) -> np.ndarray:
+    """Round to one decimal exactly like Python's round(x, 1).
+
+    np.round scales by ten first, which can land differently on values
+    that sit at a half; those few are rounded in Python instead.
+    """
+    scores = np.round(raw, 1)
+    tenths = raw * 10
+    near_half = np.abs(tenths - np.floor(tenths) - 0.5) < 1e-9
+    for index in zip(*np.nonzero(near_half)):
+        scores[index] = round(float(raw[index]), 1)
+    return scores
+
+
+def certification_levels(scores: np.ndarray) -> np.ndarray:
+    """Certification level of each score (same shape, dtype object).
+
+    Rounded scores take at most 1,001 distinct values, so the level is
+    looked up once per distinct score with
+    Assessment.determine_certification_level.
+    """
+    unique, inverse = np.unique(scores, return_inverse=True)
+    levels = np.array(
+        [Assessment.determine_certification_level(score) for score in unique],
+        dtype=object,
+    )
+    return levels[inverse].reshape(np.shape(scores))
@@ -1,21 +1,33 @@
 """Scanner service orchestrating the assessment workflow."""
 
+import fnmatch
+import logging
+import re
+import subprocess
 import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import git
-
 from ..models.assessment import Assessment
 from ..models.config import Config
 from ..models.finding import Finding
-from ..models.metadata import AssessmentMetadata
+from ..models.metadata import AssessmentMetadata, AssessorProfile
 from ..models.repository import Repository
+from ..utils.subprocess_utils import SubprocessSecurityError
+from . import profiling
+from .ast_cache import ASTCache
+from .file_index import FileIndex
+from .file_metric_cache import FileMetricCache
+from .git_probe import GitProbe, hash_blob, list_untracked_files
 from .language_detector import LanguageDetector
 from .research_loader import ResearchLoader
 from .scorer import Scorer
 
+logger = logging.getLogger(__name__)
+
 
 class MissingToolError(Exception):
     """Raised when a required tool is missing."""
@@ -37,19 +49,43 @@ class Scanner:
     - Track progress
     """
 
-    def __init__(self, repository_path: Path, config: Config | None = None):
+    def __init__(
+        self,
+        repository_path: Path,
+        config: Config | None = None,
+        metric_cache: FileMetricCache | None = None,
+        git_probe: GitProbe | None = None,
+        scorer: Scorer | None = None,
+        research_version: str | None = None,
+        repository_name: str | None = None,
+    ):
         """Initialize scanner for repository.
 
         Args:
             repository_path: Path to git repository root
             config: User configuration (optional)
+            metric_cache: Persistent per-file metric store shared across
+                scans (optional)
+            git_probe: Git metadata already collected for this repository
+                (probed during the scan if not provided)
+            scorer: Scorer with default weights already loaded (a new one
+                is created if not provided)
+            research_version: Version of the bundled research report
+                (loaded during the scan if not provided)
+            repository_name: Name to report for the repository (defaults
+                to the directory name; batch clones live in hashed cache
+                directories)
 
         Raises:
             ValueError: If repository is invalid
         """
         self.repository_path = repository_path
         self.config = config
-        self.scorer = Scorer()
+        self.metric_cache = metric_cache
+        self.git_probe = git_probe
+        self.scorer = scorer or Scorer()
+        self.research_version = research_version
+        self.repository_name = repository_name
 
         # Validate repository
         self._validate_repository()
@@ -72,6 +108,8 @@ class Scanner:
         verbose: bool = False,
         version: str = "unknown",
         command: str | None = None,
+        jobs: int = 1,
+        previous: Assessment | None = None,
     ) -> Assessment:
         """Execute full assessment workflow.
 
@@ -80,6 +118,10 @@ class Scanner:
             verbose: Enable detailed progress logging
             version: AgentReady version string
             command: CLI command executed (reconstructed from sys.argv if None)
+            jobs: Number of assessors to run concurrently (1 = sequential)
+            previous: Earlier assessment of this repository; findings of
+                assessors whose input files have the same content as when it
+                ran are reused instead of re-assessed
 
         Returns:
             Complete Assessment with findings and scores
@@ -98,17 +140,28 @@ class Scanner:
             print(f"Scanning repository: {self.repository_path.name}")
 
         # Build Repository model
-        repository = self._build_repository_model(verbose)
+        with profiling.span("repository model"):
+            repository = self._build_repository_model(verbose)
 
         if verbose:
             print(f"Languages detected: {', '.join(repository.languages.keys())}")
             print(f"\nEvaluating {len(assessors)} attributes...")
 
+        # Fingerprint assessor inputs, then reuse findings whose inputs are
+        # unchanged since the previous run
+        fingerprints = self._input_fingerprints(assessors, repository)
+        reusable = self._reusable_findings(
+            assessors, repository, previous, version, fingerprints
+        )
+        if verbose and previous is not None:
+            reused = sum(1 for finding in reusable if finding is not None)
+            print(f"Reusing {reused} unchanged findings")
+
         # Execute assessors with graceful degradation
-        findings = []
-        for assessor in assessors:
-            finding = self._execute_assessor(assessor, repository, verbose)
-            findings.append(finding)
+        profiles: list[AssessorProfile] = []
+        findings = self._execute_assessors(
+            assessors, repository, verbose, jobs, reusable, profiles
+        )
 
         # Calculate scores
         overall_score = self.scorer.calculate_overall_score(findings, self.config)
@@ -124,19 +177,12 @@ class Scanner:
             # Reconstruct command from sys.argv
             command = " ".join(sys.argv)
 
-        # Load research version
-        research_loader = ResearchLoader()
-        try:
-            _, research_metadata, _, _, _ = research_loader.load_and_validate()
-            research_version = research_metadata.version
-        except Exception:
-            research_version = "unknown"
-
         metadata = AssessmentMetadata.create(
             version=version,
-            research_version=research_version,
+            research_version=self.research_version or self.load_research_version(),
             timestamp=timestamp,
             command=command,
+            assessor_profiles=profiles,
         )
 
         if verbose:
@@ -158,8 +204,23 @@ class Scanner:
             config=self.config,
             duration_seconds=round(duration, 1),
             metadata=metadata,
+            input_fingerprints=fingerprints,
         )
 
+    @staticmethod
+    def load_research_version() -> str:
+        """Read the version of the bundled research report.
+
+        Returns:
+            Research report version, or "unknown" if it cannot be loaded
+        """
+        research_loader = ResearchLoader()
+        try:
+            _, research_metadata, _, _, _ = research_loader.load_and_validate()
+            return research_metadata.version
+        except Exception:
+            return "unknown"
+
     def _build_repository_model(self, verbose: bool = False) -> Repository:
         """Build Repository model with metadata and language detection.
 
@@ -172,44 +233,252 @@ class Scanner:
         if verbose:
             print("Detecting languages and repository metadata...")
 
-        # Git metadata
-        repo = git.Repo(self.repository_path)
-        name = self.repository_path.name
-
-        # Handle detached HEAD state (e.g., in CI/CD)
-        try:
-            branch = repo.active_branch.name
-        except TypeError:
-            # Detached HEAD - use commit hash or "HEAD"
-            branch = "HEAD"
-
-        commit_hash = repo.head.commit.hexsha
+        # Git metadata (branch, HEAD, remote, history and file listing),
+        # collected once and shared with the file index and assessors
+        probe = self.git_probe or GitProbe.collect(self.repository_path)
+        if probe.commit_hash is None:
+            raise ValueError(f"Repository has no commits: {self.repository_path}")
 
-        # Get remote URL (if available)
-        try:
-            url = repo.remotes.origin.url if repo.remotes else None
-        except Exception:
-            url = None
+        # List the repository once; detector and assessors share the index
+        file_index = FileIndex.build(self.repository_path, git_probe=probe)
 
         # Language detection
-        detector = LanguageDetector(self.repository_path)
+        detector = LanguageDetector(self.repository_path, file_index=file_index)
         languages = detector.detect_languages()
         total_files = detector.count_total_files()
         total_lines = detector.count_total_lines()
 
         return Repository(
             path=self.repository_path,
-            name=name,
-            url=url,
-            branch=branch,
-            commit_hash=commit_hash,
+            name=self.repository_name or self.repository_path.name,
+            url=probe.remote_url,
+            branch=probe.branch,
+            commit_hash=probe.commit_hash,
             languages=languages,
             total_files=total_files,
             total_lines=total_lines,
+            file_index=file_index,
+            ast_cache=ASTCache(file_index, metric_cache=self.metric_cache),
+            git_probe=probe,
         )
 
+    def _input_fingerprints(
+        self, assessors: list, repository: Repository
+    ) -> dict[str, str] | None:
+        """Fingerprint the files assessors declare as inputs.
+
+        Covers every tracked file and every untracked, non-ignored file
+        matching an assessor's input_globs, as read from the working tree:
+        clean tracked files use the blob SHA from the index, and modified or
+        untracked files are hashed the same way. Deleted files are absent.
+
+        Args:
+            assessors: Assessors about to run
+            repository: Current repository model
+
+        Returns:
+            Mapping of repository-relative path to blob SHA, or None if the
+            untracked files cannot be listed
+        """
+        globs = {
+            pattern for assessor in assessors for pattern in assessor.input_globs or ()
+        }
+        if not globs:
+            return {}
+        matches = self._glob_matcher(globs)
+
+        try:
+            untracked = list_untracked_files(self.repository_path)
+        except (SubprocessSecurityError, subprocess.SubprocessError, OSError) as e:
+            logger.debug(f"Cannot list untracked files: {e}")
+            return None
+
+        candidates = [
+            (entry.path, entry.blob_sha) for entry in repository.get_file_index()
+        ]
+        candidates.extend((path, None) for path in untracked)
+
+        fingerprints = {}
+        for path, blob_sha in candidates:
+            if not matches(path):
+                continue
+            if blob_sha is None:
+                blob_sha = hash_blob(self.repository_path / path)
+            if blob_sha is not None:
+                fingerprints[path] = blob_sha
+        return fingerprints
+
+    @staticmethod
+    def _glob_matcher(globs) -> Callable[[str], re.Match | None]:
+        """Compile fnmatch globs into one case-sensitive path matcher."""
+        pattern = "|".join(fnmatch.translate(glob) for glob in sorted(globs))
+        return re.compile(pattern).match
+
+    def _reusable_findings(
+        self,
+        assessors: list,
+        repository: Repository,
+        previous: Assessment | None,
+        version: str,
+        fingerprints: dict[str, str] | None,
+    ) -> list[Finding | None]:
+        """Find previous findings that still hold for the current tree.
+
+        A finding is reusable when its assessor declares input_globs and
+        the files matching them are the same, with the same content, as
+        when the previous assessment ran, including uncommitted and
+        untracked files. Nothing is reused if the previous run used another
+        agentready version, saw different languages, or recorded no input
+        fingerprints (e.g., reports from older versions).
+
+        Args:
+            assessors: Assessors about to run
+            repository: Current repository model
+            previous: Earlier assessment of the same repository
+            version: AgentReady version of this run
+            fingerprints: Input fingerprints of the current tree
+
+        Returns:
+            Reusable finding (or None) for each assessor, in assessor order
+        """
+        no_reuse = [None] * len(assessors)
+        if previous is None or fingerprints is None:
+            return no_reuse
+        if previous.input_fingerprints is None:
+            return no_reuse
+
+        previous_version = (
+            previous.metadata.agentready_version if previous.metadata else None
+        )
+        if previous_version != version:
+            return no_reuse
+        if previous.repository.languages != repository.languages:
+            return no_reuse
+
+        # Attribute IDs are not unique across assessors, so pair the n-th
+        # assessor with an ID with the n-th previous finding for that ID
+        previous_findings: dict[str, list[Finding]] = {}
+        for finding in previous.findings:
+            previous_findings.setdefault(finding.attribute.id, []).append(finding)
+
+        reusable = []
+        for assessor in assessors:
+            candidates = previous_findings.get(assessor.attribute_id)
+            finding = candidates.pop(0) if candidates else None
+            reusable.append(None)
+            globs = assessor.input_globs
+            # Errors may be transient, so those assessors always re-run
+            if finding is None or finding.status == "error" or not globs:
+                continue
+            matches = self._glob_matcher(globs)
+            before = {
+                path: sha
+                for path, sha in previous.input_fingerprints.items()
+                if matches(path)
+            }
+            now = {path: sha for path, sha in fingerprints.items() if matches(path)}
+            if before == now:
+                reusable[-1] = finding
+        return reusable
+
+    def _execute_assessors(
+        self,
+        assessors: list,
+        repository: Repository,
+        verbose: bool = False,
+        jobs: int = 1,
+        reusable: list[Finding | None] | None = None,
+        profiles: list[AssessorProfile] | None = None,
+    ) -> list[Finding]:
+        """Execute assessors, optionally on a thread pool.
+
+        Most assessors wait on subprocesses, git or file I/O, so threads
+        overlap that latency while sharing the repository's file index and
+        AST cache. Findings are always returned in assessor order, and
+        verbose progress lines are printed in that same order.
+
+        Each assessor runs under profiling.measure, so its wall time, CPU
+        time, file reads and subprocesses are recorded even in parallel.
+
+        Args:
+            assessors: List of assessor instances to run
+            repository: Repository model
+            verbose: Enable progress logging
+            jobs: Maximum number of assessors to run concurrently
+            reusable: Previous finding to return instead of re-assessing, or
+                None, for each assessor
+            profiles: List to append each assessor's profile to (in
+                assessor order)
+
+        Returns:
+            Findings in the same order as assessors
+        """
+        if reusable is None:
+            reusable = [None] * len(assessors)
+        if profiles is None:
+            profiles = []
+
+        if jobs <= 1 or len(assessors) <= 1:
+            findings = []
+            for assessor, previous in zip(assessors, reusable):
+                if verbose:
+                    print(f"  [{assessor.attribute_id}] ", end="", flush=True)
+                finding, outcome, profile = self._profile_assessor(
+                    assessor, repository, previous
+                )
+                if verbose:
+                    print(outcome)
+                findings.append(finding)
+                profiles.append(profile)
+            return findings
+
+        with ThreadPoolExecutor(
+            max_workers=min(jobs, len(assessors)), thread_name_prefix="assessor"
+        ) as executor:
+            futures = [
+                executor.submit(self._profile_assessor, assessor, repository, previous)
+                for assessor, previous in zip(assessors, reusable)
+            ]
+
+            findings = []
+            for assessor, future in zip(assessors, futures):
+                finding, outcome, profile = future.result()
+                if verbose:
+                    print(f"  [{assessor.attribute_id}] {outcome}", flush=True)
+                findings.append(finding)
+                profiles.append(profile)
+
+        return findings
+
+    def _profile_assessor(
+        self,
+        assessor,
+        repository: Repository,
+        previous: Finding | None = None,
+    ) -> tuple[Finding, str, AssessorProfile]:
+        """Run single assessor (see _run_assessor) and measure it.
+
+        Returns:
+            Tuple of (finding, outcome description, assessor profile)
+        """
+        with profiling.measure(assessor.attribute_id) as usage:
+            finding, outcome = self._run_assessor(assessor, repository, previous)
+        profile = AssessorProfile(
+            attribute_id=assessor.attribute_id,
+            wall_seconds=round(usage.wall_seconds, 4),
+            cpu_seconds=round(usage.cpu_seconds, 4),
+            files_read=usage.files_read,
+            bytes_read=usage.bytes_read,
+            subprocesses=usage.subprocesses,
+        )
+        return finding, outcome, profile
+
     def _execute_assessor(
-        self, assessor, repository: Repository, verbose: bool = False
+        self,
+        assessor,
+        repository: Repository,
+        verbose: bool = False,
+        previous: Finding | None = None,
     ) -> Finding:
         """Execute single assessor with error handling.
 
@@ -222,70 +491,97 @@ class Scanner:
             assessor: Assessor instance
             repository: Repository model
             verbose: Enable progress logging
+            previous: Reusable finding from a previous assessment
 
         Returns:
             Finding (pass/fail/skipped/error/not_applicable)
         """
-        attr_id = assessor.attribute_id
+        if verbose:
+            print(f"  [{assessor.attribute_id}] ", end="", flush=True)
+
+        finding, outcome = self._run_assessor(assessor, repository, previous)
 
         if verbose:
-            print(f"  [{attr_id}] ", end="", flush=True)
+            print(outcome)
+
+        return finding
+
+    def _run_assessor(
+        self,
+        assessor,
+        repository: Repository,
+        previous: Finding | None = None,
+    ) -> tuple[Finding, str]:
+        """Run single assessor without printing.
+
+        Safe to call from worker threads; see _execute_assessor for the
+        error handling semantics.
+
+        Args:
+            assessor: Assessor instance
+            repository: Repository model
+            previous: Reusable finding from a previous assessment
+
+        Returns:
+            Tuple of (finding, short outcome description for progress output)
+        """
+        if previous is not None:
+            return previous, "unchanged (reused)"
 
         # Check if applicable (language-specific checks)
         try:
             if not assessor.is_applicable(repository):
-                if verbose:
-                    print("not applicable")
-                return Finding.not_applicable(
-                    assessor.attribute,
-                    reason=f"Not applicable to {list(repository.languages.keys())}",
+                return (
+                    Finding.not_applicable(
+                        assessor.attribute,
+                        reason=f"Not applicable to {list(repository.languages.keys())}",
+                    ),
+                    "not applicable",
                 )
         except Exception as e:
-            if verbose:
-                print("error (applicability check failed)")
-            return Finding.error(
-                assessor.attribute, reason=f"Applicability check failed: {str(e)}"
+            return (
+                Finding.error(
+                    assessor.attribute, reason=f"Applicability check failed: {str(e)}"
+                ),
+                "error (applicability check failed)",
             )
 
         # Try to assess
         try:
             finding = assessor.assess(repository)
 
-            if verbose:
-                if finding.status == "pass":
-                    print(f"pass ({finding.score:.0f})")
-                elif finding.status == "fail":
-                    print(f"fail ({finding.score:.0f})")
-                elif finding.status == "skipped":
-                    print("skipped")
-                else:
-                    print(finding.status)
+            if finding.status in ("pass", "fail"):
+                outcome = f"{finding.status} ({finding.score:.0f})"
+            else:
+                outcome = finding.status
 
-            return finding
+            return finding, outcome
 
         except MissingToolError as e:
-            if verbose:
-                print(f"skipped (missing {e.tool_name})")
-
-            return Finding.skipped(
-                assessor.attribute,
-                reason=f"Missing tool: {e.tool_name}",
-                remediation=(
-                    f"Install with: {e.install_command}" if e.install_command else ""
+            return (
+                Finding.skipped(
+                    assessor.attribute,
+                    reason=f"Missing tool: {e.tool_name}",
+                    remediation=(
+                        f"Install with: {e.install_command}"
+                        if e.install_command
+                        else ""
+                    ),
                 ),
+                f"skipped (missing {e.tool_name})",
             )
 
         except PermissionError as e:
-            if verbose:
-                print("skipped (permission denied)")
-
-            return Finding.skipped(
-                assessor.attribute,
-                reason=f"Permission denied: {getattr(e, 'filename', 'unknown')}",
+            return (
+                Finding.skipped(
+                    assessor.attribute,
+                    reason=f"Permission denied: {getattr(e, 'filename', 'unknown')}",
+                ),
+                "skipped (permission denied)",
             )
 
         except Exception as e:
-            if verbose:
-                print(f"error ({type(e).__name__})")
-
-            return Finding.error(assessor.attribute, reason=str(e))
+            return (
+                Finding.error(assessor.attribute, reason=str(e)),
+                f"error ({type(e).__name__})",
+            )
@@ -2,8 +2,6 @@
 
 from pathlib import Path
 
-import yaml
-
 from ..models.assessment import Assessment
 from ..models.config import Config
 from ..models.finding import Finding
@@ -42,6 +40,8 @@ class Scorer:
             FileNotFoundError: If weights file not found
             ValueError: If weights are invalid
         """
+        import yaml
+
         if not path.exists():
             raise FileNotFoundError(f"Weights file not found: {path}")
 
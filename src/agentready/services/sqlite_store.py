@@ -0,0 +1,62 @@
+"""Base for caches kept in a single SQLite database file."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Self
+
+
+class SQLiteStore:
+    """Per-thread SQLite connections to one database file.
+
+    Each thread reuses one long-lived connection, opened on first use, so
+    caches can be shared by assessors on worker threads without opening a
+    connection per query. Stores that may live on network filesystems set
+    USE_WAL to False and keep the default rollback journal, since WAL needs
+    shared memory that network filesystems do not provide.
+
+    Subclasses create their schema after calling __init__.
+    """
+
+    # Write-ahead logging, so readers never block the writer
+    USE_WAL = True
+
+    # zlib's default level, balancing speed against size for stored payloads
+    COMPRESSION_LEVEL = 6
+
+    def __init__(self, db_path: Path):
+        """Initialize store.
+
+        Args:
+            db_path: Database file (its directory must exist)
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            if self.USE_WAL:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection.
+
+        Connections opened by other (worker) threads are closed when those
+        threads exit.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
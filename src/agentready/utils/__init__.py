@@ -7,6 +7,7 @@ from .privacy import (
     sanitize_path,
     shorten_commit_hash,
 )
+from .rate_limiter import TokenBucket
 from .subprocess_utils import (
     SUBPROCESS_TIMEOUT,
     SubprocessSecurityError,
@@ -26,4 +27,5 @@ __all__ = [
     "sanitize_error_message",
     "sanitize_metadata",
     "shorten_commit_hash",
+    "TokenBucket",
 ]
@@ -0,0 +1,68 @@
+"""Thread-safe token bucket for pacing API requests."""
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by worker threads.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each request takes one. A full bucket allows a burst of ``capacity``
+    requests, after which callers are paced to ``rate``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+            clock: Monotonic clock, replaceable in tests
+            sleep: Sleep function, replaceable in tests
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive: {capacity}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+
+            # Sleep outside the lock so other threads can check the bucket
+            self._sleep(delay)
+            waited += delay
@@ -0,0 +1,4 @@
+"""Performance benchmarks against synthetic repositories.
+
+Not collected by pytest; run with `python -m tests.benchmarks --help`.
+"""
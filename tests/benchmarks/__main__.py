@@ -0,0 +1,85 @@
+"""Run the benchmark suite: python -m tests.benchmarks --scale small."""
+
+import argparse
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from .harness import BenchmarkRunner, compare_results, load_results, save_results
+from .synthetic_repo import SCALES
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Benchmark agentready against a synthetic repository.",
+    )
+    parser.add_argument(
+        "--scale", choices=sorted(SCALES), default="small", help="Repository preset"
+    )
+    parser.add_argument("--files", type=int, help="Override the preset's file count")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    parser.add_argument(
+        "--batch-repos",
+        type=int,
+        default=4,
+        help="Repositories in the batch benchmark (0 to skip)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Results file (default: .agentready/benchmarks/<scale>.json)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="Earlier results file to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Keep generated repositories here instead of a temporary directory",
+    )
+    args = parser.parse_args(argv)
+
+    spec = SCALES[args.scale]
+    if args.files:
+        spec = replace(spec, files=args.files)
+    output = args.output or Path(".agentready/benchmarks") / f"{args.scale}.json"
+
+    with tempfile.TemporaryDirectory(prefix="agentready-bench-") as tmp:
+        work_dir = args.work_dir or Path(tmp)
+        runner = BenchmarkRunner(
+            work_dir, spec, repeat=args.repeat, batch_repos=args.batch_repos
+        )
+        results = runner.run(progress=lambda message: print(f"... {message}"))
+
+    save_results(results, output)
+    print(f"\nResults saved to {output}\n")
+    width = max(len(name) for name in results["results"])
+    for name, timing in results["results"].items():
+        print(
+            f"  {name:<{width}}  {timing['median']:8.3f}s  (min {timing['min']:.3f}s)"
+        )
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        if baseline.get("spec") != results["spec"]:
+            print("\nWarning: baseline used a different repository spec")
+        regressions = compare_results(results, baseline, threshold=args.threshold)
+        if regressions:
+            print(f"\nRegressions against {args.baseline}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Time agentready components against synthetic repositories."""
+
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Callable
+
+from agentready.assessors import create_all_assessors
+from agentready.reporters.aggregated_json import AggregatedJSONReporter
+from agentready.reporters.csv_reporter import CSVReporter
+from agentready.reporters.html import HTMLReporter
+from agentready.reporters.json_reporter import JSONReporter
+from agentready.reporters.markdown import MarkdownReporter
+from agentready.reporters.multi_html import MultiRepoHTMLReporter
+from agentready.services.batch_scanner import BatchScanner
+from agentready.services.language_detector import LanguageDetector
+from agentready.services.scanner import Scanner
+
+from .synthetic_repo import SyntheticRepoSpec, generate_repository
+
+# Bump when result keys or their meaning change
+RESULTS_FORMAT = 1
+
+
+@dataclass
+class Timing:
+    """Wall times of repeated runs of one benchmark, in seconds."""
+
+    runs: list[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "median": round(self.median, 4),
+            "min": round(min(self.runs), 4),
+            "max": round(max(self.runs), 4),
+            "runs": [round(run, 4) for run in self.runs],
+        }
+
+
+class BenchmarkRunner:
+    """Runs the benchmark suite against one synthetic repository scale.
+
+    Benchmarks:
+    - scanner.scan: full assessment with every assessor
+    - assessor.<attribute_id>: each assessor's share of scanner.scan
+    - language_detector: file listing, language detection and line counts
+    - reporter.<name>: single-repository and batch reporters
+    - batch_scanner.scan_batch: a batch of smaller repositories of the
+      same shape, without caches
+
+    Every benchmark runs `repeat` times; caches are never reused between
+    runs, so results measure cold work.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        spec: SyntheticRepoSpec,
+        repeat: int = 3,
+        batch_repos: int = 4,
+    ):
+        """Initialize benchmark runner.
+
+        Args:
+            work_dir: Empty directory for generated repositories and output
+            spec: Shape of the repository under test
+            repeat: Runs per benchmark
+            batch_repos: Repositories in the batch benchmark (0 to skip)
+        """
+        self.work_dir = Path(work_dir)
+        self.spec = spec
+        self.repeat = max(1, repeat)
+        self.batch_repos = batch_repos
+        self.timings: dict[str, Timing] = {}
+
+    def _time(self, name: str, func: Callable[[], object]) -> object:
+        """Run func once, adding its wall time to benchmark name."""
+        start = time.perf_counter()
+        result = func()
+        self.timings.setdefault(name, Timing()).runs.append(time.perf_counter() - start)
+        return result
+
+    def run(self, progress: Callable[[str], None] = lambda message: None) -> dict:
+        """Generate the repositories and run every benchmark.
+
+        Args:
+            progress: Called with a short message as each stage starts
+
+        Returns:
+            Results document (see save_results)
+        """
+        progress(f"Generating repository ({self.spec.files:,} files)")
+        repo = generate_repository(self.work_dir / "repo", self.spec)
+        agentready_version = _agentready_version()
+
+        for run in range(self.repeat):
+            progress(f"Scanning (run {run + 1}/{self.repeat})")
+            assessment = self._time(
+                "scanner.scan",
+                lambda: Scanner(repo).scan(
+                    create_all_assessors(), version=agentready_version
+                ),
+            )
+            # Several assessors may share an attribute ID; sum them per run
+            assessor_seconds: dict[str, float] = {}
+            for profile in assessment.metadata.assessor_profiles:
+                name = f"assessor.{profile.attribute_id}"
+                assessor_seconds[name] = (
+                    assessor_seconds.get(name, 0.0) + profile.wall_seconds
+                )
+            for name, seconds in assessor_seconds.items():
+                self.timings.setdefault(name, Timing()).runs.append(seconds)
+
+            self._time("language_detector", lambda: _detect_languages(repo))
+
+        progress("Generating reports")
+        reports = self.work_dir / "reports"
+        reports.mkdir(parents=True, exist_ok=True)
+        reporters = {
+            "reporter.html": (HTMLReporter(), "report.html"),
+            "reporter.markdown": (MarkdownReporter(), "report.md"),
+            "reporter.json": (JSONReporter(), "report.json"),
+        }
+        for name, (reporter, filename) in reporters.items():
+            for _ in range(self.repeat):
+                self._time(
+                    name, lambda: reporter.generate(assessment, reports / filename)
+                )
+
+        if self.batch_repos:
+            self._run_batch(agentready_version, progress)
+
+        return {
+            "format": RESULTS_FORMAT,
+            "timestamp": datetime.now().isoformat(),
+            "spec": asdict(self.spec),
+            "repeat": self.repeat,
+            "batch_repos": self.batch_repos,
+            "environment": {
+                "agentready_version": agentready_version,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "results": {
+                name: timing.to_dict() for name, timing in sorted(self.timings.items())
+            },
+        }
+
+    def _run_batch(
+        self, agentready_version: str, progress: Callable[[str], None]
+    ) -> None:
+        """Benchmark BatchScanner and the batch reporters."""
+        progress(f"Generating {self.batch_repos} batch repositories")
+        # A tenth of the main repository each, without large binaries
+        batch_spec = replace(
+            self.spec, files=max(10, self.spec.files // 10), binary_files=0
+        )
+        urls = [
+            str(
+                generate_repository(
+                    self.work_dir / "batch" / f"repo-{i}",
+                    replace(batch_spec, seed=batch_spec.seed + i),
+                )
+            )
+            for i in range(self.batch_repos)
+        ]
+
+        for run in range(self.repeat):
+            progress(f"Batch scanning (run {run + 1}/{self.repeat})")
+            scanner = BatchScanner(
+                cache_dir=self.work_dir / f"batch-cache-{run}",
+                version=agentready_version,
+            )
+            batch = self._time(
+                "batch_scanner.scan_batch",
+                lambda: scanner.scan_batch(
+                    urls, create_all_assessors(), use_cache=False
+                ),
+            )
+
+        reports = self.work_dir / "batch-reports"
+        reports.mkdir(parents=True, exist_ok=True)
+        template_dir = _templates_dir()
+        reporters = {
+            "reporter.csv": (CSVReporter(), "summary.csv"),
+            "reporter.aggregated_json": (AggregatedJSONReporter(), "all.json"),
+            "reporter.multi_html": (MultiRepoHTMLReporter(template_dir), "index.html"),
+        }
+        for name, (reporter, filename) in reporters.items():
+            for _ in range(self.repeat):
+                self._time(name, lambda: reporter.generate(batch, reports / filename))
+
+
+def _detect_languages(repo: Path) -> None:
+    """Run language detection from scratch (lists the repository again)."""
+    detector = LanguageDetector(repo)
+    detector.detect_languages()
+    detector.count_total_lines()
+
+
+def _templates_dir() -> Path:
+    """Directory of agentready's bundled templates."""
+    import agentready
+
+    return Path(agentready.__file__).parent / "templates"
+
+
+def _agentready_version() -> str:
+    try:
+        return version("agentready")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def save_results(results: dict, path: Path) -> Path:
+    """Write a results document as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def load_results(path: Path) -> dict:
+    """Read a results document written by save_results."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    current: dict,
+    baseline: dict,
+    threshold: float = 0.2,
+    min_delta: float = 0.05,
+) -> list[str]:
+    """Find benchmarks that got slower than a baseline.
+
+    A benchmark regresses when its median exceeds the baseline median by
+    more than threshold (relative) and by more than min_delta seconds, so
+    noise on very fast benchmarks is not reported.
+
+    Args:
+        current: Results of this run
+        baseline: Results to compare against
+        threshold: Allowed relative slowdown (0.2 = 20%)
+        min_delta: Smallest absolute slowdown reported, in seconds
+
+    Returns:
+        One message per regressed benchmark (empty if none)
+    """
+    regressions = []
+    baseline_results = baseline.get("results", {})
+    for name, timing in sorted(current.get("results", {}).items()):
+        if name not in baseline_results:
+            continue
+        before = baseline_results[name]["median"]
+        after = timing["median"]
+        if after - before > min_delta and after > before * (1 + threshold):
+            regressions.append(
+                f"{name}: {before:.3f}s -> {after:.3f}s "
+                f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)"
+            )
+    return regressions
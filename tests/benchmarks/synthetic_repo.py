@@ -0,0 +1,188 @@
+"""Synthetic git repositories of controlled size for benchmarks."""
+
+import random
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class SyntheticRepoSpec:
+    """Shape of a generated repository.
+
+    Attributes:
+        files: Number of source files
+        python_ratio: Share of source files that are Python (the rest are
+            JavaScript)
+        lines_per_file: Average lines per source file
+        depth: Directory nesting depth of the source tree
+        files_per_dir: Source files per leaf directory
+        binary_files: Number of binary blobs
+        binary_size: Size of each binary blob in bytes
+        readme_lines: Lines in README.md
+        claude_md_lines: Lines in CLAUDE.md (0 for none)
+        seed: Random seed; the same spec always produces the same tree
+    """
+
+    files: int = 1000
+    python_ratio: float = 0.7
+    lines_per_file: int = 60
+    depth: int = 4
+    files_per_dir: int = 40
+    binary_files: int = 0
+    binary_size: int = 1024 * 1024
+    readme_lines: int = 120
+    claude_md_lines: int = 60
+    seed: int = 0
+
+
+# Preset scales, from a quick smoke run up to a large monorepo
+SCALES = {
+    "tiny": SyntheticRepoSpec(files=30, depth=2, files_per_dir=10),
+    "small": SyntheticRepoSpec(files=1_000),
+    "medium": SyntheticRepoSpec(files=10_000, depth=6, binary_files=5),
+    "large": SyntheticRepoSpec(
+        files=50_000,
+        depth=8,
+        binary_files=20,
+        readme_lines=5_000,
+        claude_md_lines=2_000,
+    ),
+    "monorepo": SyntheticRepoSpec(
+        files=200_000,
+        depth=10,
+        files_per_dir=60,
+        binary_files=50,
+        binary_size=10 * 1024 * 1024,
+        readme_lines=20_000,
+        claude_md_lines=10_000,
+    ),
+}
+
+_PYTHON_FUNCTION = '''
+
+def {name}(value: int, limit: int = {limit}) -> int:
+    """Return a bounded transform of value."""
+    if value > limit:
+        return value - limit
+    for step in range({steps}):
+        if step % 3 == 0 and value:
+            value += step
+        elif step % 5 == 0:
+            value -= 1
+    return value
+'''
+
+_JS_FUNCTION = """
+export function {name}(value, limit = {limit}) {{
+  if (value > limit) {{
+    return value - limit;
+  }}
+  for (let step = 0; step < {steps}; step++) {{
+    if (step % 3 === 0 && value) {{
+      value += step;
+    }} else if (step % 5 === 0) {{
+      value -= 1;
+    }}
+  }}
+  return value;
+}}
+"""
+
+# Lines produced by one function template (used to size files)
+_PYTHON_FUNCTION_LINES = _PYTHON_FUNCTION.count("\n")
+_JS_FUNCTION_LINES = _JS_FUNCTION.count("\n")
+
+
+def _source(rng: random.Random, python: bool, lines: int, index: int) -> str:
+    """Generate a source file of roughly the requested length."""
+    template = _PYTHON_FUNCTION if python else _JS_FUNCTION
+    per_function = _PYTHON_FUNCTION_LINES if python else _JS_FUNCTION_LINES
+    functions = max(1, round(rng.uniform(0.5, 1.5) * lines / per_function))
+    header = (
+        f'"""Generated module {index}."""\n'
+        if python
+        else f"// Generated module {index}\n"
+    )
+    body = "".join(
+        template.format(
+            name=f"transform_{index}_{n}",
+            limit=rng.randint(1, 1000),
+            steps=rng.randint(1, 50),
+        )
+        for n in range(functions)
+    )
+    return header + body
+
+
+def _markdown(title: str, lines: int) -> str:
+    """Generate a Markdown document with sections every 20 lines."""
+    out = [f"# {title}\n"]
+    for n in range(1, lines):
+        if n % 20 == 1:
+            out.append(f"\n## Section {n // 20 + 1}\n")
+        else:
+            out.append(f"Line {n} of the {title} describing the project.\n")
+    return "".join(out)
+
+
+def _leaf_dir(root: Path, spec: SyntheticRepoSpec, directory: int) -> Path:
+    """Place leaf directory number n at the configured depth."""
+    parts = []
+    n = directory
+    for level in range(spec.depth):
+        parts.append(f"pkg{level}_{n % 8}")
+        n //= 8
+    parts.append(f"mod{directory}")
+    return root.joinpath("src", *parts)
+
+
+def generate_repository(path: Path, spec: SyntheticRepoSpec) -> Path:
+    """Create a git repository with one commit shaped by spec.
+
+    Args:
+        path: Directory to create the repository in (must not exist)
+        spec: Repository shape
+
+    Returns:
+        Repository path
+    """
+    rng = random.Random(spec.seed)
+    path.mkdir(parents=True)
+
+    (path / "README.md").write_text(_markdown("README", spec.readme_lines))
+    if spec.claude_md_lines:
+        (path / "CLAUDE.md").write_text(_markdown("CLAUDE", spec.claude_md_lines))
+    (path / ".gitignore").write_text("__pycache__/\n*.pyc\nnode_modules/\n")
+    (path / "pyproject.toml").write_text(
+        '[project]\nname = "synthetic"\nversion = "0.1.0"\n'
+    )
+    (path / "package.json").write_text('{"name": "synthetic", "version": "0.1.0"}\n')
+
+    python_files = round(spec.files * spec.python_ratio)
+    for index in range(spec.files):
+        directory = _leaf_dir(path, spec, index // spec.files_per_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        python = index < python_files
+        suffix = ".py" if python else ".js"
+        (directory / f"file_{index}{suffix}").write_text(
+            _source(rng, python, spec.lines_per_file, index)
+        )
+
+    if spec.binary_files:
+        assets = path / "assets"
+        assets.mkdir()
+        for index in range(spec.binary_files):
+            (assets / f"blob_{index}.bin").write_bytes(rng.randbytes(spec.binary_size))
+
+    git = [
+        "git",
+        "-c",
+        "user.name=Benchmark",
+        "-c",
+        "user.email=benchmark@example.com",
+    ]
+    subprocess.run([*git, "init", "-q"], cwd=path, check=True)
+    subprocess.run([*git, "add", "-A"], cwd=path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "synthetic"], cwd=path, check=True)
+    return path
@@ -0,0 +1,75 @@
+"""Import-time regression tests for CLI startup.
+
+The pre-commit hook runs agentready on every commit, so heavy dependencies
+must only be imported by the code paths that use them. These tests run
+``python -X importtime`` in a fresh interpreter and check what was loaded.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies that must not be imported just by loading a CLI module
+HEAVY_MODULES = {
+    "anthropic",
+    "git",
+    "jinja2",
+    "jsonschema",
+    "numpy",
+    "pandas",
+    "plotly",
+    "requests",
+    "scipy",
+    "yaml",
+}
+
+# Cumulative import time allowed for agentready.cli.main, in seconds. Loose
+# enough for slow CI machines; a heavy import slipping back in costs more.
+IMPORT_BUDGET_SECONDS = 1.0
+
+
+def _import_times(module: str) -> dict[str, float]:
+    """Import module in a fresh interpreter.
+
+    Returns:
+        Mapping of every module imported to its cumulative import time in
+        seconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented name>"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1]) / 1_000_000
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "agentready.cli.main",
+        "agentready.cli.learn",
+        "agentready.cli.extract_skills",
+        "agentready.cli.experiment",
+    ],
+)
+def test_cli_module_does_not_import_heavy_dependencies(module):
+    """Loading a CLI module leaves heavy dependencies unimported."""
+    imported = _import_times(module)
+    top_level = {name.split(".")[0] for name in imported}
+
+    assert top_level & HEAVY_MODULES == set()
+
+
+def test_cli_main_import_budget():
+    """Importing the CLI entry point stays within the startup budget."""
+    imported = _import_times("agentready.cli.main")
+
+    assert imported["agentready.cli.main"] < IMPORT_BUDGET_SECONDS
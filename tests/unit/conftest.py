@@ -0,0 +1,36 @@
+"""Shared fixtures and helpers for unit tests."""
+
+import subprocess
+
+import pytest
+
+
+def commit_all(repo_path, message):
+    """Stage and commit every change in the repository."""
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=Test",
+            "-c",
+            "user.email=test@example.com",
+            "commit",
+            "-m",
+            message,
+        ],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a minimal git repository with one commit."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
+    (repo / "README.md").write_text("# Test\n")
+    commit_all(repo, "init")
+    return repo
@@ -1,12 +1,15 @@
 """Tests for LLM enrichment functionality."""
 
 import json
-from unittest.mock import Mock
+import re
+import threading
+import time
+from unittest.mock import Mock, patch
 
 import pytest
-from anthropic import Anthropic
+from anthropic import Anthropic, APIError, RateLimitError
 
-from agentready.learners.llm_enricher import LLMEnricher
+from agentready.learners.llm_enricher import MAX_BACKOFF_SECONDS, LLMEnricher
 from agentready.models import Attribute, DiscoveredSkill, Finding, Repository
 
 
@@ -370,8 +373,10 @@ def test_enrich_skill_partial_json_response(
     assert enriched is not None
 
 
-def test_llm_enricher_init_default_cache(mock_anthropic_client):
+def test_llm_enricher_init_default_cache(mock_anthropic_client, tmp_path, monkeypatch):
     """Test LLMEnricher initialization with default cache directory."""
+    # The default cache directory is relative to the working directory
+    monkeypatch.chdir(tmp_path)
     enricher = LLMEnricher(mock_anthropic_client)
 
     assert enricher.client == mock_anthropic_client
@@ -444,3 +449,165 @@ def test_enrich_skill_initializes_code_sampler(
 
     # Should be initialized after enrichment
     assert enricher.code_sampler is not None
+
+
+class FakeMessages:
+    """Local stand-in for client.messages that records concurrency."""
+
+    def __init__(self, failures=None, delay=0.05):
+        self.failures = dict(failures or {})  # attribute name -> errors to raise
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        # The prompt names the attribute being enriched
+        prompt = kwargs["messages"][0]["content"]
+        attribute = re.search(r"^Attribute: (.+?) \(", prompt, re.M).group(1)
+        with self._lock:
+            self.calls.append((attribute, kwargs))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            errors = self.failures.get(attribute)
+            error = errors.pop(0) if errors else None
+        try:
+            time.sleep(self.delay)
+            if error:
+                raise error
+            response = Mock()
+            response.content = [
+                Mock(text=json.dumps({"skill_description": f"Enriched {attribute}"}))
+            ]
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _skill_and_finding(i):
+    attr = Attribute(
+        id=f"attr_{i}",
+        name=f"Attr {i}",
+        category="Testing",
+        tier=1,
+        description="A test attribute",
+        criteria="Must pass",
+        default_weight=1.0,
+    )
+    finding = Finding(
+        attribute=attr,
+        status="pass",
+        score=90.0,
+        measured_value="passing",
+        threshold="pass",
+        evidence=[f"evidence {i}"],
+        remediation=None,
+        error_message=None,
+    )
+    skill = DiscoveredSkill(
+        skill_id=f"skill-{i}",
+        name=f"Skill {i}",
+        description="Basic description",
+        confidence=95.0,
+        source_attribute_id=attr.id,
+        reusability_score=100.0,
+        impact_score=50.0,
+        pattern_summary="Test pattern",
+        code_examples=[],
+        citations=[],
+    )
+    return skill, finding
+
+
+def _rate_limit_error(retry_after=None):
+    headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+    return RateLimitError(
+        "Rate limit", response=Mock(status_code=429, headers=headers), body=None
+    )
+
+
+class TestConcurrentEnrichment:
+    """Test enrich_skills against a fake local client."""
+
+    def _enricher(self, messages, tmp_path, **kwargs):
+        client = Mock()
+        client.messages = messages
+        kwargs.setdefault("requests_per_minute", 60_000)
+        return LLMEnricher(client, cache_dir=tmp_path / "cache", **kwargs)
+
+    def test_runs_concurrently_in_order(self, sample_repository, tmp_path):
+        messages = FakeMessages()
+        enricher = self._enricher(messages, tmp_path)
+        pairs = [_skill_and_finding(i) for i in range(8)]
+
+        enriched = enricher.enrich_skills(pairs, sample_repository, max_workers=4)
+
+        assert [s.skill_id for s in enriched] == [s.skill_id for s, _ in pairs]
+        assert enriched[3].description == "Enriched Attr 3"
+        assert messages.max_in_flight > 1
+        assert len(messages.calls) == 8
+
+    def test_passes_request_timeout(self, sample_repository, tmp_path):
+        messages = FakeMessages(delay=0)
+        enricher = self._enricher(messages, tmp_path, timeout=7.5)
+
+        enricher.enrich_skills([_skill_and_finding(0)], sample_repository)
+
+        assert messages.calls[0][1]["timeout"] == 7.5
+
+    def test_rerun_resumes_from_cache(self, sample_repository, tmp_path):
+        pairs = [_skill_and_finding(i) for i in range(4)]
+        failing = FakeMessages(failures={"Attr 2": [APIError("boom", None, body=None)]})
+        self._enricher(failing, tmp_path).enrich_skills(pairs, sample_repository)
+
+        messages = FakeMessages(delay=0)
+        enriched = self._enricher(messages, tmp_path).enrich_skills(
+            pairs, sample_repository
+        )
+
+        assert [attribute for attribute, _ in messages.calls] == ["Attr 2"]
+        assert all(s.description.startswith("Enriched") for s in enriched)
+
+    def test_rate_limit_retries_are_bounded(self, sample_repository, tmp_path):
+        messages = FakeMessages(
+            failures={"Attr 0": [_rate_limit_error() for _ in range(10)]}, delay=0
+        )
+        enricher = self._enricher(messages, tmp_path, max_retries=3)
+        skill, finding = _skill_and_finding(0)
+
+        with patch("agentready.learners.llm_enricher.sleep") as mock_sleep:
+            enriched = enricher.enrich_skill(skill, sample_repository, finding)
+
+        assert enriched is skill
+        assert len(messages.calls) == 4
+        assert mock_sleep.call_count == 3
+        for call in mock_sleep.call_args_list:
+            assert 0 <= call.args[0] <= MAX_BACKOFF_SECONDS
+
+    def test_rate_limit_honors_retry_after(self, sample_repository, tmp_path):
+        messages = FakeMessages(
+            failures={"Attr 0": [_rate_limit_error(retry_after=30)]}, delay=0
+        )
+        enricher = self._enricher(messages, tmp_path)
+        skill, finding = _skill_and_finding(0)
+
+        with patch("agentready.learners.llm_enricher.sleep") as mock_sleep:
+            enriched = enricher.enrich_skill(skill, sample_repository, finding)
+
+        assert enriched.description == "Enriched Attr 0"
+        assert mock_sleep.call_args.args[0] >= 30
+
+    def test_model_change_misses_cache(self, sample_repository, tmp_path):
+        pairs = [_skill_and_finding(0)]
+        self._enricher(FakeMessages(delay=0), tmp_path).enrich_skills(
+            pairs, sample_repository
+        )
+
+        messages = FakeMessages(delay=0)
+        self._enricher(messages, tmp_path, model="other-model").enrich_skills(
+            pairs, sample_repository
+        )
+
+        assert len(messages.calls) == 1
@@ -0,0 +1,83 @@
+"""Unit tests for cross-repository skill aggregation."""
+
+import pytest
+
+from agentready.learners.pattern_extractor import PatternExtractor
+from agentready.learners.skill_aggregator import SkillAggregator
+from agentready.models import Finding
+from tests.fixtures.assessment_fixtures import (
+    create_test_finding_json,
+    create_test_repository_json,
+)
+
+
+def _findings(*entries):
+    """Findings for (attribute_id, status, score, evidence count) entries."""
+    findings = []
+    for attribute_id, status, score, evidence in entries:
+        data = create_test_finding_json(
+            attribute_id=attribute_id, status=status, score=score
+        )
+        data["evidence"] = [f"evidence {i}" for i in range(evidence)]
+        findings.append(Finding.from_dict(data))
+    return findings
+
+
+def _add(aggregator, name, findings):
+    """Extract skills from findings and add them as one repository."""
+    skills = PatternExtractor(min_score=70.0).extract_from_findings(findings)
+    aggregator.add(create_test_repository_json(name=name), findings, skills)
+
+
+class TestSkillAggregator:
+    """Test SkillAggregator."""
+
+    def test_dedupes_skills_across_repositories(self):
+        aggregator = SkillAggregator()
+        for i in range(3):
+            _add(aggregator, f"repo-{i}", _findings(("claude_md_file", "pass", 90, 1)))
+
+        skills = aggregator.skills()
+
+        assert [s.skill_id for s in skills] == ["setup-claude-md"]
+        assert aggregator.repository_count == 3
+        assert aggregator.repositories_with("setup-claude-md") == 3
+
+    def test_prevalence_counts_repositories_assessing_attribute(self):
+        aggregator = SkillAggregator()
+        _add(aggregator, "a", _findings(("lock_files", "pass", 100, 1)))
+        _add(aggregator, "b", _findings(("lock_files", "fail", 20, 1)))
+        _add(aggregator, "c", _findings(("lock_files", "fail", 0, 1)))
+        _add(aggregator, "d", _findings(("lock_files", "not_applicable", None, 0)))
+
+        (skill,) = aggregator.skills()
+
+        # Found in 1 of the 3 repositories where lock files were assessed
+        assert skill.reusability_score == pytest.approx(33.3)
+
+    def test_confidence_rewards_support(self):
+        aggregator = SkillAggregator()
+        _add(aggregator, "a", _findings(("claude_md_file", "pass", 100, 1)))
+        for name in ("b", "c", "d"):
+            _add(aggregator, name, _findings(("lock_files", "pass", 90, 1)))
+
+        skills = aggregator.skills()
+
+        # Three repositories at 90 outrank a single one at 100
+        assert [s.skill_id for s in skills] == [
+            "create-dependency-lock-files",
+            "setup-claude-md",
+        ]
+        assert skills[0].confidence == pytest.approx((3 * 90 + 50) / 4, abs=0.05)
+        assert skills[1].confidence == pytest.approx(75.0)
+
+    def test_keeps_best_exemplars(self):
+        aggregator = SkillAggregator(max_exemplars=2)
+        _add(aggregator, "low", _findings(("claude_md_file", "pass", 80, 5)))
+        _add(aggregator, "few", _findings(("claude_md_file", "pass", 95, 1)))
+        _add(aggregator, "many", _findings(("claude_md_file", "pass", 95, 3)))
+
+        exemplars = aggregator.exemplars("setup-claude-md")
+
+        assert [e.repository["name"] for e in exemplars] == ["many", "few"]
+        assert aggregator.skills()[0].code_examples == exemplars[0].skill.code_examples
@@ -1,11 +1,66 @@
 """Unit tests for assessment cache."""
 
+import json
+import sqlite3
+import zlib
+from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+from agentready.models.assessment import Assessment
+from agentready.models.attribute import Attribute
+from agentready.models.config import Config
+from agentready.models.finding import Finding
+from agentready.models.repository import Repository
 from agentready.services.assessment_cache import AssessmentCache
 
 
+def _make_assessment(repo_path: Path) -> Assessment:
+    """Build a minimal assessment for a fake repository."""
+    (repo_path / ".git").mkdir(parents=True, exist_ok=True)
+    attr = Attribute(
+        id="readme_structure",
+        name="README",
+        category="Documentation",
+        tier=1,
+        description="README",
+        criteria="Sections",
+        default_weight=0.1,
+    )
+    return Assessment(
+        repository=Repository(
+            path=repo_path,
+            name="repo",
+            url="https://github.com/user/repo",
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 1},
+            total_files=1,
+            total_lines=1,
+        ),
+        timestamp=datetime(2025, 1, 1),
+        overall_score=80.0,
+        certification_level="Gold",
+        attributes_assessed=1,
+        attributes_not_assessed=0,
+        attributes_total=1,
+        findings=[
+            Finding(
+                attribute=attr,
+                status="pass",
+                score=80.0,
+                measured_value="ok",
+                threshold="ok",
+                evidence=[],
+                remediation=None,
+                error_message=None,
+            )
+        ],
+        config=None,
+        duration_seconds=0.5,
+    )
+
+
 class TestAssessmentCache:
     """Test AssessmentCache class."""
 
@@ -82,3 +137,136 @@ class TestAssessmentCache:
             cache2 = AssessmentCache(cache2_dir)
 
             assert cache1.db_path != cache2.db_path
+
+    def test_set_then_get_returns_assessment(self, tmp_path):
+        """Test that cached assessments round-trip as cache hits."""
+        cache = AssessmentCache(tmp_path / "cache")
+        assessment = _make_assessment(tmp_path / "repo")
+        url = "https://github.com/user/repo"
+
+        assert cache.set(url, "abc123", assessment)
+        cached = cache.get(url, "abc123")
+
+        assert cached is not None
+        assert cached.to_dict() == assessment.to_dict()
+        assert cache.get(url, "other-commit") is None
+
+    def test_fingerprint_mismatch_is_a_miss(self, tmp_path):
+        """Test that version or assessor set changes invalidate entries."""
+        cache = AssessmentCache(tmp_path / "cache")
+        assessment = _make_assessment(tmp_path / "repo")
+        url = "https://github.com/user/repo"
+        fingerprint = AssessmentCache.compute_fingerprint("1.0.0", ["a", "b"])
+        cache.set(url, "abc123", assessment, fingerprint)
+
+        assert cache.get(url, "abc123", fingerprint) is not None
+        assert (
+            cache.get(
+                url, "abc123", AssessmentCache.compute_fingerprint("1.1.0", ["a", "b"])
+            )
+            is None
+        )
+        assert (
+            cache.get(
+                url, "abc123", AssessmentCache.compute_fingerprint("1.0.0", ["a"])
+            )
+            is None
+        )
+
+    def test_fingerprint_is_order_insensitive_and_config_aware(self):
+        """Test fingerprint stability across assessor order and config."""
+        base = AssessmentCache.compute_fingerprint("1.0.0", ["a", "b"])
+
+        assert AssessmentCache.compute_fingerprint("1.0.0", ["b", "a"]) == base
+        assert (
+            AssessmentCache.compute_fingerprint(
+                "1.0.0", ["a", "b"], Config(weights={"a": 2.0})
+            )
+            != base
+        )
+
+    def test_migrates_legacy_database(self, tmp_path):
+        """Test that databases without a fingerprint column are upgraded."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        with sqlite3.connect(cache_dir / "assessments.db") as conn:
+            conn.execute(
+                """
+                CREATE TABLE assessments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    repository_url TEXT NOT NULL,
+                    commit_hash TEXT NOT NULL,
+                    overall_score REAL,
+                    assessment_json TEXT NOT NULL,
+                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    expires_at TIMESTAMP,
+                    UNIQUE(repository_url, commit_hash)
+                )
+                """
+            )
+
+        cache = AssessmentCache(cache_dir)
+        assessment = _make_assessment(tmp_path / "repo")
+
+        assert cache.set("url", "abc123", assessment, "fp")
+        assert cache.get("url", "abc123", "fp") is not None
+
+    def test_set_many_and_get_many(self, tmp_path):
+        """Test bulk writes and single-query bulk lookups."""
+        cache = AssessmentCache(tmp_path / "cache")
+        assessment = _make_assessment(tmp_path / "repo")
+        entries = [
+            (f"https://github.com/user/r{i}", "abc123", assessment) for i in range(5)
+        ]
+
+        assert cache.set_many(entries, "fp") == 5
+        hits = cache.get_many(
+            [
+                ("https://github.com/user/r0", "abc123"),
+                ("https://github.com/user/r9", "abc123"),
+            ]
+            + [(url, commit) for url, commit, _ in entries[1:]],
+            "fp",
+        )
+
+        assert len(hits) == 5
+        assert ("https://github.com/user/r9", "abc123") not in hits
+        assert cache.get_many([], "fp") == {}
+
+    def test_payload_is_compressed(self, tmp_path):
+        """Test that assessment JSON is stored zlib-compressed."""
+        cache = AssessmentCache(tmp_path / "cache")
+        cache.set("url", "abc123", _make_assessment(tmp_path / "repo"))
+
+        with sqlite3.connect(cache.db_path) as conn:
+            (payload,) = conn.execute(
+                "SELECT assessment_json FROM assessments"
+            ).fetchone()
+
+        assert isinstance(payload, bytes)
+        assert json.loads(zlib.decompress(payload))["overall_score"] == 80.0
+
+    def test_reads_uncompressed_legacy_rows(self, tmp_path):
+        """Test that plain JSON rows from older caches still hit."""
+        cache = AssessmentCache(tmp_path / "cache")
+        assessment = _make_assessment(tmp_path / "repo")
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO assessments
+                (repository_url, commit_hash, overall_score, assessment_json)
+                VALUES (?, ?, ?, ?)
+                """,
+                ("url", "abc123", 80.0, json.dumps(assessment.to_dict())),
+            )
+
+        assert cache.get("url", "abc123") is not None
+
+    def test_uses_wal_and_reuses_connection(self, tmp_path):
+        """Test that the cache keeps one WAL-mode connection per thread."""
+        with AssessmentCache(tmp_path / "cache") as cache:
+            conn = cache._connection()
+            cache.get_stats()
+
+            assert cache._connection() is conn
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -0,0 +1,167 @@
+"""Unit tests for the shared parsed-module cache."""
+
+import subprocess
+
+from agentready.services.ast_cache import ASTCache
+from agentready.services.file_index import FileIndex
+from agentready.services.file_metric_cache import FileMetricCache
+
+
+def _init_git_repo(repo_path):
+    """Create a git repository with a few Python modules."""
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    (repo_path / "app.py").write_text(
+        '"""App module."""\n'
+        "import os\n"
+        "from pathlib import Path\n\n\n"
+        "class Service:\n"
+        '    """A service."""\n\n'
+        "    def run(self, x: int) -> int:\n"
+        "        return x\n\n"
+        "    def _helper(self):\n"
+        '        """Private helper."""\n'
+        "        pass\n"
+    )
+    (repo_path / "broken.py").write_text("def oops(:\n")
+    (repo_path / "other.py").write_text("x = 1\n")
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+
+
+class TestASTCache:
+    """Test ASTCache class."""
+
+    def test_summary_collects_all_facts_in_one_pass(self, tmp_path):
+        """Test that summary records functions, classes and docstrings."""
+        _init_git_repo(tmp_path)
+        cache = ASTCache(FileIndex.build(tmp_path))
+
+        summary = cache.summary("app.py")
+
+        assert summary.has_module_docstring is True
+        assert [
+            (f.name, f.is_annotated, f.has_docstring) for f in summary.functions
+        ] == [
+            ("run", True, False),
+            ("_helper", False, True),
+        ]
+        assert [(c.name, c.has_docstring) for c in summary.classes] == [
+            ("Service", True)
+        ]
+
+    def test_parses_each_file_once(self, tmp_path):
+        """Test that repeated requests reuse the cached module."""
+        _init_git_repo(tmp_path)
+        cache = ASTCache(FileIndex.build(tmp_path))
+
+        module = cache.get("app.py")
+        assert cache.get("app.py") is module
+        cache.summary("app.py")
+        cache.summary("app.py")
+
+        assert cache.misses == 1
+        assert cache.hits == 2
+
+    def test_unparseable_files_are_skipped(self, tmp_path):
+        """Test that syntax errors yield None and are not retried."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+        cache = ASTCache(index)
+
+        assert cache.get("broken.py") is None
+        assert cache.summary("broken.py") is None
+        assert cache.misses == 1
+        assert [s.path for s in cache.summaries(index.with_suffix(".py"))] == [
+            "app.py",
+            "other.py",
+        ]
+
+    def test_lru_eviction_respects_memory_budget(self, tmp_path):
+        """Test that least recently used modules are evicted over budget."""
+        _init_git_repo(tmp_path)
+        budget = len("x = 1\n") * ASTCache.AST_SIZE_FACTOR
+        cache = ASTCache(FileIndex.build(tmp_path), max_bytes=budget)
+
+        cache.get("other.py")
+        cache.get("app.py")  # Larger than the budget, never stored
+        assert cache.get("other.py") is not None
+        assert cache.hits == 1
+
+        # Summaries survive eviction without re-parsing
+        cache.summary("app.py")
+        misses = cache.misses
+        cache.summary("app.py")
+        assert cache.misses == misses
+
+    def test_parse_primes_index_line_counts(self, tmp_path):
+        """Test that the source read is shared with the file index."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+        cache = ASTCache(index)
+
+        cache.get("other.py")
+        (tmp_path / "other.py").write_text("a = 1\nb = 2\n")
+
+        assert index.line_count("other.py") == 1
+
+
+class TestASTCacheMetricStore:
+    """Test ASTCache persisting summaries by blob SHA."""
+
+    def test_stored_summaries_skip_parsing(self, tmp_path):
+        """Test that a second scan of the same content never parses."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _init_git_repo(repo)
+        index = FileIndex.build(repo)
+        first = ASTCache(index, metric_cache=FileMetricCache(tmp_path / "cache"))
+        expected = first.summaries(index.with_suffix(".py"))
+
+        index = FileIndex.build(repo)
+        second = ASTCache(index, metric_cache=FileMetricCache(tmp_path / "cache"))
+        (repo / "app.py").write_text("x = 1\n")  # Would show up if re-read
+        summaries = second.summaries(index.with_suffix(".py"))
+
+        assert second.misses == 0
+        assert summaries == expected
+        assert index.line_count("app.py") == 14
+
+    def test_same_content_shared_across_paths(self, tmp_path):
+        """Test that identical content at another path reuses the summary."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _init_git_repo(repo)
+        metric_cache = FileMetricCache(tmp_path / "cache")
+        index = FileIndex.build(repo)
+        ASTCache(index, metric_cache=metric_cache).summaries(index.with_suffix(".py"))
+
+        (repo / "vendor").mkdir()
+        (repo / "vendor" / "copy.py").write_text((repo / "app.py").read_text())
+        subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+        index = FileIndex.build(repo)
+        cache = ASTCache(index, metric_cache=metric_cache)
+
+        summary = cache.summaries([index.get("vendor/copy.py")])[0]
+
+        assert cache.misses == 0
+        assert summary.path == "vendor/copy.py"
+        assert [c.name for c in summary.classes] == ["Service"]
+
+    def test_modified_files_are_reparsed(self, tmp_path):
+        """Test that working tree edits are not served from the store."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _init_git_repo(repo)
+        metric_cache = FileMetricCache(tmp_path / "cache")
+        index = FileIndex.build(repo)
+        ASTCache(index, metric_cache=metric_cache).summaries(index.with_suffix(".py"))
+
+        (repo / "other.py").write_text("def f():\n    pass\n")
+        index = FileIndex.build(repo)
+        cache = ASTCache(index, metric_cache=metric_cache)
+
+        summary = cache.summary("other.py")
+        cache.summaries(index.with_suffix(".py"))
+
+        assert index.get("other.py").blob_sha is None
+        assert [f.name for f in summary.functions] == ["f"]
+        assert cache.misses == 1
@@ -1,5 +1,6 @@
 """Unit tests for batch assessment models."""
 
+import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -9,13 +10,19 @@ import pytest
 from agentready.models import (
     BatchAssessment,
     BatchSummary,
+    BatchSummaryAggregator,
     FailureTracker,
     RepositoryResult,
 )
 from agentready.models.assessment import Assessment
 from agentready.models.attribute import Attribute
 from agentready.models.finding import Finding
+from agentready.models.metadata import AssessmentMetadata, AssessorProfile
 from agentready.models.repository import Repository
+from agentready.reporters.aggregated_json import (
+    AggregatedJSONReporter,
+    iter_aggregated_results,
+)
 
 
 @pytest.fixture
@@ -175,6 +182,79 @@ class TestBatchSummary:
         assert data["average_score"] == 75.0
 
 
+class TestBatchSummaryAggregator:
+    """Test BatchSummaryAggregator model."""
+
+    def test_summary_counts_results(self, sample_assessment):
+        """Test that the incremental summary covers successes and failures."""
+        aggregator = BatchSummaryAggregator()
+        aggregator.add(
+            RepositoryResult(
+                repository_url="https://github.com/user/repo1",
+                assessment=sample_assessment,
+            )
+        )
+        aggregator.add(
+            RepositoryResult(
+                repository_url="https://github.com/user/repo2",
+                assessment=None,
+                error="Clone failed",
+                error_type="clone_error",
+            )
+        )
+
+        summary = aggregator.summary()
+
+        assert summary.total_repositories == 2
+        assert summary.successful_assessments == 1
+        assert summary.failed_assessments == 1
+        assert summary.average_score == 85.0
+        assert summary.score_distribution["Gold"] == 1
+        assert summary.language_breakdown == {"Python": 100}
+
+    def test_top_failing_ties_are_ordered_by_id(self, sample_assessment):
+        """Test that equally frequent failures rank the same in any order."""
+        aggregator = BatchSummaryAggregator()
+        aggregator.failing_attributes = {"b_attr": 2, "c_attr": 1, "a_attr": 2}
+
+        top = aggregator.summary().top_failing_attributes
+
+        assert [t["attribute_id"] for t in top] == ["a_attr", "b_attr", "c_attr"]
+
+    def test_assessor_timings(self, sample_assessment):
+        """Test that assessor wall times are totalled across repositories."""
+        aggregator = BatchSummaryAggregator()
+        for url, seconds in [("https://a", 0.5), ("https://b", 2.0)]:
+            sample_assessment.metadata = AssessmentMetadata.create(
+                version="1.0.0",
+                research_version="1.0.0",
+                timestamp=datetime.now(),
+                command="test",
+                assessor_profiles=[
+                    AssessorProfile("claude_md_file", seconds, seconds / 2),
+                    AssessorProfile("readme_file", 0.1, 0.1),
+                ],
+            )
+            aggregator.add(
+                RepositoryResult(repository_url=url, assessment=sample_assessment)
+            )
+
+        timings = aggregator.summary().assessor_timings
+
+        assert [t["attribute_id"] for t in timings] == ["claude_md_file", "readme_file"]
+        assert timings[0]["repositories"] == 2
+        assert timings[0]["total_wall_seconds"] == 2.5
+        assert timings[0]["max_wall_seconds"] == 2.0
+        assert timings[0]["slowest_repository"] == "https://b"
+
+    def test_empty_batch(self):
+        """Test summary of a batch without results."""
+        summary = BatchSummaryAggregator().summary()
+
+        assert summary.total_repositories == 0
+        assert summary.average_score == 0.0
+
+
 class TestFailureTracker:
     """Test FailureTracker model."""
 
@@ -334,3 +414,73 @@ class TestBatchAssessment:
         assert data["batch_id"] == "test-batch"
         assert len(data["results"]) == 1
         assert "summary" in data
+
+    def test_streamed_json_matches_to_dict(self, sample_assessment, tmp_path):
+        """Test that the streamed aggregated JSON equals the batch's to_dict."""
+        results = [
+            RepositoryResult(
+                repository_url="https://github.com/user/repo1",
+                assessment=sample_assessment,
+            ),
+            RepositoryResult(
+                repository_url="https://github.com/user/repo2",
+                assessment=None,
+                error="Clone failed",
+                error_type="clone_error",
+            ),
+        ]
+        aggregator = BatchSummaryAggregator()
+        for result in results:
+            aggregator.add(result)
+        batch = BatchAssessment(
+            batch_id="test-batch",
+            timestamp=datetime.now(),
+            results=results,
+            summary=aggregator.summary(),
+            total_duration_seconds=10.0,
+        )
+
+        output = AggregatedJSONReporter().generate(batch, tmp_path / "all.json")
+
+        assert output.read_text() == json.dumps(batch.to_dict(), indent=2, default=str)
+
+    def test_iter_aggregated_results_streams_results(self, sample_assessment, tmp_path):
+        """Test reading results back one at a time, across chunk boundaries."""
+        results = [
+            RepositoryResult(
+                repository_url=f"https://github.com/user/repo{i}",
+                assessment=sample_assessment if i % 2 == 0 else None,
+                error=None if i % 2 == 0 else "Clone failed ]}",
+                error_type=None if i % 2 == 0 else "clone_error",
+            )
+            for i in range(5)
+        ]
+        batch = BatchAssessment(
+            batch_id="test-batch",
+            timestamp=datetime.now(),
+            results=results,
+            summary=BatchSummary(
+                total_repositories=5,
+                successful_assessments=3,
+                failed_assessments=2,
+                average_score=85.0,
+            ),
+            total_duration_seconds=10.0,
+        )
+        output = AggregatedJSONReporter().generate(batch, tmp_path / "all.json")
+
+        streamed = list(iter_aggregated_results(output, chunk_size=64))
+
+        assert streamed == json.loads(output.read_text())["results"]
+
+    def test_iter_aggregated_results_truncated(self, tmp_path):
+        """Test that an unclosed results array raises after the complete results."""
+        path = tmp_path / "all.json"
+        path.write_text('{"batch_id": "b", "results": [{"a": 1}, {"a": 2}, {"a"')
+
+        streamed = []
+        with pytest.raises(ValueError, match="not closed"):
+            for result in iter_aggregated_results(path, chunk_size=8):
+                streamed.append(result)
+
+        assert streamed == [{"a": 1}, {"a": 2}]
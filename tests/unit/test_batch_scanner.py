@@ -0,0 +1,379 @@
+"""Unit tests for the pipelined batch scanner."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from agentready.assessors.documentation import CLAUDEmdAssessor, READMEAssessor
+from agentready.services.batch_journal import BatchJournal, JournaledResults
+from agentready.services.batch_scanner import BatchScanner
+from tests.unit.conftest import commit_all
+
+
+def _make_repo(path, readme="# Test\n"):
+    """Create a git repository with one commit."""
+    path.mkdir()
+    subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
+    (path / "README.md").write_text(readme)
+    commit_all(path, "init")
+    return str(path)
+
+
+@pytest.fixture
+def repo_urls(tmp_path):
+    """Three local repositories plus one invalid path."""
+    return [
+        _make_repo(tmp_path / "repo-a"),
+        str(tmp_path / "missing"),
+        _make_repo(tmp_path / "repo-b", readme="# B\n\n## Installation\n"),
+        _make_repo(tmp_path / "repo-c"),
+    ]
+
+
+class TestBatchScannerPipeline:
+    """Test BatchScanner.scan_batch pipeline stages."""
+
+    def test_results_keep_input_order(self, tmp_path, repo_urls):
+        """Test that results follow input order with parallel stages."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        batch = scanner.scan_batch(
+            repo_urls,
+            [READMEAssessor()],
+            use_cache=False,
+            clone_workers=3,
+            scan_workers=1,
+        )
+
+        assert [r.repository_url for r in batch.results] == repo_urls
+        assert [r.is_success() for r in batch.results] == [True, False, True, True]
+        assert batch.results[1].error_type == "clone_error"
+        assert batch.summary.successful_assessments == 3
+        assert batch.summary.failed_assessments == 1
+
+    def test_progress_reports_completions(self, tmp_path, repo_urls):
+        """Test that progress is reported once per finished repository."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        calls = []
+
+        scanner.scan_batch(
+            repo_urls,
+            [READMEAssessor()],
+            use_cache=False,
+            progress_callback=lambda done, total: calls.append((done, total)),
+            clone_workers=4,
+        )
+
+        assert calls == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_process_scan_workers_match_serial(self, tmp_path, repo_urls):
+        """Test that process-based scanning yields the same scores."""
+        assessors = [CLAUDEmdAssessor(), READMEAssessor()]
+
+        serial = BatchScanner(cache_dir=tmp_path / "serial").scan_batch(
+            repo_urls, assessors, use_cache=False
+        )
+        parallel = BatchScanner(cache_dir=tmp_path / "parallel").scan_batch(
+            repo_urls,
+            assessors,
+            use_cache=False,
+            clone_workers=2,
+            scan_workers=2,
+        )
+
+        def scores(batch):
+            return [
+                r.assessment.overall_score if r.assessment else None
+                for r in batch.results
+            ]
+
+        assert scores(serial) == scores(parallel)
+        assert parallel.results[0].assessment.repository.ast_cache is None
+
+    def test_cache_writer_stores_results(self, tmp_path, repo_urls):
+        """Test that successful scans are written through the cache stage."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        scanner.scan_batch(repo_urls, [READMEAssessor()], use_cache=True)
+
+        assert scanner.cache.get_stats()["total_entries"] == 3
+
+    def test_unchanged_repositories_are_served_from_cache(self, tmp_path, repo_urls):
+        """Test that a second run reuses cached assessments."""
+        assessors = [READMEAssessor()]
+        BatchScanner(cache_dir=tmp_path / "cache").scan_batch(repo_urls, assessors)
+
+        batch = BatchScanner(cache_dir=tmp_path / "cache").scan_batch(
+            repo_urls, assessors
+        )
+
+        assert [r.cached for r in batch.results if r.is_success()] == [True] * 3
+
+    def test_version_change_invalidates_cache(self, tmp_path, repo_urls):
+        """Test that a different agentready version re-scans repositories."""
+        assessors = [READMEAssessor()]
+        BatchScanner(cache_dir=tmp_path / "cache", version="1.0.0").scan_batch(
+            repo_urls, assessors
+        )
+
+        batch = BatchScanner(cache_dir=tmp_path / "cache", version="1.1.0").scan_batch(
+            repo_urls, assessors
+        )
+
+        assert not any(r.cached for r in batch.results)
+
+
+class _CountingREADMEAssessor(READMEAssessor):
+    """README assessor recording which repositories it assessed."""
+
+    def __init__(self, assessed):
+        super().__init__()
+        self.assessed = assessed
+
+    def assess(self, repository):
+        self.assessed.append(repository.name)
+        return super().assess(repository)
+
+
+class TestBatchScannerResume:
+    """Test journaling and resuming interrupted batches."""
+
+    def test_results_are_journaled(self, tmp_path, repo_urls):
+        """Test that every finished repository is appended to the journal."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache", batch_id="nightly")
+
+        scanner.scan_batch(repo_urls, [READMEAssessor()], use_cache=False)
+
+        journal = BatchJournal(scanner.journal_dir, "nightly")
+        _, successful = journal.load()
+        assert sorted(successful) == sorted(repo_urls[:1] + repo_urls[2:])
+        assert journal.path.read_text().count("\n") == len(repo_urls) + 1
+
+    def test_resume_skips_successful_repositories(self, tmp_path, repo_urls):
+        """Test that a resumed batch only re-runs failed and missing repos."""
+        cache_dir = tmp_path / "cache"
+        # "Interrupted" after the first two repositories
+        first = BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls[:2], [READMEAssessor()], use_cache=False
+        )
+
+        assessed = []
+        batch = BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls, [_CountingREADMEAssessor(assessed)], use_cache=False
+        )
+
+        assert assessed == ["repo-b", "repo-c"]
+        assert [r.is_success() for r in batch.results] == [True, False, True, True]
+        assert batch.timestamp == first.timestamp
+        assert batch.summary.successful_assessments == 3
+
+    def test_truncated_journal_line_is_ignored(self, tmp_path, repo_urls):
+        """Test that a partially written last line does not break resume."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache", batch_id="nightly")
+        scanner.scan_batch(repo_urls[:1], [READMEAssessor()], use_cache=False)
+        journal = BatchJournal(scanner.journal_dir, "nightly")
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "result", "res')
+
+        _, successful = journal.load()
+
+        assert list(successful) == repo_urls[:1]
+
+    def test_resume_after_truncated_line_keeps_new_results(self, tmp_path, repo_urls):
+        """Test that entries appended after a crash start on a new line."""
+        cache_dir = tmp_path / "cache"
+        scanner = BatchScanner(cache_dir=cache_dir, batch_id="nightly")
+        scanner.scan_batch(repo_urls[:1], [READMEAssessor()], use_cache=False)
+        journal = BatchJournal(scanner.journal_dir, "nightly")
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "result", "res')
+
+        BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            [repo_urls[0], repo_urls[2]], [READMEAssessor()], use_cache=False
+        )
+
+        _, successful = journal.load()
+        assert sorted(successful) == sorted([repo_urls[0], repo_urls[2]])
+
+    def test_resume_keeps_results_of_deleted_checkouts(self, tmp_path, repo_urls):
+        """Test that journaled results are reused after their checkout is gone."""
+        cache_dir = tmp_path / "cache"
+        BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls[:1], [READMEAssessor()], use_cache=False
+        )
+        shutil.rmtree(tmp_path / "repo-a")
+
+        assessed = []
+        batch = BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls[:1], [_CountingREADMEAssessor(assessed)], use_cache=False
+        )
+
+        assert assessed == []
+        assert batch.results[0].is_success()
+
+    def test_resume_with_other_assessors_is_rejected(self, tmp_path, repo_urls):
+        """Test that results from another configuration are never mixed in."""
+        cache_dir = tmp_path / "cache"
+        BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls[:1], [READMEAssessor()], use_cache=False
+        )
+
+        with pytest.raises(ValueError, match="different"):
+            BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+                repo_urls, [CLAUDEmdAssessor()], use_cache=False
+            )
+
+    def test_invalid_batch_id_is_rejected(self, tmp_path):
+        """Test that batch IDs cannot escape the journal directory."""
+        with pytest.raises(ValueError, match="Invalid batch ID"):
+            BatchScanner(cache_dir=tmp_path, batch_id="../x").journal_exists()
+
+
+class _RecordingSink:
+    """Batch sink that records what it is handed."""
+
+    def __init__(self):
+        self.opened = None
+        self.added = []
+        self.closed = None
+
+    def open(self, batch_id, started_at):
+        self.opened = (batch_id, started_at)
+
+    def add(self, result):
+        self.added.append(result.repository_url)
+
+    def close(self, batch):
+        self.closed = batch
+
+
+class TestBatchScannerStreaming:
+    """Test streaming of results to sinks and the journal-backed batch."""
+
+    def test_sinks_receive_every_result(self, tmp_path, repo_urls):
+        """Test that sinks are opened, fed each result and closed."""
+        sink = _RecordingSink()
+        scanner = BatchScanner(cache_dir=tmp_path / "cache", batch_id="stream")
+
+        batch = scanner.scan_batch(
+            repo_urls, [READMEAssessor()], use_cache=False, sinks=[sink]
+        )
+
+        assert sink.opened == ("stream", batch.timestamp)
+        assert sorted(sink.added) == sorted(repo_urls)
+        assert sink.closed is batch
+
+    def test_resumed_results_are_replayed_to_sinks(self, tmp_path, repo_urls):
+        """Test that a resumed batch hands journaled results to sinks too."""
+        cache_dir = tmp_path / "cache"
+        BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls[:1], [READMEAssessor()], use_cache=False
+        )
+
+        sink = _RecordingSink()
+        BatchScanner(cache_dir=cache_dir, batch_id="nightly").scan_batch(
+            repo_urls, [READMEAssessor()], use_cache=False, sinks=[sink]
+        )
+
+        assert sink.added[0] == repo_urls[0]
+        assert sorted(sink.added) == sorted(repo_urls)
+
+    def test_results_are_read_from_the_journal(self, tmp_path, repo_urls):
+        """Test that batch results are journal-backed and summarized."""
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        batch = scanner.scan_batch(repo_urls, [READMEAssessor()], use_cache=False)
+
+        assert isinstance(batch.results, JournaledResults)
+        assert batch.results[0].assessment.repository.name == "repo-a"
+        assert batch.summary.average_score == pytest.approx(
+            sum(r.assessment.overall_score for r in batch.results if r.is_success()) / 3
+        )
+
+
+def _commit_change(path):
+    """Commit a README change in an existing repository."""
+    (path / "README.md").write_text("# Changed\n")
+    commit_all(path, "change")
+
+
+class TestBatchScannerPreflight:
+    """Test skipping clones of remotes whose HEAD is already cached."""
+
+    @pytest.fixture
+    def remote_urls(self, tmp_path):
+        """Two repositories addressed as remotes."""
+        return [
+            f"file://{_make_repo(tmp_path / 'remote-a')}",
+            f"file://{_make_repo(tmp_path / 'remote-b')}",
+        ]
+
+    def _scanner(self, tmp_path):
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+        # file:// URLs stand in for remote repositories
+        scanner.repo_manager.validate_url = lambda url: (True, None)
+        return scanner
+
+    def _count_prepares(self, scanner):
+        prepared = []
+        prepare = scanner.repo_manager.prepare_repository
+
+        def counting_prepare(url):
+            prepared.append(url)
+            return prepare(url)
+
+        scanner.repo_manager.prepare_repository = counting_prepare
+        return prepared
+
+    def test_unchanged_remotes_are_not_cloned(self, tmp_path, remote_urls):
+        """Test that cached remote HEADs are served without cloning."""
+        self._scanner(tmp_path).scan_batch(remote_urls, [READMEAssessor()])
+
+        scanner = self._scanner(tmp_path)
+        prepared = self._count_prepares(scanner)
+        batch = scanner.scan_batch(remote_urls, [READMEAssessor()])
+
+        assert prepared == []
+        assert [r.cached for r in batch.results] == [True, True]
+
+    def test_cache_hits_without_local_clones(self, tmp_path, remote_urls):
+        """Test that cached remote HEADs are served after clones are deleted."""
+        self._scanner(tmp_path).scan_batch(remote_urls, [READMEAssessor()])
+        shutil.rmtree(tmp_path / "cache" / "repositories")
+
+        scanner = self._scanner(tmp_path)
+        prepared = self._count_prepares(scanner)
+        batch = scanner.scan_batch(remote_urls, [READMEAssessor()])
+
+        assert prepared == []
+        assert [r.cached for r in batch.results] == [True, True]
+
+    def test_changed_remote_is_cloned(self, tmp_path, remote_urls):
+        """Test that a remote with a new HEAD is cloned and scanned."""
+        self._scanner(tmp_path).scan_batch(remote_urls, [READMEAssessor()])
+        _commit_change(tmp_path / "remote-b")
+
+        scanner = self._scanner(tmp_path)
+        prepared = self._count_prepares(scanner)
+        batch = scanner.scan_batch(remote_urls, [READMEAssessor()])
+
+        assert prepared == remote_urls[1:]
+        assert [r.cached for r in batch.results] == [True, False]
+
+    def test_since_cache_reports_only_changed(self, tmp_path, remote_urls):
+        """Test that --since-cache leaves unchanged repositories out."""
+        self._scanner(tmp_path).scan_batch(remote_urls, [READMEAssessor()])
+        _commit_change(tmp_path / "remote-b")
+        progress = []
+
+        batch = self._scanner(tmp_path).scan_batch(
+            remote_urls,
+            [READMEAssessor()],
+            since_cache=True,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert [r.repository_url for r in batch.results] == remote_urls[1:]
+        assert batch.summary.total_repositories == 1
+        assert progress[-1] == (2, 2)
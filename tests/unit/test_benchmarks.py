@@ -0,0 +1,81 @@
+"""Tests for the benchmark suite's repository generator and harness."""
+
+import subprocess
+
+from tests.benchmarks.harness import BenchmarkRunner, compare_results
+from tests.benchmarks.synthetic_repo import SCALES, generate_repository
+
+
+def _results(**medians):
+    return {"results": {name: {"median": value} for name, value in medians.items()}}
+
+
+class TestSyntheticRepository:
+    """Test synthetic repository generation."""
+
+    def test_generates_committed_tree(self, tmp_path):
+        """Generated repository has the requested files in one commit."""
+        spec = SCALES["tiny"]
+        repo = generate_repository(tmp_path / "repo", spec)
+
+        tracked = subprocess.run(
+            ["git", "ls-files"], cwd=repo, capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        sources = [f for f in tracked if f.endswith((".py", ".js"))]
+        assert len(sources) == spec.files
+        assert "README.md" in tracked
+        assert "CLAUDE.md" in tracked
+
+    def test_same_spec_same_tree(self, tmp_path):
+        """Generation is deterministic for a given seed."""
+        spec = SCALES["tiny"]
+        first = generate_repository(tmp_path / "a", spec)
+        second = generate_repository(tmp_path / "b", spec)
+
+        def tree(repo):
+            return subprocess.run(
+                ["git", "rev-parse", "HEAD^{tree}"],
+                cwd=repo,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+
+        assert tree(first) == tree(second)
+
+
+class TestBenchmarkRunner:
+    """Test the benchmark harness."""
+
+    def test_run_tiny(self, tmp_path):
+        """A tiny run times the scanner, assessors, reporters and batch."""
+        runner = BenchmarkRunner(tmp_path, SCALES["tiny"], repeat=1, batch_repos=1)
+        results = runner.run()
+
+        names = results["results"]
+        assert "scanner.scan" in names
+        assert "batch_scanner.scan_batch" in names
+        assert "reporter.html" in names
+        assert any(name.startswith("assessor.") for name in names)
+        assert results["spec"]["files"] == SCALES["tiny"].files
+        assert all(len(timing["runs"]) == 1 for timing in names.values())
+
+
+class TestCompareResults:
+    """Test regression detection against a baseline."""
+
+    def test_reports_slowdown(self):
+        regressions = compare_results(
+            _results(scan=2.0), _results(scan=1.0), threshold=0.2
+        )
+        assert len(regressions) == 1
+        assert regressions[0].startswith("scan:")
+
+    def test_ignores_small_changes(self):
+        # Within the relative threshold
+        assert compare_results(_results(scan=1.1), _results(scan=1.0)) == []
+        # Large relative change but below the absolute floor
+        assert compare_results(_results(fast=0.02), _results(fast=0.01)) == []
+
+    def test_ignores_new_benchmarks(self):
+        assert compare_results(_results(new=5.0), _results()) == []
@@ -261,6 +261,27 @@ class TestLearnCommand:
             # Should succeed (or gracefully handle missing API key)
             assert result.exit_code == 0 or "API key" in result.output
 
+    def test_learn_command_batch(self, runner, tmp_path):
+        """Test learn command across a directory of assessments."""
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        for i in range(3):
+            assessment_data = create_test_assessment_json(repo_name=f"repo-{i}")
+            assessment_data["findings"][0]["attribute"]["id"] = "claude_md_file"
+            (reports / f"repo-{i}.json").write_text(json.dumps(assessment_data))
+        output_dir = tmp_path / "skills"
+
+        result = runner.invoke(
+            learn,
+            ["--batch", str(reports), "--output-dir", str(output_dir), "-v"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "across 3 repositories" in result.output
+        assert "Found in: 3/3 repositories" in result.output
+        data = json.loads((output_dir / "discovered-skills.json").read_text())
+        assert data["skill_count"] == 1
+
     def test_learn_command_default_repository(self, runner):
         """Test learn command with default repository (current directory)."""
         with runner.isolated_filesystem():
@@ -450,3 +450,106 @@ class TestCodeSamplerEdgeCases:
                 c for c in tree["children"] if c.get("name", "").startswith(".")
             ]
             assert len(hidden_dirs) == 0
+
+
+def _finding(attribute_id, evidence=None):
+    attr = Attribute(
+        id=attribute_id,
+        name=attribute_id,
+        category="Testing",
+        tier=2,
+        description="Test attribute",
+        criteria="Test",
+        default_weight=1.0,
+    )
+    return Finding(
+        attribute=attr,
+        status="pass",
+        score=90.0,
+        measured_value="90%",
+        threshold="80%",
+        evidence=evidence or [],
+        remediation=None,
+        error_message=None,
+    )
+
+
+def _module(name, functions=40):
+    """Python module with documented functions and long bodies."""
+    parts = [f'"""Module {name}."""\n\nimport os\n']
+    for i in range(functions):
+        body = "\n".join(f"    value_{j} = os.sep * {j}" for j in range(8))
+        parts.append(
+            f"\ndef {name}_func_{i}(a: int, b: str = 'x') -> str:\n"
+            f'    """Do thing {i} for {name}."""\n{body}\n    return b\n'
+        )
+    return "".join(parts)
+
+
+class TestTokenBudgetedSampling:
+    """Test relevance ranking, deduplication and budgeting."""
+
+    def test_evidence_file_ranked_first(self, temp_repo):
+        pkg = temp_repo.path / "src" / "pkg"
+        pkg.mkdir()
+        (pkg / "chosen.py").write_text(_module("chosen", 3))
+        finding = _finding("type_annotations", ["src/pkg/chosen.py: 100% typed"])
+
+        code = CodeSampler(temp_repo).get_relevant_code(finding)
+
+        assert code.startswith("## File: src/pkg/chosen.py")
+
+    def test_stays_within_token_budget(self, temp_repo):
+        for i in range(10):
+            (temp_repo.path / "src" / f"big_{i}.py").write_text(_module(f"m{i}"))
+        sampler = CodeSampler(temp_repo, token_budget=800)
+
+        code = sampler.get_relevant_code(_finding("type_annotations"))
+
+        assert sampler._estimate_tokens(code) <= 800
+        assert code.count("## File:") >= 2
+
+    def test_near_duplicates_skipped(self, temp_repo):
+        content = _module("copy", 3)
+        (temp_repo.path / "src" / "copy_a.py").write_text(content)
+        (temp_repo.path / "src" / "copy_b.py").write_text(content + "\n# edited\n")
+
+        code = CodeSampler(temp_repo, max_files=10).get_relevant_code(
+            _finding("type_annotations")
+        )
+
+        assert code.count("copy_func_0") == 1
+
+    def test_large_python_file_outlined(self, temp_repo):
+        (temp_repo.path / "src" / "main.py").write_text(_module("main"))
+        sampler = CodeSampler(temp_repo, max_files=1, token_budget=2000)
+
+        code = sampler.get_relevant_code(
+            _finding("type_annotations", ["src/main.py is typed"])
+        )
+
+        assert "src/main.py (key regions)" in code
+        assert "def main_func_0(a: int, b: str = 'x') -> str:" in code
+        assert '"""Do thing 0 for main."""' in code
+        assert "value_3 = os.sep" not in code
+
+    def test_large_config_keeps_sections(self, temp_repo):
+        sections = "".join(
+            f"[tool.section{i}]\n" + "".join(f"key{j} = {j}\n" for j in range(30))
+            for i in range(10)
+        )
+        (temp_repo.path / "pyproject.toml").write_text(sections)
+
+        code = CodeSampler(temp_repo).get_relevant_code(_finding("test_coverage"))
+
+        assert "[tool.section9]" in code
+        assert "key29 = 29" not in code
+
+    def test_binary_file_skipped(self, temp_repo):
+        (temp_repo.path / "src" / "blob.py").write_bytes(b"\x00\x01binary" * 100)
+
+        code = CodeSampler(temp_repo, max_files=10).get_relevant_code(
+            _finding("type_annotations")
+        )
+
+        assert "blob.py" not in code
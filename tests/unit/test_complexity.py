@@ -0,0 +1,157 @@
+"""Unit tests for the in-process complexity engine."""
+
+import ast
+import subprocess
+
+from agentready.assessors.code_quality import CyclomaticComplexityAssessor
+from agentready.models.repository import Repository
+from agentready.services import complexity
+from agentready.services.complexity import (
+    FunctionComplexity,
+    brace_complexities,
+    complexity_rank,
+    python_complexities,
+)
+
+PYTHON_SOURCE = """
+def simple():
+    return 1
+
+
+def branchy(x, items):
+    if x and items:
+        return [i for i in items if i]
+    for i in items:
+        try:
+            pass
+        except ValueError:
+            pass
+    while x:
+        x -= 1
+    return x if x else None
+
+
+class Service:
+    def run(self):
+        def helper():
+            assert self
+        return helper
+"""
+
+
+def _native(tree):
+    collector = complexity._FunctionCollector()
+    collector.visit(tree)
+    return collector.functions
+
+
+class TestPythonComplexity:
+    """Test python_complexities."""
+
+    def test_counts_decision_points_per_function(self):
+        """Test per-function complexity with closures reported separately."""
+        functions = python_complexities(ast.parse(PYTHON_SOURCE))
+
+        assert functions == [
+            FunctionComplexity("simple", 2, 1),
+            FunctionComplexity("branchy", 6, 9),
+            FunctionComplexity("Service.run", 20, 1),
+            FunctionComplexity("helper", 21, 2),
+        ]
+
+    def test_native_engine_matches_radon(self):
+        """Test that the native visitor agrees with radon's library API."""
+        tree = ast.parse(PYTHON_SOURCE)
+
+        assert _native(tree) == python_complexities(tree)
+
+    def test_rank_letters(self):
+        """Test radon-style ranks."""
+        assert [complexity_rank(c) for c in (1, 6, 11, 21, 31, 41)] == list("ABCDEF")
+
+
+class TestBraceComplexity:
+    """Test the tokenizer-based counter for C-family languages."""
+
+    def test_javascript_functions_and_arrows(self):
+        """Test named functions, methods and arrow functions."""
+        source = (
+            "// if (commented) {\n"
+            "function add(a, b) {\n"
+            "  if (a && b) { return a; }\n"
+            '  const s = "while (x) {";\n'
+            "  return items.map((x) => {\n"
+            "    return x ? 1 : 2;\n"
+            "  });\n"
+            "}\n"
+            "class Foo extends Bar {\n"
+            "  method(x) {\n"
+            "    switch (x) { case 1: break; case 2: break; }\n"
+            "  }\n"
+            "}\n"
+        )
+
+        assert brace_complexities(source) == [
+            FunctionComplexity("add", 2, 3),
+            FunctionComplexity("(anonymous)", 5, 2),
+            FunctionComplexity("method", 10, 3),
+        ]
+
+    def test_go_functions_without_semicolons(self):
+        """Test Go receivers, multiple returns and newline-separated calls."""
+        source = (
+            "func (r *T) Name(a int) (int, error) {\n"
+            "\tx := foo(a)\n"
+            "\tif err != nil {\n"
+            "\t\treturn 0, err\n"
+            "\t}\n"
+            "\treturn x, nil\n"
+            "}\n"
+        )
+
+        assert brace_complexities(source) == [FunctionComplexity("Name", 1, 2)]
+
+
+class TestCyclomaticComplexityAssessor:
+    """Test CyclomaticComplexityAssessor."""
+
+    def _repository(self, path, languages):
+        subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
+        subprocess.run(["git", "add", "."], cwd=path, check=True, capture_output=True)
+        return Repository(
+            path=path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages=languages,
+            total_files=3,
+            total_lines=100,
+        )
+
+    def test_reports_distribution_and_offenders(self, tmp_path):
+        """Test evidence lists rank distribution and the worst functions."""
+        branches = "".join(f"    if x == {i}:\n        return {i}\n" for i in range(20))
+        (tmp_path / "app.py").write_text(PYTHON_SOURCE)
+        (tmp_path / "big.py").write_text(f"def dispatch(x):\n{branches}")
+        (tmp_path / "util.js").write_text("function f(a) { return a || 1; }\n")
+        repository = self._repository(tmp_path, {"Python": 2, "JavaScript": 1})
+
+        finding = CyclomaticComplexityAssessor().assess(repository)
+
+        assert finding.status == "pass"
+        assert finding.measured_value == "6.0"
+        assert finding.evidence[1] == (
+            "Distribution: A (1-5): 4, B (6-10): 1, C (11-20): 0, "
+            "D (21-30): 1, E (31-40): 0, F (41+): 0"
+        )
+        assert finding.evidence[3] == "Most complex: big.py:1 dispatch (21)"
+
+    def test_no_functions_not_applicable(self, tmp_path):
+        """Test that repositories without functions are not applicable."""
+        (tmp_path / "constants.py").write_text("X = 1\n")
+        repository = self._repository(tmp_path, {"Python": 1})
+
+        finding = CyclomaticComplexityAssessor().assess(repository)
+
+        assert finding.status == "not_applicable"
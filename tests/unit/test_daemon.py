@@ -0,0 +1,173 @@
+"""Tests for the assessment daemon and its client."""
+
+import socket
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from agentready.cli.main import cli, get_agentready_version
+from agentready.services.daemon import (
+    SOCKET_ENV_VAR,
+    AssessmentDaemon,
+    DaemonClient,
+    DaemonError,
+    DaemonServer,
+)
+from agentready.services.scanner import Scanner
+from agentready.services.scorer import Scorer
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Serve a daemon on a temporary socket; yields its client."""
+    socket_path = tmp_path / "d.sock"
+    server = DaemonServer(socket_path, AssessmentDaemon(version="test"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield DaemonClient(socket_path)
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+class TestDaemon:
+    """Test serving assessments over the daemon socket."""
+
+    def test_status(self, running_daemon):
+        status = running_daemon.status()
+
+        assert status["version"] == "test"
+        assert status["assessments"] == 0
+
+    def test_assess_writes_reports(self, running_daemon, git_repo):
+        assessment, reports = running_daemon.assess(git_repo)
+
+        assert assessment.repository.path == git_repo
+        assert assessment.metadata.agentready_version == "test"
+        for path in reports.values():
+            assert path.exists()
+        assert (git_repo / ".agentready" / "report-latest.html").exists()
+
+    def test_repeat_assessment_is_warm(self, running_daemon, git_repo):
+        first, _ = running_daemon.assess(git_repo)
+        second, _ = running_daemon.assess(git_repo)
+
+        assert second.overall_score == first.overall_score
+        status = running_daemon.status()
+        assert status["assessments"] == 2
+        assert status["warm_repositories"] == 1
+
+    def test_warm_assessment_drops_scan_caches(self, tmp_path, git_repo):
+        daemon = AssessmentDaemon(version="test")
+        daemon.assess(str(git_repo), output_dir=str(tmp_path / "out"))
+
+        repository = daemon._previous[git_repo.resolve()].repository
+        assert repository.file_index is None
+        assert repository.ast_cache is None
+        assert repository.git_probe is None
+
+    def test_invalid_exclude_rejected(self, running_daemon, git_repo):
+        with pytest.raises(DaemonError, match="bogus"):
+            running_daemon.assess(git_repo, exclude=["bogus"])
+
+    def test_not_a_repository_rejected(self, running_daemon, tmp_path):
+        with pytest.raises(DaemonError, match="Not a git repository"):
+            running_daemon.assess(tmp_path)
+
+    def test_second_daemon_refused(self, running_daemon):
+        with pytest.raises(DaemonError, match="already running"):
+            DaemonServer(running_daemon.socket_path, AssessmentDaemon("test"))
+
+    def test_shutdown_removes_socket(self, tmp_path):
+        socket_path = tmp_path / "d.sock"
+        server = DaemonServer(socket_path, AssessmentDaemon(version="test"))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        assert DaemonClient(socket_path).shutdown()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+class TestDaemonClientWithoutDaemon:
+    """Test the client when no daemon is running."""
+
+    def test_unreachable(self, tmp_path, git_repo):
+        client = DaemonClient(tmp_path / "missing.sock")
+
+        assert client.status() is None
+        assert client.assess(git_repo) is None
+        assert client.shutdown() is False
+
+    def test_assess_timeout_is_an_error(self, tmp_path, git_repo):
+        socket_path = tmp_path / "d.sock"
+        # Accepts connections but never answers
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        listener.listen()
+        client = DaemonClient(socket_path)
+        client.ASSESS_TIMEOUT = 0.2
+        try:
+            with pytest.raises(DaemonError, match="did not finish"):
+                client.assess(git_repo)
+        finally:
+            listener.close()
+
+    def test_stale_socket_replaced(self, tmp_path):
+        socket_path = tmp_path / "d.sock"
+        socket_path.write_text("")
+
+        server = DaemonServer(socket_path, AssessmentDaemon(version="test"))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            assert DaemonClient(socket_path).status() is not None
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+
+
+class TestAssessWithDaemon:
+    """Test `agentready assess --daemon`."""
+
+    def test_uses_running_daemon(self, tmp_path, git_repo, monkeypatch):
+        socket_path = tmp_path / "d.sock"
+        server = DaemonServer(
+            socket_path, AssessmentDaemon(version=get_agentready_version())
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        monkeypatch.setenv(SOCKET_ENV_VAR, str(socket_path))
+        try:
+            result = CliRunner().invoke(cli, ["assess", "--daemon", str(git_repo)])
+            status = DaemonClient(socket_path).status()
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+
+        assert result.exit_code == 0, result.output
+        assert "Assessment complete!" in result.output
+        assert status["assessments"] == 1
+
+    def test_falls_back_without_daemon(self, tmp_path, git_repo, monkeypatch):
+        monkeypatch.setenv(SOCKET_ENV_VAR, str(tmp_path / "missing.sock"))
+
+        result = CliRunner().invoke(cli, ["assess", "--daemon", str(git_repo)])
+
+        assert result.exit_code == 0, result.output
+        assert "Assessment complete!" in result.output
+
+
+class TestScannerWarmState:
+    """Test passing preloaded state into Scanner."""
+
+    def test_injected_scorer_and_research_version(self, git_repo):
+        scorer = Scorer()
+        scanner = Scanner(git_repo, scorer=scorer, research_version="9.9.9")
+
+        assessment = scanner.scan([], version="test")
+
+        assert scanner.scorer is scorer
+        assert assessment.metadata.research_version == "9.9.9"
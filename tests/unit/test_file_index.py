@@ -0,0 +1,197 @@
+"""Unit tests for the shared per-scan file index."""
+
+import subprocess
+
+from agentready.models.repository import Repository
+from agentready.services.file_index import FileIndex
+from agentready.services.language_detector import LanguageDetector
+
+
+def _init_git_repo(repo_path):
+    """Create a git repository with tracked, ignored and untracked files."""
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    (repo_path / "src").mkdir()
+    (repo_path / "src" / "app.py").write_text("import os\n\n\ndef main():\n    pass\n")
+    (repo_path / "src" / "util.py").write_text("x = 1\n")
+    (repo_path / "README.md").write_text("# Title\n")
+    (repo_path / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\0\0\0binary")
+    (repo_path / ".gitignore").write_text("build/\n")
+    (repo_path / "build").mkdir()
+    (repo_path / "build" / "generated.py").write_text("y = 2\n")
+    subprocess.run(
+        ["git", "add", "src", "README.md", "logo.png", ".gitignore"],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+    )
+    (repo_path / "untracked.py").write_text("z = 3\n")
+
+
+class TestFileIndex:
+    """Test FileIndex class."""
+
+    def test_build_lists_tracked_files_only(self, tmp_path):
+        """Test that index respects .gitignore and skips untracked files."""
+        _init_git_repo(tmp_path)
+
+        index = FileIndex.build(tmp_path)
+
+        assert index.tracked is True
+        assert [f.path for f in index] == [
+            ".gitignore",
+            "README.md",
+            "logo.png",
+            "src/app.py",
+            "src/util.py",
+        ]
+        assert "build/generated.py" not in index
+        assert "untracked.py" not in index
+
+    def test_entries_record_blob_sha_of_clean_files(self, tmp_path):
+        """Test that blob SHAs come from git and are dropped for edited files."""
+        _init_git_repo(tmp_path)
+        (tmp_path / "src" / "util.py").write_text("x = 2\n")
+        expected = subprocess.run(
+            ["git", "hash-object", "README.md"],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        index = FileIndex.build(tmp_path)
+
+        assert index.get("README.md").blob_sha == expected
+        assert index.get("src/util.py").blob_sha is None
+
+    def test_entries_capture_suffix_size_and_mtime(self, tmp_path):
+        """Test that entries record suffix, size and mtime."""
+        _init_git_repo(tmp_path)
+
+        entry = FileIndex.build(tmp_path).get("src/app.py")
+
+        assert entry.suffix == ".py"
+        assert entry.name == "app.py"
+        assert entry.parts == ("src", "app.py")
+        assert entry.size == (tmp_path / "src" / "app.py").stat().st_size
+        assert entry.mtime > 0
+
+    def test_fallback_walk_without_git(self, tmp_path):
+        """Test fallback to filesystem walk when git ls-files fails."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "main.py").write_text("pass\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("x\n")
+
+        index = FileIndex.build(tmp_path)
+
+        assert index.tracked is False
+        assert [f.path for f in index] == ["main.py"]
+
+    def test_queries_by_suffix_and_name(self, tmp_path):
+        """Test suffix, name and directory-exclusion queries."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+
+        assert [f.path for f in index.with_suffix(".py")] == [
+            "src/app.py",
+            "src/util.py",
+        ]
+        assert [f.path for f in index.named("util.py")] == ["src/util.py"]
+        assert index.excluding_dirs(index.with_suffix(".py"), {"src"}) == []
+
+    def test_line_counts_are_lazy_and_cached(self, tmp_path):
+        """Test that line counts are computed once on first request."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+
+        assert index.line_count("src/app.py") == 5
+        assert index.code_line_count("src/app.py") == 3
+
+        # Cached: later edits to the file are not observed
+        (tmp_path / "src" / "app.py").write_text("one\n")
+        assert index.line_count("src/app.py") == 5
+
+    def test_line_count_skips_binary_files(self, tmp_path):
+        """Test that binary files have no line count."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+
+        assert index.line_count("logo.png") is None
+        assert index.code_line_count("logo.png") is None
+
+    def test_streamed_counts_match_across_chunk_sizes(self, tmp_path, monkeypatch):
+        """Test that chunk boundaries do not change line counts."""
+        _init_git_repo(tmp_path)
+        content = "a\n\n  \r\nlong line\t\n\n   x" * 50
+        (tmp_path / "src" / "util.py").write_text(content, newline="")
+        lines = content.splitlines()
+        expected = (len(lines), sum(1 for line in lines if line.strip()))
+
+        for chunk_size in (1, 3, 7, 1024):
+            monkeypatch.setattr(FileIndex, "BINARY_SNIFF_BYTES", chunk_size)
+            monkeypatch.setattr(FileIndex, "LINE_COUNT_CHUNK_BYTES", chunk_size)
+            index = FileIndex.build(tmp_path)
+            assert (
+                index.line_count("src/util.py"),
+                index.code_line_count("src/util.py"),
+            ) == expected
+
+    def test_count_lines_fills_cache_on_thread_pool(self, tmp_path):
+        """Test that bulk counting caches results for every entry."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+
+        index.count_lines(index.files, max_workers=4)
+        (tmp_path / "src" / "app.py").write_text("one\n")
+
+        assert index.line_count("src/app.py") == 5
+        assert index.line_count("logo.png") is None
+
+
+class TestFileIndexConsumers:
+    """Test that detector and repository share the index."""
+
+    def test_language_detector_uses_index(self, tmp_path):
+        """Test that LanguageDetector counts from the provided index."""
+        _init_git_repo(tmp_path)
+        index = FileIndex.build(tmp_path)
+
+        detector = LanguageDetector(tmp_path, file_index=index)
+        detector.minimum_file_threshold = 1
+
+        assert detector.file_index is index
+        assert detector.detect_languages() == {"Python": 2, "Markdown": 1}
+        assert detector.count_total_files() == 5
+        # .gitignore (1) + README (1) + app.py (3) + util.py (1), binary skipped
+        assert detector.count_total_lines() == 6
+
+    def test_repository_builds_index_lazily(self, tmp_path):
+        """Test that Repository.get_file_index builds once and caches."""
+        _init_git_repo(tmp_path)
+        repo = Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 2},
+            total_files=5,
+            total_lines=6,
+        )
+
+        assert repo.file_index is None
+        index = repo.get_file_index()
+        assert repo.get_file_index() is index
+        assert "file_index" not in repo.to_dict()
+
+    def test_language_detector_skips_files_over_size_cap(self, tmp_path):
+        """Test that oversized files are left out of the line total."""
+        _init_git_repo(tmp_path)
+        detector = LanguageDetector(tmp_path, file_index=FileIndex.build(tmp_path))
+        detector.max_line_count_bytes = (
+            len("import os\n\n\ndef main():\n    pass\n") - 1
+        )
+
+        # app.py (3 code lines) is over the cap
+        assert detector.count_total_lines() == 3
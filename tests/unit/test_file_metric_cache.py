@@ -0,0 +1,50 @@
+"""Unit tests for the blob-SHA keyed file metric cache."""
+
+from agentready.services.file_metric_cache import FileMetricCache
+
+
+class TestFileMetricCache:
+    """Test FileMetricCache class."""
+
+    def test_round_trip_many(self, tmp_path):
+        """Test that stored metrics are returned for known blobs only."""
+        cache = FileMetricCache(tmp_path)
+
+        written = cache.set_many({"a" * 40: {"lines": [3, 2]}, "b" * 40: {}})
+
+        assert written == 2
+        assert cache.get_many(["a" * 40, "b" * 40, "c" * 40]) == {
+            "a" * 40: {"lines": [3, 2]},
+            "b" * 40: {},
+        }
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that metrics survive reopening the database."""
+        with FileMetricCache(tmp_path) as cache:
+            cache.set_many({"a" * 40: {"lines": [1, 1]}})
+
+        assert FileMetricCache(tmp_path).get_many(["a" * 40]) == {
+            "a" * 40: {"lines": [1, 1]}
+        }
+
+    def test_version_bump_invalidates_entries(self, tmp_path, monkeypatch):
+        """Test that entries written under another metrics version are misses."""
+        FileMetricCache(tmp_path).set_many({"a" * 40: {"lines": [1, 1]}})
+        monkeypatch.setattr(
+            FileMetricCache, "METRICS_VERSION", FileMetricCache.METRICS_VERSION + 1
+        )
+
+        cache = FileMetricCache(tmp_path)
+
+        assert cache.get_many(["a" * 40]) == {}
+        assert cache.get_stats()["total_entries"] == 1
+        assert cache.get_stats()["current_entries"] == 0
+
+    def test_bulk_lookup_spans_chunks(self, tmp_path, monkeypatch):
+        """Test that lookups larger than one chunk return every hit."""
+        monkeypatch.setattr(FileMetricCache, "BULK_CHUNK_SIZE", 2)
+        cache = FileMetricCache(tmp_path)
+        shas = [f"{i:040x}" for i in range(5)]
+        cache.set_many({sha: {"n": i} for i, sha in enumerate(shas)})
+
+        assert len(cache.get_many(shas)) == 5
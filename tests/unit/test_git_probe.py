@@ -0,0 +1,92 @@
+"""Unit tests for the consolidated git metadata probe."""
+
+import subprocess
+
+import pytest
+
+from agentready.services.file_index import FileIndex
+from agentready.services.git_probe import GitProbe
+from agentready.services.scanner import Scanner
+from tests.unit.conftest import commit_all
+
+
+def _git(repo_path, *args):
+    """Run a git command with a fixed identity."""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(git_repo):
+    """Repository on branch main with two commits and an origin remote."""
+    _git(git_repo, "branch", "-M", "main")
+    _git(git_repo, "remote", "add", "origin", "https://github.com/user/repo.git")
+    (git_repo / "app.py").write_text("x = 1\n")
+    commit_all(git_repo, "feat: add app")
+    return git_repo
+
+
+class TestGitProbe:
+    """Test GitProbe.collect and the tracked file listing."""
+
+    def test_collects_head_metadata_and_history(self, git_repo):
+        """Test branch, HEAD, remote and recent commits from one probe."""
+        probe = GitProbe.collect(git_repo)
+
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert probe.branch == "main"
+        assert probe.commit_hash == head
+        assert probe.remote_url == "https://github.com/user/repo.git"
+        assert [c.subject for c in probe.recent_commits] == ["feat: add app", "init"]
+        assert probe.recent_commits[0].author == "Test"
+
+    def test_detached_head(self, git_repo):
+        """Test that a detached HEAD reports "HEAD" as the branch."""
+        _git(git_repo, "checkout", "--detach")
+
+        probe = GitProbe.collect(git_repo)
+
+        assert probe.branch == "HEAD"
+        assert probe.commit_hash is not None
+
+    def test_repository_without_commits(self, tmp_path):
+        """Test that an empty repository has no HEAD commit or history."""
+        _git(tmp_path, "init")
+
+        probe = GitProbe.collect(tmp_path)
+
+        assert probe.commit_hash is None
+        assert probe.recent_commits == []
+        assert probe.remote_url is None
+
+    def test_modified_and_deleted_files_have_no_blob_sha(self, git_repo):
+        """Test that working tree changes invalidate staged blob SHAs."""
+        (git_repo / "README.md").write_text("# Changed\n")
+
+        files = GitProbe.collect(git_repo).tracked_files()
+
+        assert files["README.md"] is None
+        assert len(files["app.py"]) == 40
+
+    def test_file_listing_is_shared(self, git_repo):
+        """Test that the file index and scanner reuse the probe's listing."""
+        probe = GitProbe.collect(git_repo, list_files=True)
+        # Files appearing later would show up if git were asked again
+        (git_repo / "later.py").write_text("y = 2\n")
+        _git(git_repo, "add", "later.py")
+
+        index = FileIndex.build(git_repo, git_probe=probe)
+        repository = Scanner(git_repo, git_probe=probe).scan([])
+
+        assert "later.py" not in index
+        assert repository.repository.git_probe is probe
+        assert repository.repository.commit_hash == probe.commit_hash
@@ -1,6 +1,10 @@
 """Unit tests for GitHub organization scanner."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import requests
@@ -70,7 +74,7 @@ def test_valid_org_names():
     with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
         scanner = GitHubOrgScanner()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             # Mock empty response (no repos)
             mock_response = Mock()
             mock_response.status_code = 200
@@ -101,7 +105,7 @@ def test_token_redaction():
         assert scanner._redact_token(text_without_token) == text_without_token
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_successful_org_scan(mock_get):
     """Test successful organization scan."""
     token = "ghp_" + "a" * 36
@@ -135,7 +139,7 @@ def test_successful_org_scan(mock_get):
         assert "https://github.com/org/repo2.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_filters_private_repos(mock_get):
     """Test that private repos are filtered by default."""
     token = "ghp_" + "a" * 36
@@ -167,7 +171,7 @@ def test_filters_private_repos(mock_get):
         assert "https://github.com/org/public.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_includes_private_repos_when_requested(mock_get):
     """Test that private repos are included when requested."""
     token = "ghp_" + "a" * 36
@@ -200,7 +204,7 @@ def test_includes_private_repos_when_requested(mock_get):
         assert "https://github.com/org/private.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_filters_archived_repos(mock_get):
     """Test that archived repos are always filtered."""
     token = "ghp_" + "a" * 36
@@ -232,7 +236,7 @@ def test_filters_archived_repos(mock_get):
         assert "https://github.com/org/active.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_respects_max_repos_limit(mock_get):
     """Test that max_repos limit is enforced."""
     token = "ghp_" + "a" * 36
@@ -261,7 +265,7 @@ def test_respects_max_repos_limit(mock_get):
         assert len(repos) == 10
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_pagination(mock_get):
     """Test that pagination works correctly."""
     token = "ghp_" + "a" * 36
@@ -312,7 +316,7 @@ def test_pagination(mock_get):
         assert len(repos) == 150
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_404_org_not_found(mock_get):
     """Test handling of 404 (org not found)."""
     token = "ghp_" + "a" * 36
@@ -328,7 +332,7 @@ def test_handles_404_org_not_found(mock_get):
             scanner.get_org_repos("nonexistent")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_401_auth_failed(mock_get):
     """Test handling of 401 (authentication failed)."""
     token = "ghp_" + "a" * 36
@@ -344,7 +348,7 @@ def test_handles_401_auth_failed(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_403_rate_limit(mock_get):
     """Test handling of 403 (rate limit exceeded)."""
     token = "ghp_" + "a" * 36
@@ -361,7 +365,7 @@ def test_handles_403_rate_limit(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_403_authorization_failed(mock_get):
     """Test handling of 403 (authorization failed, not rate limit)."""
     token = "ghp_" + "a" * 36
@@ -378,7 +382,7 @@ def test_handles_403_authorization_failed(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_timeout(mock_get):
     """Test handling of request timeout."""
     token = "ghp_" + "a" * 36
@@ -391,7 +395,7 @@ def test_handles_timeout(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_invalid_json(mock_get):
     """Test handling of invalid JSON response."""
     token = "ghp_" + "a" * 36
@@ -407,7 +411,7 @@ def test_handles_invalid_json(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_token_redacted_in_request_exception(mock_get):
     """Test that token is redacted when RequestException contains it."""
     token = "ghp_" + "a" * 36
@@ -426,7 +430,7 @@ def test_token_redacted_in_request_exception(mock_get):
         assert "[REDACTED]" in error_msg
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_rate_limit_warning(mock_get, caplog):
     """Test that low rate limit triggers warning."""
     token = "ghp_" + "a" * 36
@@ -454,3 +458,151 @@ def test_rate_limit_warning(mock_get, caplog):
         assert any(
             "rate limit low" in record.message.lower() for record in caplog.records
         )
+
+
+class _StubGitHub:
+    """Local stand-in for the GitHub org repos endpoint.
+
+    Serves total_repos repositories with Link headers and ETags, answers
+    If-None-Match with 304 and can reject the first request as rate limited.
+    """
+
+    def __init__(self, total_repos):
+        self.repos = [
+            {
+                "name": f"repo{i}",
+                "clone_url": f"https://github.com/stub/repo{i}.git",
+                "private": False,
+                "archived": False,
+            }
+            for i in range(total_repos)
+        ]
+        self.requests = []
+        self.rate_limited_requests = 0
+        self.lock = threading.Lock()
+
+    def handle(self, handler):
+        query = parse_qs(urlparse(handler.path).query)
+        page = int(query["page"][0])
+        per_page = int(query["per_page"][0])
+        with self.lock:
+            self.requests.append((page, handler.headers.get("If-None-Match")))
+            rate_limited = self.rate_limited_requests > 0
+            self.rate_limited_requests -= 1
+
+        if rate_limited:
+            handler.send_response(403)
+            handler.send_header("X-RateLimit-Remaining", "0")
+            handler.send_header("Retry-After", "0")
+            handler.end_headers()
+            handler.wfile.write(b'{"message": "API rate limit exceeded"}')
+            return
+
+        etag = f'"page-{page}"'
+        last_page = max(1, -(-len(self.repos) // per_page))
+        base = f"http://{handler.headers['Host']}{urlparse(handler.path).path}"
+        link = (
+            f'<{base}?per_page={per_page}&page={min(page + 1, last_page)}>; rel="next", '
+            f'<{base}?per_page={per_page}&page={last_page}>; rel="last"'
+        )
+        if handler.headers.get("If-None-Match") == etag:
+            handler.send_response(304)
+            handler.send_header("Link", link)
+            handler.end_headers()
+            return
+
+        body = json.dumps(self.repos[(page - 1) * per_page : page * per_page])
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("ETag", etag)
+        handler.send_header("Link", link)
+        handler.send_header("X-RateLimit-Remaining", "4999")
+        handler.end_headers()
+        handler.wfile.write(body.encode("utf-8"))
+
+
+@pytest.fixture
+def stub_github():
+    """Run a stub GitHub API on localhost; yields (stub, api_url)."""
+    stub = _StubGitHub(total_repos=250)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            stub.handle(self)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield stub, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestStubGitHubEnumeration:
+    """Test enumeration against a local stub of the GitHub API."""
+
+    token = "ghp_" + "a" * 36
+
+    def test_pages_from_link_header(self, stub_github):
+        """Test that all pages named by the Link header are fetched in order."""
+        stub, api_url = stub_github
+        scanner = GitHubOrgScanner(token=self.token, api_url=api_url)
+
+        repos = scanner.get_org_repos("stub", max_repos=1000)
+
+        assert repos == [r["clone_url"] for r in stub.repos]
+        assert sorted(page for page, _ in stub.requests) == [1, 2, 3]
+
+    def test_stops_fetching_at_max_repos(self, stub_github):
+        """Test that pages beyond max_repos are never requested."""
+        stub, api_url = stub_github
+        scanner = GitHubOrgScanner(token=self.token, api_url=api_url)
+
+        repos = scanner.get_org_repos("stub", max_repos=150)
+
+        assert len(repos) == 150
+        assert sorted(page for page, _ in stub.requests) == [1, 2]
+
+    def test_repeat_run_uses_conditional_requests(self, stub_github, tmp_path):
+        """Test that cached pages are revalidated with If-None-Match."""
+        stub, api_url = stub_github
+        first = GitHubOrgScanner(
+            token=self.token, api_url=api_url, cache_dir=tmp_path
+        ).get_org_repos("stub", max_repos=1000)
+        stub.requests.clear()
+
+        second = GitHubOrgScanner(
+            token=self.token, api_url=api_url, cache_dir=tmp_path
+        ).get_org_repos("stub", max_repos=1000)
+
+        assert second == first
+        assert sorted(stub.requests) == [
+            (1, '"page-1"'),
+            (2, '"page-2"'),
+            (3, '"page-3"'),
+        ]
+
+    def test_waits_out_rate_limit(self, stub_github):
+        """Test that a rate limited request is retried after Retry-After."""
+        stub, api_url = stub_github
+        stub.rate_limited_requests = 1
+        scanner = GitHubOrgScanner(token=self.token, api_url=api_url)
+
+        repos = scanner.get_org_repos("stub", max_repos=1000)
+
+        assert len(repos) == 250
+        assert [page for page, _ in stub.requests][:2] == [1, 1]
+
+    def test_gives_up_after_max_retries(self, stub_github):
+        """Test that a persistently rate limited request is not retried forever."""
+        stub, api_url = stub_github
+        stub.rate_limited_requests = 100
+        scanner = GitHubOrgScanner(token=self.token, api_url=api_url)
+
+        with pytest.raises(GitHubAPIError, match="rate limit"):
+            scanner.get_org_repos("stub", max_repos=1000)
+
+        assert len(stub.requests) == GitHubOrgScanner.MAX_RETRIES + 1
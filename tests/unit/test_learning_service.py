@@ -3,12 +3,16 @@
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from agentready.models import DiscoveredSkill
 from agentready.services.learning_service import LearningService
+from tests.fixtures.assessment_fixtures import (
+    create_test_assessment_json,
+    create_test_finding_json,
+)
 
 
 @pytest.fixture
@@ -449,3 +453,114 @@ class TestLearningServiceEdgeCases:
 
         # Should not enrich any skills (budget is 0)
         assert len(skills) >= 0
+
+
+def _batch_assessment(temp_dir, name, score, commit="abc123"):
+    """Assessment of a checked-out repository with a CLAUDE.md finding."""
+    repo_path = temp_dir / "repos" / name
+    (repo_path / ".git").mkdir(parents=True, exist_ok=True)
+    data = create_test_assessment_json(repo_path=str(repo_path), repo_name=name)
+    data["repository"]["commit_hash"] = commit
+    data["findings"] = [
+        create_test_finding_json(attribute_id="claude_md_file", score=score),
+        create_test_finding_json(attribute_id="lock_files", status="fail", score=0),
+    ]
+    return data
+
+
+def _write_batch(path, assessments):
+    """Write an aggregated batch JSON with one failed repository."""
+    results = [
+        {"repository_url": a["repository"]["name"], "assessment": a, "error": None}
+        for a in assessments
+    ]
+    results.append({"repository_url": "broken", "assessment": None, "error": "x"})
+    path.write_text(
+        json.dumps({"schema_version": "1.0.0", "batch_id": "b", "results": results})
+    )
+    return path
+
+
+class TestBatchLearning:
+    """Test learning across the repositories of a batch."""
+
+    def test_batch_file_aggregates_skills(self, temp_dir):
+        assessments = [
+            _batch_assessment(temp_dir, f"repo-{i}", score)
+            for i, score in enumerate([100.0, 90.0, 60.0])
+        ]
+        batch_file = _write_batch(temp_dir / "all-assessments.json", assessments)
+
+        service = LearningService(output_dir=temp_dir / "out")
+        results = service.run_batch_workflow(batch_file, output_format="json")
+
+        assert results["repositories_analyzed"] == 3
+        assert results["skills_discovered"] == 1
+        # The score-60 repository is below the confidence threshold
+        assert results["skill_repositories"] == {"setup-claude-md": 2}
+        skill = results["skills"][0]
+        assert skill.reusability_score == pytest.approx(66.7)
+        assert skill.confidence == pytest.approx((100 + 90 + 50) / 3)
+
+    def test_batch_threshold_applies_to_aggregated_confidence(self, temp_dir):
+        single = _write_batch(
+            temp_dir / "single.json", [_batch_assessment(temp_dir, "repo-0", 80.0)]
+        )
+        several = _write_batch(
+            temp_dir / "several.json",
+            [_batch_assessment(temp_dir, f"repo-{i}", 80.0) for i in range(3)],
+        )
+        service = LearningService(output_dir=temp_dir / "out", min_confidence=70)
+
+        # One repository at 80 aggregates to (80 + 50) / 2 = 65
+        skills, aggregator = service.extract_patterns_from_batch(single)
+        assert skills == []
+        assert aggregator.repositories_with("setup-claude-md") == 1
+
+        # Three repositories at 80 aggregate to (3 * 80 + 50) / 4 = 72.5
+        skills, _ = service.extract_patterns_from_batch(several)
+        assert [s.skill_id for s in skills] == ["setup-claude-md"]
+        assert skills[0].confidence == pytest.approx(72.5)
+
+    def test_batch_directory_skips_duplicates(self, temp_dir):
+        reports = temp_dir / "reports"
+        reports.mkdir()
+        assessments = [_batch_assessment(temp_dir, f"repo-{i}", 90.0) for i in range(2)]
+        _write_batch(reports / "all-assessments.json", assessments)
+        for data in assessments:
+            name = data["repository"]["name"]
+            (reports / f"{name}.json").write_text(json.dumps(data))
+        (reports / "latest.json").symlink_to(reports / "repo-0.json")
+        (reports / "summary.json").write_text(json.dumps({"total": 2}))
+        # Same repository at a later commit counts separately
+        (reports / "repo-0-new.json").write_text(
+            json.dumps(_batch_assessment(temp_dir, "repo-0", 90.0, commit="def456"))
+        )
+
+        service = LearningService(output_dir=temp_dir / "out")
+        repositories = list(service.iter_batch_assessments(reports))
+
+        assert len(repositories) == 3
+
+    def test_batch_enriches_each_skill_once(self, temp_dir):
+        assessments = [
+            _batch_assessment(temp_dir, f"repo-{i}", score)
+            for i, score in enumerate([85.0, 100.0, 90.0, 95.0])
+        ]
+        batch_file = _write_batch(temp_dir / "all-assessments.json", assessments)
+        enricher = Mock()
+        enricher.enrich_many.side_effect = lambda items, **kwargs: [
+            DiscoveredSkill(**{**skill.to_dict(), "description": "Enriched"})
+            for skill, _, _ in items
+        ]
+
+        service = LearningService(output_dir=temp_dir / "out")
+        with patch.object(service, "_get_llm_enricher", return_value=enricher):
+            skills, _ = service.extract_patterns_from_batch(batch_file, enable_llm=True)
+
+        enricher.enrich_many.assert_called_once()
+        (item,) = enricher.enrich_many.call_args.args[0]
+        # Code is sampled from the best exemplar
+        assert item[2].name == "repo-1"
+        assert skills[0].description == "Enriched"
+        assert skills[0].reusability_score == 100.0
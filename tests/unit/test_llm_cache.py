@@ -0,0 +1,149 @@
+"""Unit tests for the SQLite-backed LLM response cache."""
+
+from datetime import datetime, timedelta
+
+from agentready.models import DiscoveredSkill
+from agentready.services.llm_cache import LLMCache
+
+
+def _skill(i, examples=1):
+    return DiscoveredSkill(
+        skill_id=f"skill-{i}",
+        name=f"Skill {i}",
+        description="Enriched description",
+        confidence=90.0,
+        source_attribute_id=f"attr_{i}",
+        reusability_score=80.0,
+        impact_score=50.0,
+        pattern_summary="Pattern",
+        # Random-looking text so compressed sizes stay predictable
+        code_examples=[f"{i * 7919 + n:x}" * 50 for n in range(examples)],
+        citations=[],
+    )
+
+
+def _wait_for_sweep(cache):
+    if cache._sweep_thread is not None:
+        cache._sweep_thread.join(timeout=5)
+
+
+class TestLLMCache:
+    """Test LLMCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a cached skill is returned unchanged."""
+        cache = LLMCache(tmp_path)
+
+        cache.set("key1", _skill(1))
+
+        assert cache.get("key1") == _skill(1)
+        assert cache.get("missing") is None
+
+    def test_single_database_file(self, tmp_path):
+        """Test that entries share one database instead of a file per key."""
+        cache = LLMCache(tmp_path)
+
+        for i in range(20):
+            cache.set(f"key{i}", _skill(i))
+
+        assert [p.name for p in tmp_path.iterdir() if p.suffix != ".db-journal"] == [
+            "llm_responses.db"
+        ]
+
+    def test_get_many_prefetch(self, tmp_path):
+        """Test bulk lookup returns hits only."""
+        cache = LLMCache(tmp_path)
+        cache.set("key1", _skill(1))
+        cache.set("key2", _skill(2))
+
+        hits = cache.get_many(["key1", "key2", "key3", "key1"])
+
+        assert hits == {"key1": _skill(1), "key2": _skill(2)}
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that entries survive reopening the database."""
+        with LLMCache(tmp_path) as cache:
+            cache.set("key1", _skill(1))
+
+        assert LLMCache(tmp_path).get("key1") == _skill(1)
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        """Test that expired entries are not returned."""
+        cache = LLMCache(tmp_path, ttl_days=0)
+
+        cache.set("key1", _skill(1))
+
+        assert cache.get("key1") is None
+
+    def test_background_sweep_removes_expired(self, tmp_path):
+        """Test that opening the cache sweeps expired entries."""
+        cache = LLMCache(tmp_path, ttl_days=0)
+        _wait_for_sweep(cache)
+        cache.set("key1", _skill(1))
+        cache.close()
+        # Make the last sweep old enough for the next open to sweep again
+        with cache._connection() as conn:
+            conn.execute(
+                "UPDATE cache_meta SET value = ? WHERE key = 'last_sweep'",
+                ((datetime.now() - timedelta(days=1)).isoformat(),),
+            )
+
+        reopened = LLMCache(tmp_path)
+        _wait_for_sweep(reopened)
+
+        assert reopened.get_stats()["total_entries"] == 0
+
+    def test_recent_sweep_not_repeated(self, tmp_path):
+        """Test that the sweep runs at most once per interval."""
+        _wait_for_sweep(LLMCache(tmp_path))
+
+        assert LLMCache(tmp_path)._sweep_thread is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted past max_bytes."""
+        cache = LLMCache(tmp_path)
+        cache.set("key0", _skill(0))
+        entry_size = cache.get_stats()["total_bytes"]
+        # Room for three entries after trimming to EVICTION_TARGET
+        cache.max_bytes = int(entry_size * 3.5)
+
+        cache.set("key1", _skill(1))
+        cache.set("key2", _skill(2))
+        cache.get("key0")  # key1 is now least recently used
+        cache.set("key3", _skill(3))
+
+        assert set(cache.get_many(["key0", "key1", "key2", "key3"])) == {
+            "key0",
+            "key2",
+            "key3",
+        }
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["total_bytes"] <= cache.max_bytes
+
+    def test_stats(self, tmp_path):
+        """Test hit, miss and byte statistics."""
+        cache = LLMCache(tmp_path)
+        cache.set("key1", _skill(1))
+
+        cache.get_many(["key1", "key2"])
+        cache.get("key1")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["bytes_written"] == stats["total_bytes"] > 0
+        assert stats["bytes_read"] == 2 * stats["total_bytes"]
+        assert stats["total_entries"] == 1
+
+
+class TestGenerateKey:
+    """Test cache key generation."""
+
+    def test_model_and_prompt_version_change_key(self):
+        """Test that a new model or prompt never reuses an old key."""
+        key = LLMCache.generate_key("attr", 90.0, "abc", "model-a", "v1")
+
+        assert key == LLMCache.generate_key("attr", 90.0, "abc", "model-a", "v1")
+        assert key != LLMCache.generate_key("attr", 90.0, "abc", "model-b", "v1")
+        assert key != LLMCache.generate_key("attr", 90.0, "abc", "model-a", "v2")
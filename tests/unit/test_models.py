@@ -321,6 +321,114 @@ class TestAssessment:
         assert Assessment.determine_certification_level(45.0) == "Bronze"
         assert Assessment.determine_certification_level(20.0) == "Needs Improvement"
 
+    def _make_full_assessment(self, tmp_path):
+        """Build an assessment exercising every nested model."""
+        (tmp_path / ".git").mkdir()
+        repo = Repository(
+            path=tmp_path,
+            name="test",
+            url="https://github.com/user/test",
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 3},
+            total_files=10,
+            total_lines=100,
+        )
+        attr = Attribute(
+            id="test_attr",
+            name="Test",
+            category="Test",
+            tier=2,
+            description="Test",
+            criteria="Test",
+            default_weight=0.04,
+        )
+        citation = Citation(
+            source="Source", title="Title", url=None, relevance="Relevant"
+        )
+        findings = [
+            Finding(
+                attribute=attr,
+                status="fail",
+                score=40.0,
+                measured_value="40%",
+                threshold="≥80%",
+                evidence=["evidence"],
+                remediation=Remediation(
+                    summary="Fix it",
+                    steps=["Step 1"],
+                    tools=["tool"],
+                    commands=["cmd"],
+                    examples=["example"],
+                    citations=[citation],
+                ),
+                error_message=None,
+            ),
+            Finding.error(attr, reason="boom"),
+        ]
+        timestamp = datetime(2025, 1, 2, 3, 4, 5)
+        return Assessment(
+            repository=repo,
+            timestamp=timestamp,
+            overall_score=40.0,
+            certification_level="Bronze",
+            attributes_assessed=1,
+            attributes_not_assessed=1,
+            attributes_total=2,
+            findings=findings,
+            config=Config(weights={"test_attr": 2.0}, excluded_attributes=["x"]),
+            duration_seconds=1.5,
+            discovered_skills=[
+                DiscoveredSkill(
+                    skill_id="test-skill",
+                    name="Test Skill",
+                    description="Does things",
+                    confidence=90.0,
+                    source_attribute_id="test_attr",
+                    reusability_score=50.0,
+                    impact_score=10.0,
+                    pattern_summary="Pattern",
+                    citations=[citation],
+                )
+            ],
+            metadata=AssessmentMetadata.create(
+                version="1.2.3",
+                research_version="1.0.0",
+                timestamp=timestamp,
+                command="agentready assess .",
+            ),
+        )
+
+    def test_assessment_from_dict_round_trip(self, tmp_path):
+        """Test that from_dict reverses to_dict for all nested models."""
+        assessment = self._make_full_assessment(tmp_path)
+
+        restored = Assessment.from_dict(assessment.to_dict())
+
+        assert restored.to_dict() == assessment.to_dict()
+        assert restored.findings[0].remediation.citations[0].title == "Title"
+        assert restored.config.get_weight("test_attr", 1.0) == 2.0
+        assert restored.metadata.agentready_version == "1.2.3"
+
+    def test_assessment_from_dict_repository_path_override(self, tmp_path):
+        """Test that the repository path can point at a new checkout."""
+        (tmp_path / "old").mkdir()
+        data = self._make_full_assessment(tmp_path / "old").to_dict()
+        new_checkout = tmp_path / "new"
+        (new_checkout / ".git").mkdir(parents=True)
+
+        restored = Assessment.from_dict(data, repository_path=new_checkout)
+
+        assert restored.repository.path == new_checkout
+
+    def test_assessment_from_dict_rejects_unknown_schema(self, tmp_path):
+        """Test that unsupported schema versions are rejected."""
+        data = self._make_full_assessment(tmp_path).to_dict()
+        data["schema_version"] = "0.1.0"
+
+        with pytest.raises(ValueError, match="schema version"):
+            Assessment.from_dict(data)
+
 
 class TestAssessmentMetadata:
     """Test AssessmentMetadata model."""
@@ -1,9 +1,14 @@
 """Unit tests for repository manager."""
 
+import shutil
+import subprocess
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 from agentready.services.repository_manager import RepositoryManager
+from tests.unit.conftest import commit_all
 
 
 class TestRepositoryManager:
@@ -119,3 +124,243 @@ class TestRepositoryManager:
 
         # Should return True even if directory doesn't exist
         assert success is True
+
+
+def _local_object_count(repo_path):
+    """Count objects stored in the repository itself (not alternates)."""
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "count-objects", "-v"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    stats = dict(line.split(": ") for line in result.stdout.splitlines())
+    return int(stats["count"]) + int(stats["in-pack"])
+
+
+def _head(repo_path):
+    """Get the HEAD commit of a repository."""
+    return subprocess.run(
+        ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    """Upstream repository with a few files, reachable via a file:// URL."""
+    path = tmp_path / "upstream"
+    path.mkdir()
+    subprocess.run(
+        ["git", "init", "-b", "main"], cwd=path, check=True, capture_output=True
+    )
+    (path / "README.md").write_text("# Upstream\n")
+    (path / "docs").mkdir()
+    for i in range(5):
+        (path / "docs" / f"page{i}.md").write_text(f"Page {i}\n")
+    commit_all(path, "init")
+    return path
+
+
+class TestRepositoryManagerCloneCache:
+    """Test cached clones being updated and sharing objects."""
+
+    @pytest.fixture
+    def manager_factory(self, tmp_path):
+        def factory(**kwargs):
+            manager = RepositoryManager(tmp_path / "cache", **kwargs)
+            # file:// URLs stand in for remote repositories
+            manager.validate_url = lambda url: (True, None)
+            return manager
+
+        return factory
+
+    def test_update_fetches_new_commits_and_resets(self, upstream, manager_factory):
+        """Test that a cached clone is moved to the new upstream tip."""
+        manager = manager_factory()
+        url = f"file://{upstream}"
+        success, clone, error = manager.clone_repository(url)
+        assert success, error
+
+        (clone / "README.md").write_text("local edit\n")
+        (clone / "junk.txt").write_text("junk\n")
+        (upstream / "NEW.md").write_text("new\n")
+        commit_all(upstream, "second")
+
+        success, updated, error = manager.clone_repository(url)
+
+        assert success, error
+        assert updated == clone
+        assert (clone / "NEW.md").exists()
+        assert (clone / "README.md").read_text() == "# Upstream\n"
+        assert not (clone / "junk.txt").exists()
+
+    def test_no_update_reuses_clone_as_is(self, upstream, manager_factory):
+        """Test that update=False leaves an existing clone untouched."""
+        url = f"file://{upstream}"
+        manager_factory().clone_repository(url)
+        (upstream / "NEW.md").write_text("new\n")
+        commit_all(upstream, "second")
+
+        success, clone, error = manager_factory(update=False).clone_repository(url)
+
+        assert success, error
+        assert not (clone / "NEW.md").exists()
+
+    def test_forks_borrow_shared_objects(self, tmp_path, upstream, manager_factory):
+        """Test that a fork only stores objects the upstream clone lacks."""
+        fork = tmp_path / "fork" / "upstream"
+        subprocess.run(
+            ["git", "clone", "-q", str(upstream), str(fork)],
+            check=True,
+            capture_output=True,
+        )
+        (fork / "FORK.md").write_text("fork\n")
+        commit_all(fork, "fork change")
+
+        manager = manager_factory()
+        success, upstream_clone, error = manager.clone_repository(f"file://{upstream}")
+        assert success, error
+        success, fork_clone, error = manager.clone_repository(f"file://{fork}")
+        assert success, error
+
+        assert fork_clone != upstream_clone
+        # New commit, root tree and FORK.md; docs/ and README.md are borrowed
+        assert _local_object_count(fork_clone) == 3
+        status = subprocess.run(
+            ["git", "-C", str(fork_clone), "status", "--porcelain"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        assert status.stdout == ""
+
+    def test_shallow_boundaries_stay_within_family(
+        self, tmp_path, upstream, manager_factory
+    ):
+        """Test that clones do not collect other repositories' boundaries."""
+        other = tmp_path / "other"
+        other.mkdir()
+        subprocess.run(["git", "init"], cwd=other, check=True, capture_output=True)
+        (other / "OTHER.md").write_text("other\n")
+        commit_all(other, "init")
+
+        manager = manager_factory()
+        _, other_clone, _ = manager.clone_repository(f"file://{other}")
+        _, upstream_clone, _ = manager.clone_repository(f"file://{upstream}")
+        first_head = _head(upstream_clone)
+        (upstream / "NEW.md").write_text("new\n")
+        commit_all(upstream, "second")
+        success, _, error = manager.clone_repository(f"file://{upstream}")
+
+        assert success, error
+        assert (upstream_clone / "NEW.md").exists()
+        shallow = (upstream_clone / ".git" / "shallow").read_text().split()
+        assert _head(other_clone) not in shallow
+        assert set(shallow) <= {first_head, _head(upstream_clone)}
+
+    def test_maintenance_drops_deleted_clones(
+        self, tmp_path, upstream, manager_factory
+    ):
+        """Test that refs of deleted clones go and their objects are pruned."""
+        other = tmp_path / "other"
+        other.mkdir()
+        subprocess.run(["git", "init"], cwd=other, check=True, capture_output=True)
+        (other / "OTHER.md").write_text("other\n")
+        commit_all(other, "init")
+        manager = manager_factory()
+        _, upstream_clone, _ = manager.clone_repository(f"file://{upstream}")
+        _, other_clone, _ = manager.clone_repository(f"file://{other}")
+        other_head = _head(other_clone)
+        shutil.rmtree(other_clone)
+
+        assert manager.maintain_shared_objects() is True
+
+        shared = manager.cache_dir / manager.SHARED_OBJECTS_DIR
+        refs = subprocess.run(
+            ["git", "-C", str(shared), "for-each-ref", "--format=%(refname)"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert refs == [f"refs/clones/{upstream_clone.name}"]
+        missing = subprocess.run(
+            ["git", "-C", str(shared), "cat-file", "-e", other_head],
+            capture_output=True,
+        )
+        assert missing.returncode != 0
+        # Objects the remaining clone borrows are kept
+        subprocess.run(
+            ["git", "-C", str(upstream_clone), "fsck", "--connectivity-only"],
+            check=True,
+            capture_output=True,
+        )
+        # Garbage collection is rate limited
+        assert manager.maintain_shared_objects() is False
+
+    def test_maintenance_skips_gc_for_unrecorded_clone(self, upstream, manager_factory):
+        """Test that nothing is pruned while a clone's HEAD is not recorded."""
+        manager = manager_factory()
+        _, clone, _ = manager.clone_repository(f"file://{upstream}")
+        shared = manager.cache_dir / manager.SHARED_OBJECTS_DIR
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                str(shared),
+                "update-ref",
+                "-d",
+                f"refs/clones/{clone.name}",
+            ],
+            check=True,
+            capture_output=True,
+        )
+
+        assert manager.maintain_shared_objects() is False
+
+    def test_sparse_patterns_limit_checkout(self, upstream, manager_factory):
+        """Test that sparse-checkout patterns exclude matching paths."""
+        manager = manager_factory(sparse_patterns=["/*", "!/docs/"])
+
+        success, clone, error = manager.clone_repository(f"file://{upstream}")
+
+        assert success, error
+        assert (clone / "README.md").exists()
+        assert not (clone / "docs").exists()
+
+    def test_prepared_repository_keeps_plain_name(self, upstream, manager_factory):
+        """Test that the URL hash of the clone directory stays out of the name."""
+        manager = manager_factory()
+
+        success, repository, failure = manager.prepare_repository(f"file://{upstream}")
+
+        assert success, failure
+        assert repository.path.name != "upstream"
+        assert repository.name == "upstream"
+
+    def test_unreachable_remote_fails_cleanly(self, tmp_path, manager_factory):
+        """Test that a failed clone reports an error and leaves no directory."""
+        manager = manager_factory()
+        url = f"file://{tmp_path / 'missing'}"
+
+        success, _, error = manager.clone_repository(url)
+
+        assert success is False
+        assert error
+        assert not manager.get_clone_dir(url).exists()
+
+    def test_resolve_remote_head(self, upstream, manager_factory):
+        """Test that the remote HEAD commit is read without cloning."""
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=upstream,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        manager = manager_factory()
+
+        assert manager.resolve_remote_head(f"file://{upstream}") == head
+        assert manager.resolve_remote_head(str(upstream)) is None
+        assert not any(manager.cache_dir.iterdir())
@@ -0,0 +1,239 @@
+"""Tests for vectorized re-scoring of stored assessments."""
+
+import json
+import random
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from agentready.cli.main import cli
+from agentready.models.assessment import Assessment
+from agentready.models.config import Config
+from agentready.models.finding import Finding
+from agentready.services.rescoring import (
+    ScoreMatrix,
+    WeightCandidate,
+    certification_levels,
+    load_candidates,
+)
+from agentready.services.scorer import Scorer
+from tests.fixtures.assessment_fixtures import (
+    create_test_assessment_json,
+    create_test_finding_json,
+)
+
+SCORER = Scorer()
+ATTRIBUTE_IDS = sorted(SCORER.default_weights)
+TIERS = {attr_id: i % 4 + 1 for i, attr_id in enumerate(ATTRIBUTE_IDS)}
+
+
+def _random_assessment(rng, name):
+    """Assessment JSON with random statuses and scores."""
+    findings = []
+    # A duplicate attribute ID and one missing from the default weights
+    for attr_id in ATTRIBUTE_IDS + ATTRIBUTE_IDS[:1] + ["unknown_attr"]:
+        status = rng.choice(["pass", "fail", "pass", "skipped", "not_applicable"])
+        # Coarse scores make ties at .x5 common
+        score = rng.choice([0.0, 25.0, 50.0, 75.0, 100.0, 33.3, 66.7])
+        findings.append(
+            create_test_finding_json(
+                attribute_id=attr_id,
+                status=status,
+                score=score if status in ("pass", "fail") else None,
+                tier=TIERS.get(attr_id, 4),
+            )
+        )
+    data = create_test_assessment_json(repo_name=name)
+    data["findings"] = findings
+    data["overall_score"] = SCORER.calculate_overall_score(
+        [Finding.from_dict(f) for f in findings]
+    )
+    return data
+
+
+@pytest.fixture
+def assessments():
+    rng = random.Random(7)
+    return [
+        (f"repo-{i}.json", _random_assessment(rng, f"repo-{i}")) for i in range(200)
+    ]
+
+
+class TestScoreMatrix:
+    """Test ScoreMatrix against Scorer."""
+
+    def test_default_weights_match_stored_scores(self, assessments):
+        matrix = ScoreMatrix.from_assessments(assessments)
+
+        scores = matrix.rescore(matrix.weight_vector(WeightCandidate("default")))
+
+        assert scores.tolist() == matrix.stored_scores.tolist()
+
+    def test_custom_weights_match_scorer(self, assessments):
+        overrides = {"claude_md_file": 0.5, "test_coverage": 0.2, "unknown_attr": 2.0}
+        matrix = ScoreMatrix.from_assessments(assessments)
+
+        scores = matrix.rescore(
+            matrix.weight_vector(WeightCandidate("custom", weights=overrides))
+        )
+
+        scorer = Scorer()
+        config = Config(weights=overrides)
+        expected = [
+            scorer.calculate_overall_score(
+                [Finding.from_dict(f) for f in data["findings"]], config
+            )
+            for _, data in assessments
+        ]
+        assert scores.tolist() == expected
+
+    def test_many_candidates_in_one_pass(self, assessments):
+        matrix = ScoreMatrix.from_assessments(assessments)
+        candidates = [
+            WeightCandidate("default"),
+            WeightCandidate("docs", weights={"readme_structure": 0.4}),
+        ]
+        weights = np.vstack([matrix.weight_vector(c) for c in candidates])
+
+        scores = matrix.rescore(weights)
+
+        assert scores.shape == (2, len(assessments))
+        for row, candidate in enumerate(candidates):
+            single = matrix.rescore(matrix.weight_vector(candidate))
+            assert scores[row].tolist() == single.tolist()
+
+    def test_tier_weights_keep_proportions(self, assessments):
+        matrix = ScoreMatrix.from_assessments(assessments)
+        default = matrix.weight_vector(WeightCandidate("default"))
+        shares: dict[int, float] = {}
+        for attr_id, weight in Scorer().default_weights.items():
+            shares[TIERS[attr_id]] = shares.get(TIERS[attr_id], 0.0) + weight
+
+        rebalanced = matrix.weight_vector(WeightCandidate("same", tier_weights=shares))
+
+        assert np.allclose(rebalanced, default)
+
+    def test_tier_weights_shift_weight(self, assessments):
+        matrix = ScoreMatrix.from_assessments(assessments)
+        vector = matrix.weight_vector(
+            WeightCandidate("tier1", tier_weights={1: 10.0, 2: 1.0})
+        )
+
+        weights = dict(zip(matrix.attributes, vector))
+        tier1 = sum(w for a, w in weights.items() if TIERS.get(a) == 1)
+        tier2 = sum(w for a, w in weights.items() if TIERS.get(a) == 2)
+        assert tier1 == pytest.approx(tier2 * 10)
+
+    def test_nothing_scored_is_zero(self):
+        data = create_test_assessment_json()
+        for finding in data["findings"]:
+            finding["status"] = "skipped"
+            finding["score"] = None
+        matrix = ScoreMatrix.from_assessments([("a.json", data)])
+
+        scores = matrix.rescore(matrix.weight_vector(WeightCandidate("default")))
+
+        assert scores.tolist() == [0.0]
+
+    def test_save_and_load(self, assessments, tmp_path):
+        matrix = ScoreMatrix.from_assessments(assessments)
+
+        loaded = ScoreMatrix.load(matrix.save(tmp_path / "matrix.npz"))
+
+        assert loaded.sources == matrix.sources
+        assert loaded.attributes == matrix.attributes
+        assert np.array_equal(loaded.finding_scores, matrix.finding_scores)
+        assert np.array_equal(loaded.scored, matrix.scored)
+
+    def test_from_directory_skips_links_and_other_json(self, assessments, tmp_path):
+        for source, data in assessments[:3]:
+            (tmp_path / source).write_text(json.dumps(data))
+        (tmp_path / "latest.json").symlink_to(tmp_path / assessments[0][0])
+        (tmp_path / "summary.json").write_text(json.dumps({"total": 3}))
+        (tmp_path / "broken.json").write_text("{")
+
+        matrix = ScoreMatrix.from_directory(tmp_path)
+
+        assert len(matrix) == 3
+
+
+class TestCertificationLevels:
+    """Test vectorized certification levels."""
+
+    def test_matches_assessment_thresholds(self):
+        scores = np.array([[0.0, 39.9, 40.0, 59.9], [60.0, 74.9, 75.0, 90.0]])
+
+        levels = certification_levels(scores)
+
+        for score, level in zip(scores.ravel(), levels.ravel()):
+            assert level == Assessment.determine_certification_level(score)
+
+
+class TestLoadCandidates:
+    """Test reading candidate weightings."""
+
+    def test_candidates_layout(self, tmp_path):
+        path = tmp_path / "weights.yaml"
+        path.write_text(
+            "candidates:\n"
+            "  docs:\n"
+            "    weights:\n"
+            "      claude_md_file: 0.3\n"
+            "  tiers:\n"
+            "    tier_weights: {1: 0.7, 2: 0.3}\n"
+        )
+
+        candidates = load_candidates(path)
+
+        assert [c.name for c in candidates] == ["default", "docs", "tiers"]
+        assert candidates[1].weights == {"claude_md_file": 0.3}
+        assert candidates[2].tier_weights == {1: 0.7, 2: 0.3}
+
+    def test_config_layout(self, tmp_path):
+        path = tmp_path / "team.yaml"
+        path.write_text("weights:\n  claude_md_file: 0.3\n")
+
+        candidates = load_candidates(path)
+
+        assert [c.name for c in candidates] == ["default", "team"]
+
+    def test_rejects_non_positive_weight(self, tmp_path):
+        path = tmp_path / "weights.yaml"
+        path.write_text("weights:\n  claude_md_file: 0\n")
+
+        with pytest.raises(ValueError, match="positive"):
+            load_candidates(path)
+
+
+class TestRescoreCommand:
+    """Test `agentready rescore`."""
+
+    def test_rescore_directory(self, assessments, tmp_path):
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        for source, data in assessments:
+            (reports / source).write_text(json.dumps(data))
+        weights = tmp_path / "weights.yaml"
+        weights.write_text("weights:\n  claude_md_file: 0.5\n")
+        output = tmp_path / "out.json"
+
+        result = CliRunner().invoke(
+            cli, ["rescore", str(weights), str(reports), "-o", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert f"Loaded {len(assessments)} assessments" in result.output
+        results = json.loads(output.read_text())
+        first = results["assessments"][0]
+        assert first["scores"]["default"]["score"] == first["stored_score"]
+        assert set(first["scores"]) == {"default", "weights"}
+
+    def test_no_assessments(self, tmp_path):
+        weights = tmp_path / "weights.yaml"
+        weights.write_text("weights:\n  claude_md_file: 0.5\n")
+
+        result = CliRunner().invoke(cli, ["rescore", str(weights), str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "No assessment JSON files" in result.output
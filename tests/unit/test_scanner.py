@@ -0,0 +1,311 @@
+"""Unit tests for Scanner assessor execution."""
+
+import json
+import pstats
+import subprocess
+import threading
+import time
+
+import pytest
+
+from agentready.assessors.base import BaseAssessor
+from agentready.models.assessment import Assessment
+from agentready.models.attribute import Attribute
+from agentready.models.finding import Finding
+from agentready.services.profiling import ScanProfiler
+from agentready.services.scanner import MissingToolError, Scanner
+from tests.unit.conftest import commit_all
+
+
+class _StubAssessor(BaseAssessor):
+    """Assessor with a configurable delay and behavior."""
+
+    def __init__(self, attribute_id, delay=0.0, raises=None, barrier=None):
+        self._attribute_id = attribute_id
+        self.delay = delay
+        self.raises = raises
+        self.barrier = barrier
+
+    @property
+    def attribute_id(self):
+        return self._attribute_id
+
+    @property
+    def tier(self):
+        return 1
+
+    @property
+    def attribute(self):
+        return Attribute(
+            id=self._attribute_id,
+            name=self._attribute_id,
+            category="Testing",
+            tier=1,
+            description="Stub attribute",
+            criteria="None",
+            default_weight=0.1,
+        )
+
+    def assess(self, repository):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        time.sleep(self.delay)
+        if self.raises is not None:
+            raise self.raises
+        return Finding(
+            attribute=self.attribute,
+            status="pass",
+            score=100.0,
+            measured_value="ok",
+            threshold="ok",
+            evidence=[],
+            remediation=None,
+            error_message=None,
+        )
+
+
+class TestScannerParallelExecution:
+    """Test Scanner.scan with a worker pool."""
+
+    def test_findings_keep_assessor_order(self, git_repo):
+        """Test that findings follow assessor order regardless of completion."""
+        assessors = [
+            _StubAssessor("slow", delay=0.2),
+            _StubAssessor("fast"),
+            _StubAssessor("medium", delay=0.1),
+        ]
+
+        assessment = Scanner(git_repo).scan(assessors, jobs=3)
+
+        assert [f.attribute.id for f in assessment.findings] == [
+            "slow",
+            "fast",
+            "medium",
+        ]
+
+    def test_assessors_run_concurrently(self, git_repo):
+        """Test that jobs > 1 overlaps assessor execution."""
+        # Each assessor waits until all three are running at once
+        barrier = threading.Barrier(3)
+        assessors = [_StubAssessor(f"a{i}", barrier=barrier) for i in range(3)]
+
+        assessment = Scanner(git_repo).scan(assessors, jobs=3)
+
+        assert [f.status for f in assessment.findings] == ["pass"] * 3
+
+    def test_error_semantics_preserved(self, git_repo):
+        """Test that missing tools skip and other exceptions become errors."""
+        assessors = [
+            _StubAssessor("missing", raises=MissingToolError("radon", "pip install")),
+            _StubAssessor("denied", raises=PermissionError("nope")),
+            _StubAssessor("broken", raises=RuntimeError("boom")),
+        ]
+
+        assessment = Scanner(git_repo).scan(assessors, jobs=2)
+
+        assert [f.status for f in assessment.findings] == [
+            "skipped",
+            "skipped",
+            "error",
+        ]
+        assert assessment.findings[2].error_message == "boom"
+
+    def test_verbose_output_in_assessor_order(self, git_repo, capsys):
+        """Test that progress lines are printed in assessor order."""
+        assessors = [
+            _StubAssessor("first", delay=0.1),
+            _StubAssessor("second", raises=RuntimeError("boom")),
+        ]
+
+        Scanner(git_repo).scan(assessors, verbose=True, jobs=2)
+
+        out = capsys.readouterr().out
+        assert "  [first] pass (100)\n  [second] error (RuntimeError)\n" in out
+
+    def test_sequential_and_parallel_agree(self, git_repo):
+        """Test that jobs does not change the resulting score."""
+        assessors = [_StubAssessor("a"), _StubAssessor("b", raises=KeyError("x"))]
+
+        serial = Scanner(git_repo).scan(assessors, jobs=1)
+        parallel = Scanner(git_repo).scan(assessors, jobs=4)
+
+        assert serial.overall_score == parallel.overall_score
+        assert [f.status for f in serial.findings] == [
+            f.status for f in parallel.findings
+        ]
+
+    def test_repository_name_override(self, git_repo):
+        """Test that an explicit repository name replaces the directory name."""
+        assessment = Scanner(git_repo, repository_name="project").scan(
+            [_StubAssessor("a")]
+        )
+
+        assert assessment.repository.name == "project"
+
+
+class _GlobStubAssessor(_StubAssessor):
+    """Stub assessor declaring the files it reads and counting its runs."""
+
+    def __init__(self, attribute_id, globs):
+        super().__init__(attribute_id)
+        self.globs = globs
+        self.runs = 0
+
+    @property
+    def input_globs(self):
+        return self.globs
+
+    def assess(self, repository):
+        self.runs += 1
+        return super().assess(repository)
+
+
+class TestScannerIncrementalReassessment:
+    """Test Scanner.scan reusing findings of a previous assessment."""
+
+    def _assessors(self):
+        return [
+            _GlobStubAssessor("readme", ("README.md",)),
+            _GlobStubAssessor("python", ("*.py",)),
+            _GlobStubAssessor("unknown", None),
+        ]
+
+    def test_unchanged_inputs_reuse_previous_findings(self, git_repo):
+        """Test that only assessors whose globs match changed paths re-run."""
+        previous = Scanner(git_repo).scan(self._assessors(), version="1.0.0")
+        (git_repo / "src").mkdir()
+        (git_repo / "src" / "app.py").write_text("x = 1\n")
+        commit_all(git_repo, "add module")
+
+        assessors = self._assessors()
+        assessment = Scanner(git_repo).scan(
+            assessors, version="1.0.0", previous=previous
+        )
+
+        assert [a.runs for a in assessors] == [0, 1, 1]
+        assert assessment.findings[0] is previous.findings[0]
+        assert assessment.overall_score == previous.overall_score
+
+    def test_uncommitted_and_untracked_changes_count(self, git_repo):
+        """Test that working tree edits and new files invalidate findings."""
+        previous = Scanner(git_repo).scan(self._assessors(), version="1.0.0")
+        (git_repo / "README.md").write_text("# Changed\n")
+        (git_repo / "tool.py").write_text("y = 2\n")
+
+        assessors = self._assessors()
+        Scanner(git_repo).scan(assessors, version="1.0.0", previous=previous)
+
+        assert [a.runs for a in assessors] == [1, 1, 1]
+
+    def test_version_change_runs_everything(self, git_repo):
+        """Test that findings from another agentready version are not reused."""
+        previous = Scanner(git_repo).scan(self._assessors(), version="1.0.0")
+
+        assessors = self._assessors()
+        Scanner(git_repo).scan(assessors, version="1.1.0", previous=previous)
+
+        assert [a.runs for a in assessors] == [1, 1, 1]
+
+    def test_missing_fingerprints_run_everything(self, git_repo):
+        """Test that assessments without input fingerprints are not reused."""
+        previous = Scanner(git_repo).scan(self._assessors(), version="1.0.0")
+        previous.input_fingerprints = None
+
+        assessors = self._assessors()
+        Scanner(git_repo).scan(assessors, version="1.0.0", previous=previous)
+
+        assert [a.runs for a in assessors] == [1, 1, 1]
+
+    def test_deleted_untracked_input_reruns(self, git_repo):
+        """Test that an untracked input read by the previous run is tracked."""
+        (git_repo / "NOTES.md").write_text("# Notes\n")
+        assessors = [_GlobStubAssessor("notes", ("NOTES.md",))]
+        previous = Scanner(git_repo).scan(assessors, version="1.0.0")
+        assert "NOTES.md" in previous.input_fingerprints
+        (git_repo / "NOTES.md").unlink()
+
+        assessors = [_GlobStubAssessor("notes", ("NOTES.md",))]
+        Scanner(git_repo).scan(assessors, version="1.0.0", previous=previous)
+
+        assert assessors[0].runs == 1
+
+    def test_reverted_uncommitted_change_reruns(self, git_repo):
+        """Test that a dirty input reverted after the previous run re-runs."""
+        original = (git_repo / "README.md").read_text()
+        (git_repo / "README.md").write_text("# Work in progress\n")
+        previous = Scanner(git_repo).scan(self._assessors(), version="1.0.0")
+        (git_repo / "README.md").write_text(original)
+
+        assessors = self._assessors()
+        Scanner(git_repo).scan(assessors, version="1.0.0", previous=previous)
+
+        assert [a.runs for a in assessors] == [1, 0, 1]
+
+    def test_fingerprints_survive_serialization(self, git_repo):
+        """Test that a previous assessment loaded from JSON can be reused."""
+        previous = Scanner(git_repo).scan(self._assessors(), version="1.0.0")
+        loaded = Assessment.from_dict(previous.to_dict())
+
+        assessors = self._assessors()
+        Scanner(git_repo).scan(assessors, version="1.0.0", previous=loaded)
+
+        assert loaded.input_fingerprints == previous.input_fingerprints
+        assert [a.runs for a in assessors] == [0, 0, 1]
+
+
+class _ReadingStubAssessor(_StubAssessor):
+    """Stub assessor that reads README.md and runs git once."""
+
+    def assess(self, repository):
+        (repository.path / "README.md").read_text()
+        subprocess.run(["git", "status"], cwd=repository.path, capture_output=True)
+        return super().assess(repository)
+
+
+class TestScannerProfiling:
+    """Test per-assessor resource accounting and the scan profiler."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_profiles_record_each_assessor(self, git_repo, jobs):
+        """Test that every assessor gets its own time, file and process counts."""
+        assessors = [_ReadingStubAssessor("reader"), _StubAssessor("idle", delay=0.05)]
+
+        assessment = Scanner(git_repo).scan(assessors, jobs=jobs)
+
+        reader, idle = assessment.metadata.assessor_profiles
+        assert (reader.attribute_id, idle.attribute_id) == ("reader", "idle")
+        assert reader.files_read >= 1
+        assert reader.bytes_read >= len("# Test\n")
+        assert reader.subprocesses == 1
+        assert (idle.files_read, idle.subprocesses) == (0, 0)
+        assert idle.wall_seconds >= 0.05
+        assert idle.cpu_seconds < idle.wall_seconds
+
+    def test_profiles_round_trip_through_json(self, git_repo):
+        """Test that profiles survive the JSON report."""
+        assessment = Scanner(git_repo).scan([_ReadingStubAssessor("reader")])
+
+        restored = Assessment.from_dict(assessment.to_dict())
+
+        assert (
+            restored.metadata.assessor_profiles == assessment.metadata.assessor_profiles
+        )
+
+    def test_chrome_trace(self, git_repo, tmp_path):
+        """Test that a .json profile is a trace with a span per assessor."""
+        trace_path = tmp_path / "scan-trace.json"
+        with ScanProfiler(trace_path):
+            Scanner(git_repo).scan([_StubAssessor("a"), _StubAssessor("b")], jobs=2)
+
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        spans = {e["name"] for e in events if e["ph"] == "X"}
+        assert {"repository model", "a", "b"} <= spans
+
+    def test_cprofile_stats(self, git_repo, tmp_path):
+        """Test that other extensions produce pstats-readable output."""
+        stats_path = tmp_path / "scan.prof"
+        with ScanProfiler(stats_path):
+            Scanner(git_repo).scan([_StubAssessor("a")])
+
+        stats = pstats.Stats(str(stats_path))
+        assert any(func[2] == "scan" for func in stats.stats)
@@ -341,7 +341,7 @@ class TestGitHubTokenSecurity:
         token = "ghp_" + "a" * 36
 
         with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.get") as mock_get:
                 # Simulate error with token in response
                 mock_response = Mock()
                 mock_response.status_code = 500
@@ -444,7 +444,7 @@ class TestGitHubTokenSecurity:
         ]
 
         with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.get") as mock_get:
                 mock_response = Mock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = mock_repos
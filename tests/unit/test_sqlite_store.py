@@ -0,0 +1,35 @@
+"""Unit tests for the shared SQLite store base."""
+
+import threading
+
+from agentready.services.sqlite_store import SQLiteStore
+
+
+class _RollbackStore(SQLiteStore):
+    USE_WAL = False
+
+
+class TestSQLiteStore:
+    """Test per-thread connection handling."""
+
+    def test_reuses_connection_per_thread(self, tmp_path):
+        store = SQLiteStore(tmp_path / "store.db")
+        other = []
+        thread = threading.Thread(target=lambda: other.append(store._connection()))
+        thread.start()
+        thread.join()
+
+        assert store._connection() is store._connection()
+        assert other[0] is not store._connection()
+
+    def test_close_reopens_on_next_use(self, tmp_path):
+        with SQLiteStore(tmp_path / "store.db") as store:
+            first = store._connection()
+        assert store._connection() is not first
+
+    def test_journal_mode(self, tmp_path):
+        wal = SQLiteStore(tmp_path / "wal.db")._connection()
+        rollback = _RollbackStore(tmp_path / "rollback.db")._connection()
+
+        assert wal.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert rollback.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
@@ -0,0 +1,83 @@
+"""Unit tests for the token bucket rate limiter."""
+
+import threading
+
+import pytest
+
+from agentready.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Clock that only advances when sleep is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test TokenBucket pacing."""
+
+    def test_burst_up_to_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_paces_to_rate_after_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+        for _ in range(5):
+            bucket.acquire()
+
+        # First request is free, the other four wait 0.5s each
+        assert clock.now == pytest.approx(2.0)
+
+    def test_refills_while_idle(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10  # Idle long enough to refill, but only to capacity
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_shared_between_threads(self):
+        bucket = TokenBucket(rate=200.0, capacity=1)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(5):
+                waited = bucket.acquire()
+                with lock:
+                    waits.append(waited)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 requests at 200/s after a burst of one take at least 95ms
+        assert len(waits) == 20
+        assert sum(waits) >= 0.095 * 0.9
+
+    @pytest.mark.parametrize("rate, capacity", [(0, 1), (1, 0), (-1, 1)])
+    def test_rejects_non_positive_settings(self, rate, capacity):
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate=rate, capacity=capacity)